@@ -0,0 +1,40 @@
+"""add covering vintage index on macro_series for PIT queries
+
+PointInTimeDataLoader.get_macro_series asks for "latest revision per
+observation_date as of T" with DISTINCT ON (observation_date) ordered by
+revision_number DESC and a range predicate on release_time.  This index
+matches that sort order and carries release_time/value so the query is an
+index-only scan per series instead of a full series scan + sort.
+
+Created per chunk on the macro_series hypertable (TimescaleDB propagates
+hypertable indexes to every uncompressed chunk).
+
+Revision ID: k1l2m3n4o5p6
+Revises: j0k1l2m3n4o5
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "k1l2m3n4o5p6"
+down_revision: Union[str, None] = "j0k1l2m3n4o5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_macro_series_vintage",
+        "macro_series",
+        ["series_id", "observation_date", sa.text("revision_number DESC")],
+        postgresql_include=["release_time", "value"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_macro_series_vintage", table_name="macro_series")
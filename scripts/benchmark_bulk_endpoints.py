@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""Benchmark row-model JSON vs streamed columnar payloads for OHLCV history.
+
+Times the serialization path of ``GET /market-data/{ticker}`` (fetch every
+row, one ``OHLCVRecord`` per row, ``jsonable_encoder`` + ``json.dumps``)
+against ``GET /market-data/bulk`` (cursor partitions of
+``STREAM_CHUNK_ROWS`` rows encoded by ``src.api.streaming``) on synthetic
+rows -- 20 years of daily bars per ticker by default.  Each mode runs in a
+fresh subprocess so its peak RSS is measured in isolation.  No database is
+needed: rows are generated in memory, materialized up front for the legacy
+path (as ``.all()`` does) and lazily per partition for the streamed path
+(as the server-side cursor does).
+
+Usage:
+    python scripts/benchmark_bulk_endpoints.py
+    python scripts/benchmark_bulk_endpoints.py --tickers 50 --years 20 --gzip
+"""
+
+import argparse
+import asyncio
+import json
+import resource
+import subprocess
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+
+from src.api import streaming  # noqa: E402
+from src.api.routes.market_data import _BULK_COLUMNS, OHLCVRecord  # noqa: E402
+
+MODES = ("legacy", "json", "arrow")
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--tickers", type=int, default=20, help="Number of tickers")
+    parser.add_argument("--years", type=int, default=20, help="Daily history length")
+    parser.add_argument("--gzip", action="store_true", help="Compress streamed output")
+    parser.add_argument("--mode", choices=MODES, help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+
+def synthetic_rows(n_tickers: int, years: int):
+    start = datetime(2000, 1, 3, tzinfo=timezone.utc)
+    n_days = years * 252
+    for t in range(n_tickers):
+        ticker = f"BENCH{t:03d}"
+        price = 100.0
+        for d in range(n_days):
+            price *= 1.0 + ((d * 7919 + t) % 201 - 100) / 10_000
+            yield (
+                ticker,
+                start + timedelta(days=d),
+                price,
+                price * 1.01,
+                price * 0.99,
+                price,
+                1_000_000.0 + d,
+            )
+
+
+def run_legacy(args: argparse.Namespace) -> tuple[int, int]:
+    rows = list(synthetic_rows(args.tickers, args.years))
+    models = [
+        OHLCVRecord(
+            timestamp=r[1], open=r[2], high=r[3], low=r[4], close=r[5], volume=r[6]
+        )
+        for r in rows
+    ]
+    body = json.dumps(jsonable_encoder(models)).encode()
+    return len(rows), len(body)
+
+
+async def _partitions(args: argparse.Namespace):
+    chunk: list[tuple] = []
+    for row in synthetic_rows(args.tickers, args.years):
+        chunk.append(row)
+        if len(chunk) == streaming.STREAM_CHUNK_ROWS:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+async def run_streamed(args: argparse.Namespace, fmt: str) -> tuple[int, int]:
+    encode = streaming.encode_arrow if fmt == "arrow" else streaming.encode_json
+    body = encode(_partitions(args), _BULK_COLUMNS)
+    if args.gzip:
+        body = streaming.gzip_stream(body)
+    n_bytes = 0
+    async for chunk in body:
+        n_bytes += len(chunk)  # sent to the socket, not retained
+    return args.tickers * args.years * 252, n_bytes
+
+
+def run_mode(args: argparse.Namespace) -> None:
+    """Child process: run one mode and print a JSON result line."""
+    t0 = time.perf_counter()
+    if args.mode == "legacy":
+        n_rows, n_bytes = run_legacy(args)
+    else:
+        n_rows, n_bytes = asyncio.run(run_streamed(args, args.mode))
+    elapsed = time.perf_counter() - t0
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(
+        json.dumps(
+            {
+                "rows": n_rows,
+                "seconds": elapsed,
+                "bytes": n_bytes,
+                "peak_rss_mb": peak_kb / 1024,
+            }
+        )
+    )
+
+
+def main() -> None:
+    args = parse_args()
+    if args.mode:
+        run_mode(args)
+        return
+
+    modes = [m for m in MODES if m != "arrow" or streaming._ARROW_AVAILABLE]
+    base = [
+        sys.executable,
+        __file__,
+        "--tickers",
+        str(args.tickers),
+        "--years",
+        str(args.years),
+    ]
+    if args.gzip:
+        base.append("--gzip")
+
+    print(
+        f"{args.tickers} tickers x {args.years}y daily"
+        f" ({args.tickers * args.years * 252:,} rows)"
+        f"{', gzip' if args.gzip else ''}"
+    )
+    print(f"{'mode':<8} {'rows/s':>12} {'seconds':>9} {'MB out':>9} {'peak RSS MB':>12}")
+    for mode in modes:
+        out = subprocess.run(
+            [*base, "--mode", mode], capture_output=True, text=True, check=True
+        )
+        r = json.loads(out.stdout.strip().splitlines()[-1])
+        print(
+            f"{mode:<8} {r['rows'] / r['seconds']:>12,.0f} {r['seconds']:>9.2f}"
+            f" {r['bytes'] / 1e6:>9.1f} {r['peak_rss_mb']:>12.0f}"
+        )
+    if "arrow" not in modes:
+        print("(arrow skipped: pyarrow not installed)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""Benchmark batched INSERT vs COPY + merge in BaseConnector._bulk_insert.
+
+Seeds two synthetic macro series (one per path), loads the same
+``--rows`` observations into each -- first into an empty series, then
+again so every row conflicts -- and reports wall-clock time and inserted
+counts for the batched ``INSERT ... ON CONFLICT`` path and the
+``_copy_insert`` path.  Both paths commit, so the benchmark deletes its
+rows, series and data source at the end.  Run after ``make migrate``.
+
+Usage:
+    python scripts/benchmark_bulk_insert.py
+    python scripts/benchmark_bulk_insert.py --rows 1000000
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from sqlalchemy import delete, insert
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.connectors.base import BaseConnector  # noqa: E402
+from src.core.database import async_engine, sync_session_factory  # noqa: E402
+from src.core.models.data_sources import DataSource  # noqa: E402
+from src.core.models.macro_series import MacroSeries  # noqa: E402
+from src.core.models.series_metadata import SeriesMetadata  # noqa: E402
+
+BENCH_SOURCE = "BENCH_BULK_INSERT"
+CONSTRAINT = "uq_macro_series_natural_key"
+
+
+class _BenchConnector(BaseConnector):
+    """Connector shell exposing _bulk_insert; nothing is fetched."""
+
+    SOURCE_NAME = BENCH_SOURCE
+
+    async def fetch(self, start_date: date, end_date: date, **kwargs: Any) -> list:
+        return []
+
+    async def store(self, records: list[dict[str, Any]]) -> int:
+        return await self._bulk_insert(MacroSeries, records, CONSTRAINT)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--rows", type=int, default=200_000, help="Rows per load")
+    return parser.parse_args(argv)
+
+
+def seed_series() -> tuple[int, dict[str, int]]:
+    """Create the bench data source and one series per path."""
+    session = sync_session_factory()
+    try:
+        sources = DataSource.__table__
+        source_id = session.execute(
+            insert(sources)
+            .values(name=BENCH_SOURCE, base_url="local://bench", auth_type="none")
+            .returning(sources.c.id)
+        ).scalar_one()
+        meta = SeriesMetadata.__table__
+        series_ids = {}
+        for path in ("batched", "copy"):
+            series_ids[path] = session.execute(
+                insert(meta)
+                .values(
+                    source_id=source_id,
+                    series_code=f"{BENCH_SOURCE}_{path.upper()}",
+                    name=f"Bulk insert benchmark ({path})",
+                    frequency="D",
+                    country="BR",
+                    unit="index",
+                )
+                .returning(meta.c.id)
+            ).scalar_one()
+        session.commit()
+        return source_id, series_ids
+    finally:
+        session.close()
+
+
+def cleanup(source_id: int, series_ids: dict[str, int]) -> None:
+    session = sync_session_factory()
+    try:
+        ids = list(series_ids.values())
+        session.execute(delete(MacroSeries).where(MacroSeries.series_id.in_(ids)))
+        session.execute(delete(SeriesMetadata).where(SeriesMetadata.id.in_(ids)))
+        session.execute(delete(DataSource).where(DataSource.id == source_id))
+        session.commit()
+    finally:
+        session.close()
+
+
+def make_records(series_id: int, n: int) -> list[dict[str, Any]]:
+    rng = np.random.default_rng(42)
+    start = date.today() - timedelta(days=n)
+    released = datetime.now(tz=timezone.utc)
+    return [
+        {
+            "series_id": series_id,
+            "observation_date": start + timedelta(days=i),
+            "value": float(v),
+            "release_time": released,
+            "revision_number": 0,
+        }
+        for i, v in enumerate(rng.normal(size=n))
+    ]
+
+
+async def timed_load(
+    conn: _BenchConnector, records: list[dict[str, Any]]
+) -> tuple[float, int]:
+    t0 = time.perf_counter()
+    inserted = await conn.store(records)
+    return time.perf_counter() - t0, inserted
+
+
+async def run(rows: int, series_ids: dict[str, int]) -> None:
+    batched = _BenchConnector()
+    batched.COPY_THRESHOLD = rows + 1
+    copying = _BenchConnector()
+    copying.COPY_THRESHOLD = 0
+
+    print(f"Loading {rows} rows per path\n")
+    print(f"  {'path':<8} {'load':<9} {'seconds':>9} {'rows/s':>11} {'inserted':>9}")
+    results: dict[tuple[str, str], int] = {}
+    for path, conn in (("batched", batched), ("copy", copying)):
+        records = make_records(series_ids[path], rows)
+        for load in ("fresh", "conflict"):
+            elapsed, inserted = await timed_load(conn, records)
+            results[(path, load)] = inserted
+            print(
+                f"  {path:<8} {load:<9} {elapsed:9.2f} "
+                f"{rows / max(elapsed, 1e-9):11.0f} {inserted:9d}"
+            )
+
+    for load in ("fresh", "conflict"):
+        if results[("batched", load)] != results[("copy", load)]:
+            print(
+                f"  [WARN] inserted count mismatch on {load} load: "
+                f"batched={results[('batched', load)]} copy={results[('copy', load)]}"
+            )
+    await async_engine.dispose()
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = parse_args(argv)
+    source_id, series_ids = seed_series()
+    try:
+        asyncio.run(run(args.rows, series_ids))
+    finally:
+        cleanup(source_id, series_ids)
+
+
+if __name__ == "__main__":
+    main()
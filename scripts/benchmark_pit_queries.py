@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""Benchmark legacy vs sargable PIT vintage queries on macro_series.
+
+Seeds a synthetic 20-year daily series (with revisions) inside a single
+transaction, times the legacy ``get_macro_series`` query (``cast(release_time,
+Date) <= T`` + every revision + pandas ``drop_duplicates``) against the new
+``PointInTimeDataLoader.macro_vintage_stmt`` (``release_time < cutoff`` +
+``DISTINCT ON``), then rolls everything back.  Run after ``make migrate`` so
+``ix_macro_series_vintage`` exists.
+
+Usage:
+    python scripts/benchmark_pit_queries.py
+    python scripts/benchmark_pit_queries.py --years 20 --runs 50 --explain
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import Date, and_, cast, insert, select
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.agents.data_loader import PointInTimeDataLoader  # noqa: E402
+from src.core.database import sync_session_factory  # noqa: E402
+from src.core.models.data_sources import DataSource  # noqa: E402
+from src.core.models.macro_series import MacroSeries  # noqa: E402
+from src.core.models.series_metadata import SeriesMetadata  # noqa: E402
+
+BENCH_CODE = "BENCH_PIT_VINTAGE"
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--years", type=int, default=20, help="Series length")
+    parser.add_argument("--runs", type=int, default=30, help="Timed runs per query")
+    parser.add_argument(
+        "--revision-rate",
+        type=float,
+        default=0.3,
+        help="Fraction of observations with a second revision",
+    )
+    parser.add_argument("--explain", action="store_true", help="Print query plans")
+    return parser.parse_args(argv)
+
+
+def legacy_stmt(series_code: str, as_of_date: date, start: date):
+    """The pre-011 query: non-sargable cast, every revision returned."""
+    return (
+        select(
+            MacroSeries.observation_date.label("date"),
+            MacroSeries.value,
+            MacroSeries.release_time,
+            MacroSeries.revision_number,
+        )
+        .join(SeriesMetadata, MacroSeries.series_id == SeriesMetadata.id)
+        .where(
+            and_(
+                SeriesMetadata.series_code == series_code,
+                cast(MacroSeries.release_time, Date) <= as_of_date,
+                MacroSeries.observation_date >= start,
+            )
+        )
+        .order_by(MacroSeries.observation_date, MacroSeries.revision_number.desc())
+    )
+
+
+def seed(session, years: int, revision_rate: float) -> int:
+    """Insert the synthetic series; returns the number of rows."""
+    sources = DataSource.__table__
+    source_id = session.execute(
+        insert(sources)
+        .values(name=BENCH_CODE, base_url="local://bench", auth_type="none")
+        .returning(sources.c.id)
+    ).scalar_one()
+    meta = SeriesMetadata.__table__
+    series_id = session.execute(
+        insert(meta)
+        .values(
+            source_id=source_id,
+            series_code=BENCH_CODE,
+            name="PIT benchmark series",
+            frequency="D",
+            country="BR",
+            unit="index",
+        )
+        .returning(meta.c.id)
+    ).scalar_one()
+
+    rng = np.random.default_rng(42)
+    end = date.today()
+    obs_dates = pd.bdate_range(end - timedelta(days=365 * years), end)
+    rows = []
+    for obs in obs_dates:
+        released = datetime.combine(obs.date() + timedelta(days=1), datetime.min.time())
+        released = released.replace(hour=12, tzinfo=timezone.utc)
+        value = float(rng.normal())
+        rows.append(
+            dict(
+                series_id=series_id,
+                observation_date=obs.date(),
+                value=value,
+                release_time=released,
+                revision_number=0,
+            )
+        )
+        if rng.random() < revision_rate:
+            rows.append(
+                dict(
+                    series_id=series_id,
+                    observation_date=obs.date(),
+                    value=value + 0.01,
+                    release_time=released + timedelta(days=30),
+                    revision_number=1,
+                )
+            )
+    for i in range(0, len(rows), 5000):
+        session.execute(insert(MacroSeries.__table__), rows[i : i + 5000])
+    session.connection().exec_driver_sql("ANALYZE macro_series")
+    return len(rows)
+
+
+def time_query(session, stmt, runs: int, dedup: bool) -> tuple[list[float], int]:
+    timings = []
+    n_rows = 0
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        rows = session.execute(stmt).all()
+        df = pd.DataFrame(rows, columns=["date", "value", "release_time", "rev"])
+        if dedup:
+            df = df.drop_duplicates(subset=["date"], keep="first")
+        timings.append((time.perf_counter() - t0) * 1000)
+        n_rows = len(df)
+    return timings, n_rows
+
+
+def report(label: str, timings: list[float], n_rows: int) -> None:
+    p95 = sorted(timings)[max(0, int(len(timings) * 0.95) - 1)]
+    print(
+        f"  {label:<10} median={statistics.median(timings):8.2f} ms  "
+        f"p95={p95:8.2f} ms  rows={n_rows}"
+    )
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = parse_args(argv)
+    session = sync_session_factory()
+    try:
+        n = seed(session, args.years, args.revision_rate)
+        as_of = date.today()
+        start = as_of - timedelta(days=365 * args.years)
+        print(f"Seeded {n} rows ({args.years}y daily, {args.revision_rate:.0%} revised)")
+
+        old = legacy_stmt(BENCH_CODE, as_of, start)
+        new = PointInTimeDataLoader.macro_vintage_stmt(BENCH_CODE, as_of, start)
+
+        if args.explain:
+            for label, stmt in (("legacy", old), ("vintage", new)):
+                compiled = stmt.compile(
+                    dialect=session.get_bind().dialect,
+                    compile_kwargs={"literal_binds": True},
+                )
+                plan = (
+                    session.connection()
+                    .exec_driver_sql(f"EXPLAIN ANALYZE {compiled}")
+                    .all()
+                )
+                print(f"\n-- {label} plan --")
+                print("\n".join(r[0] for r in plan))
+
+        old_t, old_rows = time_query(session, old, args.runs, dedup=True)
+        new_t, new_rows = time_query(session, new, args.runs, dedup=False)
+        print(f"\nLatency over {args.runs} runs:")
+        report("legacy", old_t, old_rows)
+        report("vintage", new_t, new_rows)
+        speedup = statistics.median(old_t) / max(statistics.median(new_t), 1e-9)
+        print(f"  speedup    {speedup:.1f}x")
+        if old_rows != new_rows:
+            print(f"  [WARN] row count mismatch: legacy={old_rows} vintage={new_rows}")
+    finally:
+        session.rollback()
+        session.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -58,6 +58,18 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
         default=False,
         help="Run full computation but skip all DB persistence",
     )
+    parser.add_argument(
+        "--strategy-workers",
+        type=int,
+        default=8,
+        help="Strategies generating signals concurrently (default: 8)",
+    )
+    parser.add_argument(
+        "--strategy-timeout",
+        type=float,
+        default=60.0,
+        help="Per-strategy timeout in seconds (default: 60)",
+    )
     return parser.parse_args(argv)
 
 
@@ -71,7 +83,12 @@ def main(argv: list[str] | None = None) -> int:
         Exit code: 0 on success, 1 on failure.
     """
     args = parse_args(argv)
-    pipeline = DailyPipeline(as_of_date=args.date, dry_run=args.dry_run)
+    pipeline = DailyPipeline(
+        as_of_date=args.date,
+        dry_run=args.dry_run,
+        strategy_workers=args.strategy_workers,
+        strategy_timeout=args.strategy_timeout,
+    )
 
     try:
         result = pipeline.run()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""Publish the incremental EWMA risk state (src.risk.risk_state).
+
+Loads the state from ``settings.risk_state_path`` and folds in every bar
+newer than its ``last_date`` -- an O(n_assets^2) update per day -- or,
+with ``--rebuild`` (or when no state exists yet), warms a fresh state
+from the full return history.  The result is written back to disk and
+to Redis (bumping its version key) so running API processes reload it.
+Run after the daily ingest.
+
+Usage:
+    python scripts/update_risk_state.py
+    python scripts/update_risk_state.py --rebuild --instruments USDBRL DI1_F26
+"""
+
+import argparse
+import asyncio
+import sys
+from datetime import date
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.agents.data_loader import PointInTimeDataLoader  # noqa: E402
+from src.api.routes.risk_api import _load_all_tradeable_instruments  # noqa: E402
+from src.core.config import settings  # noqa: E402
+from src.core.redis import close_redis  # noqa: E402
+from src.risk.risk_state import EWMARiskState  # noqa: E402
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--rebuild", action="store_true", help="Warm from history")
+    parser.add_argument("--instruments", nargs="+", help="Universe for a rebuild")
+    parser.add_argument("--decay", type=float, default=0.94, help="EWMA lambda")
+    parser.add_argument("--lookback", type=int, default=756, help="History days")
+    parser.add_argument("--no-redis", action="store_true", help="Skip Redis publish")
+    return parser.parse_args(argv)
+
+
+def load_returns(instruments: list[str], lookback_days: int) -> pd.DataFrame:
+    """Daily close-to-close returns, one column per instrument."""
+    loader = PointInTimeDataLoader()
+    frames = []
+    for ticker in instruments:
+        md = loader.get_market_data(
+            ticker, as_of_date=date.today(), lookback_days=lookback_days
+        )
+        if md is None or md.empty or "close" not in md.columns:
+            print(f"  [WARN] no market data for {ticker}")
+            continue
+        ret = md["close"].pct_change().dropna()
+        ret.index = ret.index.normalize()
+        ret = ret[~ret.index.duplicated(keep="last")]
+        ret.name = ticker
+        frames.append(ret)
+    if not frames:
+        return pd.DataFrame(columns=instruments)
+    # Missing quotes on a day are carried forward (zero return)
+    return pd.concat(frames, axis=1).reindex(columns=instruments).fillna(0.0)
+
+
+async def publish(state: EWMARiskState) -> None:
+    await state.save_redis()
+    await close_redis()
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = parse_args(argv)
+    path = Path(settings.risk_state_path)
+    state = None if args.rebuild or not path.exists() else EWMARiskState.load(path)
+
+    if state is None:
+        instruments = args.instruments or _load_all_tradeable_instruments()
+        if not instruments:
+            sys.exit("No instruments: pass --instruments or seed market data.")
+        returns = load_returns(instruments, args.lookback)
+        state = EWMARiskState.from_history(
+            returns, decay=args.decay, history_days=args.lookback
+        )
+        print(f"Rebuilt state: {state.n_assets} assets, {state.n_updates} bars")
+    else:
+        returns = load_returns(state.instruments, lookback_days=30)
+        applied = sum(
+            state.update(ts.date(), row.to_dict()) for ts, row in returns.iterrows()
+        )
+        print(f"Applied {applied} new bars to {state.n_assets} assets")
+
+    state.save(path)
+    print(f"Saved {path} (last bar {state.last_date})")
+    if not args.no_redis:
+        asyncio.run(publish(state))
+        print("Published to Redis")
+
+
+if __name__ == "__main__":
+    main()
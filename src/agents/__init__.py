@@ -5,11 +5,15 @@ Re-exports the core agent infrastructure:
 - AgentSignal: Typed signal output dataclass
 - AgentReport: Complete agent run output
 - PointInTimeDataLoader: PIT-correct data access layer
+- PointInTimeDataCube: Preloaded in-memory PIT loader for backtests
+- CachedDataLoader: PIT loader backed by the shared LRU + TTL result cache
 - AgentRegistry: Ordered execution and agent lookup
 """
 
 from src.agents.base import AgentReport, AgentSignal, BaseAgent
 from src.agents.data_loader import PointInTimeDataLoader
+from src.agents.loader_cache import CachedDataLoader, LoaderCache
+from src.agents.pit_data_cube import PointInTimeDataCube
 from src.agents.registry import AgentRegistry
 
 __all__ = [
@@ -17,5 +21,8 @@ __all__ = [
     "AgentSignal",
     "AgentReport",
     "PointInTimeDataLoader",
+    "PointInTimeDataCube",
+    "CachedDataLoader",
+    "LoaderCache",
     "AgentRegistry",
 ]
@@ -6,11 +6,14 @@ while subclasses supply the domain-specific implementations.
 
 AgentSignal is the typed output for a single signal produced by a model.
 AgentReport bundles all signals from a single agent run with metadata.
+Per-stage wall-clock timings are reported under
+``AgentReport.model_diagnostics["stage_timings"]``.
 """
 
 import abc
 import concurrent.futures
 import json
+import time
 from dataclasses import dataclass, field
 from datetime import date, datetime
 from typing import Any
@@ -116,6 +119,11 @@ class BaseAgent(abc.ABC):
     full pipeline using the Template Method pattern.
     """
 
+    # Set True when compute_features/run_models are CPU bound and the agent
+    # pickles without its loader; AgentRegistry.run_all then runs those
+    # stages in a worker process.
+    CPU_BOUND: bool = False
+
     def __init__(self, agent_id: str, agent_name: str) -> None:
         self.agent_id = agent_id
         self.agent_name = agent_name
@@ -191,16 +199,53 @@ class BaseAgent(abc.ABC):
             Complete AgentReport with all signals and narrative.
         """
         self.log.info("agent_run_start", as_of_date=str(as_of_date))
-        start = datetime.utcnow()
+        data, timings = self.load_stage(as_of_date)
+        data_flags = self._check_data_quality(data)
+        signals, narrative, model_timings = self.model_stages(data)
+        timings.update(model_timings)
+        return self.finish_run(as_of_date, signals, narrative, data_flags, timings)
 
+    def load_stage(self, as_of_date: date) -> tuple[dict[str, Any], dict[str, float]]:
+        """Run ``load_data`` and time it (I/O bound stage)."""
+        t0 = time.perf_counter()
         data = self.load_data(as_of_date)
-        data_flags = self._check_data_quality(data)
+        return data, {"load_data": round(time.perf_counter() - t0, 4)}
+
+    def model_stages(
+        self, data: dict[str, Any]
+    ) -> tuple[list[AgentSignal], str, dict[str, float]]:
+        """Run compute_features -> run_models -> generate_narrative, timed.
+
+        Self-contained so it can execute in a worker process: returns only
+        picklable outputs (features stay local).
+        """
+        timings: dict[str, float] = {}
+        t0 = time.perf_counter()
         features = self.compute_features(data)
+        t1 = time.perf_counter()
         signals = self.run_models(features)
+        t2 = time.perf_counter()
         narrative = self.generate_narrative(signals, features)
+        t3 = time.perf_counter()
+        timings["compute_features"] = round(t1 - t0, 4)
+        timings["run_models"] = round(t2 - t1, 4)
+        timings["generate_narrative"] = round(t3 - t2, 4)
+        return signals, narrative, timings
+
+    def finish_run(
+        self,
+        as_of_date: date,
+        signals: list[AgentSignal],
+        narrative: str,
+        data_flags: list[str],
+        timings: dict[str, float],
+    ) -> AgentReport:
+        """Persist signals, assemble the report and persist it."""
+        t0 = time.perf_counter()
         self._persist_signals(signals)
+        timings["persist_signals"] = round(time.perf_counter() - t0, 4)
 
-        elapsed = (datetime.utcnow() - start).total_seconds()
+        elapsed = sum(timings.values())
         self.log.info(
             "agent_run_complete",
             signals=len(signals),
@@ -212,7 +257,7 @@ class BaseAgent(abc.ABC):
             generated_at=datetime.utcnow(),
             signals=signals,
             narrative=narrative,
-            model_diagnostics={},
+            model_diagnostics={"stage_timings": timings},
             data_quality_flags=data_flags,
         )
         self._persist_report(report)
@@ -230,17 +275,16 @@ class BaseAgent(abc.ABC):
         Returns:
             AgentReport with signals but no side-effects.
         """
-        data = self.load_data(as_of_date)
-        features = self.compute_features(data)
-        signals = self.run_models(features)
-        narrative = self.generate_narrative(signals, features)
+        data, timings = self.load_stage(as_of_date)
+        signals, narrative, model_timings = self.model_stages(data)
+        timings.update(model_timings)
         return AgentReport(
             agent_id=self.agent_id,
             as_of_date=as_of_date,
             generated_at=datetime.utcnow(),
             signals=signals,
             narrative=narrative,
-            model_diagnostics={},
+            model_diagnostics={"stage_timings": timings},
             data_quality_flags=[],
         )
 
@@ -18,11 +18,11 @@ own session to avoid long-lived connections.
 """
 
 from datetime import date, datetime, time, timedelta, timezone
-from typing import Optional
+from typing import Any, Optional
 
 import pandas as pd
 import structlog
-from sqlalchemy import Date, and_, cast, func, select
+from sqlalchemy import and_, func, or_, select
 
 from src.core.database import sync_session_factory
 from src.core.models.curves import CurveData
@@ -101,6 +101,19 @@ def _normalize_curve_id(raw_id: str) -> str:
     return _CURVE_ALIASES.get(raw_id, raw_id)
 
 
+def _release_cutoff(as_of_date: date) -> datetime:
+    """Exclusive upper bound on ``release_time`` for a PIT ``as_of_date``.
+
+    ``release_time < cutoff`` is the sargable equivalent of
+    ``cast(release_time, Date) <= as_of_date`` (with the DB session in UTC):
+    it compares the raw TIMESTAMPTZ column, so the planner can use the
+    ``ix_macro_series_vintage`` index instead of evaluating a cast per row.
+    """
+    return datetime.combine(
+        as_of_date + timedelta(days=1), time.min, tzinfo=timezone.utc
+    )
+
+
 class PointInTimeDataLoader:
     """Load data respecting point-in-time constraints for backtesting.
 
@@ -204,24 +217,8 @@ class PointInTimeDataLoader:
         """
         series_code = _normalize_series_code(series_code)
         start = as_of_date - timedelta(days=lookback_days)
-
-        stmt = (
-            select(
-                MacroSeries.observation_date.label("date"),
-                MacroSeries.value,
-                MacroSeries.release_time,
-                MacroSeries.revision_number,
-            )
-            .join(SeriesMetadata, MacroSeries.series_id == SeriesMetadata.id)
-            .where(
-                and_(
-                    SeriesMetadata.series_code
-                    == self._normalize_series_code(series_code),
-                    cast(MacroSeries.release_time, Date) <= as_of_date,
-                    MacroSeries.observation_date >= start,
-                )
-            )
-            .order_by(MacroSeries.observation_date, MacroSeries.revision_number.desc())
+        stmt = self.macro_vintage_stmt(
+            self._normalize_series_code(series_code), as_of_date, start
         )
 
         session = sync_session_factory()
@@ -241,12 +238,10 @@ class PointInTimeDataLoader:
                 columns=["date", "value", "release_time", "revision_number"]
             )
 
+        # DISTINCT ON already returned one (latest) revision per date
         df = pd.DataFrame(
             rows, columns=["date", "value", "release_time", "revision_number"]
         )
-
-        # Keep only the highest revision per observation_date
-        df = df.drop_duplicates(subset=["date"], keep="first")
         df["date"] = pd.to_datetime(df["date"])
         df = df.set_index("date").sort_index()
 
@@ -258,6 +253,44 @@ class PointInTimeDataLoader:
         )
         return df
 
+    @staticmethod
+    def macro_vintage_stmt(db_series_code: str, as_of_date: date, start: date) -> Any:
+        """Build the "latest revision per observation_date as of T" query.
+
+        The dedup is pushed into the database with ``DISTINCT ON
+        (observation_date)`` ordered by ``revision_number DESC``, and the
+        PIT filter is a range predicate on the raw ``release_time`` column
+        (see ``_release_cutoff``).  Both are served by the covering
+        ``ix_macro_series_vintage`` index (migration 011).
+
+        Args:
+            db_series_code: Already-normalized ``series_metadata.series_code``.
+            as_of_date: PIT reference date.
+            start: First observation_date to include.
+
+        Returns:
+            SQLAlchemy Select yielding ``(date, value, release_time,
+            revision_number)`` rows ordered by date.
+        """
+        return (
+            select(
+                MacroSeries.observation_date.label("date"),
+                MacroSeries.value,
+                MacroSeries.release_time,
+                MacroSeries.revision_number,
+            )
+            .join(SeriesMetadata, MacroSeries.series_id == SeriesMetadata.id)
+            .where(
+                and_(
+                    SeriesMetadata.series_code == db_series_code,
+                    MacroSeries.release_time < _release_cutoff(as_of_date),
+                    MacroSeries.observation_date >= start,
+                )
+            )
+            .distinct(MacroSeries.observation_date)
+            .order_by(MacroSeries.observation_date, MacroSeries.revision_number.desc())
+        )
+
     def get_latest_macro_value(
         self,
         series_code: str,
@@ -283,7 +316,7 @@ class PointInTimeDataLoader:
                 and_(
                     SeriesMetadata.series_code
                     == self._normalize_series_code(series_code),
-                    cast(MacroSeries.release_time, Date) <= as_of_date,
+                    MacroSeries.release_time < _release_cutoff(as_of_date),
                 )
             )
             .order_by(
@@ -556,6 +589,74 @@ class PointInTimeDataLoader:
         df = df.set_index("date").sort_index()
         return df
 
+    def get_last_prices(
+        self,
+        tickers: list[str],
+        as_of_date: date,
+        lookback_days: Optional[int] = None,
+    ) -> dict[str, tuple[float, date]]:
+        """Load the last known close for many tickers in a single query.
+
+        Uses ``DISTINCT ON (ticker)`` ordered by ``timestamp DESC`` so the
+        database returns exactly one row per ticker, regardless of how
+        much history exists.  Same PIT proxy as ``get_market_data``.
+
+        Args:
+            tickers: Instrument tickers.
+            as_of_date: PIT reference date.
+            lookback_days: Optional staleness bound; closes older than
+                ``as_of_date - lookback_days`` are ignored.  ``None`` = no
+                bound.
+
+        Returns:
+            ``{ticker: (close, price_date)}`` for tickers with a non-null
+            close.  Missing tickers are omitted.
+        """
+        if not tickers:
+            return {}
+
+        end_dt = datetime.combine(as_of_date, time.max, tzinfo=timezone.utc)
+        conditions = [
+            Instrument.ticker.in_(list(tickers)),
+            MarketData.close.is_not(None),
+            MarketData.timestamp <= end_dt,
+        ]
+        if lookback_days is not None:
+            conditions.append(
+                MarketData.timestamp
+                >= datetime.combine(
+                    as_of_date - timedelta(days=lookback_days),
+                    time.min,
+                    tzinfo=timezone.utc,
+                )
+            )
+
+        stmt = (
+            select(Instrument.ticker, MarketData.close, MarketData.timestamp)
+            .join(Instrument, MarketData.instrument_id == Instrument.id)
+            .where(and_(*conditions))
+            .distinct(Instrument.ticker)
+            .order_by(Instrument.ticker, MarketData.timestamp.desc())
+        )
+
+        session = sync_session_factory()
+        try:
+            rows = session.execute(stmt).all()
+        finally:
+            session.close()
+
+        result = {
+            ticker: (float(close), ts.date() if isinstance(ts, datetime) else ts)
+            for ticker, close, ts in rows
+        }
+        self.log.debug(
+            "last_prices_loaded",
+            requested=len(tickers),
+            found=len(result),
+            as_of=str(as_of_date),
+        )
+        return result
+
     # ------------------------------------------------------------------
     # flow_data (PIT via release_time when available, else observation_date)
     # ------------------------------------------------------------------
@@ -596,11 +697,14 @@ class PointInTimeDataLoader:
                     == self._normalize_series_code(series_code),
                     FlowData.observation_date >= start,
                     # PIT: use release_time if available, else observation_date
-                    func.coalesce(
-                        cast(FlowData.release_time, Date),
-                        FlowData.observation_date,
-                    )
-                    <= as_of_date,
+                    # (expanded coalesce so each branch stays sargable)
+                    or_(
+                        FlowData.release_time < _release_cutoff(as_of_date),
+                        and_(
+                            FlowData.release_time.is_(None),
+                            FlowData.observation_date <= as_of_date,
+                        ),
+                    ),
                 )
             )
             .order_by(FlowData.observation_date)
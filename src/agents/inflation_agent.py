@@ -45,6 +45,7 @@ class InflationAgent(BaseAgent):
 
     AGENT_ID = "inflation_agent"
     AGENT_NAME = "Inflation Agent"
+    CPU_BOUND = True  # model fits dominate; stateless across runs
 
     # BCB SGS series codes
     _IPCA_HEADLINE = "BCB-433"
@@ -0,0 +1,387 @@
+"""Shared LRU + TTL result cache for PointInTimeDataLoader.
+
+In a daily run the agents and strategies all call the PIT loader for the
+same handful of series (SELIC, Focus IPCA, the DI curve, USDBRL), each
+call issuing its own query.  ``CachedDataLoader`` memoizes loader results
+in a process-wide ``LoaderCache`` keyed on
+``(method, normalized code, as_of_date, lookback_days)``:
+
+- A request is served from any cached entry for the same
+  ``(method, code, as_of_date)`` with a **wider** lookback, sliced down to
+  the requested window (macro, market and flow data only -- their rows do
+  not depend on the window start).  Curve history is only reused for the
+  exact window because its fuzzy-tenor fallback depends on the window.
+- Memory is bounded by an approximate byte budget with LRU eviction, and
+  entries expire after ``ttl_seconds`` so a long-lived process picks up
+  newly ingested data.
+- ``stats`` exposes hit / miss / eviction counters.
+
+Usage::
+
+    loader = CachedDataLoader()  # uses get_shared_loader_cache()
+    loader.get_macro_series("BR_SELIC_TARGET", date(2024, 6, 14))
+    loader.cache.stats  # {"hits": ..., "misses": ..., ...}
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Optional
+
+import pandas as pd
+import structlog
+
+from src.agents.data_loader import (
+    PointInTimeDataLoader,
+    _normalize_curve_id,
+    _normalize_series_code,
+)
+
+logger = structlog.get_logger()
+
+# Rough per-item overhead for dict / scalar results
+_ITEM_OVERHEAD_BYTES = 64
+
+_PrefixKey = tuple[str, Hashable, date]
+
+
+@dataclass
+class _Entry:
+    value: Any
+    nbytes: int
+    stored_at: float
+
+
+def _sizeof(value: Any) -> int:
+    """Approximate in-memory size of a cached loader result."""
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True, deep=True).sum())
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + _ITEM_OVERHEAD_BYTES * len(value)
+    return sys.getsizeof(value)
+
+
+def _copy(value: Any) -> Any:
+    """Hand out copies so callers cannot mutate the shared entry."""
+    if isinstance(value, pd.DataFrame):
+        return value.copy()
+    if isinstance(value, dict):
+        return dict(value)
+    return value
+
+
+class LoaderCache:
+    """Thread-safe LRU cache of loader results bounded by bytes and age.
+
+    Args:
+        max_bytes: Approximate memory budget; least-recently-used entries
+            are evicted once the total exceeds it.
+        ttl_seconds: Entry lifetime.  ``None`` = never expire.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 256 * 1024 * 1024,
+        ttl_seconds: Optional[float] = 900.0,
+    ) -> None:
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[tuple, _Entry] = OrderedDict()
+        # (method, code, as_of) -> cached lookbacks, for wider-window reuse
+        self._windows: dict[_PrefixKey, set[Optional[int]]] = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Counters and current occupancy."""
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+            }
+
+    def get(
+        self,
+        method: str,
+        code: Hashable,
+        as_of_date: date,
+        lookback_days: Optional[int] = None,
+        widen: bool = False,
+    ) -> tuple[Optional[int], Any]:
+        """Look up a cached result.
+
+        Args:
+            method: Loader method name.
+            code: Normalized series / curve / ticker key.
+            as_of_date: PIT reference date.
+            lookback_days: Requested window (``None`` for window-less calls).
+            widen: Also accept the narrowest cached window that is wider
+                than ``lookback_days``.
+
+        Returns:
+            ``(cached_lookback, value)``; ``value`` is ``None`` on a miss.
+            The value is shared -- callers must copy or slice it.
+        """
+        prefix = (method, code, as_of_date)
+        now = time.monotonic()
+        with self._lock:
+            candidates = [lookback_days]
+            if widen and lookback_days is not None:
+                wider = sorted(
+                    lb
+                    for lb in self._windows.get(prefix, ())
+                    if lb is not None and lb > lookback_days
+                )
+                candidates.extend(wider)
+
+            for lb in candidates:
+                key = (*prefix, lb)
+                entry = self._entries.get(key)
+                if entry is None:
+                    continue
+                if self._expired(entry, now):
+                    self._drop(key)
+                    continue
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return lb, entry.value
+
+            self._misses += 1
+            return None, None
+
+    def put(
+        self,
+        method: str,
+        code: Hashable,
+        as_of_date: date,
+        lookback_days: Optional[int],
+        value: Any,
+    ) -> None:
+        """Store a result, evicting LRU entries beyond the byte budget."""
+        prefix = (method, code, as_of_date)
+        key = (*prefix, lookback_days)
+        nbytes = _sizeof(value)
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            if nbytes > self.max_bytes:
+                return
+            self._entries[key] = _Entry(value, nbytes, time.monotonic())
+            self._windows.setdefault(prefix, set()).add(lookback_days)
+            self._bytes += nbytes
+            while self._bytes > self.max_bytes and self._entries:
+                oldest = next(iter(self._entries))
+                self._drop(oldest)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        """Drop every entry and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self._windows.clear()
+            self._bytes = 0
+            self._hits = self._misses = self._evictions = 0
+
+    def _expired(self, entry: _Entry, now: float) -> bool:
+        return self.ttl_seconds is not None and now - entry.stored_at > self.ttl_seconds
+
+    def _drop(self, key: tuple) -> None:
+        """Remove one entry (caller holds the lock)."""
+        entry = self._entries.pop(key)
+        self._bytes -= entry.nbytes
+        prefix = key[:3]
+        windows = self._windows.get(prefix)
+        if windows is not None:
+            windows.discard(key[3])
+            if not windows:
+                del self._windows[prefix]
+
+
+_SHARED_CACHE: Optional[LoaderCache] = None
+_SHARED_LOCK = threading.Lock()
+
+
+def get_shared_loader_cache() -> LoaderCache:
+    """Return the process-wide cache, sized from settings on first use."""
+    global _SHARED_CACHE
+    with _SHARED_LOCK:
+        if _SHARED_CACHE is None:
+            from src.core.config import settings
+
+            _SHARED_CACHE = LoaderCache(
+                max_bytes=settings.loader_cache_max_mb * 1024 * 1024,
+                ttl_seconds=settings.loader_cache_ttl_seconds,
+            )
+        return _SHARED_CACHE
+
+
+class CachedDataLoader(PointInTimeDataLoader):
+    """PointInTimeDataLoader that memoizes results in a ``LoaderCache``.
+
+    Drop-in replacement: same methods, same return shapes, same PIT rules.
+    Every instance built without an explicit ``cache`` shares the
+    process-wide one, so agents and strategies each holding their own
+    loader still hit the same warm cache.
+
+    Args:
+        cache: Cache to use (default: ``get_shared_loader_cache()``).
+    """
+
+    def __init__(self, cache: Optional[LoaderCache] = None) -> None:
+        super().__init__()
+        self.cache = cache if cache is not None else get_shared_loader_cache()
+
+    def _series_key(self, series_code: str) -> str:
+        """Resolve a series code exactly like the uncached query does."""
+        return self._normalize_series_code(_normalize_series_code(series_code))
+
+    def _windowed(
+        self,
+        method: str,
+        code: str,
+        as_of_date: date,
+        lookback_days: int,
+        start: Any,
+        fetch: Any,
+    ) -> pd.DataFrame:
+        """Serve a date-indexed frame, reusing any wider cached window."""
+        cached_lb, df = self.cache.get(
+            method, code, as_of_date, lookback_days, widen=True
+        )
+        if df is None:
+            df = fetch()
+            self.cache.put(method, code, as_of_date, lookback_days, df)
+            return _copy(df)
+        if cached_lb == lookback_days or df.empty:
+            return _copy(df)
+        return df.loc[df.index >= start].copy()
+
+    # ------------------------------------------------------------------
+    # Cached overrides
+    # ------------------------------------------------------------------
+    def get_macro_series(
+        self,
+        series_code: str,
+        as_of_date: date,
+        lookback_days: int = 3650,
+    ) -> pd.DataFrame:
+        """Cached ``PointInTimeDataLoader.get_macro_series``."""
+        start = pd.Timestamp(as_of_date - timedelta(days=lookback_days))
+        return self._windowed(
+            "macro_series",
+            self._series_key(series_code),
+            as_of_date,
+            lookback_days,
+            start,
+            lambda: super(CachedDataLoader, self).get_macro_series(
+                series_code, as_of_date, lookback_days
+            ),
+        )
+
+    def get_latest_macro_value(
+        self,
+        series_code: str,
+        as_of_date: date,
+    ) -> Optional[float]:
+        """Cached ``PointInTimeDataLoader.get_latest_macro_value``."""
+        code = self._series_key(series_code)
+        _, value = self.cache.get("latest_macro_value", code, as_of_date)
+        if value is None:
+            value = super().get_latest_macro_value(series_code, as_of_date)
+            if value is not None:
+                self.cache.put("latest_macro_value", code, as_of_date, None, value)
+        return value
+
+    def get_curve(self, curve_id: str, as_of_date: date) -> dict[int, float]:
+        """Cached ``PointInTimeDataLoader.get_curve``."""
+        code = _normalize_curve_id(curve_id)
+        _, curve = self.cache.get("curve", code, as_of_date)
+        if curve is None:
+            curve = super().get_curve(curve_id, as_of_date)
+            self.cache.put("curve", code, as_of_date, None, curve)
+        return _copy(curve)
+
+    def get_curve_history(
+        self,
+        curve_id: str,
+        tenor_days: int,
+        as_of_date: date,
+        lookback_days: int = 756,
+    ) -> pd.DataFrame:
+        """Cached ``PointInTimeDataLoader.get_curve_history`` (exact window)."""
+        code = (_normalize_curve_id(curve_id), tenor_days)
+        _, df = self.cache.get("curve_history", code, as_of_date, lookback_days)
+        if df is None:
+            df = super().get_curve_history(
+                curve_id, tenor_days, as_of_date, lookback_days
+            )
+            self.cache.put("curve_history", code, as_of_date, lookback_days, df)
+        return _copy(df)
+
+    def get_market_data(
+        self,
+        ticker: str,
+        as_of_date: date,
+        lookback_days: int = 756,
+    ) -> pd.DataFrame:
+        """Cached ``PointInTimeDataLoader.get_market_data``."""
+        start = pd.Timestamp(
+            datetime.combine(
+                as_of_date - timedelta(days=lookback_days),
+                datetime.min.time(),
+                tzinfo=timezone.utc,
+            )
+        )
+        return self._windowed(
+            "market_data",
+            ticker,
+            as_of_date,
+            lookback_days,
+            start,
+            lambda: super(CachedDataLoader, self).get_market_data(
+                ticker, as_of_date, lookback_days
+            ),
+        )
+
+    def get_flow_data(
+        self,
+        series_code: str,
+        as_of_date: date,
+        lookback_days: int = 365,
+    ) -> pd.DataFrame:
+        """Cached ``PointInTimeDataLoader.get_flow_data``."""
+        start = pd.Timestamp(as_of_date - timedelta(days=lookback_days))
+        return self._windowed(
+            "flow_data",
+            self._series_key(series_code),
+            as_of_date,
+            lookback_days,
+            start,
+            lambda: super(CachedDataLoader, self).get_flow_data(
+                series_code, as_of_date, lookback_days
+            ),
+        )
+
+
+def log_cache_stats(event: str, cache: Optional[LoaderCache] = None) -> None:
+    """Emit the cache counters under ``event`` (used at the end of runs)."""
+    stats = (cache or get_shared_loader_cache()).stats
+    lookups = stats["hits"] + stats["misses"]
+    logger.info(
+        event,
+        hit_rate=round(stats["hits"] / lookups, 3) if lookups else 0.0,
+        **stats,
+    )
@@ -685,6 +685,7 @@ class MonetaryPolicyAgent(BaseAgent):
 
     AGENT_ID = "monetary_agent"
     AGENT_NAME = "Monetary Policy Agent"
+    CPU_BOUND = True  # model fits dominate; stateless across runs
 
     def __init__(self, loader: PointInTimeDataLoader) -> None:
         super().__init__(self.AGENT_ID, self.AGENT_NAME)
@@ -0,0 +1,620 @@
+"""In-memory point-in-time data cube for backtests.
+
+``PointInTimeDataLoader`` opens a session and re-reads years of history on
+every call.  During a backtest the same strategy asks for the same series on
+every rebalance date, so a daily 10-year run issues tens of thousands of
+nearly identical queries.
+
+``PointInTimeDataCube`` is a drop-in subclass that bulk-loads each series
+**once** (all revisions, with their ``release_time``) into sorted NumPy
+arrays and answers every ``as_of_date`` slice from memory:
+
+- ``market_data`` / ``curves``: pure binary search (``np.searchsorted``) on
+  the sorted timestamp column -- O(log n) per call, no DB round trip.
+- ``macro_series``: observations are sorted by ``(observation_date,
+  revision_number DESC)``.  Series whose release dates are monotone in
+  observation order and carry no revisions (the vast majority) are sliced
+  by two binary searches.  Revised series fall back to a vectorized
+  ``release_date <= as_of`` mask plus first-per-date dedup on the
+  lookback slice -- still no DB access.
+- ``flow_data``: same as revised macro series, using
+  ``coalesce(release_date, observation_date)`` as the PIT date.
+
+PIT semantics are identical to the parent loader (``release_time`` is
+compared at date granularity, exactly like ``cast(release_time, Date)``).
+
+Usage::
+
+    cube = PointInTimeDataCube(horizon=config.end_date)
+    strategy = strategy_cls(data_loader=cube)
+    result = BacktestEngine(config, cube).run(strategy)
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Any, Optional
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import and_, select
+
+from src.agents.data_loader import (
+    PointInTimeDataLoader,
+    _normalize_curve_id,
+    _normalize_series_code,
+)
+from src.core.database import sync_session_factory
+from src.core.models.curves import CurveData
+from src.core.models.flow_data import FlowData
+from src.core.models.instruments import Instrument
+from src.core.models.macro_series import MacroSeries
+from src.core.models.market_data import MarketData
+from src.core.models.series_metadata import SeriesMetadata
+
+_MACRO_COLUMNS = ["date", "value", "release_time", "revision_number"]
+_MARKET_COLUMNS = [
+    "date",
+    "open",
+    "high",
+    "low",
+    "close",
+    "volume",
+    "adjusted_close",
+]
+_OHLCV_FIELDS = _MARKET_COLUMNS[1:]
+_FLOW_COLUMNS = ["date", "value", "flow_type", "release_time"]
+
+
+def _to_day(d: date | datetime) -> np.datetime64:
+    """Convert a date/datetime to a ``datetime64[D]`` scalar."""
+    if isinstance(d, datetime):
+        d = d.date()
+    return np.datetime64(d, "D")
+
+
+def _day_array(values: list[Any]) -> np.ndarray:
+    """Build a ``datetime64[D]`` array from dates/datetimes."""
+    return np.array(
+        [v.date() if isinstance(v, datetime) else v for v in values],
+        dtype="datetime64[D]",
+    )
+
+
+# ---------------------------------------------------------------------------
+# Columnar panels
+# ---------------------------------------------------------------------------
+@dataclass
+class _MacroPanel:
+    """All vintages of one macro series, sorted by (obs_date, revision DESC)."""
+
+    obs: np.ndarray  # datetime64[D]
+    value: np.ndarray  # float64
+    release_time: np.ndarray  # object (original datetimes)
+    release_day: np.ndarray  # datetime64[D]
+    revision: np.ndarray  # int64
+    monotone: bool  # single vintage per obs + non-decreasing release days
+
+    @classmethod
+    def from_rows(cls, rows: list[tuple]) -> "_MacroPanel":
+        rows = sorted(rows, key=lambda r: (r[0], -(r[3] or 0)))
+        obs = _day_array([r[0] for r in rows])
+        release_time = np.array([r[2] for r in rows], dtype=object)
+        release_day = _day_array([r[2] for r in rows])
+        revision = np.array([r[3] or 0 for r in rows], dtype=np.int64)
+        monotone = bool(
+            len(rows) == 0
+            or (
+                np.all(obs[1:] > obs[:-1])
+                and np.all(release_day[1:] >= release_day[:-1])
+            )
+        )
+        return cls(
+            obs=obs,
+            value=np.array([r[1] for r in rows], dtype=np.float64),
+            release_time=release_time,
+            release_day=release_day,
+            revision=revision,
+            monotone=monotone,
+        )
+
+    def visible(self, as_of: np.datetime64, start: np.datetime64) -> np.ndarray:
+        """Row indices of the latest vintage per obs_date known at ``as_of``."""
+        lo = int(np.searchsorted(self.obs, start, side="left"))
+        if self.monotone:
+            hi = int(np.searchsorted(self.release_day, as_of, side="right"))
+            return np.arange(lo, max(lo, hi))
+
+        idx = np.arange(lo, len(self.obs))
+        idx = idx[self.release_day[lo:] <= as_of]
+        if len(idx) == 0:
+            return idx
+        # Rows are ordered revision DESC within each obs_date, so the first
+        # surviving row per date is the latest revision known at as_of.
+        obs = self.obs[idx]
+        first = np.ones(len(idx), dtype=bool)
+        first[1:] = obs[1:] != obs[:-1]
+        return idx[first]
+
+
+@dataclass
+class _MarketPanel:
+    """OHLCV history of one ticker, sorted by UTC timestamp."""
+
+    ts: np.ndarray  # datetime64[ns], UTC-naive
+    fields: dict[str, np.ndarray]  # float64 (NaN for NULL)
+
+    @classmethod
+    def from_rows(cls, rows: list[tuple]) -> "_MarketPanel":
+        ts = pd.to_datetime([r[0] for r in rows], utc=True)
+        order = np.argsort(ts.asi8, kind="stable")
+        fields = {
+            name: np.array(
+                [np.nan if r[i + 1] is None else r[i + 1] for r in rows],
+                dtype=np.float64,
+            )[order]
+            for i, name in enumerate(_OHLCV_FIELDS)
+        }
+        return cls(
+            ts=ts.tz_localize(None).values[order].astype("datetime64[ns]"),
+            fields=fields,
+        )
+
+    def window(self, start: datetime, end: datetime) -> slice:
+        lo = np.searchsorted(
+            self.ts, np.datetime64(start.replace(tzinfo=None), "ns"), side="left"
+        )
+        hi = np.searchsorted(
+            self.ts, np.datetime64(end.replace(tzinfo=None), "ns"), side="right"
+        )
+        return slice(int(lo), int(max(lo, hi)))
+
+
+@dataclass
+class _CurvePanel:
+    """Every tenor point of one curve.
+
+    ``dates``/``tenors``/``rates`` are sorted by (curve_date, tenor) so a
+    snapshot is one contiguous block; ``by_tenor`` holds per-tenor
+    histories sorted by date for ``get_curve_history``.
+    """
+
+    dates: np.ndarray  # datetime64[D]
+    tenors: np.ndarray  # int64
+    rates: np.ndarray  # float64
+    snapshot_dates: np.ndarray  # unique curve dates
+    snapshot_starts: np.ndarray  # offset of each snapshot in the flat arrays
+    by_tenor: dict[int, tuple[np.ndarray, np.ndarray]]
+
+    @classmethod
+    def from_rows(cls, rows: list[tuple]) -> "_CurvePanel":
+        rows = sorted(rows, key=lambda r: (r[0], r[1]))
+        dates = _day_array([r[0] for r in rows])
+        tenors = np.array([r[1] for r in rows], dtype=np.int64)
+        rates = np.array([r[2] for r in rows], dtype=np.float64)
+        snapshot_dates, snapshot_starts = np.unique(dates, return_index=True)
+
+        by_tenor: dict[int, tuple[np.ndarray, np.ndarray]] = {}
+        for tenor in np.unique(tenors):
+            mask = tenors == tenor
+            by_tenor[int(tenor)] = (dates[mask], rates[mask])
+
+        return cls(
+            dates=dates,
+            tenors=tenors,
+            rates=rates,
+            snapshot_dates=snapshot_dates,
+            snapshot_starts=snapshot_starts,
+            by_tenor=by_tenor,
+        )
+
+    def tenors_in_window(self, start: np.datetime64, end: np.datetime64) -> list[int]:
+        available = []
+        for tenor, (dates, _) in self.by_tenor.items():
+            lo = np.searchsorted(dates, start, side="left")
+            hi = np.searchsorted(dates, end, side="right")
+            if hi > lo:
+                available.append(tenor)
+        return available
+
+
+@dataclass
+class _FlowPanel:
+    """Flow series sorted by observation_date with a precomputed PIT day."""
+
+    obs: np.ndarray  # datetime64[D]
+    pit_day: np.ndarray  # datetime64[D] = coalesce(release day, obs)
+    value: np.ndarray
+    flow_type: np.ndarray  # object
+    release_time: np.ndarray  # object
+
+    @classmethod
+    def from_rows(cls, rows: list[tuple]) -> "_FlowPanel":
+        rows = sorted(rows, key=lambda r: r[0])
+        obs = _day_array([r[0] for r in rows])
+        pit_day = _day_array([r[3] if r[3] is not None else r[0] for r in rows])
+        return cls(
+            obs=obs,
+            pit_day=pit_day,
+            value=np.array([r[1] for r in rows], dtype=np.float64),
+            flow_type=np.array([r[2] for r in rows], dtype=object),
+            release_time=np.array([r[3] for r in rows], dtype=object),
+        )
+
+
+# ---------------------------------------------------------------------------
+# Cube
+# ---------------------------------------------------------------------------
+class PointInTimeDataCube(PointInTimeDataLoader):
+    """Preloaded, vintage-aware replacement for ``PointInTimeDataLoader``.
+
+    Each series is fetched from the database the first time it is
+    requested (or via :meth:`preload`) and kept in memory for the
+    lifetime of the cube -- typically one backtest.  Subsequent calls
+    never touch the database.
+
+    Args:
+        horizon: Latest ``as_of_date`` the cube will be asked about
+            (usually ``BacktestConfig.end_date``).  Bulk loads are bounded
+            by it so no data past the backtest end is held in memory.
+            ``None`` loads the full history.
+    """
+
+    def __init__(self, horizon: Optional[date] = None) -> None:
+        super().__init__()
+        self.log = self.log.bind(component="pit_data_cube")
+        self.horizon = horizon
+        self._macro: dict[str, _MacroPanel] = {}
+        self._market: dict[str, _MarketPanel] = {}
+        self._curves: dict[str, _CurvePanel] = {}
+        self._flows: dict[str, _FlowPanel] = {}
+        self.stats: dict[str, int] = {"loads": 0, "hits": 0}
+
+    # ------------------------------------------------------------------
+    # Cache management
+    # ------------------------------------------------------------------
+    def preload(
+        self,
+        macro_series: list[str] | None = None,
+        tickers: list[str] | None = None,
+        curves: list[str] | None = None,
+        flow_series: list[str] | None = None,
+    ) -> None:
+        """Eagerly bulk-load the given series (one query each)."""
+        for code in macro_series or []:
+            self._macro_panel(code)
+        for ticker in tickers or []:
+            self._market_panel(ticker)
+        for curve_id in curves or []:
+            self._curve_panel(curve_id)
+        for code in flow_series or []:
+            self._flow_panel(code)
+
+    def clear(self) -> None:
+        """Drop every loaded panel."""
+        self._macro.clear()
+        self._market.clear()
+        self._curves.clear()
+        self._flows.clear()
+
+    def _db_macro_code(self, series_code: str) -> str:
+        return self._normalize_series_code(_normalize_series_code(series_code))
+
+    def _horizon_end(self) -> datetime:
+        return datetime.combine(self.horizon or date.max, time.max, tzinfo=timezone.utc)
+
+    def _macro_panel(self, series_code: str) -> _MacroPanel:
+        key = self._db_macro_code(series_code)
+        panel = self._macro.get(key)
+        if panel is None:
+            panel = _MacroPanel.from_rows(self._fetch_macro_rows(key))
+            self._macro[key] = panel
+            self.stats["loads"] += 1
+            self.log.debug("cube_macro_loaded", series=key, rows=len(panel.obs))
+        else:
+            self.stats["hits"] += 1
+        return panel
+
+    def _market_panel(self, ticker: str) -> _MarketPanel:
+        panel = self._market.get(ticker)
+        if panel is None:
+            panel = _MarketPanel.from_rows(self._fetch_market_rows(ticker))
+            self._market[ticker] = panel
+            self.stats["loads"] += 1
+            self.log.debug("cube_market_loaded", ticker=ticker, rows=len(panel.ts))
+        else:
+            self.stats["hits"] += 1
+        return panel
+
+    def _curve_panel(self, curve_id: str) -> _CurvePanel:
+        key = _normalize_curve_id(curve_id)
+        panel = self._curves.get(key)
+        if panel is None:
+            panel = _CurvePanel.from_rows(self._fetch_curve_rows(key))
+            self._curves[key] = panel
+            self.stats["loads"] += 1
+            self.log.debug("cube_curve_loaded", curve_id=key, rows=len(panel.dates))
+        else:
+            self.stats["hits"] += 1
+        return panel
+
+    def _flow_panel(self, series_code: str) -> _FlowPanel:
+        key = self._db_macro_code(series_code)
+        panel = self._flows.get(key)
+        if panel is None:
+            panel = _FlowPanel.from_rows(self._fetch_flow_rows(key))
+            self._flows[key] = panel
+            self.stats["loads"] += 1
+            self.log.debug("cube_flow_loaded", series=key, rows=len(panel.obs))
+        else:
+            self.stats["hits"] += 1
+        return panel
+
+    # ------------------------------------------------------------------
+    # Bulk fetchers (one query per series, bounded by horizon)
+    # ------------------------------------------------------------------
+    def _fetch_macro_rows(self, db_code: str) -> list[tuple]:
+        stmt = (
+            select(
+                MacroSeries.observation_date,
+                MacroSeries.value,
+                MacroSeries.release_time,
+                MacroSeries.revision_number,
+            )
+            .join(SeriesMetadata, MacroSeries.series_id == SeriesMetadata.id)
+            .where(
+                and_(
+                    SeriesMetadata.series_code == db_code,
+                    MacroSeries.release_time <= self._horizon_end(),
+                )
+            )
+        )
+        return self._execute(stmt)
+
+    def _fetch_market_rows(self, ticker: str) -> list[tuple]:
+        stmt = (
+            select(
+                MarketData.timestamp,
+                MarketData.open,
+                MarketData.high,
+                MarketData.low,
+                MarketData.close,
+                MarketData.volume,
+                MarketData.adjusted_close,
+            )
+            .join(Instrument, MarketData.instrument_id == Instrument.id)
+            .where(
+                and_(
+                    Instrument.ticker == ticker,
+                    MarketData.timestamp <= self._horizon_end(),
+                )
+            )
+        )
+        return self._execute(stmt)
+
+    def _fetch_curve_rows(self, curve_id: str) -> list[tuple]:
+        stmt = select(CurveData.curve_date, CurveData.tenor_days, CurveData.rate).where(
+            and_(
+                CurveData.curve_id == curve_id,
+                CurveData.curve_date <= (self.horizon or date.max),
+            )
+        )
+        return self._execute(stmt)
+
+    def _fetch_flow_rows(self, db_code: str) -> list[tuple]:
+        stmt = (
+            select(
+                FlowData.observation_date,
+                FlowData.value,
+                FlowData.flow_type,
+                FlowData.release_time,
+            )
+            .join(SeriesMetadata, FlowData.series_id == SeriesMetadata.id)
+            .where(
+                and_(
+                    SeriesMetadata.series_code == db_code,
+                    FlowData.observation_date <= (self.horizon or date.max),
+                )
+            )
+        )
+        return self._execute(stmt)
+
+    @staticmethod
+    def _execute(stmt: Any) -> list[tuple]:
+        session = sync_session_factory()
+        try:
+            return [tuple(r) for r in session.execute(stmt).all()]
+        finally:
+            session.close()
+
+    # ------------------------------------------------------------------
+    # PointInTimeDataLoader interface (served from memory)
+    # ------------------------------------------------------------------
+    def get_macro_series(
+        self,
+        series_code: str,
+        as_of_date: date,
+        lookback_days: int = 3650,
+    ) -> pd.DataFrame:
+        """Same contract as ``PointInTimeDataLoader.get_macro_series``."""
+        panel = self._macro_panel(series_code)
+        start = _to_day(as_of_date - timedelta(days=lookback_days))
+        idx = panel.visible(_to_day(as_of_date), start)
+        if len(idx) == 0:
+            return pd.DataFrame(columns=_MACRO_COLUMNS)
+
+        df = pd.DataFrame(
+            {
+                "date": panel.obs[idx].astype("datetime64[ns]"),
+                "value": panel.value[idx],
+                "release_time": panel.release_time[idx],
+                "revision_number": panel.revision[idx],
+            }
+        )
+        return df.set_index("date")
+
+    def get_latest_macro_value(
+        self,
+        series_code: str,
+        as_of_date: date,
+    ) -> Optional[float]:
+        """Same contract as ``PointInTimeDataLoader.get_latest_macro_value``."""
+        panel = self._macro_panel(series_code)
+        if len(panel.obs) == 0:
+            return None
+        idx = panel.visible(_to_day(as_of_date), panel.obs[0])
+        if len(idx) == 0:
+            return None
+        return float(panel.value[idx[-1]])
+
+    def get_curve(
+        self,
+        curve_id: str,
+        as_of_date: date,
+    ) -> dict[int, float]:
+        """Same contract as ``PointInTimeDataLoader.get_curve``."""
+        panel = self._curve_panel(curve_id)
+        pos = (
+            int(
+                np.searchsorted(panel.snapshot_dates, _to_day(as_of_date), side="right")
+            )
+            - 1
+        )
+        if pos < 0:
+            return {}
+        lo = int(panel.snapshot_starts[pos])
+        hi = (
+            int(panel.snapshot_starts[pos + 1])
+            if pos + 1 < len(panel.snapshot_starts)
+            else len(panel.dates)
+        )
+        return {
+            int(t): float(r) for t, r in zip(panel.tenors[lo:hi], panel.rates[lo:hi])
+        }
+
+    def get_curve_history(
+        self,
+        curve_id: str,
+        tenor_days: int,
+        as_of_date: date,
+        lookback_days: int = 756,
+    ) -> pd.DataFrame:
+        """Same contract as ``PointInTimeDataLoader.get_curve_history``.
+
+        Includes the parent's fuzzy-tenor fallback (closest tenor within
+        20%, minimum 30 days).
+        """
+        panel = self._curve_panel(curve_id)
+        start = _to_day(as_of_date - timedelta(days=lookback_days))
+        end = _to_day(as_of_date)
+
+        tenor = tenor_days
+        if tenor not in panel.by_tenor or not self._tenor_has_rows(
+            panel, tenor, start, end
+        ):
+            available = panel.tenors_in_window(start, end)
+            if not available:
+                return pd.DataFrame(columns=["date", "rate"])
+            closest = min(available, key=lambda t: abs(t - tenor_days))
+            if abs(closest - tenor_days) > max(30, int(tenor_days * 0.20)):
+                return pd.DataFrame(columns=["date", "rate"])
+            tenor = closest
+
+        dates, rates = panel.by_tenor[tenor]
+        lo = int(np.searchsorted(dates, start, side="left"))
+        hi = int(np.searchsorted(dates, end, side="right"))
+        df = pd.DataFrame(
+            {"date": dates[lo:hi].astype("datetime64[ns]"), "rate": rates[lo:hi]}
+        )
+        return df.set_index("date")
+
+    @staticmethod
+    def _tenor_has_rows(
+        panel: _CurvePanel, tenor: int, start: np.datetime64, end: np.datetime64
+    ) -> bool:
+        dates, _ = panel.by_tenor[tenor]
+        return bool(
+            np.searchsorted(dates, end, side="right")
+            > np.searchsorted(dates, start, side="left")
+        )
+
+    def get_market_data(
+        self,
+        ticker: str,
+        as_of_date: date,
+        lookback_days: int = 756,
+    ) -> pd.DataFrame:
+        """Same contract as ``PointInTimeDataLoader.get_market_data``."""
+        panel = self._market_panel(ticker)
+        start_dt = datetime.combine(
+            as_of_date - timedelta(days=lookback_days),
+            time.min,
+            tzinfo=timezone.utc,
+        )
+        end_dt = datetime.combine(as_of_date, time.max, tzinfo=timezone.utc)
+        window = panel.window(start_dt, end_dt)
+        if window.stop <= window.start:
+            return pd.DataFrame(columns=_MARKET_COLUMNS)
+
+        data: dict[str, Any] = {
+            "date": pd.to_datetime(panel.ts[window]).tz_localize(timezone.utc)
+        }
+        for name in _OHLCV_FIELDS:
+            data[name] = panel.fields[name][window]
+        return pd.DataFrame(data).set_index("date")
+
+    def get_last_prices(
+        self,
+        tickers: list[str],
+        as_of_date: date,
+        lookback_days: Optional[int] = None,
+    ) -> dict[str, tuple[float, date]]:
+        """Same contract as ``PointInTimeDataLoader.get_last_prices``.
+
+        One binary search per ticker on the preloaded panel.
+        """
+        end = np.datetime64(datetime.combine(as_of_date, time.max), "ns")
+        start = (
+            np.datetime64(as_of_date - timedelta(days=lookback_days), "ns")
+            if lookback_days is not None
+            else None
+        )
+        result: dict[str, tuple[float, date]] = {}
+        for ticker in tickers:
+            panel = self._market_panel(ticker)
+            close = panel.fields["close"]
+            lo = 0 if start is None else int(np.searchsorted(panel.ts, start, "left"))
+            pos = int(np.searchsorted(panel.ts, end, side="right")) - 1
+            # Step back over NULL closes (rare) within the window
+            while pos >= lo and np.isnan(close[pos]):
+                pos -= 1
+            if pos >= lo:
+                ts = pd.Timestamp(panel.ts[pos])
+                result[ticker] = (float(close[pos]), ts.date())
+        return result
+
+    def get_flow_data(
+        self,
+        series_code: str,
+        as_of_date: date,
+        lookback_days: int = 365,
+    ) -> pd.DataFrame:
+        """Same contract as ``PointInTimeDataLoader.get_flow_data``."""
+        panel = self._flow_panel(series_code)
+        start = _to_day(as_of_date - timedelta(days=lookback_days))
+        lo = int(np.searchsorted(panel.obs, start, side="left"))
+        idx = np.arange(lo, len(panel.obs))
+        idx = idx[panel.pit_day[lo:] <= _to_day(as_of_date)]
+        if len(idx) == 0:
+            return pd.DataFrame(columns=_FLOW_COLUMNS)
+
+        df = pd.DataFrame(
+            {
+                "date": panel.obs[idx].astype("datetime64[ns]"),
+                "value": panel.value[idx],
+                "flow_type": panel.flow_type[idx],
+                "release_time": panel.release_time[idx],
+            }
+        )
+        return df.set_index("date")
@@ -2,17 +2,42 @@
 
 Manages registration, lookup, and ordered execution of all analytical agents.
 Execution order: inflation -> monetary -> fiscal -> fx -> cross_asset
+
+``run_all`` executes agents as a dependency DAG (``DEPENDENCIES``): agents
+in the same wave load their data concurrently on a thread pool, and
+``CPU_BOUND`` agents run compute_features/run_models in a spawn-started
+process pool.
+Dependents (cross_asset) start only after their whole wave completed.
+
+During ``run_all`` / ``run_all_backtest`` agents holding a plain
+``PointInTimeDataLoader`` are temporarily switched to one shared
+``CachedDataLoader`` so overlapping series are queried once per run.
 """
 
+import copy
+import multiprocessing
+import os
+import pickle
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import date
+from typing import Any, Iterator, Optional
 
 import structlog
 
 from src.agents.base import AgentReport, BaseAgent
+from src.agents.data_loader import PointInTimeDataLoader
+from src.agents.loader_cache import CachedDataLoader, log_cache_stats
 
 logger = structlog.get_logger()
 
 
+def _model_stages_from_payload(payload: bytes) -> tuple[list, str, dict[str, float]]:
+    """Process-pool entry point: unpickle (agent, data) and run the models."""
+    agent, data = pickle.loads(payload)
+    return agent.model_stages(data)
+
+
 class AgentRegistry:
     """Registry of all active agents.
 
@@ -37,6 +62,16 @@ class AgentRegistry:
         "cross_asset_agent",
     ]
 
+    # agent_id -> agent_ids it must run after (unregistered ones are ignored)
+    DEPENDENCIES: dict[str, list[str]] = {
+        "cross_asset_agent": [
+            "inflation_agent",
+            "monetary_agent",
+            "fiscal_agent",
+            "fx_agent",
+        ],
+    }
+
     @classmethod
     def register(cls, agent: BaseAgent) -> None:
         """Register an agent instance.
@@ -121,39 +156,180 @@ class AgentRegistry:
         return ordered
 
     @classmethod
-    def run_all(cls, as_of_date: date) -> dict[str, AgentReport]:
-        """Execute all registered agents in dependency order.
+    @contextmanager
+    def _shared_loader(cls) -> Iterator[CachedDataLoader]:
+        """Point every agent's plain loader at one cached loader for a run.
+
+        Only exact ``PointInTimeDataLoader`` instances are swapped; cubes,
+        already-cached loaders and test doubles are left alone.  Original
+        loaders are restored on exit.
+        """
+        shared = CachedDataLoader()
+        swapped: list[tuple[BaseAgent, PointInTimeDataLoader]] = []
+        for agent in cls._agents.values():
+            loader = getattr(agent, "loader", None)
+            if type(loader) is PointInTimeDataLoader:
+                swapped.append((agent, loader))
+                agent.loader = shared
+        try:
+            yield shared
+        finally:
+            for agent, loader in swapped:
+                agent.loader = loader
+            if swapped:
+                log_cache_stats("agent_run_loader_cache", shared.cache)
+
+    @classmethod
+    def _execution_waves(cls) -> list[list[str]]:
+        """Group registered agents into dependency levels.
+
+        Wave *n* holds the agents whose registered dependencies all sit in
+        waves ``< n``; within a wave ``_ordered_agent_ids`` order is kept.
+
+        Raises:
+            ValueError: If ``DEPENDENCIES`` contains a cycle.
+        """
+        ordered = cls._ordered_agent_ids()
+        registered = set(ordered)
+        level: dict[str, int] = {}
+
+        def depth(agent_id: str, path: tuple[str, ...]) -> int:
+            if agent_id in level:
+                return level[agent_id]
+            if agent_id in path:
+                raise ValueError(
+                    f"Agent dependency cycle: {' -> '.join(path + (agent_id,))}"
+                )
+            deps = [d for d in cls.DEPENDENCIES.get(agent_id, []) if d in registered]
+            level[agent_id] = 1 + max(
+                (depth(d, path + (agent_id,)) for d in deps), default=-1
+            )
+            return level[agent_id]
+
+        for agent_id in ordered:
+            depth(agent_id, ())
+
+        waves: list[list[str]] = [[] for _ in range(max(level.values(), default=-1) + 1)]
+        for agent_id in ordered:
+            waves[level[agent_id]].append(agent_id)
+        return waves
+
+    @classmethod
+    def _run_agent_stages(
+        cls,
+        agent: BaseAgent,
+        as_of_date: date,
+        process_pool: Optional[Executor],
+    ) -> AgentReport:
+        """Run one agent: load on this thread, models here or in a process."""
+        logger.info("agent_run_starting", agent_id=agent.agent_id)
+        data, timings = agent.load_stage(as_of_date)
+        data_flags = agent._check_data_quality(data)
+
+        payload: Optional[bytes] = None
+        if process_pool is not None and agent.CPU_BOUND:
+            detached = copy.copy(agent)
+            if hasattr(detached, "loader"):
+                detached.loader = None  # not needed past load_data
+            try:
+                payload = pickle.dumps((detached, data))
+            except Exception as exc:
+                logger.warning(
+                    "agent_process_pool_skipped",
+                    agent_id=agent.agent_id,
+                    reason=str(exc),
+                )
+
+        if payload is not None:
+            signals, narrative, model_timings = process_pool.submit(
+                _model_stages_from_payload, payload
+            ).result()
+        else:
+            signals, narrative, model_timings = agent.model_stages(data)
+        timings.update(model_timings)
+        return agent.finish_run(as_of_date, signals, narrative, data_flags, timings)
+
+    @classmethod
+    def run_all(
+        cls,
+        as_of_date: date,
+        max_workers: Optional[int] = None,
+        use_processes: bool = True,
+    ) -> dict[str, AgentReport]:
+        """Execute all registered agents concurrently along the dependency DAG.
 
         Each agent is wrapped in try/except so that a failure in one agent
-        does not abort the remaining agents.
+        does not abort the remaining agents (dependents still run).
 
         Args:
             as_of_date: Point-in-time reference date.
+            max_workers: Thread pool size (default: widest wave).
+            use_processes: Run ``CPU_BOUND`` agents' model stages in a
+                process pool.  ``False`` keeps everything in-process.
 
         Returns:
-            ``{agent_id: AgentReport}`` for agents that completed successfully.
+            ``{agent_id: AgentReport}`` for agents that completed successfully,
+            in execution order.  Each report carries per-stage timings in
+            ``model_diagnostics["stage_timings"]``.
         """
-        reports: dict[str, AgentReport] = {}
-        for agent_id in cls._ordered_agent_ids():
-            agent = cls._agents[agent_id]
-            try:
-                logger.info("agent_run_starting", agent_id=agent_id)
-                report = agent.run(as_of_date)
-                reports[agent_id] = report
-            except Exception:
-                logger.exception(
-                    "agent_run_failed",
-                    agent_id=agent_id,
-                    as_of_date=str(as_of_date),
-                )
-        return reports
+        waves = cls._execution_waves()
+        if not waves:
+            return {}
+
+        n_threads = max_workers or max(len(w) for w in waves)
+        n_cpu = sum(1 for a in cls._agents.values() if a.CPU_BOUND)
+        process_pool: Optional[ProcessPoolExecutor] = None
+        if use_processes and n_cpu:
+            # Workers start lazily on the first submit, from an agent thread
+            # while other threads may hold locks (loader cache, logging, DB
+            # pool); fork would copy those locks held into the child.
+            process_pool = ProcessPoolExecutor(
+                max_workers=min(n_cpu, n_threads, os.cpu_count() or 1),
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+
+        completed: dict[str, AgentReport] = {}
+        try:
+            with cls._shared_loader(), ThreadPoolExecutor(
+                max_workers=n_threads, thread_name_prefix="agent"
+            ) as threads:
+                for wave in waves:
+                    futures: dict[str, Any] = {
+                        agent_id: threads.submit(
+                            cls._run_agent_stages,
+                            cls._agents[agent_id],
+                            as_of_date,
+                            process_pool,
+                        )
+                        for agent_id in wave
+                    }
+                    for agent_id, future in futures.items():
+                        try:
+                            completed[agent_id] = future.result()
+                        except Exception:
+                            logger.exception(
+                                "agent_run_failed",
+                                agent_id=agent_id,
+                                as_of_date=str(as_of_date),
+                            )
+        finally:
+            if process_pool is not None:
+                process_pool.shutdown()
+
+        return {
+            agent_id: completed[agent_id]
+            for agent_id in cls._ordered_agent_ids()
+            if agent_id in completed
+        }
 
     @classmethod
     def run_all_backtest(cls, as_of_date: date) -> dict[str, AgentReport]:
         """Execute all registered agents in dependency order (backtest mode).
 
-        Same as ``run_all`` but calls ``backtest_run()`` which does NOT
-        persist signals or reports to the database.
+        Same agents as ``run_all`` but calls ``backtest_run()`` which does NOT
+        persist signals or reports to the database.  Runs sequentially:
+        backtests call this once per date and parallelise across dates /
+        walk-forward trials instead.
 
         Args:
             as_of_date: Point-in-time reference date.
@@ -162,18 +338,19 @@ class AgentRegistry:
             ``{agent_id: AgentReport}`` for agents that completed successfully.
         """
         reports: dict[str, AgentReport] = {}
-        for agent_id in cls._ordered_agent_ids():
-            agent = cls._agents[agent_id]
-            try:
-                logger.info("agent_backtest_starting", agent_id=agent_id)
-                report = agent.backtest_run(as_of_date)
-                reports[agent_id] = report
-            except Exception:
-                logger.exception(
-                    "agent_backtest_failed",
-                    agent_id=agent_id,
-                    as_of_date=str(as_of_date),
-                )
+        with cls._shared_loader():
+            for agent_id in cls._ordered_agent_ids():
+                agent = cls._agents[agent_id]
+                try:
+                    logger.info("agent_backtest_starting", agent_id=agent_id)
+                    report = agent.backtest_run(as_of_date)
+                    reports[agent_id] = report
+                except Exception:
+                    logger.exception(
+                        "agent_backtest_failed",
+                        agent_id=agent_id,
+                        as_of_date=str(as_of_date),
+                    )
         return reports
 
     @classmethod
@@ -4,6 +4,7 @@ Configures CORS, lifespan startup/shutdown, and mounts all route modules.
 Run with:  uvicorn src.api.main:app --reload --host 0.0.0.0 --port 8000
 """
 
+import asyncio
 import logging
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
@@ -42,6 +43,7 @@ from src.api.routes.pms_portfolio import router as pms_portfolio_router
 from src.api.routes.pms_risk import router as pms_risk_router
 from src.api.routes.pms_trades import router as pms_trades_router
 from src.api.routes.reports_api import router as reports_api_router
+from src.api.routes.websocket_api import manager as websocket_manager
 from src.api.routes.websocket_api import router as websocket_router
 from src.core.config import settings
 from src.core.database import async_engine
@@ -91,8 +93,31 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     except Exception as exc:
         logger.warning("Agent registration skipped: %s", exc)
 
+    # Warm the incremental risk state so VaR reads need no refit, then
+    # follow the states published after startup
+    from src.risk.risk_state import warm_shared_risk_state, watch_shared_risk_state
+
+    try:
+        await warm_shared_risk_state()
+    except Exception as exc:
+        logger.warning("Risk state warm-up skipped: %s", exc)
+    risk_state_task = asyncio.create_task(watch_shared_risk_state())
+
+    # Background producer for the materialized /risk snapshot
+    snapshot_task = asyncio.create_task(risk_api.get_risk_snapshot_service().run())
+
+    # Share WebSocket channels across workers (falls back to in-process)
+    from src.api.ws_broadcast import RedisPubSub
+    from src.core.redis import get_redis
+
+    await websocket_manager.start_bridge(RedisPubSub(await get_redis()))
+
     yield
     # Shutdown
+    snapshot_task.cancel()
+    risk_state_task.cancel()
+    await websocket_manager.stop_bridge()
+    risk_api.get_risk_snapshot_service().close()
     await async_engine.dispose()
     logger.info("Database engine disposed")
 
@@ -85,7 +85,7 @@ async def run_backtest(request: BacktestRunRequest):
             else date(2024, 12, 31)
         )
 
-        from src.agents.data_loader import PointInTimeDataLoader
+        from src.agents.pit_data_cube import PointInTimeDataCube
         from src.backtesting.engine import BacktestConfig, BacktestEngine
 
         config = BacktestConfig(
@@ -98,7 +98,8 @@ async def run_backtest(request: BacktestRunRequest):
             request.strategy_id,
             StrategyRegistry._strategies.get(request.strategy_id),
         )
-        loader = PointInTimeDataLoader()
+        # Preloaded PIT cube: each series hits the DB once per backtest
+        loader = PointInTimeDataCube(horizon=end)
         strategy = strategy_cls(data_loader=loader)
 
         engine = BacktestEngine(config, loader)
@@ -237,7 +238,7 @@ async def portfolio_backtest(request: PortfolioBacktestRequest):
         weights = {sid: 1.0 / n for sid in request.strategy_ids}
 
     try:
-        from src.agents.data_loader import PointInTimeDataLoader
+        from src.agents.pit_data_cube import PointInTimeDataCube
         from src.backtesting.engine import BacktestConfig, BacktestEngine
         from src.strategies import ALL_STRATEGIES
         from src.strategies.registry import StrategyRegistry
@@ -255,7 +256,7 @@ async def portfolio_backtest(request: PortfolioBacktestRequest):
             initial_capital=1_000_000.0,
         )
 
-        loader = PointInTimeDataLoader()
+        loader = PointInTimeDataCube(horizon=config.end_date)
         strategies = []
         for sid in request.strategy_ids:
             strategy_cls = ALL_STRATEGIES.get(
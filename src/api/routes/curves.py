@@ -1,18 +1,21 @@
 """Yield-curve and rate-curve endpoints.
 
-Exposes curve snapshots by date, tenor-level history, and a list of
-available curve identifiers.
+Exposes curve snapshots by date, tenor-level history (single tenor, or
+many tenors streamed as columnar JSON / Arrow), and a list of available
+curve identifiers.
 """
 
 from datetime import date
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.api.deps import get_db
+from src.api.streaming import columnar_response, negotiate_format, stream_rows
 from src.core.models.curves import CurveData
 
 router = APIRouter(prefix="/curves", tags=["Curves"])
@@ -136,3 +139,63 @@ async def get_curve_history(
         )
 
     return [CurveHistoryPoint(date=r.curve_date, rate=r.rate) for r in rows]
+
+
+# ---------------------------------------------------------------------------
+# GET /api/v1/curves/{curve_id}/history/bulk
+# ---------------------------------------------------------------------------
+_BULK_HISTORY_COLUMNS = (
+    ("date", "date"),
+    ("tenor_label", "str"),
+    ("tenor_days", "int"),
+    ("rate", "float"),
+)
+
+
+@router.get("/{curve_id}/history/bulk", response_class=StreamingResponse)
+async def bulk_curve_history(
+    request: Request,
+    curve_id: str,
+    tenors: Optional[str] = Query(
+        None, description="Comma-separated tenor labels, e.g. 1Y,5Y (default: all)"
+    ),
+    start: Optional[date] = Query(None, description="Start date"),
+    end: Optional[date] = Query(None, description="End date"),
+    format: Optional[str] = Query(
+        None, description="json (columnar) or arrow; defaults to the Accept header"
+    ),
+    session: AsyncSession = Depends(get_db),
+) -> StreamingResponse:
+    """Stream rate history for many tenors of a curve as columnar JSON or Arrow.
+
+    Rows are ordered by date, then tenor_days.  See ``src.api.streaming``
+    for the payload layout.
+    """
+    fmt = negotiate_format(request, format)
+
+    # Existence check before the stream starts (a 404 can't be sent mid-body)
+    exists = (
+        await session.execute(
+            select(CurveData.curve_id).where(CurveData.curve_id == curve_id).limit(1)
+        )
+    ).scalar_one_or_none()
+    if exists is None:
+        raise HTTPException(status_code=404, detail=f"No data for curve '{curve_id}'")
+
+    stmt = select(
+        CurveData.curve_date,
+        CurveData.tenor_label,
+        CurveData.tenor_days,
+        CurveData.rate,
+    ).where(CurveData.curve_id == curve_id)
+
+    tenor_list = [t.strip() for t in (tenors or "").split(",") if t.strip()]
+    if tenor_list:
+        stmt = stmt.where(CurveData.tenor_label.in_(tenor_list))
+    if start:
+        stmt = stmt.where(CurveData.curve_date >= start)
+    if end:
+        stmt = stmt.where(CurveData.curve_date <= end)
+    stmt = stmt.order_by(CurveData.curve_date.asc(), CurveData.tenor_days.asc())
+
+    return columnar_response(request, stream_rows(stmt), _BULK_HISTORY_COLUMNS, fmt)
@@ -3,12 +3,14 @@
 from datetime import date, datetime
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.api.deps import get_db
+from src.api.streaming import columnar_response, negotiate_format, stream_rows
 from src.core.models.instruments import Instrument
 from src.core.models.market_data import MarketData
 
@@ -75,6 +77,81 @@ async def latest_prices(
     return result
 
 
+# ---------------------------------------------------------------------------
+# GET /api/v1/market-data/bulk  (before parameterised route)
+# ---------------------------------------------------------------------------
+_BULK_COLUMNS = (
+    ("ticker", "str"),
+    ("timestamp", "timestamp"),
+    ("open", "float"),
+    ("high", "float"),
+    ("low", "float"),
+    ("close", "float"),
+    ("volume", "float"),
+)
+
+
+@router.get("/bulk", response_class=StreamingResponse)
+async def bulk_market_data(
+    request: Request,
+    tickers: str = Query(
+        ..., description="Comma-separated tickers, e.g. USDBRL,IBOVESPA,VIX"
+    ),
+    start: Optional[date] = Query(None, description="Start date"),
+    end: Optional[date] = Query(None, description="End date"),
+    format: Optional[str] = Query(
+        None, description="json (columnar) or arrow; defaults to the Accept header"
+    ),
+    session: AsyncSession = Depends(get_db),
+) -> StreamingResponse:
+    """Stream OHLCV history for many instruments as columnar JSON or Arrow.
+
+    Rows are ordered by ticker, then timestamp.  See ``src.api.streaming``
+    for the payload layout.
+    """
+    fmt = negotiate_format(request, format)
+    ticker_list = list(dict.fromkeys(t.strip() for t in tickers.split(",") if t.strip()))
+    if not ticker_list:
+        raise HTTPException(status_code=400, detail="No tickers given")
+
+    # Resolve up front: errors must be raised before the stream starts
+    known = (
+        await session.execute(
+            select(Instrument.ticker).where(Instrument.ticker.in_(ticker_list))
+        )
+    ).scalars().all()
+    missing = sorted(set(ticker_list) - set(known))
+    if missing:
+        raise HTTPException(
+            status_code=404, detail=f"Instruments not found: {', '.join(missing)}"
+        )
+
+    stmt = (
+        select(
+            Instrument.ticker,
+            MarketData.timestamp,
+            MarketData.open,
+            MarketData.high,
+            MarketData.low,
+            MarketData.close,
+            MarketData.volume,
+        )
+        .join(Instrument, MarketData.instrument_id == Instrument.id)
+        .where(Instrument.ticker.in_(ticker_list))
+    )
+    if start:
+        stmt = stmt.where(
+            MarketData.timestamp >= datetime.combine(start, datetime.min.time())
+        )
+    if end:
+        stmt = stmt.where(
+            MarketData.timestamp <= datetime.combine(end, datetime.max.time())
+        )
+    stmt = stmt.order_by(Instrument.ticker.asc(), MarketData.timestamp.asc())
+
+    return columnar_response(request, stream_rows(stmt), _BULK_COLUMNS, fmt)
+
+
 # ---------------------------------------------------------------------------
 # GET /api/v1/market-data/{ticker}
 # ---------------------------------------------------------------------------
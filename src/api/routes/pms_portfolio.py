@@ -33,7 +33,9 @@ from src.api.schemas.pms_schemas import (
     UpdatePriceRequest,
 )
 from src.api.auth import Role, require_role
+from src.api.routes import risk_api
 from src.cache import PMSCache, get_pms_cache
+from src.pms.mtm_service import get_price_cache
 
 logger = logging.getLogger(__name__)
 
@@ -166,6 +168,7 @@ async def open_position(
         position = result["position"]
 
         # Write-through: invalidate + refresh book cache
+        risk_api.notify_book_changed()
         try:
             await cache.invalidate_portfolio_data()
             new_book = wf.position_manager.get_book()
@@ -204,6 +207,7 @@ async def close_position(
         )
 
         # Write-through: invalidate + refresh book cache
+        risk_api.notify_book_changed()
         try:
             await cache.invalidate_portfolio_data()
             new_book = wf.position_manager.get_book()
@@ -247,6 +251,7 @@ async def update_price(
         position["updated_at"] = datetime.now(tz=timezone.utc)
 
         # Write-through: invalidate + refresh book cache
+        risk_api.notify_book_changed()
         try:
             await cache.invalidate_portfolio_data()
             new_book = wf.position_manager.get_book()
@@ -275,12 +280,19 @@ async def run_mark_to_market(
     """Mark all open positions to market (MANAGER only)."""
     try:
         wf = _get_workflow()
+
+        # Drop cached latest prices if bars were ingested since the last MTM
+        versions = await cache.get_versions()
+        if versions is not None:
+            get_price_cache().observe_version(versions["price"])
+
         updated = wf.position_manager.mark_to_market(
             price_overrides=body.price_overrides or None,
             current_fx_rate=body.fx_rate,
         )
 
         # Write-through: invalidate + refresh book cache after MTM
+        risk_api.notify_book_changed()
         try:
             await cache.invalidate_portfolio_data()
             new_book = wf.position_manager.get_book()
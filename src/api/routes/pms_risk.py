@@ -16,6 +16,7 @@ from fastapi import APIRouter, Body, Depends, HTTPException, Query
 from pydantic import BaseModel
 
 from src.api.auth import Role, require_role
+from src.api.routes import risk_api
 from src.api.schemas.pms_schemas import (
     LiveRiskResponse,
     RiskTrendPointResponse,
@@ -38,9 +39,12 @@ def _get_service():
     if _service is None:
         from src.pms import PositionManager
         from src.pms.risk_monitor import RiskMonitorService
+        from src.risk.risk_state import get_shared_risk_state
 
         pm = PositionManager()
-        _service = RiskMonitorService(position_manager=pm)
+        _service = RiskMonitorService(
+            position_manager=pm, risk_state=get_shared_risk_state
+        )
         # Hydrate from DB so in-memory stores have real data
         try:
             from src.pms.db_loader import hydrate_position_manager
@@ -189,6 +193,7 @@ async def trigger_emergency_stop(
             logger.warning("Audit log failed for emergency stop")
 
         # Invalidate cache
+        risk_api.notify_book_changed()
         try:
             await cache.invalidate_portfolio_data()
         except Exception:
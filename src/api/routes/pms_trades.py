@@ -2,6 +2,7 @@
 
 Provides:
 - GET  /pms/trades/proposals                        -- list trade proposals
+- GET  /pms/trades/proposals/risk-impact            -- batch pre-trade risk impact
 - GET  /pms/trades/proposals/{id}                   -- single proposal detail
 - POST /pms/trades/proposals/{id}/approve           -- approve a pending proposal
 - POST /pms/trades/proposals/{id}/reject            -- reject a pending proposal
@@ -18,6 +19,7 @@ from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
 
 from src.api.auth import Role, require_role
+from src.api.routes import risk_api
 from src.api.schemas.pms_schemas import (
     ApproveProposalRequest,
     GenerateProposalsRequest,
@@ -42,8 +44,9 @@ def _get_workflow():
     global _workflow
     if _workflow is None:
         from src.pms import TradeWorkflowService
+        from src.risk.risk_state import get_shared_risk_state
 
-        _workflow = TradeWorkflowService()
+        _workflow = TradeWorkflowService(risk_state=get_shared_risk_state)
         # Hydrate from DB so in-memory stores have real data
         try:
             from src.pms.db_loader import hydrate_trade_workflow
@@ -91,6 +94,25 @@ async def list_proposals(
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
+# ---------------------------------------------------------------------------
+# 1b. GET /pms/trades/proposals/risk-impact (before /{proposal_id})
+# ---------------------------------------------------------------------------
+@router.get("/proposals/risk-impact")
+async def proposals_risk_impact(
+    date: Optional[str] = Query(None, description="Filter by as_of_date YYYY-MM-DD"),
+):
+    """Return pre-trade risk impact for every PENDING proposal in one batch."""
+    try:
+        wf = _get_workflow()
+        impacts = wf.evaluate_pending_risk(_parse_date(date))
+        return {str(pid): impact for pid, impact in impacts.items()}
+    except HTTPException:
+        raise
+    except Exception as exc:
+        logger.error("%s error: %s", __name__, exc)
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
 # ---------------------------------------------------------------------------
 # 2. GET /pms/trades/proposals/{proposal_id}
 # ---------------------------------------------------------------------------
@@ -188,6 +210,7 @@ async def approve_proposal(
             logger.warning("Audit log failed for trade approval")
 
         # Approving a trade changes the book -- invalidate portfolio cache
+        risk_api.notify_book_changed()
         try:
             await cache.invalidate_portfolio_data()
             logger.debug("POST /approve: cache invalidated")
@@ -223,6 +246,7 @@ async def reject_proposal(
         )
 
         # Rejecting a trade may affect pending book views -- invalidate
+        risk_api.notify_book_changed()
         try:
             await cache.invalidate_portfolio_data()
             logger.debug("POST /reject: cache invalidated")
@@ -262,6 +286,7 @@ async def modify_approve_proposal(
         )
 
         # Modify-approve changes the book -- invalidate portfolio cache
+        risk_api.notify_book_changed()
         try:
             await cache.invalidate_portfolio_data()
             logger.debug("POST /modify-approve: cache invalidated")
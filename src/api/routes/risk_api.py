@@ -1,5 +1,9 @@
 """Risk API endpoints for VaR, stress testing, limits, and dashboard.
 
+/var, /stress and /dashboard are served from a materialized risk snapshot
+(``src.cache.risk_snapshot``) recomputed once per book version; ``meta``
+carries its ``snapshot_id``, ``as_of`` and ``staleness_seconds``.
+
 Provides:
 - GET /risk/var       -- VaR/CVaR at 95% and 99% for all methods
 - GET /risk/stress    -- Stress scenario results (6 scenarios)
@@ -27,11 +31,14 @@ router = APIRouter(prefix="/risk", tags=["Risk"])
 # ---------------------------------------------------------------------------
 
 
-def _envelope(data: Any) -> dict:
+def _envelope(data: Any, snapshot: Any = None) -> dict:
+    meta = {"timestamp": datetime.now(timezone.utc).isoformat()}
+    if snapshot is not None:
+        meta.update(snapshot.meta())
     return {
         "status": "ok",
         "data": data,
-        "meta": {"timestamp": datetime.now(timezone.utc).isoformat()},
+        "meta": meta,
     }
 
 
@@ -309,6 +316,16 @@ def _load_portfolio_state() -> dict:
             p["instrument"]: p.get("asset_class", "OTHER") for p in positions
         }
 
+        var_95 = summary.get("var_95", 0.0)
+        var_99 = summary.get("var_99", 0.0)
+        if not var_95:
+            from src.risk.risk_state import get_shared_risk_state
+
+            state = get_shared_risk_state()
+            if state is not None and state.n_updates > 0:
+                vr = state.calculate(weights, method="parametric")
+                var_95, var_99 = vr.var_95, vr.var_99
+
         # Aggregate asset class weights
         ac_weights: dict[str, float] = {}
         for inst, w in weights.items():
@@ -318,8 +335,8 @@ def _load_portfolio_state() -> dict:
         return {
             "weights": weights,
             "leverage": summary.get("leverage", sum(abs(w) for w in weights.values())),
-            "var_95": summary.get("var_95", 0.0),
-            "var_99": summary.get("var_99", 0.0),
+            "var_95": var_95,
+            "var_99": var_99,
             "drawdown_pct": summary.get("drawdown_pct", 0.0),
             "risk_contributions": risk_contributions,
             "asset_class_weights": ac_weights,
@@ -334,6 +351,249 @@ def _load_portfolio_state() -> dict:
         ) from exc
 
 
+def _ewma_var_from_state(
+    positions: dict[str, float], portfolio_value: float
+) -> dict | None:
+    """VaR/CVaR for the current book read from the shared EWMA risk state.
+
+    Returns None when no state has been published.
+    """
+    from src.risk.risk_state import get_shared_risk_state
+
+    state = get_shared_risk_state()
+    if state is None or state.n_updates == 0:
+        return None
+    weights = {k: v / portfolio_value for k, v in positions.items()}
+    vr = state.calculate(weights, method="parametric")
+    return {
+        **_var_entry("ewma", vr),
+        "as_of_date": str(state.last_date),
+    }
+
+
+# ---------------------------------------------------------------------------
+# Materialized risk snapshot: /risk/var, /risk/stress and /risk/dashboard
+# read one precomputed snapshot (src.cache.risk_snapshot)
+# ---------------------------------------------------------------------------
+
+_snapshot_service = None
+
+
+def get_risk_snapshot_service():
+    """Return (or create) the module-level RiskSnapshotService singleton."""
+    global _snapshot_service
+    if _snapshot_service is None:
+        from src.cache import RiskSnapshotService, get_pms_cache
+
+        _snapshot_service = RiskSnapshotService(
+            _compute_risk_snapshot, cache_factory=get_pms_cache
+        )
+    return _snapshot_service
+
+
+def notify_book_changed() -> None:
+    """Mark the in-process book as changed so the next /risk read recomputes.
+
+    Called by the PMS write routes next to ``invalidate_portfolio_data``;
+    without Redis this is the only signal that the book version moved.
+    """
+    get_risk_snapshot_service().notify_book_changed()
+
+
+def _var_entry(method: str, vr: Any) -> dict:
+    return {
+        "method": method,
+        "var_95": round(vr.var_95, 6),
+        "var_99": round(vr.var_99, 6),
+        "cvar_95": round(vr.cvar_95, 6),
+        "cvar_99": round(vr.cvar_99, 6),
+        "n_observations": vr.n_observations,
+    }
+
+
+def _var_section(
+    returns: np.ndarray, positions: dict[str, float], portfolio_value: float
+) -> dict:
+    """VaR/CVaR for every method (historical, parametric, MC, EWMA)."""
+    from src.risk.var_calculator import VaRCalculator
+
+    calc = VaRCalculator()
+    results: dict[str, dict] = {}
+    warning = None
+
+    vr = calc.calculate(returns, "historical")
+    results["historical"] = _var_entry("historical", vr)
+    if vr.confidence_warning:
+        warning = vr.confidence_warning
+
+    vr = calc.calculate(returns, "parametric")
+    results["parametric"] = _var_entry("parametric", vr)
+
+    # Build real returns matrix from portfolio positions
+    instruments = list(positions.keys())
+    from src.agents.data_loader import PointInTimeDataLoader
+
+    loader = PointInTimeDataLoader()
+    from datetime import date as date_type
+
+    import pandas as pd
+
+    returns_frames = []
+    for ticker in instruments:
+        try:
+            md = loader.get_market_data(
+                ticker, as_of_date=date_type.today(), lookback_days=252
+            )
+            if md is not None and not md.empty and "close" in md.columns:
+                ret = md["close"].pct_change().dropna()
+                ret.index = ret.index.normalize()
+                ret = ret[~ret.index.duplicated(keep="last")]
+                ret.name = ticker
+                returns_frames.append(ret)
+        except Exception:
+            continue
+    returns_df = pd.concat(returns_frames, axis=1).dropna() if returns_frames else None
+    if returns_df is not None and len(returns_df) >= 2:
+        returns_matrix = returns_df.values
+        total = sum(positions.values())
+        weights = np.array([positions[i] / total for i in returns_df.columns])
+    else:
+        # Use portfolio-level returns as single-asset fallback
+        returns_matrix = returns.reshape(-1, 1)
+        weights = np.array([1.0])
+
+    vr = calc.calculate_monte_carlo(returns_matrix, weights)
+    results["monte_carlo"] = {
+        **_var_entry("monte_carlo", vr),
+        "standard_errors": {k: round(v, 6) for k, v in vr.standard_errors.items()},
+    }
+
+    ewma = _ewma_var_from_state(positions, portfolio_value)
+    if ewma is not None:
+        results["ewma"] = ewma
+
+    section: dict[str, Any] = {"results": results}
+    if warning:
+        section["warning"] = warning
+    return section
+
+
+def _stress_section(positions: dict[str, float], portfolio_value: float) -> dict:
+    """All stress scenario results for the current book."""
+    from src.risk.stress_tester import StressTester
+
+    tester = StressTester()
+    scenarios_out = [
+        {
+            "scenario_name": sr.scenario_name,
+            "portfolio_pnl": round(sr.portfolio_pnl, 2),
+            "portfolio_pnl_pct": round(sr.portfolio_pnl_pct, 6),
+            "worst_position": sr.worst_position,
+            "positions_impacted": sr.positions_impacted,
+        }
+        for sr in tester.run_all(positions, portfolio_value)
+    ]
+    return {"scenarios": scenarios_out}
+
+
+def _dashboard_section(
+    returns: np.ndarray, positions: dict[str, float], portfolio_value: float
+) -> dict:
+    """Aggregated risk overview (VaR, worst stress, limits, circuit breaker)."""
+    from src.risk.risk_monitor import RiskMonitor
+
+    monitor = RiskMonitor()
+    weights = {k: v / portfolio_value for k, v in positions.items()}
+
+    report = monitor.generate_report(
+        portfolio_returns=returns,
+        positions=positions,
+        portfolio_value=portfolio_value,
+        weights=weights,
+    )
+
+    var_data: dict[str, dict] = {}
+    for method_name, vr in report.var_results.items():
+        var_data[method_name] = {
+            "var_95": round(vr.var_95, 6),
+            "cvar_95": round(vr.cvar_95, 6),
+            "var_99": round(vr.var_99, 6),
+            "cvar_99": round(vr.cvar_99, 6),
+        }
+
+    worst_stress: dict[str, Any] = {}
+    if report.stress_results:
+        worst = min(report.stress_results, key=lambda s: s.portfolio_pnl)
+        worst_stress = {
+            "scenario_name": worst.scenario_name,
+            "pnl_pct": round(worst.portfolio_pnl_pct, 6),
+        }
+
+    limits_breached = sum(1 for lr in report.limit_results if lr.breached)
+
+    return {
+        "overall_risk_level": report.overall_risk_level,
+        "portfolio_value": report.portfolio_value,
+        "var": var_data,
+        "worst_stress": worst_stress,
+        "limits_breached": limits_breached,
+        "circuit_breaker": {
+            "state": report.circuit_breaker_state.value,
+            "scale": report.circuit_breaker_scale,
+            "drawdown_pct": round(report.drawdown_pct, 6),
+        },
+    }
+
+
+def _compute_risk_snapshot() -> dict:
+    """Load the book once and compute every snapshot section.
+
+    A section whose inputs or computation fail carries ``{"error",
+    "status_code"}`` (503 for unavailable data, 500 otherwise) so the
+    remaining sections are still served.
+    """
+    inputs: dict[str, Any] = {}
+    for name, loader in (
+        ("returns", _load_portfolio_returns),
+        ("positions", _load_positions),
+        ("portfolio_value", _load_portfolio_value),
+    ):
+        try:
+            inputs[name] = loader()
+        except Exception as exc:
+            inputs[name] = exc
+
+    def run(builder: Any, *names: str) -> dict:
+        args = [inputs[n] for n in names]
+        try:
+            for arg in args:
+                if isinstance(arg, Exception):
+                    raise arg
+            return builder(*args)
+        except Exception as exc:
+            status = 503 if isinstance(exc, RuntimeError) else 500
+            logger.error("risk snapshot section failed: %s", exc, exc_info=True)
+            return {"error": str(exc), "status_code": status}
+
+    return {
+        "var": run(_var_section, "returns", "positions", "portfolio_value"),
+        "stress": run(_stress_section, "positions", "portfolio_value"),
+        "dashboard": run(
+            _dashboard_section, "returns", "positions", "portfolio_value"
+        ),
+    }
+
+
+def _snapshot_section(snapshot: Any, name: str, what: str) -> dict:
+    """Return a snapshot section, raising its stored error as HTTP."""
+    section = snapshot.payload.get(name, {})
+    if "error" in section:
+        status = section.get("status_code", 500)
+        detail = section["error"] if status == 503 else f"{what} failed: {section['error']}"
+        raise HTTPException(status_code=status, detail=detail)
+    return section
+
+
 # ---------------------------------------------------------------------------
 # GET /risk/var
 # ---------------------------------------------------------------------------
@@ -343,7 +603,7 @@ def _load_portfolio_state() -> dict:
 async def risk_var(
     method: Optional[str] = Query(
         "all",
-        description="VaR method: historical, parametric, monte_carlo, or all",
+        description="VaR method: historical, parametric, monte_carlo, ewma, or all",
     ),
     confidence: Optional[int] = Query(
         None,
@@ -353,105 +613,33 @@ async def risk_var(
     """Return VaR and CVaR at 95% and 99% confidence levels.
 
     When method='all', returns results for historical, parametric, and
-    monte_carlo methods. A single method can be selected to narrow output.
+    monte_carlo methods, plus ``ewma`` when an incremental risk state has
+    been published (a read from ``src.risk.risk_state``, no refit). A
+    single method can be selected to narrow output.  Served from the
+    materialized risk snapshot; ``meta`` carries its id and staleness.
     """
     try:
-        from src.risk.var_calculator import VaRCalculator
-
-        def _compute_var():
-            calc = VaRCalculator()
-            returns = _load_portfolio_returns()
-
-            valid_methods = {"historical", "parametric", "monte_carlo", "all"}
-            selected = method if method in valid_methods else "all"
-
-            results: dict[str, dict] = {}
-            warning = None
-
-            if selected in ("historical", "all"):
-                vr = calc.calculate(returns, "historical")
-                results["historical"] = {
-                    "method": "historical",
-                    "var_95": round(vr.var_95, 6),
-                    "var_99": round(vr.var_99, 6),
-                    "cvar_95": round(vr.cvar_95, 6),
-                    "cvar_99": round(vr.cvar_99, 6),
-                    "n_observations": vr.n_observations,
-                }
-                if vr.confidence_warning:
-                    warning = vr.confidence_warning
-
-            if selected in ("parametric", "all"):
-                vr = calc.calculate(returns, "parametric")
-                results["parametric"] = {
-                    "method": "parametric",
-                    "var_95": round(vr.var_95, 6),
-                    "var_99": round(vr.var_99, 6),
-                    "cvar_95": round(vr.cvar_95, 6),
-                    "cvar_99": round(vr.cvar_99, 6),
-                    "n_observations": vr.n_observations,
-                }
-
-            if selected in ("monte_carlo", "all"):
-                # Build real returns matrix from portfolio positions
-                positions = _load_positions()
-                instruments = list(positions.keys())
-                from src.agents.data_loader import PointInTimeDataLoader
-
-                loader = PointInTimeDataLoader()
-                from datetime import date as date_type
-
-                import pandas as pd
-
-                returns_frames = []
-                for ticker in instruments:
-                    try:
-                        md = loader.get_market_data(
-                            ticker, as_of_date=date_type.today(), lookback_days=252
-                        )
-                        if md is not None and not md.empty and "close" in md.columns:
-                            ret = md["close"].pct_change().dropna()
-                            ret.index = ret.index.normalize()
-                            ret = ret[~ret.index.duplicated(keep="last")]
-                            ret.name = ticker
-                            returns_frames.append(ret)
-                    except Exception:
-                        continue
-                returns_df = (
-                    pd.concat(returns_frames, axis=1).dropna()
-                    if returns_frames
-                    else None
-                )
-                if returns_df is not None and len(returns_df) >= 2:
-                    returns_matrix = returns_df.values
-                    total = sum(positions.values())
-                    weights = np.array([positions[i] / total for i in instruments])
-                else:
-                    # Use portfolio-level returns as single-asset fallback
-                    returns_matrix = returns.reshape(-1, 1)
-                    weights = np.array([1.0])
-
-                vr = calc.calculate_monte_carlo(returns_matrix, weights)
-                results["monte_carlo"] = {
-                    "method": "monte_carlo",
-                    "var_95": round(vr.var_95, 6),
-                    "var_99": round(vr.var_99, 6),
-                    "cvar_95": round(vr.cvar_95, 6),
-                    "cvar_99": round(vr.cvar_99, 6),
-                    "n_observations": vr.n_observations,
-                }
-
-            output: dict[str, Any] = {"results": results}
-            if warning:
-                output["warning"] = warning
-            if selected != "all":
-                output["results"] = results.get(selected, {})
-
-            return output
+        snapshot = await get_risk_snapshot_service().get()
+        section = _snapshot_section(snapshot, "var", "VaR computation")
+
+        valid_methods = {"historical", "parametric", "monte_carlo", "ewma", "all"}
+        selected = method if method in valid_methods else "all"
+        results = section["results"]
+        if selected == "ewma" and "ewma" not in results:
+            raise RuntimeError(
+                "Risk state unavailable. Publish one with "
+                "scripts/update_risk_state.py."
+            )
 
-        data = await asyncio.to_thread(_compute_var)
-        return _envelope(data)
+        output: dict[str, Any] = {
+            "results": results if selected == "all" else results.get(selected, {})
+        }
+        if section.get("warning") and selected in ("historical", "all"):
+            output["warning"] = section["warning"]
+        return _envelope(output, snapshot)
 
+    except HTTPException:
+        raise
     except RuntimeError as exc:
         raise HTTPException(status_code=503, detail=str(exc))
     except Exception as exc:
@@ -473,39 +661,19 @@ async def risk_stress(
 ):
     """Return stress test results for all 6 scenarios (or a filtered one)."""
     try:
-        from src.risk.stress_tester import StressTester
-
-        def _compute_stress():
-            tester = StressTester()
-            positions = _load_positions()
-            portfolio_value = _load_portfolio_value()
-
-            all_results = tester.run_all(positions, portfolio_value)
-
-            scenarios_out = []
-            for sr in all_results:
-                entry = {
-                    "scenario_name": sr.scenario_name,
-                    "portfolio_pnl": round(sr.portfolio_pnl, 2),
-                    "portfolio_pnl_pct": round(sr.portfolio_pnl_pct, 6),
-                    "worst_position": sr.worst_position,
-                    "positions_impacted": sr.positions_impacted,
-                }
-                scenarios_out.append(entry)
-
-            if scenario:
-                scenario_lower = scenario.lower()
-                scenarios_out = [
-                    s
-                    for s in scenarios_out
-                    if scenario_lower in s["scenario_name"].lower()
-                ]
-
-            return {"scenarios": scenarios_out}
-
-        data = await asyncio.to_thread(_compute_stress)
-        return _envelope(data)
+        snapshot = await get_risk_snapshot_service().get()
+        section = _snapshot_section(snapshot, "stress", "Stress test")
+
+        scenarios_out = section["scenarios"]
+        if scenario:
+            scenario_lower = scenario.lower()
+            scenarios_out = [
+                s for s in scenarios_out if scenario_lower in s["scenario_name"].lower()
+            ]
+        return _envelope({"scenarios": scenarios_out}, snapshot)
 
+    except HTTPException:
+        raise
     except RuntimeError as exc:
         raise HTTPException(status_code=503, detail=str(exc))
     except Exception as exc:
@@ -587,57 +755,12 @@ async def risk_limits():
 async def risk_dashboard():
     """Return aggregated risk overview combining VaR, stress, limits, and circuit breaker."""
     try:
-        from src.risk.risk_monitor import RiskMonitor
-
-        def _compute_dashboard():
-            monitor = RiskMonitor()
-            portfolio_returns = _load_portfolio_returns()
-            positions = _load_positions()
-            portfolio_value = _load_portfolio_value()
-            weights = {k: v / portfolio_value for k, v in positions.items()}
-
-            report = monitor.generate_report(
-                portfolio_returns=portfolio_returns,
-                positions=positions,
-                portfolio_value=portfolio_value,
-                weights=weights,
-            )
-
-            var_data: dict[str, dict] = {}
-            for method_name, vr in report.var_results.items():
-                var_data[method_name] = {
-                    "var_95": round(vr.var_95, 6),
-                    "cvar_95": round(vr.cvar_95, 6),
-                    "var_99": round(vr.var_99, 6),
-                    "cvar_99": round(vr.cvar_99, 6),
-                }
-
-            worst_stress: dict[str, Any] = {}
-            if report.stress_results:
-                worst = min(report.stress_results, key=lambda s: s.portfolio_pnl)
-                worst_stress = {
-                    "scenario_name": worst.scenario_name,
-                    "pnl_pct": round(worst.portfolio_pnl_pct, 6),
-                }
-
-            limits_breached = sum(1 for lr in report.limit_results if lr.breached)
-
-            return {
-                "overall_risk_level": report.overall_risk_level,
-                "portfolio_value": report.portfolio_value,
-                "var": var_data,
-                "worst_stress": worst_stress,
-                "limits_breached": limits_breached,
-                "circuit_breaker": {
-                    "state": report.circuit_breaker_state.value,
-                    "scale": report.circuit_breaker_scale,
-                    "drawdown_pct": round(report.drawdown_pct, 6),
-                },
-            }
-
-        data = await asyncio.to_thread(_compute_dashboard)
-        return _envelope(data)
+        snapshot = await get_risk_snapshot_service().get()
+        data = _snapshot_section(snapshot, "dashboard", "Risk dashboard")
+        return _envelope(data, snapshot)
 
+    except HTTPException:
+        raise
     except RuntimeError as exc:
         raise HTTPException(status_code=503, detail=str(exc))
     except Exception as exc:
@@ -5,6 +5,8 @@ Provides real-time WebSocket channels for:
 - /ws/portfolio -- Portfolio position and P&L updates
 - /ws/alerts    -- System alerts and notifications
 
+and GET /ws/metrics -- per-channel queue depth, drops and send latency.
+
 Usage from other modules:
     from src.api.routes.websocket_api import manager
     await manager.broadcast("alerts", {"type": "risk_breach", "message": "VaR limit exceeded"})
@@ -19,6 +21,17 @@ from typing import Any
 import jwt
 from fastapi import APIRouter, Query, WebSocket, WebSocketDisconnect
 
+from src.api.ws_broadcast import (
+    CHANNEL_POLICIES,
+    CLIENT_QUEUE_SIZE,
+    DROP_OLDEST,
+    ChannelStats,
+    ClientQueue,
+    ClientWriter,
+    LocalPubSub,
+    RedisPubSub,
+    start_bridge,
+)
 from src.core.config import settings
 
 logger = logging.getLogger(__name__)
@@ -48,12 +61,27 @@ router = APIRouter(tags=["WebSocket"])
 class ConnectionManager:
     """Manages WebSocket connections grouped by named channels.
 
+    Each connection has a bounded outbound queue and its own writer task
+    (see :mod:`src.api.ws_broadcast`), so a slow client only backs up its
+    own queue.  Broadcasts go through a pub/sub bridge -- in-process by
+    default, Redis once :meth:`start_bridge` attaches it -- so every API
+    worker delivers to its own clients.
+
     Attributes:
-        active: Dict mapping channel names to sets of connected WebSocket instances.
+        active: Dict mapping channel names to ``{websocket: ClientWriter}``.
+        policies: Queue policy per channel (``drop_oldest`` if absent).
     """
 
-    def __init__(self) -> None:
-        self.active: dict[str, set[WebSocket]] = {}
+    def __init__(
+        self,
+        policies: dict[str, str] | None = None,
+        queue_size: int = CLIENT_QUEUE_SIZE,
+    ) -> None:
+        self.active: dict[str, dict[WebSocket, ClientWriter]] = {}
+        self.policies = dict(CHANNEL_POLICIES if policies is None else policies)
+        self.queue_size = queue_size
+        self._stats: dict[str, ChannelStats] = {}
+        self._bridge: LocalPubSub | RedisPubSub = LocalPubSub(self.deliver)
 
     async def connect(self, websocket: WebSocket, channel: str) -> None:
         """Accept a WebSocket connection and add it to the specified channel.
@@ -63,9 +91,14 @@ class ConnectionManager:
             channel: Channel name to register the connection under.
         """
         await websocket.accept()
-        if channel not in self.active:
-            self.active[channel] = set()
-        self.active[channel].add(websocket)
+        queue = ClientQueue(self.queue_size, self.policies.get(channel, DROP_OLDEST))
+        writer = ClientWriter(
+            websocket,
+            queue,
+            self._channel_stats(channel),
+            on_failure=lambda: self.disconnect(websocket, channel),
+        )
+        self.active.setdefault(channel, {})[websocket] = writer
         logger.info(
             "websocket_connected channel=%s total=%d",
             channel,
@@ -73,14 +106,18 @@ class ConnectionManager:
         )
 
     def disconnect(self, websocket: WebSocket, channel: str) -> None:
-        """Remove a WebSocket connection from a channel.
+        """Remove a WebSocket connection from a channel and stop its writer.
+
+        Safe to call more than once for the same connection.  Writers that
+        evict a failed or stalled client close its socket themselves.
 
         Args:
             websocket: The WebSocket connection to remove.
             channel: Channel name to remove the connection from.
         """
-        if channel in self.active:
-            self.active[channel].discard(websocket)
+        writer = self.active.get(channel, {}).pop(websocket, None)
+        if writer is not None:
+            writer.cancel()
             logger.info(
                 "websocket_disconnected channel=%s remaining=%d",
                 channel,
@@ -88,30 +125,63 @@ class ConnectionManager:
             )
 
     async def broadcast(self, channel: str, message: dict[str, Any]) -> None:
-        """Send a JSON message to all connected clients on a channel.
+        """Publish a JSON message to all clients on a channel, on every worker.
 
-        Disconnected clients are automatically cleaned up.
+        The message is serialized once; delivery only enqueues onto each
+        client's queue, so this never waits on a socket.
 
         Args:
             channel: Channel name to broadcast to.
             message: Dict payload to send as JSON.
         """
-        if channel not in self.active:
+        payload = json.dumps(message, default=str)
+        self._channel_stats(channel).published += 1
+        if not getattr(self._bridge, "healthy", True):
+            self.deliver(channel, payload)
             return
-
-        disconnected: list[WebSocket] = []
-        payload = json.dumps(message)
-
-        for websocket in self.active[channel]:
-            try:
-                await websocket.send_text(payload)
-            except Exception:
-                disconnected.append(websocket)
-
-        # Clean up disconnected clients
-        for ws in disconnected:
-            self.active[channel].discard(ws)
-            logger.debug("websocket_cleaned_stale channel=%s", channel)
+        try:
+            await self._bridge.publish(channel, payload)
+        except Exception as exc:
+            logger.warning("websocket_publish_failed channel=%s error=%s", channel, exc)
+            self.deliver(channel, payload)
+
+    def deliver(self, channel: str, payload: str) -> None:
+        """Enqueue a serialized payload for this worker's clients on a channel."""
+        for writer in self.active.get(channel, {}).values():
+            writer.enqueue(payload)
+
+    async def start_bridge(self, bridge: LocalPubSub | RedisPubSub) -> None:
+        """Attach a pub/sub bridge (falls back to in-process on failure)."""
+        await self._bridge.stop()
+        self._bridge = await start_bridge(bridge, self.deliver)
+
+    async def stop_bridge(self) -> None:
+        """Detach the bridge and revert to in-process delivery."""
+        await self._bridge.stop()
+        self._bridge = LocalPubSub(self.deliver)
+
+    def _channel_stats(self, channel: str) -> ChannelStats:
+        stats = self._stats.get(channel)
+        if stats is None:
+            stats = self._stats[channel] = ChannelStats()
+        return stats
+
+    def metrics(self) -> dict[str, Any]:
+        """Queue depth, drops and send latency per channel."""
+        return {
+            "bridge": type(self._bridge).__name__,
+            "bridge_healthy": getattr(self._bridge, "healthy", True),
+            "bridge_reconnects": getattr(self._bridge, "reconnects", 0),
+            "channels": {
+                channel: {
+                    "policy": self.policies.get(channel, DROP_OLDEST),
+                    **stats.snapshot(
+                        [w.queue for w in self.active.get(channel, {}).values()]
+                    ),
+                }
+                for channel, stats in self._stats.items()
+            },
+        }
 
     @property
     def channel_counts(self) -> dict[str, int]:
@@ -126,6 +196,12 @@ manager = ConnectionManager()
 # ---------------------------------------------------------------------------
 # WebSocket endpoints
 # ---------------------------------------------------------------------------
+@router.get("/ws/metrics")
+async def websocket_metrics() -> dict[str, Any]:
+    """Per-channel client count, queue depth, drops and send latency."""
+    return manager.metrics()
+
+
 @router.websocket("/ws/signals")
 async def signals_websocket(
     websocket: WebSocket,
@@ -267,6 +267,7 @@ class MorningPackResponse(BaseModel):
     signal_changes: Any
     portfolio_state: Any
     macro_narrative: Any
+    section_timings: Optional[dict] = None  # section -> seconds / cached / status
 
 
 class MorningPackSummaryResponse(BaseModel):
@@ -0,0 +1,205 @@
+"""Streamed columnar payloads for bulk time-series endpoints.
+
+The per-ticker / per-tenor endpoints load every row, build one Pydantic
+model per row and serialize a JSON array of objects -- fine for a chart,
+slow and memory-heavy for 20 years of daily data across many series.  The
+bulk endpoints instead:
+
+- read through a server-side cursor (``AsyncSession.stream``) in
+  partitions of ``STREAM_CHUNK_ROWS`` rows, so at most one partition is in
+  memory;
+- transpose each partition into columns with no per-row objects;
+- encode it as a chunk of column-oriented JSON (default) or an Arrow IPC
+  record batch (``Accept: application/vnd.apache.arrow.stream`` or
+  ``?format=arrow``; needs the optional ``pyarrow`` package);
+- gzip the stream when the client sends ``Accept-Encoding: gzip``.
+
+Columnar JSON layout::
+
+    {"columns": ["ticker", "timestamp", ...],
+     "chunks": [{"ticker": [...], "timestamp": [...], ...}, ...],
+     "row_count": 12345}
+
+Concatenating each column across ``chunks`` yields the full table.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import zlib
+from datetime import date, datetime
+from typing import Any, AsyncIterator, Optional, Sequence
+
+from fastapi import HTTPException, Request
+from fastapi.responses import StreamingResponse
+
+from src.core.database import async_session_factory
+
+# ---------------------------------------------------------------------------
+# Conditional import of pyarrow
+# ---------------------------------------------------------------------------
+try:
+    import pyarrow as pa
+
+    _ARROW_AVAILABLE = True
+except ImportError:
+    pa = None  # type: ignore[assignment]
+    _ARROW_AVAILABLE = False
+
+JSON_MEDIA_TYPE = "application/json"
+ARROW_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+
+# Rows fetched from the server-side cursor per chunk
+STREAM_CHUNK_ROWS = 10_000
+
+# Column kinds: how values are encoded in JSON and typed in Arrow
+_JSON_ENCODERS = {
+    "str": None,
+    "int": None,
+    "float": None,
+    "date": date.isoformat,
+    "timestamp": datetime.isoformat,
+}
+
+
+def _arrow_type(kind: str):
+    return {
+        "str": pa.string(),
+        "int": pa.int64(),
+        "float": pa.float64(),
+        "date": pa.date32(),
+        "timestamp": pa.timestamp("us", tz="UTC"),
+    }[kind]
+
+
+def negotiate_format(request: Request, format: Optional[str] = None) -> str:
+    """Pick ``"json"`` or ``"arrow"`` from ``?format=`` or the Accept header.
+
+    Raises:
+        HTTPException: 406 if Arrow is requested but pyarrow is not installed,
+            400 for an unknown ``format``.
+    """
+    if format is None:
+        accept = request.headers.get("accept", "")
+        format = "arrow" if ARROW_MEDIA_TYPE in accept else "json"
+    format = format.lower()
+    if format not in ("json", "arrow"):
+        raise HTTPException(status_code=400, detail=f"Unknown format '{format}'")
+    if format == "arrow" and not _ARROW_AVAILABLE:
+        raise HTTPException(
+            status_code=406, detail="Arrow output requires pyarrow on the server"
+        )
+    return format
+
+
+async def stream_rows(
+    stmt, chunk_rows: int = STREAM_CHUNK_ROWS
+) -> AsyncIterator[Sequence]:
+    """Yield partitions of rows from a server-side cursor.
+
+    Opens its own session: request-scoped ``get_db`` sessions are closed
+    before a streaming body is consumed.
+    """
+    async with async_session_factory() as session:
+        result = await session.stream(stmt.execution_options(yield_per=chunk_rows))
+        async for partition in result.partitions(chunk_rows):
+            yield partition
+
+
+def _columns(partition: Sequence, n_columns: int) -> list[list]:
+    """Transpose a partition of row tuples into column lists."""
+    if not partition:
+        return [[] for _ in range(n_columns)]
+    return [list(col) for col in zip(*partition)]
+
+
+async def encode_json(
+    partitions: AsyncIterator[Sequence], columns: Sequence[tuple[str, str]]
+) -> AsyncIterator[bytes]:
+    """Columnar JSON, one ``chunks`` entry per partition."""
+    names = [name for name, _ in columns]
+    encoders = [_JSON_ENCODERS[kind] for _, kind in columns]
+    yield b'{"columns":' + json.dumps(names).encode() + b',"chunks":['
+    row_count = 0
+    first = True
+    async for partition in partitions:
+        cols = _columns(partition, len(columns))
+        row_count += len(cols[0])
+        chunk = {
+            name: (
+                values
+                if encode is None
+                else [None if v is None else encode(v) for v in values]
+            )
+            for name, encode, values in zip(names, encoders, cols)
+        }
+        encoded = json.dumps(chunk, separators=(",", ":")).encode()
+        yield encoded if first else b"," + encoded
+        first = False
+    yield b'],"row_count":' + str(row_count).encode() + b"}"
+
+
+async def encode_arrow(
+    partitions: AsyncIterator[Sequence], columns: Sequence[tuple[str, str]]
+) -> AsyncIterator[bytes]:
+    """Arrow IPC stream, one record batch per partition."""
+    schema = pa.schema([(name, _arrow_type(kind)) for name, kind in columns])
+    sink = io.BytesIO()
+    writer = pa.ipc.new_stream(sink, schema)
+
+    def drain() -> bytes:
+        data = sink.getvalue()
+        sink.seek(0)
+        sink.truncate()
+        return data
+
+    yield drain()  # schema message
+    async for partition in partitions:
+        cols = _columns(partition, len(columns))
+        batch = pa.record_batch(
+            [pa.array(values, type=field.type) for values, field in zip(cols, schema)],
+            schema=schema,
+        )
+        writer.write_batch(batch)
+        yield drain()
+    writer.close()
+    yield drain()
+
+
+async def gzip_stream(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)  # wbits 31: gzip framing
+    async for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def columnar_response(
+    request: Request,
+    partitions: AsyncIterator[Sequence],
+    columns: Sequence[tuple[str, str]],
+    format: str,
+) -> StreamingResponse:
+    """Stream ``partitions`` as columnar JSON or Arrow, gzipped if accepted.
+
+    Args:
+        request: Incoming request (for Accept-Encoding).
+        partitions: Async iterator of row-tuple partitions (``stream_rows``).
+        columns: ``(name, kind)`` per row position; kind is one of
+            ``str``, ``int``, ``float``, ``date``, ``timestamp``.
+        format: ``"json"`` or ``"arrow"`` (see ``negotiate_format``).
+    """
+    if format == "arrow":
+        body: AsyncIterator[bytes] = encode_arrow(partitions, columns)
+        media_type = ARROW_MEDIA_TYPE
+    else:
+        body = encode_json(partitions, columns)
+        media_type = JSON_MEDIA_TYPE
+
+    headers: dict[str, Any] = {"Vary": "Accept, Accept-Encoding"}
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        body = gzip_stream(body)
+        headers["Content-Encoding"] = "gzip"
+    return StreamingResponse(body, media_type=media_type, headers=headers)
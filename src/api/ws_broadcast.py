@@ -0,0 +1,295 @@
+"""Per-client fan-out for WebSocket channels.
+
+``ConnectionManager.broadcast`` used to await ``send_text`` for each socket
+in turn, so one slow client delayed every other client on the channel and
+nothing bounded the backlog.  The pieces here decouple producers from
+sockets:
+
+- each connection gets a bounded :class:`ClientQueue` drained by its own
+  writer task; a broadcast serializes the payload once and only enqueues;
+- a full queue follows the channel's policy: ``drop_oldest`` evicts the
+  oldest pending message, ``coalesce_latest`` keeps only the newest (for
+  channels that carry full snapshots, e.g. portfolio);
+- :class:`ChannelStats` tracks sends, drops and send latency (enqueue to
+  ``send_text`` completion) for the metrics endpoint;
+- a client whose send fails or stalls past ``SEND_TIMEOUT_SECONDS`` is
+  evicted and its socket closed with ``EVICT_CLOSE_CODE`` (1013, "try
+  again later") so it reconnects instead of silently receiving nothing;
+- a pub/sub bridge carries serialized payloads between API workers.
+  :class:`LocalPubSub` delivers in-process; :class:`RedisPubSub`
+  publishes to ``ws:<channel>`` and feeds every worker's local fan-out
+  from a pattern subscription, resubscribing with backoff if the
+  subscription drops (broadcasts are delivered locally meanwhile).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, Callable
+
+from fastapi import WebSocket
+
+logger = logging.getLogger(__name__)
+
+DROP_OLDEST = "drop_oldest"
+COALESCE_LATEST = "coalesce_latest"
+
+# Pending messages per client before the channel policy kicks in
+CLIENT_QUEUE_SIZE = 256
+
+# A client whose send stalls longer than this is disconnected
+SEND_TIMEOUT_SECONDS = 10.0
+
+# Close code sent to evicted clients (1013 = try again later)
+EVICT_CLOSE_CODE = 1013
+
+# Redis resubscribe backoff: first delay, doubled up to the cap
+BRIDGE_RETRY_SECONDS = 1.0
+BRIDGE_RETRY_MAX_SECONDS = 30.0
+
+# Channels not listed here use DROP_OLDEST
+CHANNEL_POLICIES: dict[str, str] = {"portfolio": COALESCE_LATEST}
+
+REDIS_CHANNEL_PREFIX = "ws:"
+
+# Send latencies kept per channel for percentiles
+_LATENCY_WINDOW = 1024
+
+DeliverFn = Callable[[str, str], None]
+
+
+class ClientQueue:
+    """Bounded outbound queue of serialized payloads for one connection.
+
+    Args:
+        maxsize: Pending messages kept under ``drop_oldest``.
+        policy: ``DROP_OLDEST`` or ``COALESCE_LATEST``.
+    """
+
+    def __init__(self, maxsize: int = CLIENT_QUEUE_SIZE, policy: str = DROP_OLDEST) -> None:
+        if policy not in (DROP_OLDEST, COALESCE_LATEST):
+            raise ValueError(f"Unknown queue policy '{policy}'")
+        self._maxsize = 1 if policy == COALESCE_LATEST else max(maxsize, 1)
+        self._items: deque[tuple[str, float]] = deque()
+        self._ready = asyncio.Event()
+        self.policy = policy
+        self.dropped = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def put(self, payload: str) -> bool:
+        """Enqueue without blocking; returns False if a message was dropped."""
+        dropped = len(self._items) >= self._maxsize
+        if dropped:
+            self._items.popleft()
+            self.dropped += 1
+        self._items.append((payload, time.perf_counter()))
+        self._ready.set()
+        return not dropped
+
+    async def get(self) -> tuple[str, float]:
+        """Next ``(payload, enqueued_at)``, waiting while the queue is empty."""
+        while not self._items:
+            self._ready.clear()
+            await self._ready.wait()
+        return self._items.popleft()
+
+
+class ChannelStats:
+    """Delivery counters and recent send latencies for one channel."""
+
+    def __init__(self) -> None:
+        self.published = 0
+        self.sent = 0
+        self.dropped = 0
+        self.evicted = 0
+        self.latencies: deque[float] = deque(maxlen=_LATENCY_WINDOW)
+
+    def snapshot(self, queues: list[ClientQueue]) -> dict[str, Any]:
+        depths = [len(q) for q in queues]
+        latencies = sorted(self.latencies)
+
+        def pct(q: float) -> float | None:
+            if not latencies:
+                return None
+            return round(latencies[min(int(q * len(latencies)), len(latencies) - 1)] * 1000, 3)
+
+        return {
+            "clients": len(queues),
+            "queue_depth_total": sum(depths),
+            "queue_depth_max": max(depths, default=0),
+            "published": self.published,
+            "sent": self.sent,
+            "dropped": self.dropped,
+            "evicted_clients": self.evicted,
+            "send_latency_ms": {"p50": pct(0.50), "p95": pct(0.95), "max": pct(1.0)},
+        }
+
+
+class ClientWriter:
+    """Drains one connection's queue into its socket on a dedicated task.
+
+    Args:
+        websocket: Accepted connection.
+        queue: The connection's outbound queue.
+        stats: Stats of the connection's channel.
+        on_failure: Called once if a send fails or times out, after the
+            socket close has been scheduled.
+    """
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        queue: ClientQueue,
+        stats: ChannelStats,
+        on_failure: Callable[[], None],
+    ) -> None:
+        self.websocket = websocket
+        self.queue = queue
+        self._stats = stats
+        self._on_failure = on_failure
+        self._task = asyncio.create_task(self._run())
+        self._close_task: asyncio.Task | None = None
+
+    def enqueue(self, payload: str) -> None:
+        if not self.queue.put(payload):
+            self._stats.dropped += 1
+
+    def cancel(self) -> None:
+        self._task.cancel()
+
+    async def _run(self) -> None:
+        while True:
+            payload, enqueued_at = await self.queue.get()
+            try:
+                await asyncio.wait_for(self.websocket.send_text(payload), SEND_TIMEOUT_SECONDS)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.warning("websocket_client_evicted error=%r", exc)
+                self._stats.evicted += 1
+                # Separate task: on_failure cancels this one
+                self._close_task = asyncio.create_task(self._close())
+                self._on_failure()
+                return
+            self._stats.sent += 1
+            self._stats.latencies.append(time.perf_counter() - enqueued_at)
+
+    async def _close(self) -> None:
+        """Close the evicted socket so the client reconnects."""
+        try:
+            await asyncio.wait_for(
+                self.websocket.close(code=EVICT_CLOSE_CODE), SEND_TIMEOUT_SECONDS
+            )
+        except Exception as exc:
+            logger.debug("websocket_close_failed error=%r", exc)
+
+
+# ---------------------------------------------------------------------------
+# Pub/sub bridges -- carry serialized payloads between API workers
+# ---------------------------------------------------------------------------
+class LocalPubSub:
+    """In-process stand-in for the bridge: publish delivers immediately."""
+
+    def __init__(self, deliver: DeliverFn | None = None) -> None:
+        self._deliver = deliver
+
+    async def start(self, deliver: DeliverFn) -> None:
+        self._deliver = deliver
+
+    async def publish(self, channel: str, payload: str) -> None:
+        if self._deliver is not None:
+            self._deliver(channel, payload)
+
+    async def stop(self) -> None:
+        self._deliver = None
+
+
+class RedisPubSub:
+    """Redis bridge: every worker receives every channel's payloads.
+
+    Args:
+        redis: ``redis.asyncio.Redis`` client (``decode_responses=True``).
+        prefix: Prefix of the Redis channel names.
+    """
+
+    def __init__(self, redis: Any, prefix: str = REDIS_CHANNEL_PREFIX) -> None:
+        self._redis = redis
+        self._prefix = prefix
+        self._pubsub: Any = None
+        self._task: asyncio.Task | None = None
+        self._subscribed = False
+        self.reconnects = 0
+
+    async def start(self, deliver: DeliverFn) -> None:
+        """Subscribe (raises if Redis is unreachable) and start listening."""
+        await self._subscribe()
+        self._task = asyncio.create_task(self._listen(deliver))
+
+    async def publish(self, channel: str, payload: str) -> None:
+        await self._redis.publish(f"{self._prefix}{channel}", payload)
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        await self._unsubscribe()
+
+    async def _subscribe(self) -> None:
+        self._pubsub = self._redis.pubsub()
+        await self._pubsub.psubscribe(f"{self._prefix}*")
+        self._subscribed = True
+
+    async def _unsubscribe(self) -> None:
+        self._subscribed = False
+        pubsub, self._pubsub = self._pubsub, None
+        if pubsub is not None:
+            try:
+                await pubsub.aclose()
+            except Exception as exc:
+                logger.debug("websocket_bridge_close_failed error=%s", exc)
+
+    async def _listen(self, deliver: DeliverFn) -> None:
+        """Feed ``deliver`` from the subscription, resubscribing with backoff."""
+        delay = BRIDGE_RETRY_SECONDS
+        while True:
+            try:
+                if not self._subscribed:
+                    await self._subscribe()
+                    self.reconnects += 1
+                    delay = BRIDGE_RETRY_SECONDS
+                    logger.warning("websocket_bridge_resubscribed reconnects=%d", self.reconnects)
+                async for message in self._pubsub.listen():
+                    if message.get("type") != "pmessage":
+                        continue
+                    deliver(message["channel"][len(self._prefix):], message["data"])
+                raise ConnectionError("subscription closed")
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.error(
+                    "websocket_bridge_listener_failed error=%s; local-only, retrying in %.1fs",
+                    exc,
+                    delay,
+                )
+                await self._unsubscribe()
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, BRIDGE_RETRY_MAX_SECONDS)
+
+    @property
+    def healthy(self) -> bool:
+        return self._subscribed and self._task is not None and not self._task.done()
+
+
+async def start_bridge(bridge: LocalPubSub | RedisPubSub, deliver: DeliverFn) -> LocalPubSub | RedisPubSub:
+    """Start ``bridge``, falling back to a :class:`LocalPubSub` on failure."""
+    try:
+        await bridge.start(deliver)
+        return bridge
+    except Exception as exc:
+        logger.warning("websocket_bridge_unavailable error=%s; using local fan-out", exc)
+        return LocalPubSub(deliver)
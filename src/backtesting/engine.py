@@ -3,18 +3,24 @@
 Point-in-time correctness is enforced by PointInTimeDataLoader:
 strategy.generate_signals(as_of_date) calls loader.get_*() methods
 which filter by release_time <= as_of_date. BacktestEngine passes
-as_of_date to strategy -- no future data can leak in.
+as_of_date to strategy -- no future data can leak in.  For long daily
+backtests pass a ``PointInTimeDataCube`` (same interface, preloaded in
+memory) as the loader so each series is read from the DB only once.
 
 v2 additions (BTST-01, BTST-02):
 - run_portfolio: Multi-strategy portfolio backtesting with weights and attribution
 - walk_forward_validation: Train/test window splitting with overfit detection
 - BacktestConfig: New optional fields for walk-forward and cost model
+
+Fast path:
+- run_vectorized: Array-based replay of a precomputed weight matrix
+  (see ``src.backtesting.vectorized``) for large parameter sweeps
 """
 
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import date
 from typing import Any, Optional, Protocol
 
@@ -25,6 +31,7 @@ from src.agents.data_loader import PointInTimeDataLoader
 from src.backtesting.costs import TransactionCostModel
 from src.backtesting.metrics import BacktestResult, compute_metrics
 from src.backtesting.portfolio import Portfolio
+from src.backtesting.vectorized import run_vectorized
 from src.core.enums import SignalDirection
 
 logger = logging.getLogger(__name__)
@@ -160,6 +167,75 @@ class BacktestEngine:
 
         return compute_metrics(portfolio, self.config, strategy.strategy_id)
 
+    # ------------------------------------------------------------------
+    # Vectorized fast path
+    # ------------------------------------------------------------------
+    def build_weight_matrix(self, strategy: StrategyProtocol) -> pd.DataFrame:
+        """Collect target weights for every rebalance date into a matrix.
+
+        Calls ``strategy.generate_signals`` once per rebalance date (same
+        PIT guarantees as ``run``).  Instruments absent from a date's
+        target dict are ``NaN``; dates that return no signal are all-``NaN``
+        rows.  Dates whose call fails are left out, as ``run`` records no
+        equity point for them.
+
+        Returns:
+            DataFrame indexed by rebalance date, one column per instrument.
+        """
+        rows: dict[pd.Timestamp, dict[str, float]] = {}
+        for as_of_date in self._get_rebalance_dates():
+            try:
+                raw_signals = strategy.generate_signals(as_of_date)
+                rows[pd.Timestamp(as_of_date)] = dict(
+                    self._adapt_signals_to_weights(raw_signals)
+                )
+            except Exception as exc:
+                logger.warning(
+                    "weight_matrix_step_failed as_of_date=%s error=%s",
+                    str(as_of_date),
+                    str(exc),
+                )
+        matrix = pd.DataFrame.from_dict(rows, orient="index", dtype=float)
+        # from_dict drops empty dicts; keep them as all-NaN "no signal" rows
+        return matrix.reindex(pd.DatetimeIndex(list(rows)))
+
+    def build_price_matrix(self, tickers: list[str], dates: pd.Index) -> pd.DataFrame:
+        """Fetch PIT last prices for ``tickers`` on every date in ``dates``."""
+        data = {
+            pd.Timestamp(d): self._get_prices(pd.Timestamp(d).date(), tickers)
+            for d in dates
+        }
+        return pd.DataFrame.from_dict(data, orient="index", dtype=float).reindex(
+            columns=tickers
+        )
+
+    def run_vectorized(
+        self,
+        weights: pd.DataFrame,
+        prices: pd.DataFrame | None = None,
+        strategy_id: str = "VECTORIZED",
+    ) -> BacktestResult:
+        """Backtest a precomputed (dates x instruments) target-weight matrix.
+
+        Produces the same equity curve and trade statistics as ``run``
+        (within ``vectorized.EQUIVALENCE_RTOL``) without per-ticker Python
+        loops, so one weight matrix can be re-costed or re-levered for
+        thousands of parameter variants.
+
+        Args:
+            weights: Target weights, e.g. from ``build_weight_matrix``.
+            prices: Aligned price matrix.  Fetched via the loader when
+                ``None``.
+            strategy_id: Identifier stored on the result.
+
+        Returns:
+            BacktestResult populated exactly like ``run``.
+        """
+        if prices is None:
+            prices = self.build_price_matrix(list(weights.columns), weights.index)
+        vectorized = run_vectorized(weights, prices, self.config)
+        return vectorized.to_result(self.config, strategy_id)
+
     def _adapt_signals_to_weights(self, raw: Any) -> dict[str, float]:
         """Convert strategy output to ``{ticker: target_weight}`` dict.
 
@@ -437,9 +513,11 @@ class BacktestEngine:
             params_used: dict[str, Any] = {}
 
             if param_grid:
-                # Grid search on training window
+                # Grid search on training window; the best trial's result is
+                # kept as the in-sample result (no redundant re-run).
                 best_sharpe = -float("inf")
                 best_params: dict[str, Any] = {}
+                in_sample_result = None
 
                 import itertools
 
@@ -452,63 +530,34 @@ class BacktestEngine:
                     for k, v in trial_params.items():
                         setattr(strategy, k, v)
 
-                    train_config = BacktestConfig(
-                        start_date=train_start,
-                        end_date=train_end,
-                        initial_capital=self.config.initial_capital,
-                        rebalance_frequency=self.config.rebalance_frequency,
-                        transaction_cost_bps=self.config.transaction_cost_bps,
-                        slippage_bps=self.config.slippage_bps,
-                        max_leverage=self.config.max_leverage,
+                    train_engine = BacktestEngine(
+                        self._window_config(train_start, train_end), self.loader
                     )
-                    train_engine = BacktestEngine(train_config, self.loader)
                     train_result = train_engine.run(strategy)
 
-                    if train_result.sharpe_ratio > best_sharpe:
+                    if (
+                        in_sample_result is None
+                        or train_result.sharpe_ratio > best_sharpe
+                    ):
                         best_sharpe = train_result.sharpe_ratio
                         best_params = trial_params.copy()
+                        in_sample_result = train_result
 
                 # Apply best params for test
                 for k, v in best_params.items():
                     setattr(strategy, k, v)
                 params_used = best_params
             else:
-                # No param grid: run with current params
-                train_config = BacktestConfig(
-                    start_date=train_start,
-                    end_date=train_end,
-                    initial_capital=self.config.initial_capital,
-                    rebalance_frequency=self.config.rebalance_frequency,
-                    transaction_cost_bps=self.config.transaction_cost_bps,
-                    slippage_bps=self.config.slippage_bps,
-                    max_leverage=self.config.max_leverage,
+                # No param grid: run train (in-sample) with current params
+                train_engine = BacktestEngine(
+                    self._window_config(train_start, train_end), self.loader
                 )
-                train_engine = BacktestEngine(train_config, self.loader)
-
-            # Run train (in-sample)
-            train_config = BacktestConfig(
-                start_date=train_start,
-                end_date=train_end,
-                initial_capital=self.config.initial_capital,
-                rebalance_frequency=self.config.rebalance_frequency,
-                transaction_cost_bps=self.config.transaction_cost_bps,
-                slippage_bps=self.config.slippage_bps,
-                max_leverage=self.config.max_leverage,
-            )
-            train_engine = BacktestEngine(train_config, self.loader)
-            in_sample_result = train_engine.run(strategy)
+                in_sample_result = train_engine.run(strategy)
 
             # Run test (out-of-sample)
-            test_config = BacktestConfig(
-                start_date=test_start,
-                end_date=test_end,
-                initial_capital=self.config.initial_capital,
-                rebalance_frequency=self.config.rebalance_frequency,
-                transaction_cost_bps=self.config.transaction_cost_bps,
-                slippage_bps=self.config.slippage_bps,
-                max_leverage=self.config.max_leverage,
+            test_engine = BacktestEngine(
+                self._window_config(test_start, test_end), self.loader
             )
-            test_engine = BacktestEngine(test_config, self.loader)
             oos_result = test_engine.run(strategy)
 
             is_sharpes.append(in_sample_result.sharpe_ratio)
@@ -556,6 +605,31 @@ class BacktestEngine:
 
         return results
 
+    def walk_forward_parallel(
+        self,
+        strategy: StrategyProtocol,
+        param_grid: dict[str, list] | None = None,
+        max_workers: int | None = None,
+    ) -> Any:
+        """Process-pool variant of ``walk_forward_validation``.
+
+        Fans every (window x param combo) trial out across ``max_workers``
+        processes on isolated strategy copies.  See
+        ``src.backtesting.parallel`` for details.
+
+        Returns:
+            ParallelWalkForwardResult whose ``windows`` list has the same
+            dicts as ``walk_forward_validation``, plus per-trial and
+            wall-clock timing.
+        """
+        from src.backtesting.parallel import parallel_walk_forward
+
+        return parallel_walk_forward(self, strategy, param_grid, max_workers)
+
+    def _window_config(self, start: date, end: date) -> BacktestConfig:
+        """Copy of self.config restricted to a walk-forward window."""
+        return replace(self.config, start_date=start, end_date=end)
+
     @staticmethod
     def _generate_wf_windows(
         start: date,
@@ -609,6 +683,11 @@ class BacktestEngine:
     def _get_prices(self, as_of_date: date, tickers: list[str]) -> dict[str, float]:
         """Fetch PIT prices for tickers, falling back to last known price on gaps.
 
+        ``PointInTimeDataLoader`` instances answer all tickers with one
+        batched ``get_last_prices`` call (a single ``DISTINCT ON`` query, or
+        binary searches on a ``PointInTimeDataCube``).  Other loaders that
+        only implement ``get_market_data`` are queried per ticker.
+
         Args:
             as_of_date: Reference date (PIT enforced by loader).
             tickers: List of ticker strings.
@@ -616,6 +695,9 @@ class BacktestEngine:
         Returns:
             {ticker: price} dict. Missing tickers use last known price if available.
         """
+        if isinstance(self.loader, PointInTimeDataLoader):
+            return self._get_prices_batched(as_of_date, tickers)
+
         prices: dict[str, float] = {}
         for ticker in tickers:
             try:
@@ -631,3 +713,27 @@ class BacktestEngine:
                 if ticker in self._last_known_prices:
                     prices[ticker] = self._last_known_prices[ticker]
         return prices
+
+    def _get_prices_batched(
+        self, as_of_date: date, tickers: list[str]
+    ) -> dict[str, float]:
+        """Single-call variant of ``_get_prices`` via ``get_last_prices``."""
+        try:
+            latest = self.loader.get_last_prices(tickers, as_of_date, lookback_days=5)
+        except Exception as exc:
+            logger.warning(
+                "batched_price_fetch_failed as_of_date=%s error=%s",
+                str(as_of_date),
+                str(exc),
+            )
+            latest = {}
+
+        prices: dict[str, float] = {}
+        for ticker in tickers:
+            close = latest.get(ticker, (0.0, None))[0]
+            if close > 0:
+                prices[ticker] = close
+                self._last_known_prices[ticker] = close
+            elif ticker in self._last_known_prices:
+                prices[ticker] = self._last_known_prices[ticker]
+        return prices
@@ -0,0 +1,282 @@
+"""Parallel walk-forward validation and parameter-grid search.
+
+``BacktestEngine.walk_forward_validation`` runs every (window x param
+combo) trial serially on one mutable strategy instance.  This module fans
+the trials out across a process pool:
+
+1. **Train phase** -- every (window, combo) in-sample trial is submitted
+   at once.  The best-Sharpe trial per window is kept *as* the window's
+   in-sample result (the serial path used to re-run it).
+2. **Test phase** -- one out-of-sample trial per window with its best
+   params, again all windows at once.
+
+Each trial runs on an isolated ``copy.deepcopy`` of the strategy, so
+``setattr`` of grid params never leaks between trials; the copy keeps
+sharing the loader instead of cloning its cached data.  The strategy and
+loader (ideally a warmed ``PointInTimeDataCube``) are pickled once per
+worker via the pool initializer, not once per trial.  Workers are started
+with ``spawn`` so they never inherit the parent's database connection
+pool (already used by the warm-up) or locks held by other threads.
+
+Usage::
+
+    engine = BacktestEngine(config, PointInTimeDataCube(horizon=config.end_date))
+    run = engine.walk_forward_parallel(strategy, {"lookback": [21, 63]})
+    run.windows  # same dicts as walk_forward_validation
+    run.wall_clock_seconds, run.trials
+"""
+
+from __future__ import annotations
+
+import copy
+import itertools
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
+from datetime import date
+from typing import Any, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Worker-side shared state: (strategy, loader, base_config)
+_WORKER_SHARED: Optional[tuple[Any, Any, Any]] = None
+
+
+@dataclass(frozen=True)
+class _Trial:
+    """One backtest to run in a worker."""
+
+    window: int
+    phase: str  # "train" or "test"
+    start_date: date
+    end_date: date
+    params: tuple[tuple[str, Any], ...]
+
+
+@dataclass
+class ParallelWalkForwardResult:
+    """Output of ``parallel_walk_forward``.
+
+    Attributes:
+        windows: Per-window dicts with the same keys as
+            ``BacktestEngine.walk_forward_validation``.
+        trials: One dict per executed trial: window, phase, params,
+            sharpe_ratio, elapsed_seconds.
+        wall_clock_seconds: End-to-end elapsed time.
+        n_workers: Worker processes used (1 = inline).
+    """
+
+    windows: list[dict[str, Any]] = field(default_factory=list)
+    trials: list[dict[str, Any]] = field(default_factory=list)
+    wall_clock_seconds: float = 0.0
+    n_workers: int = 1
+
+
+def _init_worker(shared: tuple[Any, Any, Any]) -> None:
+    """Pool initializer: install the shared (strategy, loader, config)."""
+    global _WORKER_SHARED
+    _WORKER_SHARED = shared
+
+
+def _run_trial(trial: _Trial) -> tuple[_Trial, Any, float]:
+    """Run one trial on an isolated strategy copy (executes in a worker)."""
+    from src.backtesting.engine import BacktestEngine
+
+    assert _WORKER_SHARED is not None, "worker not initialised"
+    strategy, loader, base_config = _WORKER_SHARED
+
+    started = time.perf_counter()
+    trial_strategy = _isolated_copy(strategy, loader)
+    for k, v in trial.params:
+        setattr(trial_strategy, k, v)
+    config = replace(base_config, start_date=trial.start_date, end_date=trial.end_date)
+    result = BacktestEngine(config, loader).run(trial_strategy)
+    return trial, result, time.perf_counter() - started
+
+
+def _isolated_copy(strategy: Any, loader: Any) -> Any:
+    """Deep copy of ``strategy`` that still shares ``loader`` (read-only).
+
+    A plain ``deepcopy`` would also clone the strategy's ``data_loader``
+    -- for a warmed ``PointInTimeDataCube``, every preloaded array.
+    """
+    memo: dict[int, Any] = {id(loader): loader}
+    data_loader = getattr(strategy, "data_loader", None)
+    if data_loader is not None:
+        memo[id(data_loader)] = data_loader
+    return copy.deepcopy(strategy, memo)
+
+
+def _warm_loader(strategy: Any, loader: Any, as_of: date) -> None:
+    """Populate a preloading loader once in the parent before workers start.
+
+    ``PointInTimeDataCube`` loads each series' full history on first touch,
+    so one ``generate_signals`` call pulls in everything the strategy reads;
+    workers then receive those arrays instead of each re-querying.
+    """
+    if not hasattr(loader, "preload"):
+        return
+    try:
+        _isolated_copy(strategy, loader).generate_signals(as_of)
+    except Exception as exc:
+        logger.warning("walk_forward_warmup_failed error=%s", str(exc))
+
+
+def parallel_walk_forward(
+    engine: Any,
+    strategy: Any,
+    param_grid: dict[str, list] | None = None,
+    max_workers: int | None = None,
+) -> ParallelWalkForwardResult:
+    """Walk-forward validation with trials fanned out over a process pool.
+
+    Args:
+        engine: BacktestEngine providing config, loader and window rules.
+        strategy: Strategy instance (never mutated; copied per trial).
+        param_grid: Optional ``{attribute: [candidates]}`` grid.
+        max_workers: Worker processes.  ``None`` = ``os.cpu_count()``;
+            ``1`` runs every trial inline in this process.
+
+    Returns:
+        ParallelWalkForwardResult with the per-window result dicts plus
+        per-trial and wall-clock timing.
+    """
+    global _WORKER_SHARED
+
+    wall_start = time.perf_counter()
+    config = engine.config
+    windows = engine._generate_wf_windows(
+        config.start_date,
+        config.end_date,
+        config.walk_forward_train_months,
+        config.walk_forward_test_months,
+    )
+    if not windows:
+        logger.warning(
+            "walk_forward_no_windows period too short for train=%d test=%d months",
+            config.walk_forward_train_months,
+            config.walk_forward_test_months,
+        )
+        return ParallelWalkForwardResult()
+
+    if param_grid:
+        names = list(param_grid.keys())
+        combos = [
+            tuple(zip(names, values))
+            for values in itertools.product(*param_grid.values())
+        ]
+    else:
+        combos = [()]
+
+    n_workers = max_workers or os.cpu_count() or 1
+    n_workers = max(1, min(n_workers, len(windows) * len(combos)))
+
+    _warm_loader(strategy, engine.loader, config.end_date)
+    shared = (strategy, engine.loader, config)
+
+    executor: Optional[ProcessPoolExecutor] = None
+    if n_workers > 1:
+        # The warm-up above used the sync DB pool; fork would hand its
+        # open connections to every child.
+        executor = ProcessPoolExecutor(
+            max_workers=n_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(shared,),
+        )
+    else:
+        _WORKER_SHARED = shared
+
+    def run_all(trials: list[_Trial]) -> list[tuple[_Trial, Any, float]]:
+        if executor is None:
+            return [_run_trial(t) for t in trials]
+        return list(executor.map(_run_trial, trials))
+
+    trial_log: list[dict[str, Any]] = []
+
+    def record(outcomes: list[tuple[_Trial, Any, float]]) -> None:
+        for trial, result, elapsed in outcomes:
+            trial_log.append(
+                {
+                    "window": trial.window,
+                    "phase": trial.phase,
+                    "params": dict(trial.params),
+                    "sharpe_ratio": result.sharpe_ratio,
+                    "elapsed_seconds": round(elapsed, 4),
+                }
+            )
+
+    try:
+        # Phase 1: all in-sample trials
+        train_trials = [
+            _Trial(i, "train", train_start, train_end, combo)
+            for i, (train_start, train_end, _, _) in enumerate(windows)
+            for combo in combos
+        ]
+        train_outcomes = run_all(train_trials)
+        record(train_outcomes)
+
+        # Best combo per window; first strictly-greater wins (serial order)
+        best: dict[int, tuple[_Trial, Any]] = {}
+        for trial, result, _ in train_outcomes:
+            current = best.get(trial.window)
+            if current is None or result.sharpe_ratio > current[1].sharpe_ratio:
+                best[trial.window] = (trial, result)
+
+        # Phase 2: one out-of-sample trial per window
+        test_trials = [
+            _Trial(i, "test", test_start, test_end, best[i][0].params)
+            for i, (_, _, test_start, test_end) in enumerate(windows)
+        ]
+        test_outcomes = run_all(test_trials)
+        record(test_outcomes)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+        _WORKER_SHARED = None
+
+    results: list[dict[str, Any]] = []
+    for (trial, oos_result, _), (train_start, train_end, test_start, test_end) in zip(
+        test_outcomes, windows
+    ):
+        in_sample_result = best[trial.window][1]
+        results.append(
+            {
+                "window": trial.window,
+                "train_start": train_start,
+                "train_end": train_end,
+                "test_start": test_start,
+                "test_end": test_end,
+                "in_sample_sharpe": in_sample_result.sharpe_ratio,
+                "out_of_sample_sharpe": oos_result.sharpe_ratio,
+                "in_sample_result": in_sample_result,
+                "out_of_sample_result": oos_result,
+                "params_used": dict(trial.params),
+            }
+        )
+
+    wall_clock = time.perf_counter() - wall_start
+    mean_is = float(np.mean([r["in_sample_sharpe"] for r in results]))
+    mean_oos = float(np.mean([r["out_of_sample_sharpe"] for r in results]))
+    logger.info(
+        "walk_forward_parallel_complete n_windows=%d n_trials=%d n_workers=%d "
+        "wall_clock=%.2fs mean_is_sharpe=%.2f mean_oos_sharpe=%.2f",
+        len(results),
+        len(trial_log),
+        n_workers,
+        wall_clock,
+        mean_is,
+        mean_oos,
+    )
+
+    return ParallelWalkForwardResult(
+        windows=results,
+        trials=trial_log,
+        wall_clock_seconds=round(wall_clock, 4),
+        n_workers=n_workers,
+    )
@@ -12,6 +12,25 @@ from datetime import date
 from typing import Any
 
 
+def trade_cost_bps(ticker: str, config: Any) -> float:
+    """One-way cost (transaction cost + slippage) in bps for a ticker.
+
+    Uses the per-instrument ``config.cost_model`` when one is configured,
+    otherwise the flat ``config.transaction_cost_bps``.
+
+    Args:
+        ticker: Instrument ticker.
+        config: BacktestConfig instance with cost parameters.
+
+    Returns:
+        Total one-way cost in basis points.
+    """
+    cost_model = getattr(config, "cost_model", None)
+    if cost_model is not None:
+        return cost_model.get_cost_bps(ticker) + config.slippage_bps
+    return config.transaction_cost_bps + config.slippage_bps
+
+
 class Portfolio:
     """Mutable in-memory portfolio state.
 
@@ -73,7 +92,8 @@ class Portfolio:
         1. Enforce max_leverage: scale weights if sum(abs(w)) > max_leverage
         2. For each ticker in target_weights, compute target notional
         3. Compute trade_notional = target_notional - current_notional
-        4. cost = abs(trade_notional) * (tc_bps + slip_bps) / 10_000
+        4. cost = abs(trade_notional) * (tc_bps + slip_bps) / 10_000, where
+           tc_bps comes from config.cost_model per instrument when set
         5. Deduct cost from cash
         6. Set positions[ticker] = target_notional (skip if price unknown)
         7. Log trade to trade_log with estimated PnL for closed/reduced positions
@@ -109,11 +129,7 @@ class Portfolio:
                 continue
 
             # Transaction cost + slippage
-            cost = (
-                abs(trade_notional)
-                * (config.transaction_cost_bps + config.slippage_bps)
-                / 10_000
-            )
+            cost = abs(trade_notional) * trade_cost_bps(ticker, config) / 10_000
             # Move capital from cash to position (or vice versa) + deduct cost
             self.cash -= trade_notional + cost
 
@@ -154,9 +170,7 @@ class Portfolio:
                 current_notional = self.positions[ticker]
                 if abs(current_notional) > 1.0:
                     cost = (
-                        abs(current_notional)
-                        * (config.transaction_cost_bps + config.slippage_bps)
-                        / 10_000
+                        abs(current_notional) * trade_cost_bps(ticker, config) / 10_000
                     )
                     # Return position notional to cash, deduct exit cost
                     self.cash += current_notional - cost
@@ -3,9 +3,11 @@
 Exports:
 - ``PMSCache`` -- Redis-backed cache for PMS endpoints with tiered TTLs
 - ``get_pms_cache`` -- FastAPI async dependency returning a PMSCache instance
+- ``RiskSnapshotService`` -- materialized, version-keyed risk snapshots
 """
 
 from src.cache.pms_cache import PMSCache
+from src.cache.risk_snapshot import RiskSnapshot, RiskSnapshotService
 from src.core.redis import get_redis
 
 
@@ -22,4 +24,4 @@ async def get_pms_cache() -> PMSCache:
     return PMSCache(redis)
 
 
-__all__ = ["PMSCache", "get_pms_cache"]
+__all__ = ["PMSCache", "RiskSnapshot", "RiskSnapshotService", "get_pms_cache"]
@@ -89,6 +89,38 @@ class PMSCache:
         """Cache live risk metrics."""
         await self._set(f"{KEY_PREFIX}risk:live", data, ttl)
 
+    # ------------------------------------------------------------------
+    # Materialized risk snapshot (see src.cache.risk_snapshot) -- 60s TTL
+    # ------------------------------------------------------------------
+    async def get_risk_snapshot(self) -> Optional[dict]:
+        """Retrieve the latest materialized risk snapshot, or ``None``."""
+        return await self._get(f"{KEY_PREFIX}risk:snapshot")
+
+    async def set_risk_snapshot(self, data: dict, ttl: int = TTL_RISK) -> None:
+        """Cache the latest materialized risk snapshot."""
+        await self._set(f"{KEY_PREFIX}risk:snapshot", data, ttl)
+
+    # ------------------------------------------------------------------
+    # Book / price version counters (no TTL)
+    # ------------------------------------------------------------------
+    async def get_versions(self) -> Optional[dict]:
+        """Return ``{"book": int, "price": int}``, or ``None`` on error."""
+        try:
+            book, price = await self._redis.mget(
+                f"{KEY_PREFIX}book_version", f"{KEY_PREFIX}price_version"
+            )
+            return {"book": int(book or 0), "price": int(price or 0)}
+        except Exception:
+            logger.warning("PMSCache: version read failed", exc_info=True)
+            return None
+
+    async def bump_price_version(self) -> None:
+        """Record a price update (market data ingestion, MTM marks)."""
+        try:
+            await self._redis.incr(f"{KEY_PREFIX}price_version")
+        except Exception:
+            logger.warning("PMSCache: price version bump failed", exc_info=True)
+
     # ------------------------------------------------------------------
     # Attribution -- 300s TTL
     # ------------------------------------------------------------------
@@ -112,6 +144,8 @@ class PMSCache:
         (position open/close, MTM, trade approval).
         """
         try:
+            # New book version: materialized risk snapshots recompute
+            await self._redis.incr(f"{KEY_PREFIX}book_version")
             # Delete deterministic keys
             await self._redis.delete(
                 f"{KEY_PREFIX}book",
@@ -0,0 +1,275 @@
+"""Materialized risk snapshots shared by the /risk endpoints.
+
+Instead of each request loading positions and returns and recomputing
+VaR, stress and the dashboard, a ``RiskSnapshotService`` computes all of
+them together once per *book version* and serves every request from the
+latest snapshot:
+
+- The book version is the ``pms:book_version`` / ``pms:price_version``
+  counters in Redis (bumped by ``PMSCache.invalidate_portfolio_data`` and
+  ``PMSCache.bump_price_version``), so every API process agrees on it and
+  a version change means "recompute". Only when Redis is unavailable does
+  it fall back to a process-local epoch (``notify_book_changed``).
+- Snapshots older than ``max_age_seconds`` are recomputed even if the
+  version is unchanged (prices drift between explicit updates).
+- Concurrent requests for the same version share one computation: the
+  first caller submits it to a single worker thread and the rest await
+  the same ``concurrent.futures.Future``.
+- Finished snapshots are written through to Redis (``PMSCache``) so other
+  API processes read them instead of recomputing.
+
+``run`` is the background producer: it polls the version and refreshes
+the snapshot ahead of requests.
+
+Usage::
+
+    service = RiskSnapshotService(compute_fn=build_payload)
+    snapshot = await service.get()
+    snapshot.payload["var"], snapshot.meta()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Optional
+
+from src.cache.pms_cache import TTL_RISK, PMSCache
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RiskSnapshot:
+    """One materialized risk computation.
+
+    Attributes:
+        snapshot_id: Short id unique per (version, computation time).
+        version: Book version the snapshot was computed for.
+        as_of: UTC time the computation finished.
+        payload: Section name -> endpoint-ready data.
+        compute_seconds: Wall time of the computation.
+    """
+
+    snapshot_id: str
+    version: str
+    as_of: datetime
+    payload: dict = field(default_factory=dict)
+    compute_seconds: float = 0.0
+
+    def staleness_seconds(self, now: datetime | None = None) -> float:
+        now = now or datetime.now(timezone.utc)
+        return max((now - self.as_of).total_seconds(), 0.0)
+
+    def meta(self) -> dict:
+        """Snapshot identity and staleness for response envelopes."""
+        return {
+            "snapshot_id": self.snapshot_id,
+            "book_version": self.version,
+            "as_of": self.as_of.isoformat(),
+            "staleness_seconds": round(self.staleness_seconds(), 3),
+        }
+
+    def to_dict(self) -> dict:
+        return {
+            "snapshot_id": self.snapshot_id,
+            "version": self.version,
+            "as_of": self.as_of.isoformat(),
+            "payload": self.payload,
+            "compute_seconds": self.compute_seconds,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> RiskSnapshot:
+        return cls(
+            snapshot_id=data["snapshot_id"],
+            version=data["version"],
+            as_of=datetime.fromisoformat(data["as_of"]),
+            payload=data.get("payload", {}),
+            compute_seconds=float(data.get("compute_seconds", 0.0)),
+        )
+
+
+class RiskSnapshotService:
+    """Produces and serves risk snapshots keyed by book version.
+
+    Parameters
+    ----------
+    compute_fn : callable
+        Synchronous function returning the snapshot payload dict; runs on
+        a worker thread.
+    cache_factory : async callable, optional
+        Returns a :class:`PMSCache` (e.g. ``src.cache.get_pms_cache``).
+        Without one, snapshots and versions stay process-local.
+    max_age_seconds : float
+        Recompute snapshots older than this even if the version is unchanged.
+    """
+
+    def __init__(
+        self,
+        compute_fn: Callable[[], dict],
+        cache_factory: Optional[Callable[[], Awaitable[PMSCache]]] = None,
+        max_age_seconds: float = float(TTL_RISK),
+    ) -> None:
+        self._compute_fn = compute_fn
+        self._cache_factory = cache_factory
+        self.max_age_seconds = max_age_seconds
+        self._latest: RiskSnapshot | None = None
+        self._local_epoch = 0
+        self._lock = threading.Lock()
+        self._inflight: dict[str, Future] = {}
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="risk-snapshot"
+        )
+        self.computations = 0
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+    @property
+    def latest(self) -> RiskSnapshot | None:
+        return self._latest
+
+    def notify_book_changed(self) -> None:
+        """Mark the in-process book as changed.
+
+        Only affects the version while Redis is unavailable; with Redis the
+        shared counters already move on every PMS write.
+        """
+        with self._lock:
+            self._local_epoch += 1
+
+    async def get(self) -> RiskSnapshot:
+        """Return a snapshot for the current book version.
+
+        In-memory hit -> Redis hit -> (coalesced) computation.
+        """
+        version = await self._current_version()
+        snapshot = self._latest
+        if self._is_current(snapshot, version):
+            return snapshot
+
+        cached = await self._load_shared()
+        if self._is_current(cached, version):
+            self._latest = cached
+            return cached
+
+        return await self.refresh(version)
+
+    async def refresh(self, version: str | None = None) -> RiskSnapshot:
+        """Compute (or join the in-flight computation of) ``version``."""
+        if version is None:
+            version = await self._current_version()
+        future, started = self._submit(version)
+        snapshot = await asyncio.wrap_future(future)
+        if started:
+            await self._store_shared(snapshot)
+        return snapshot
+
+    async def run(self, poll_seconds: float = 5.0) -> None:
+        """Background producer: refresh whenever the version changes."""
+        while True:
+            try:
+                version = await self._current_version()
+                if not self._is_current(self._latest, version):
+                    await self.refresh(version)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning("Risk snapshot refresh failed", exc_info=True)
+            await asyncio.sleep(poll_seconds)
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+    def _is_current(self, snapshot: RiskSnapshot | None, version: str) -> bool:
+        return (
+            snapshot is not None
+            and snapshot.version == version
+            and snapshot.staleness_seconds() < self.max_age_seconds
+        )
+
+    def _submit(self, version: str) -> tuple[Future, bool]:
+        """Return the in-flight future for ``version``, starting one if needed."""
+        with self._lock:
+            future = self._inflight.get(version)
+            if future is not None:
+                return future, False
+            future = self._executor.submit(self._produce, version)
+            self._inflight[version] = future
+
+        def _done(_: Future, key: str = version) -> None:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+        future.add_done_callback(_done)
+        return future, True
+
+    def _produce(self, version: str) -> RiskSnapshot:
+        t0 = time.perf_counter()
+        payload = self._compute_fn()
+        as_of = datetime.now(timezone.utc)
+        digest = hashlib.blake2b(
+            f"{version}|{as_of.isoformat()}".encode(), digest_size=6
+        ).hexdigest()
+        snapshot = RiskSnapshot(
+            snapshot_id=digest,
+            version=version,
+            as_of=as_of,
+            payload=payload,
+            compute_seconds=round(time.perf_counter() - t0, 3),
+        )
+        self._latest = snapshot
+        self.computations += 1
+        logger.info(
+            "Risk snapshot %s computed for version %s in %.3fs",
+            digest,
+            version,
+            snapshot.compute_seconds,
+        )
+        return snapshot
+
+    async def _cache(self) -> PMSCache | None:
+        if self._cache_factory is None:
+            return None
+        try:
+            return await self._cache_factory()
+        except Exception:
+            logger.debug("Risk snapshot cache unavailable", exc_info=True)
+            return None
+
+    async def _current_version(self) -> str:
+        cache = await self._cache()
+        if cache is not None:
+            versions = await cache.get_versions()
+            if versions is not None:
+                return f"{versions['book']}.{versions['price']}"
+        return f"local:{self._local_epoch}"
+
+    async def _load_shared(self) -> RiskSnapshot | None:
+        cache = await self._cache()
+        if cache is None:
+            return None
+        data = await cache.get_risk_snapshot()
+        if data is None:
+            return None
+        try:
+            return RiskSnapshot.from_dict(data)
+        except (KeyError, TypeError, ValueError):
+            logger.warning("Discarding malformed cached risk snapshot")
+            return None
+
+    async def _store_shared(self, snapshot: RiskSnapshot) -> None:
+        cache = await self._cache()
+        if cache is not None:
+            await cache.set_risk_snapshot(snapshot.to_dict())
+
@@ -2,7 +2,9 @@
 
 Provides immutable, tamper-evident audit trail for all PMS events.
 Each record includes a SHA-256 checksum covering the canonical fields
-so downstream consumers can verify integrity.
+and the previous record's checksum, so the file trail forms a chain that
+:meth:`AuditLogger.verify_chain` can check end to end.  Records are stored
+in daily, indexed segments (see :mod:`src.compliance.audit_store`).
 
 All functions tolerate database unavailability -- file logging is the
 primary store; DB insert is best-effort.
@@ -20,6 +22,8 @@ from typing import Any
 
 import structlog
 
+from src.compliance.audit_store import shared_store, to_epoch
+
 logger = structlog.get_logger(__name__)
 
 # ---------------------------------------------------------------------------
@@ -64,9 +68,9 @@ def _compute_checksum(record: dict[str, Any]) -> str:
     """Compute SHA-256 over the canonical fields of an audit record.
 
     The checksum covers: event_timestamp, event_type, entity_type,
-    entity_id, user, action, before_state, after_state, severity.
-    Metadata is intentionally excluded so enrichment does not
-    invalidate the checksum.
+    entity_id, user, action, before_state, after_state, severity and,
+    for chained records, prev_checksum.  Metadata is intentionally
+    excluded so enrichment does not invalidate the checksum.
     """
     canonical_fields = [
         str(record.get("event_timestamp", "")),
@@ -79,6 +83,8 @@ def _compute_checksum(record: dict[str, Any]) -> str:
         json.dumps(record.get("after_state"), sort_keys=True, default=str),
         str(record.get("severity", "")),
     ]
+    if "prev_checksum" in record:  # records written before chaining lack it
+        canonical_fields.append(str(record["prev_checksum"] or ""))
     payload = "|".join(canonical_fields).encode("utf-8")
     return hashlib.sha256(payload).hexdigest()
 
@@ -92,9 +98,12 @@ class AuditLogger:
     """Immutable audit logger with dual-write (JSONL file + optional DB).
 
     Args:
-        audit_dir: Directory for the JSONL file. Defaults to ``logs/``
+        audit_dir: Directory for the JSONL segments. Defaults to ``logs/``
             at the project root.
-        audit_file: Filename within *audit_dir*. Defaults to ``audit.jsonl``.
+        audit_file: Legacy single-file name within *audit_dir*. Defaults
+            to ``audit.jsonl``; its stem names the daily segments
+            (``audit-YYYYMMDD.jsonl``) and, if present, it is read as the
+            oldest segment.
         db_session_factory: Optional callable that returns a DB session.
             If provided, each event is *also* inserted into an
             ``audit_events`` table. DB failures are logged but never
@@ -113,6 +122,7 @@ class AuditLogger:
 
         # Ensure the audit directory exists
         Path(self._audit_dir).mkdir(parents=True, exist_ok=True)
+        self._store = shared_store(self._audit_dir, audit_file)
 
         logger.info(
             "audit_logger.init",
@@ -165,9 +175,8 @@ class AuditLogger:
             "metadata": metadata or {},
             "severity": str(severity.value if isinstance(severity, Severity) else severity),
         }
-        record["checksum"] = _compute_checksum(record)
 
-        # --- File write (primary) ---
+        # --- File write (primary; chains and checksums the record) ---
         self._write_jsonl(record)
 
         # --- DB write (best-effort) ---
@@ -233,11 +242,11 @@ class AuditLogger:
         end_time: datetime | None = None,
         limit: int = 500,
     ) -> list[dict[str, Any]]:
-        """Read audit trail from the JSONL file with optional filters.
+        """Read the audit trail from the JSONL segments with optional filters.
 
-        This scans the file sequentially -- suitable for operational queries
-        and compliance review, not for high-frequency analytics. For heavy
-        queries, use the DB copy.
+        Segments are visited newest first; their sidecar indexes select
+        the matching records, which are read by offset until *limit* is
+        reached.  Segments outside the time range are skipped unread.
 
         Args:
             event_type: Filter by event type.
@@ -250,63 +259,52 @@ class AuditLogger:
         Returns:
             List of matching audit records, most recent first.
         """
-        if not os.path.exists(self._audit_path):
-            return []
-
-        records: list[dict[str, Any]] = []
-        et_str = str(
-            event_type.value if isinstance(event_type, EventType) else event_type
-        ) if event_type else None
-        sev_str = str(
-            severity.value if isinstance(severity, Severity) else severity
-        ) if severity else None
+        filters: dict[str, str] = {}
+        if event_type:
+            filters["event_type"] = str(
+                event_type.value if isinstance(event_type, EventType) else event_type
+            )
+        if entity_id:
+            filters["entity_id"] = entity_id
+        if severity:
+            filters["severity"] = str(
+                severity.value if isinstance(severity, Severity) else severity
+            )
 
         try:
-            with open(self._audit_path, "r", encoding="utf-8") as fh:
-                for line in fh:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        rec = json.loads(line)
-                    except json.JSONDecodeError:
-                        continue
-
-                    # Apply filters
-                    if et_str and rec.get("event_type") != et_str:
-                        continue
-                    if entity_id and rec.get("entity_id") != entity_id:
-                        continue
-                    if sev_str and rec.get("severity") != sev_str:
-                        continue
-                    if start_time:
-                        rec_ts = datetime.fromisoformat(rec["event_timestamp"])
-                        if rec_ts < start_time:
-                            continue
-                    if end_time:
-                        rec_ts = datetime.fromisoformat(rec["event_timestamp"])
-                        if rec_ts > end_time:
-                            continue
-
-                    records.append(rec)
-        except OSError as exc:
+            return self._store.query(
+                filters,
+                start=to_epoch(start_time) if start_time else None,
+                end=to_epoch(end_time) if end_time else None,
+                limit=limit,
+            )
+        except (OSError, ValueError) as exc:
             logger.error("audit_logger.read_error", error=str(exc))
             return []
 
-        # Most recent first, apply limit
-        records.reverse()
-        return records[:limit]
+    def verify_chain(self) -> dict[str, Any]:
+        """Verify every record's checksum and the checksum chain.
+
+        Returns:
+            Dict with ``valid`` (bool), ``records`` (count checked) and
+            ``errors`` (segment, line and reason of each problem).
+        """
+        return self._store.verify(_compute_checksum)
+
+    def close(self) -> None:
+        """Close the long-lived segment writer."""
+        self._store.close()
 
     # ------------------------------------------------------------------
     # Internal write methods
     # ------------------------------------------------------------------
 
     def _write_jsonl(self, record: dict[str, Any]) -> None:
-        """Append a single JSON line to the audit file."""
+        """Chain, checksum and append the record to today's segment."""
         try:
-            with open(self._audit_path, "a", encoding="utf-8") as fh:
-                fh.write(json.dumps(record, default=str) + "\n")
+            self._store.append(record, _compute_checksum)
         except OSError as exc:
+            record.setdefault("checksum", _compute_checksum(record))
             logger.error(
                 "audit_logger.file_write_error",
                 error=str(exc),
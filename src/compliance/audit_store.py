@@ -0,0 +1,462 @@
+"""Segmented, indexed file store behind :class:`~src.compliance.audit.AuditLogger`.
+
+The audit trail used to be a single JSONL file that was reopened for every
+event and fully parsed for every query.  This store keeps the same JSONL
+record format but:
+
+- rotates daily into append-only segments ``<stem>-YYYYMMDD.jsonl``
+  (a pre-existing ``<stem>.jsonl`` is kept as the oldest segment);
+- writes through one long-lived binary append handle per process,
+  flushed after every record;
+- keeps a sidecar index per segment (``<segment>.idx``) with each
+  record's byte offset, timestamp, ``event_type``, ``entity_id`` and
+  ``severity``, from which postings lists are built.  Indexes are caught
+  up incrementally from their ``indexed_bytes`` mark, so records appended
+  by other processes are picked up on the next query, and each catch-up
+  appends only its new entries to the sidecar;
+- answers queries newest segment first, intersecting postings, seeking
+  straight to the matching records and stopping at ``limit``;
+- chains records: each one carries ``prev_checksum`` (the previous
+  record's checksum, across segments), which ``verify`` checks along
+  with every record's own checksum.  Reading the chain tail and writing
+  the record happen under an exclusive ``flock`` on ``.<stem>.lock``, so
+  concurrent writers -- other store instances or other processes -- never
+  fork the chain.  A record stamped just before midnight but written after
+  the next day's segment exists goes into that newer segment, so segment
+  order always matches write (and chain) order.  :func:`shared_store` hands out one store per audit
+  directory within a process.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+import structlog
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover -- non-POSIX: in-process locking only
+    fcntl = None
+
+logger = structlog.get_logger(__name__)
+
+SEGMENT_DATE_FORMAT = "%Y%m%d"
+INDEXED_FIELDS = ("event_type", "entity_id", "severity")
+_INDEX_SUFFIX = ".idx"
+_INDEX_VERSION = 2
+
+ChecksumFn = Callable[[dict[str, Any]], str]
+
+_shared_stores: dict[tuple[str, str], SegmentedAuditStore] = {}
+_shared_stores_lock = threading.Lock()
+
+
+def to_epoch(value: datetime | str) -> float:
+    """Epoch seconds of an ISO string or datetime (naive = UTC)."""
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+class _SegmentIndex:
+    """Byte offsets, timestamps and postings of one segment's records.
+
+    ``pending`` holds the entries added since the sidecar was last written
+    and ``persisted_bytes`` the segment offset the sidecar covers, so a
+    catch-up appends only the new entries to the sidecar.
+    """
+
+    __slots__ = (
+        "indexed_bytes",
+        "offsets",
+        "ts",
+        "postings",
+        "min_ts",
+        "max_ts",
+        "pending",
+        "persisted_bytes",
+    )
+
+    def __init__(self) -> None:
+        self.indexed_bytes = 0
+        self.offsets: list[int] = []
+        self.ts: list[float] = []
+        self.postings: dict[str, dict[str, list[int]]] = {f: {} for f in INDEXED_FIELDS}
+        self.min_ts = float("inf")
+        self.max_ts = float("-inf")
+        self.pending: list[list[Any]] = []
+        self.persisted_bytes = 0
+
+    def add(self, offset: int, record: dict[str, Any]) -> None:
+        entry = [offset, to_epoch(record["event_timestamp"])]
+        entry += [str(record.get(name)) for name in INDEXED_FIELDS]
+        self.add_entry(entry)
+        self.pending.append(entry)
+
+    def add_entry(self, entry: list[Any]) -> None:
+        """Index one ``[offset, ts, *INDEXED_FIELDS values]`` entry."""
+        offset, ts, *values = entry
+        ordinal = len(self.offsets)
+        self.offsets.append(offset)
+        self.ts.append(ts)
+        self.min_ts = min(self.min_ts, ts)
+        self.max_ts = max(self.max_ts, ts)
+        for name, value in zip(INDEXED_FIELDS, values):
+            self.postings[name].setdefault(value, []).append(ordinal)
+
+    def match(self, filters: dict[str, str]) -> Iterable[int]:
+        """Matching ordinals, newest first."""
+        if not filters:
+            return range(len(self.offsets) - 1, -1, -1)
+        lists = [self.postings[name].get(value, []) for name, value in filters.items()]
+        lists.sort(key=len)
+        if len(lists) == 1:
+            return reversed(lists[0])
+        others = [set(lst) for lst in lists[1:]]
+        return [i for i in reversed(lists[0]) if all(i in s for s in others)]
+
+    def take_chunk(self) -> dict[str, Any]:
+        """Sidecar line for the entries indexed since the last write."""
+        chunk = {
+            "from": self.persisted_bytes,
+            "to": self.indexed_bytes,
+            "entries": self.pending,
+        }
+        self.pending = []
+        self.persisted_bytes = self.indexed_bytes
+        return chunk
+
+
+class SegmentedAuditStore:
+    """Daily-segmented JSONL audit store with sidecar indexes.
+
+    Args:
+        audit_dir: Directory holding the segments.
+        audit_file: Legacy single-file name; its stem names the segments
+            (``audit.jsonl`` -> ``audit-YYYYMMDD.jsonl``).
+    """
+
+    def __init__(self, audit_dir: str | os.PathLike, audit_file: str = "audit.jsonl") -> None:
+        self._dir = Path(audit_dir)
+        self._legacy = self._dir / audit_file
+        self._stem = Path(audit_file).stem
+        self._lock = threading.RLock()
+        self._fh = None
+        self._fh_path: Path | None = None
+        self._lock_fh = None
+        self._known_size = -1  # segment size after our last write
+        self._last_checksum: str | None = None
+        self._indexes: dict[Path, _SegmentIndex] = {}
+
+    # ------------------------------------------------------------------
+    # Segments
+    # ------------------------------------------------------------------
+
+    def segment_path(self, when: datetime) -> Path:
+        day = when.astimezone(timezone.utc) if when.tzinfo else when
+        return self._dir / f"{self._stem}-{day.strftime(SEGMENT_DATE_FORMAT)}.jsonl"
+
+    def segments(self) -> list[Path]:
+        """All segments, oldest first (legacy single file before the dailies)."""
+        daily = sorted(self._dir.glob(f"{self._stem}-[0-9]*.jsonl"))
+        return ([self._legacy] if self._legacy.exists() else []) + daily
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def append(self, record: dict[str, Any], checksum_fn: ChecksumFn) -> None:
+        """Chain, checksum and append ``record`` to its day's segment.
+
+        Sets ``record["prev_checksum"]`` and ``record["checksum"]``.
+
+        Raises:
+            OSError: If the segment cannot be opened or written.
+        """
+        when = datetime.fromisoformat(record["event_timestamp"])
+        with self._lock, self._chain_lock():
+            path = self._append_segment(when)
+            fh = self._writer(path)
+            offset = os.fstat(fh.fileno()).st_size
+            if offset != self._known_size:
+                # First write, new segment, or another process appended
+                self._last_checksum = self._find_last_checksum(path)
+            record["prev_checksum"] = self._last_checksum
+            record["checksum"] = checksum_fn(record)
+
+            line = (json.dumps(record, default=str) + "\n").encode("utf-8")
+            fh.write(line)
+            fh.flush()
+            self._known_size = offset + len(line)
+            self._last_checksum = record["checksum"]
+
+            index = self._indexes.get(path)
+            if index is not None and index.indexed_bytes == offset:
+                index.add(offset, record)
+                index.indexed_bytes = self._known_size
+
+    def close(self) -> None:
+        with self._lock:
+            self._close_writer()
+            if self._lock_fh is not None:
+                self._lock_fh.close()
+                self._lock_fh = None
+
+    @contextmanager
+    def _chain_lock(self):
+        """Hold the directory-wide write lock across tail read and append."""
+        if fcntl is None:
+            yield
+            return
+        if self._lock_fh is None:
+            self._lock_fh = open(self._dir / f".{self._stem}.lock", "ab")  # noqa: SIM115
+        fcntl.flock(self._lock_fh.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(self._lock_fh.fileno(), fcntl.LOCK_UN)
+
+    def _close_writer(self) -> None:
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+            self._fh_path = None
+
+    def _writer(self, path: Path):
+        if self._fh_path != path:
+            self._close_writer()
+            self._fh = open(path, "ab")  # noqa: SIM115 -- long-lived handle
+            self._fh_path = path
+            self._known_size = -1
+        return self._fh
+
+    def _append_segment(self, when: datetime) -> Path:
+        """Segment to append a record stamped ``when`` to (under the lock).
+
+        Normally ``when``'s day segment; if a newer daily segment already
+        exists (another writer crossed midnight first), that one instead.
+        """
+        path = self.segment_path(when)
+        behind = self._fh_path is not None and self._fh_path.name > path.name
+        if not behind and not self.segment_path(when + timedelta(days=1)).exists():
+            return path
+        daily = sorted(self._dir.glob(f"{self._stem}-[0-9]*.jsonl"))
+        return max([path, *daily[-1:]], key=lambda p: p.name)
+
+    def _find_last_checksum(self, path: Path) -> str | None:
+        """Checksum of the newest record at or before ``path``'s segment."""
+        for segment in reversed(self.segments()):
+            if segment != path and segment.name > path.name and segment != self._legacy:
+                continue
+            checksum = _tail_checksum(segment)
+            if checksum is not None:
+                return checksum
+        return None
+
+    # ------------------------------------------------------------------
+    # Querying
+    # ------------------------------------------------------------------
+
+    def query(
+        self,
+        filters: dict[str, str],
+        start: float | None = None,
+        end: float | None = None,
+        limit: int = 500,
+    ) -> list[dict[str, Any]]:
+        """Matching records, most recent first, reading only what is returned.
+
+        Args:
+            filters: Exact-match values for fields in ``INDEXED_FIELDS``.
+            start / end: Inclusive epoch-seconds bounds.
+            limit: Maximum number of records.
+        """
+        results: list[dict[str, Any]] = []
+        if limit <= 0:
+            return results
+        for path in reversed(self.segments()):
+            index = self._index(path)
+            if not index.offsets:
+                continue
+            if start is not None and index.max_ts < start and path != self._legacy:
+                break  # every older daily segment is older still
+            if (start is not None and index.max_ts < start) or (
+                end is not None and index.min_ts > end
+            ):
+                continue
+            with open(path, "rb") as fh:
+                for ordinal in index.match(filters):
+                    ts = index.ts[ordinal]
+                    if (start is not None and ts < start) or (end is not None and ts > end):
+                        continue
+                    fh.seek(index.offsets[ordinal])
+                    results.append(json.loads(fh.readline()))
+                    if len(results) >= limit:
+                        return results
+        return results
+
+    def _index(self, path: Path) -> _SegmentIndex:
+        """The segment's index, loaded from its sidecar and caught up."""
+        with self._lock:
+            index = self._indexes.get(path)
+            if index is None:
+                index = self._load_sidecar(path)
+            size = path.stat().st_size
+            if size < index.indexed_bytes:
+                index = _SegmentIndex()  # segment replaced -- rebuild
+            if size > index.indexed_bytes:
+                self._catch_up(path, index)
+                self._save_sidecar(path, index)
+            self._indexes[path] = index
+            return index
+
+    @staticmethod
+    def _catch_up(path: Path, index: _SegmentIndex) -> None:
+        """Index the complete lines appended since ``indexed_bytes``."""
+        with open(path, "rb") as fh:
+            fh.seek(index.indexed_bytes)
+            offset = index.indexed_bytes
+            for line in fh:
+                if not line.endswith(b"\n"):
+                    break  # partially written record; index it next time
+                if line.strip():
+                    try:
+                        index.add(offset, json.loads(line))
+                    except (ValueError, KeyError, TypeError):
+                        logger.warning(
+                            "audit_store.unparseable_record", segment=path.name, offset=offset
+                        )
+                offset += len(line)
+            index.indexed_bytes = offset
+
+    @staticmethod
+    def _load_sidecar(path: Path) -> _SegmentIndex:
+        """Replay the sidecar: a version header, then one chunk per catch-up.
+
+        A chunk applies only if it starts where the previous one ended, so
+        chunks appended twice by racing processes are skipped.
+        """
+        sidecar = path.with_name(path.name + _INDEX_SUFFIX)
+        index = _SegmentIndex()
+        try:
+            with open(sidecar, "rb") as fh:
+                header = json.loads(fh.readline())
+                if header.get("version") != _INDEX_VERSION:
+                    raise ValueError("unsupported audit index version")
+                for line in fh:
+                    if not line.endswith(b"\n"):
+                        break  # torn final chunk; caught up from the segment
+                    chunk = json.loads(line)
+                    if chunk["from"] != index.indexed_bytes:
+                        continue
+                    for entry in chunk["entries"]:
+                        index.add_entry(entry)
+                    index.indexed_bytes = int(chunk["to"])
+        except FileNotFoundError:
+            return _SegmentIndex()
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            logger.warning("audit_store.sidecar_rebuilt", segment=path.name)
+            return _SegmentIndex()
+        index.persisted_bytes = index.indexed_bytes
+        return index
+
+    @staticmethod
+    def _save_sidecar(path: Path, index: _SegmentIndex) -> None:
+        """Append the new entries to the sidecar (rewrite it when rebuilt)."""
+        sidecar = path.with_name(path.name + _INDEX_SUFFIX)
+        fresh = index.persisted_bytes == 0
+        line = (json.dumps(index.take_chunk(), separators=(",", ":")) + "\n").encode("utf-8")
+        try:
+            if fresh:
+                header = json.dumps({"version": _INDEX_VERSION}) + "\n"
+                tmp = sidecar.with_name(f"{sidecar.name}.{os.getpid()}.tmp")
+                with open(tmp, "wb") as fh:
+                    fh.write(header.encode("utf-8") + line)
+                os.replace(tmp, sidecar)
+            else:
+                with open(sidecar, "ab") as fh:
+                    fh.write(line)
+        except OSError as exc:
+            logger.warning("audit_store.sidecar_write_error", error=str(exc))
+
+    # ------------------------------------------------------------------
+    # Verification
+    # ------------------------------------------------------------------
+
+    def verify(self, checksum_fn: ChecksumFn) -> dict[str, Any]:
+        """Recompute every checksum and check the ``prev_checksum`` links.
+
+        Records written before chaining (no ``prev_checksum``) are checked
+        individually.
+
+        Returns:
+            Dict with ``valid``, ``records`` and ``errors`` (segment,
+            line number and reason of each problem).
+        """
+        errors: list[dict[str, Any]] = []
+        count = 0
+        prev: str | None = None
+        for path in self.segments():
+            with open(path, "r", encoding="utf-8") as fh:
+                for lineno, line in enumerate(fh, start=1):
+                    if not line.strip():
+                        continue
+                    where = {"segment": path.name, "line": lineno}
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        errors.append({**where, "error": "unparseable record"})
+                        continue
+                    count += 1
+                    if record.get("checksum") != checksum_fn(record):
+                        errors.append({**where, "error": "checksum mismatch"})
+                    if "prev_checksum" in record and record["prev_checksum"] != prev:
+                        errors.append({**where, "error": "broken chain link"})
+                    prev = record.get("checksum")
+        return {"valid": not errors, "records": count, "errors": errors}
+
+
+def shared_store(audit_dir: str | os.PathLike, audit_file: str = "audit.jsonl") -> SegmentedAuditStore:
+    """The process-wide store for ``audit_dir`` / ``audit_file``.
+
+    Loggers created per request share its writer handle and indexes
+    instead of each reopening the segment and rebuilding the postings.
+    """
+    key = (os.path.realpath(audit_dir), audit_file)
+    with _shared_stores_lock:
+        store = _shared_stores.get(key)
+        if store is None:
+            store = _shared_stores[key] = SegmentedAuditStore(audit_dir, audit_file)
+        return store
+
+
+def _tail_checksum(path: Path, window: int = 65_536) -> str | None:
+    """Checksum of the last complete record in ``path`` (reads only the tail)."""
+    try:
+        size = path.stat().st_size
+    except FileNotFoundError:
+        return None
+    with open(path, "rb") as fh:
+        while True:
+            start = max(size - window, 0)
+            fh.seek(start)
+            lines = fh.read(size - start).split(b"\n")
+            # The first piece may be a partial line unless we read from 0
+            candidates = lines if start == 0 else lines[1:]
+            for line in reversed(candidates):
+                if line.strip():
+                    try:
+                        return json.loads(line).get("checksum")
+                    except ValueError:
+                        continue  # partially written tail
+            if start == 0:
+                return None
+            window *= 4
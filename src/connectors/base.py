@@ -3,9 +3,13 @@
 Provides the BaseConnector abstract class with:
 - Async HTTP client via httpx with connection pooling
 - Retry with exponential backoff + jitter via tenacity
-- Rate limiting via asyncio.Semaphore
+- Rate limiting via a token bucket (requests/second) plus an
+  asyncio.Semaphore bounding requests in flight
+- Concurrent multi-request fetching via ``fetch_many`` / ``fetch_series_many``
 - Structured logging via structlog
-- Reusable _bulk_insert with ON CONFLICT DO NOTHING for idempotent ingestion
+- Reusable _bulk_insert with ON CONFLICT DO NOTHING for idempotent ingestion;
+  large loads stream through COPY into a staging table and merge in one
+  set-based INSERT ... SELECT (see _copy_insert)
 
 Exception hierarchy:
 - ConnectorError: base for all connector errors
@@ -17,6 +21,8 @@ Exception hierarchy:
 import abc
 import asyncio
 import inspect
+import time
+from collections.abc import Awaitable, Callable, Hashable, Mapping
 from datetime import date, timedelta
 from typing import Any
 
@@ -31,7 +37,7 @@ from tenacity import (
     wait_exponential_jitter,
 )
 
-from src.core.database import async_session_factory
+from src.core.database import async_engine, async_session_factory
 from src.core.models.data_sources import DataSource
 
 
@@ -54,6 +60,103 @@ class FetchError(ConnectorError):
     """Raised when an HTTP request fails after all retry attempts."""
 
 
+# ---------------------------------------------------------------------------
+# COPY + merge SQL
+# ---------------------------------------------------------------------------
+def _python_defaults(table: Any) -> dict[str, Callable[[], Any]]:
+    """Column name -> producer of its ORM Python-side default.
+
+    ``insert()`` fills these for rows that omit the column; COPY bypasses
+    the ORM, so ``_copy_insert`` applies them itself.  SQL-expression and
+    sequence defaults are left to the database.
+    """
+    defaults: dict[str, Callable[[], Any]] = {}
+    for column in table.c:
+        default = column.default
+        if default is None:
+            continue
+        if default.is_scalar:
+            defaults[column.name] = lambda arg=default.arg: arg
+        elif default.is_callable:
+            defaults[column.name] = lambda fn=default.arg: fn(None)
+    return defaults
+
+
+def _copy_merge_sql(
+    table: str,
+    columns: list[str],
+    constraint_name: str,
+    staging: str,
+    quote: Callable[[str], str] = lambda ident: f'"{ident}"',
+) -> tuple[str, str]:
+    """Build the staging-table DDL and the set-based merge for _copy_insert.
+
+    The staging table is a session-local TEMP table (never WAL-logged,
+    dropped on commit) holding only the copied columns, so identity and
+    server defaults are applied once, by the merge into the target.
+
+    Args:
+        table: Target table name.
+        columns: Columns being loaded, in COPY order.
+        constraint_name: Unique constraint for ON CONFLICT DO NOTHING.
+        staging: Staging table name.
+        quote: Identifier quoting function (dialect preparer in production).
+
+    Returns:
+        ``(create_sql, merge_sql)``.
+    """
+    cols = ", ".join(quote(c) for c in columns)
+    create_sql = (
+        f"CREATE TEMP TABLE {quote(staging)} ON COMMIT DROP AS "
+        f"SELECT {cols} FROM {quote(table)} WITH NO DATA"
+    )
+    merge_sql = (
+        f"INSERT INTO {quote(table)} ({cols}) "
+        f"SELECT {cols} FROM {quote(staging)} "
+        f"ON CONFLICT ON CONSTRAINT {quote(constraint_name)} DO NOTHING"
+    )
+    return create_sql, merge_sql
+
+
+# ---------------------------------------------------------------------------
+# Token-bucket rate limiter
+# ---------------------------------------------------------------------------
+class TokenBucket:
+    """Async token-bucket limiter: at most ``rate`` acquisitions per second.
+
+    Up to ``capacity`` acquisitions may happen back to back (burst); after
+    that callers are paced at ``1 / rate`` seconds.  Waiters are served in
+    FIFO order.
+
+    Args:
+        rate: Tokens added per second.
+        capacity: Bucket size (default: ``max(1, rate)``).
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None) -> None:
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Take one token, sleeping until one is available."""
+        async with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            if self._tokens < 1.0:
+                await asyncio.sleep((1.0 - self._tokens) / self.rate)
+                self._tokens = 1.0
+                self._updated = time.monotonic()
+            self._tokens -= 1.0
+
+
 # ---------------------------------------------------------------------------
 # BaseConnector ABC
 # ---------------------------------------------------------------------------
@@ -65,9 +168,12 @@ class BaseConnector(abc.ABC):
         BASE_URL: str - base API URL
 
     Subclasses MAY override:
-        RATE_LIMIT_PER_SECOND: float - max concurrent requests (default 5.0)
+        RATE_LIMIT_PER_SECOND: float - max requests per second, also the
+            bound on requests in flight (default 5.0)
         MAX_RETRIES: int - retry attempts on failure (default 3)
         TIMEOUT_SECONDS: float - HTTP timeout per request (default 30.0)
+        COPY_THRESHOLD: int - record count from which _bulk_insert switches
+            to the COPY + merge path (default 10_000)
 
     Usage::
 
@@ -92,9 +198,13 @@ class BaseConnector(abc.ABC):
     # Date chunking (subclasses MAY override; used by _chunk_date_range)
     MAX_DATE_RANGE_YEARS: int = 10
 
+    # Bulk loads at or above this size use COPY (see _bulk_insert)
+    COPY_THRESHOLD: int = 10_000
+
     def __init__(self) -> None:
         self._client: httpx.AsyncClient | None = None
-        self._semaphore = asyncio.Semaphore(int(self.RATE_LIMIT_PER_SECOND))
+        self._semaphore = asyncio.Semaphore(max(1, int(self.RATE_LIMIT_PER_SECOND)))
+        self._rate_limiter = TokenBucket(self.RATE_LIMIT_PER_SECOND)
         self.log = structlog.get_logger().bind(connector=self.SOURCE_NAME)
 
     async def __aenter__(self) -> "BaseConnector":
@@ -132,8 +242,9 @@ class BaseConnector(abc.ABC):
     async def _request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
         """Rate-limited HTTP request with retry.
 
-        Acquires a semaphore slot before delegating to _request_with_retry
-        to enforce the per-second concurrency limit.
+        Acquires a semaphore slot (bounds requests in flight) and a token
+        from the token bucket (bounds requests per second) before
+        delegating to _request_with_retry.
 
         Args:
             method: HTTP method (GET, POST, etc.)
@@ -148,6 +259,7 @@ class BaseConnector(abc.ABC):
             FetchError: If all retry attempts are exhausted.
         """
         async with self._semaphore:
+            await self._rate_limiter.acquire()
             return await self._request_with_retry(method, url, **kwargs)
 
     async def _request_with_retry(
@@ -256,6 +368,106 @@ class BaseConnector(abc.ABC):
         )
         return inserted
 
+    async def fetch_many(
+        self,
+        jobs: Mapping[Hashable, Callable[[], Awaitable[list[dict[str, Any]]]]],
+        strict: bool = False,
+    ) -> dict[Hashable, list[dict[str, Any]]]:
+        """Run many fetch jobs concurrently under the connector's limiter.
+
+        All jobs are scheduled at once with ``asyncio.gather``; pacing is
+        left to ``_request`` (token bucket + semaphore), so no fixed sleeps
+        are needed between requests.  A failing job is logged and omitted
+        without affecting the others, unless ``strict`` is set.
+
+        Args:
+            jobs: ``{job_key: zero-arg coroutine factory}``.
+            strict: Raise the first job's exception once every job has
+                finished, for fetches whose results are only meaningful
+                together.
+
+        Returns:
+            ``{job_key: records}`` for the jobs that succeeded.
+
+        Raises:
+            Exception: The first failed job's exception, if ``strict``.
+        """
+        keys = list(jobs)
+        results = await asyncio.gather(
+            *(jobs[key]() for key in keys), return_exceptions=True
+        )
+
+        completed: dict[Hashable, list[dict[str, Any]]] = {}
+        failures: list[Exception] = []
+        for key, result in zip(keys, results):
+            if isinstance(result, Exception):
+                self.log.warning("fetch_job_error", job=str(key), error=str(result))
+                failures.append(result)
+                continue
+            if isinstance(result, BaseException):
+                raise result
+            completed[key] = result
+
+        self.log.info(
+            "fetch_many_complete",
+            jobs=len(keys),
+            succeeded=len(completed),
+        )
+        if strict and failures:
+            raise failures[0]
+        return completed
+
+    async def fetch_series_many(
+        self,
+        series: Mapping[str, Any],
+        start_date: date,
+        end_date: date,
+        chunked: bool = True,
+    ) -> list[dict[str, Any]]:
+        """Fetch many series via ``self.fetch_series`` concurrently.
+
+        Schedules one job per (series, date chunk) through ``fetch_many``.
+        Records are tagged with ``_series_key``.  A series with any failed
+        chunk is dropped entirely, so a partial history is never stored.
+
+        Args:
+            series: ``{series_key: provider_code}`` in output order.
+            start_date: Inclusive start date.
+            end_date: Inclusive end date.
+            chunked: Split the range with ``_chunk_date_range`` (set False
+                for APIs that accept arbitrarily long ranges).
+
+        Returns:
+            Records ordered by series (as given) then by chunk.
+        """
+        fetch_series = getattr(self, "fetch_series", None)
+        if fetch_series is None:
+            raise ConnectorError(f"{self.SOURCE_NAME}: no fetch_series() to fan out")
+
+        windows = (
+            self._chunk_date_range(start_date, end_date)
+            if chunked
+            else [(start_date, end_date)]
+        )
+        jobs = {
+            (key, i): (lambda c=code, s=s, e=e: fetch_series(c, s, e))
+            for key, code in series.items()
+            for i, (s, e) in enumerate(windows)
+        }
+        results = await self.fetch_many(jobs)
+
+        all_records: list[dict[str, Any]] = []
+        for key in series:
+            chunks = [results.get((key, i)) for i in range(len(windows))]
+            if any(c is None for c in chunks):
+                self.log.warning("fetch_series_error", series_key=key)
+                continue
+            for records in chunks:
+                for rec in records:
+                    rec["_series_key"] = key
+                all_records.extend(records)
+        return all_records
+
     def _chunk_date_range(
         self, start_date: date, end_date: date
     ) -> list[tuple[date, date]]:
@@ -330,7 +542,11 @@ class BaseConnector(abc.ABC):
         """Bulk insert records using INSERT ... ON CONFLICT DO NOTHING.
 
         Records are inserted in batches to avoid exceeding the asyncpg
-        limit of 32767 query parameters.
+        limit of 32767 query parameters.  Loads of ``COPY_THRESHOLD``
+        records or more (backfills) go through ``_copy_insert`` instead;
+        the returned count has the same meaning on both paths.  New
+        ``market_data`` rows invalidate cached latest prices
+        (``_notify_prices_changed``).
 
         Args:
             model_class: SQLAlchemy ORM model class (the table).
@@ -344,14 +560,112 @@ class BaseConnector(abc.ABC):
         """
         if not records:
             return 0
-
-        total_inserted = 0
-        for i in range(0, len(records), batch_size):
-            batch = records[i : i + batch_size]
-            async with async_session_factory() as session:
-                async with session.begin():
-                    stmt = pg_insert(model_class).values(batch)
-                    stmt = stmt.on_conflict_do_nothing(constraint=constraint_name)
-                    result = await session.execute(stmt)
-                    total_inserted += result.rowcount
+        if len(records) >= self.COPY_THRESHOLD:
+            total_inserted = await self._copy_insert(
+                model_class, records, constraint_name
+            )
+        else:
+            total_inserted = 0
+            for i in range(0, len(records), batch_size):
+                batch = records[i : i + batch_size]
+                async with async_session_factory() as session:
+                    async with session.begin():
+                        stmt = pg_insert(model_class).values(batch)
+                        stmt = stmt.on_conflict_do_nothing(constraint=constraint_name)
+                        result = await session.execute(stmt)
+                        total_inserted += result.rowcount
+
+        if total_inserted and model_class.__tablename__ == "market_data":
+            await self._notify_prices_changed()
         return total_inserted
+
+    async def _notify_prices_changed(self) -> None:
+        """Invalidate latest-price caches after new market bars land.
+
+        Clears this process's MTM price cache and bumps the shared
+        ``pms:price_version`` counter, which other processes' price caches
+        and the risk snapshot service watch.  Best effort: a Redis outage
+        never fails ingestion.
+        """
+        from src.cache.pms_cache import PMSCache
+        from src.core.redis import get_redis
+        from src.pms.mtm_service import invalidate_price_cache
+
+        invalidate_price_cache()
+        try:
+            await PMSCache(await get_redis()).bump_price_version()
+        except Exception as exc:
+            self.log.warning("price_version_bump_failed", error=str(exc))
+
+    async def _copy_insert(
+        self,
+        model_class: type,
+        records: list[dict[str, Any]],
+        constraint_name: str,
+    ) -> int:
+        """High-throughput insert: COPY into a staging table, then merge.
+
+        In one transaction on one connection: create a TEMP staging table
+        shaped like the loaded columns, stream every record into it with
+        asyncpg ``copy_records_to_table`` (binary COPY, no parameter
+        limit), then run a single ``INSERT ... SELECT ... ON CONFLICT
+        DO NOTHING`` into the target.  Duplicates -- against existing rows
+        or within ``records`` -- are skipped exactly as on the batched path.
+
+        Args:
+            model_class: SQLAlchemy ORM model class (the table).
+            records: List of dicts whose keys match model columns.  A
+                missing key takes the column's ORM Python default (as
+                ``insert()`` would), else NULL; columns no record sets
+                keep their server defaults.
+            constraint_name: Unique constraint for ON CONFLICT DO NOTHING.
+
+        Returns:
+            Number of rows actually inserted (excludes conflicts).
+        """
+        if not records:
+            return 0
+
+        table = model_class.__table__
+        columns = list(dict.fromkeys(k for rec in records for k in rec))
+        unknown = [c for c in columns if c not in table.c]
+        if unknown:
+            raise ConnectorError(
+                f"{self.SOURCE_NAME}: unknown columns for {table.name}: {unknown}"
+            )
+        defaults = _python_defaults(table)
+        columns += [c for c in defaults if c not in columns]
+        staging = f"_stg_{table.name}"
+        rows = [
+            tuple(
+                rec[c] if c in rec else defaults[c]() if c in defaults else None
+                for c in columns
+            )
+            for rec in records
+        ]
+
+        started = time.perf_counter()
+        async with async_engine.begin() as conn:
+            create_sql, merge_sql = _copy_merge_sql(
+                table.name,
+                columns,
+                constraint_name,
+                staging,
+                quote=conn.dialect.identifier_preparer.quote,
+            )
+            await conn.exec_driver_sql(create_sql)
+            raw = await conn.get_raw_connection()
+            await raw.driver_connection.copy_records_to_table(
+                staging, records=rows, columns=columns
+            )
+            result = await conn.exec_driver_sql(merge_sql)
+            inserted = result.rowcount
+
+        self.log.info(
+            "copy_insert_complete",
+            table=table.name,
+            staged=len(rows),
+            inserted=inserted,
+            elapsed_s=round(time.perf_counter() - started, 3),
+        )
+        return inserted
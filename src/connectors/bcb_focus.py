@@ -16,7 +16,6 @@ Key design decisions:
 
 from __future__ import annotations
 
-import asyncio
 import unicodedata
 from datetime import date, datetime
 from typing import Any
@@ -127,12 +126,10 @@ class BcbFocusConnector(BaseConnector):
                 total_accumulated=len(all_items),
             )
 
-            # Terminate if partial or empty page (last page)
+            # Terminate if partial or empty page (last page); pages are
+            # paced by the connector's token bucket
             if len(items) < self.ODATA_PAGE_SIZE:
                 break
-
-            # Rate limit between pages
-            await asyncio.sleep(1.0 / self.RATE_LIMIT_PER_SECOND)
         else:
             # MAX_PAGES reached without termination
             self.log.warning(
@@ -163,91 +160,31 @@ class BcbFocusConnector(BaseConnector):
         Returns:
             List of record dicts tagged with _series_key.
         """
-        all_records: list[dict[str, Any]] = []
         start_str = start_date.isoformat()
         end_str = end_date.isoformat()
 
-        for indicator, config in self.INDICATORS.items():
-            entity_set = config["entity_set"]
-
+        def job(indicator: str, entity_set: str):
             odata_filter = (
                 f"Indicador eq '{indicator}' "
                 f"and Data ge '{start_str}' "
                 f"and Data le '{end_str}'"
             )
+            return lambda: self._fetch_odata_paginated(entity_set, odata_filter)
+
+        self.log.info("fetching_indicators", indicators=list(self.INDICATORS))
+        # Indicators are paginated concurrently, paced by the token bucket;
+        # a failed indicator fails the fetch rather than silently going missing
+        results = await self.fetch_many(
+            {
+                indicator: job(indicator, config["entity_set"])
+                for indicator, config in self.INDICATORS.items()
+            },
+            strict=True,
+        )
 
-            self.log.info(
-                "fetching_indicator",
-                indicator=indicator,
-                entity_set=entity_set,
-            )
-
-            items = await self._fetch_odata_paginated(entity_set, odata_filter)
-
-            normalized_name = _normalize_indicator_name(indicator)
-
-            for item in items:
-                # Parse survey publication date
-                data_str = item.get("Data", "")
-                try:
-                    obs_date = datetime.strptime(data_str, "%Y-%m-%d").date()
-                except (ValueError, TypeError):
-                    self.log.warning(
-                        "invalid_date",
-                        indicator=indicator,
-                        raw_date=data_str,
-                    )
-                    continue
-
-                # Get reference year/period
-                ref = item.get("DataReferencia", "")
-                ref_year = str(ref).strip()
-
-                if not ref_year:
-                    self.log.warning(
-                        "missing_reference_year",
-                        indicator=indicator,
-                        date=data_str,
-                    )
-                    continue
-
-                # Get median value (the consensus)
-                mediana = item.get("Mediana")
-                if mediana is None:
-                    continue
-
-                try:
-                    value = float(mediana)
-                except (ValueError, TypeError):
-                    continue
-
-                # Build series key: BR_FOCUS_{INDICATOR}_{YEAR}_MEDIAN
-                series_key = f"BR_FOCUS_{normalized_name}_{ref_year}_MEDIAN"
-
-                # release_time is the survey publication date with SP timezone
-                release_time = datetime(
-                    obs_date.year,
-                    obs_date.month,
-                    obs_date.day,
-                    8,
-                    30,  # Focus is published ~8:30 AM Brasilia time
-                    tzinfo=_SP_TZ,
-                )
-
-                all_records.append(
-                    {
-                        "_series_key": series_key,
-                        "observation_date": obs_date,
-                        "value": value,
-                        "release_time": release_time,
-                        "revision_number": 0,
-                        "source": self.SOURCE_NAME,
-                    }
-                )
-
-            # Rate limit between indicators
-            if indicator != list(self.INDICATORS.keys())[-1]:
-                await asyncio.sleep(1.0 / self.RATE_LIMIT_PER_SECOND)
+        all_records: list[dict[str, Any]] = []
+        for indicator in self.INDICATORS:
+            all_records.extend(self._parse_items(indicator, results[indicator]))
 
         self.log.info(
             "fetch_complete",
@@ -257,6 +194,74 @@ class BcbFocusConnector(BaseConnector):
         )
         return all_records
 
+    def _parse_items(
+        self, indicator: str, items: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """Convert raw OData items for one indicator into record dicts."""
+        records: list[dict[str, Any]] = []
+        normalized_name = _normalize_indicator_name(indicator)
+
+        for item in items:
+            # Parse survey publication date
+            data_str = item.get("Data", "")
+            try:
+                obs_date = datetime.strptime(data_str, "%Y-%m-%d").date()
+            except (ValueError, TypeError):
+                self.log.warning(
+                    "invalid_date",
+                    indicator=indicator,
+                    raw_date=data_str,
+                )
+                continue
+
+            # Get reference year/period
+            ref = item.get("DataReferencia", "")
+            ref_year = str(ref).strip()
+
+            if not ref_year:
+                self.log.warning(
+                    "missing_reference_year",
+                    indicator=indicator,
+                    date=data_str,
+                )
+                continue
+
+            # Get median value (the consensus)
+            mediana = item.get("Mediana")
+            if mediana is None:
+                continue
+
+            try:
+                value = float(mediana)
+            except (ValueError, TypeError):
+                continue
+
+            # Build series key: BR_FOCUS_{INDICATOR}_{YEAR}_MEDIAN
+            series_key = f"BR_FOCUS_{normalized_name}_{ref_year}_MEDIAN"
+
+            # release_time is the survey publication date with SP timezone
+            release_time = datetime(
+                obs_date.year,
+                obs_date.month,
+                obs_date.day,
+                8,
+                30,  # Focus is published ~8:30 AM Brasilia time
+                tzinfo=_SP_TZ,
+            )
+
+            records.append(
+                {
+                    "_series_key": series_key,
+                    "observation_date": obs_date,
+                    "value": value,
+                    "release_time": release_time,
+                    "revision_number": 0,
+                    "source": self.SOURCE_NAME,
+                }
+            )
+
+        return records
+
     async def _ensure_series_metadata(self, series_key: str, source_id: int) -> int:
         """Ensure a series_metadata row exists for the given series. Returns its id."""
         async with async_session_factory() as session:
@@ -11,7 +11,6 @@ inflation, activity, monetary/credit, external, and fiscal.
 
 from __future__ import annotations
 
-import asyncio
 from datetime import date, datetime
 from typing import Any
 from zoneinfo import ZoneInfo
@@ -210,7 +209,7 @@ class BcbSgsConnector(BaseConnector):
         series_ids: list[str] | None = None,
         **kwargs: Any,
     ) -> list[dict[str, Any]]:
-        """Fetch observations for multiple BCB SGS series.
+        """Fetch observations for multiple BCB SGS series concurrently.
 
         Args:
             start_date: Inclusive start date.
@@ -223,10 +222,8 @@ class BcbSgsConnector(BaseConnector):
             List of record dicts, each tagged with _series_key.
         """
         keys = series_ids or list(self.SERIES_REGISTRY.keys())
-        all_records: list[dict[str, Any]] = []
-        total = len(keys)
-
-        for i, series_key in enumerate(keys, 1):
+        series: dict[str, int] = {}
+        for series_key in keys:
             bcb_code = self.SERIES_REGISTRY.get(series_key)
             if bcb_code is None:
                 self.log.warning(
@@ -234,33 +231,15 @@ class BcbSgsConnector(BaseConnector):
                     series_key=series_key,
                 )
                 continue
+            series[series_key] = bcb_code
 
-            self.log.info(
-                "fetching_series",
-                series_key=series_key,
-                bcb_code=bcb_code,
-                progress=f"{i}/{total}",
-            )
-
-            try:
-                records = await self.fetch_series(bcb_code, start_date, end_date)
-                for rec in records:
-                    rec["_series_key"] = series_key
-                all_records.extend(records)
-            except Exception as exc:
-                self.log.warning(
-                    "fetch_series_error",
-                    series_key=series_key,
-                    bcb_code=bcb_code,
-                    error=str(exc),
-                )
-                continue
-
-            # Rate limiting between series requests
-            if i < total:
-                await asyncio.sleep(1.0 / self.RATE_LIMIT_PER_SECOND)
-
-        return all_records
+        self.log.info(
+            "fetching_series",
+            n_series=len(series),
+            n_chunks=len(self._chunk_date_range(start_date, end_date)),
+        )
+        # One request per (series, 10-year chunk), paced by the token bucket
+        return await self.fetch_series_many(series, start_date, end_date)
 
     async def _ensure_series_metadata(
         self,
@@ -13,7 +13,6 @@ for future point-in-time revision tracking.
 
 from __future__ import annotations
 
-import asyncio
 from datetime import date, datetime
 from typing import Any
 from zoneinfo import ZoneInfo
@@ -252,7 +251,7 @@ class FredConnector(BaseConnector):
         series_ids: list[str] | None = None,
         **kwargs: Any,
     ) -> list[dict[str, Any]]:
-        """Fetch observations for multiple FRED series.
+        """Fetch observations for multiple FRED series concurrently.
 
         Args:
             start_date: Inclusive start date.
@@ -265,10 +264,8 @@ class FredConnector(BaseConnector):
             List of record dicts, each tagged with _series_key.
         """
         keys = series_ids or list(self.SERIES_REGISTRY.keys())
-        all_records: list[dict[str, Any]] = []
-        total = len(keys)
-
-        for i, series_key in enumerate(keys, 1):
+        series: dict[str, str] = {}
+        for series_key in keys:
             fred_code = self.SERIES_REGISTRY.get(series_key)
             if fred_code is None:
                 self.log.warning(
@@ -276,33 +273,13 @@ class FredConnector(BaseConnector):
                     series_key=series_key,
                 )
                 continue
+            series[series_key] = fred_code
 
-            self.log.info(
-                "fetching_series",
-                series_key=series_key,
-                fred_code=fred_code,
-                progress=f"{i}/{total}",
-            )
-
-            try:
-                records = await self.fetch_series(fred_code, start_date, end_date)
-                for rec in records:
-                    rec["_series_key"] = series_key
-                all_records.extend(records)
-            except Exception as exc:
-                self.log.warning(
-                    "fetch_series_error",
-                    series_key=series_key,
-                    fred_code=fred_code,
-                    error=str(exc),
-                )
-                continue
-
-            # Rate limiting between series requests
-            if i < total:
-                await asyncio.sleep(1.0 / self.RATE_LIMIT_PER_SECOND)
-
-        return all_records
+        self.log.info("fetching_series", n_series=len(series))
+        # FRED accepts arbitrarily long ranges: one request per series
+        return await self.fetch_series_many(
+            series, start_date, end_date, chunked=False
+        )
 
     # -----------------------------------------------------------------------
     # Vintage fetch (stub for Phase 4 revision tracking)
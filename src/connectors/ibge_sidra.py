@@ -15,7 +15,6 @@ Key design decisions:
 
 from __future__ import annotations
 
-import asyncio
 from datetime import date, datetime
 from typing import Any
 from zoneinfo import ZoneInfo
@@ -239,34 +238,25 @@ class IbgeSidraConnector(BaseConnector):
         start_period = self._date_to_period(start_date)
         end_period = self._date_to_period(end_date)
 
-        all_records: list[dict[str, Any]] = []
-
-        # Fetch MoM change (variable 63)
-        self.log.info(
-            "fetching_variable",
-            variable="MoM change (63)",
-            start=start_period,
-            end=end_period,
-        )
-        mom_records = await self._fetch_variable(
-            self._VAR_MOM_CHANGE, start_period, end_period
-        )
-        all_records.extend(mom_records)
-
-        # Rate limit between requests
-        await asyncio.sleep(1.0 / self.RATE_LIMIT_PER_SECOND)
-
-        # Fetch weight (variable 2265)
         self.log.info(
-            "fetching_variable",
-            variable="Weight (2265)",
+            "fetching_variables",
+            variables="MoM change (63), Weight (2265)",
             start=start_period,
             end=end_period,
         )
-        weight_records = await self._fetch_variable(
-            self._VAR_WEIGHT, start_period, end_period
+        # Both variables are requested concurrently, paced by the limiter;
+        # MoM changes are useless without their weights, so either failing
+        # fails the fetch
+        results = await self.fetch_many(
+            {
+                variable: (lambda v=variable: self._fetch_variable(v, start_period, end_period))
+                for variable in (self._VAR_MOM_CHANGE, self._VAR_WEIGHT)
+            },
+            strict=True,
         )
-        all_records.extend(weight_records)
+        mom_records = results[self._VAR_MOM_CHANGE]
+        weight_records = results[self._VAR_WEIGHT]
+        all_records = mom_records + weight_records
 
         self.log.info(
             "fetch_complete",
@@ -26,7 +26,6 @@ Series codes follow the pattern ``OECD_<COUNTRY>_<VARIABLE>``
 
 from __future__ import annotations
 
-import asyncio
 from datetime import date, datetime
 from typing import Any
 from zoneinfo import ZoneInfo
@@ -167,41 +166,40 @@ class OecdSdmxConnector(BaseConnector):
         start_period: str,
         end_period: str,
     ) -> list[dict[str, Any]]:
-        """Fallback: fetch each country+variable pair individually."""
-        all_records: list[dict[str, Any]] = []
+        """Fallback: fetch each country+variable pair individually.
 
-        for country_oecd, country_iso2 in self.COUNTRIES.items():
-            for var_code, var_suffix in self.VARIABLES.items():
-                try:
-                    key = f"{country_oecd}.{var_code}.A"
-                    url = f"/data/dataflow/OECD.SDD.NAD/{self.DATAFLOW}/1.1/{key}"
-                    params = {
-                        "startPeriod": start_period,
-                        "endPeriod": end_period,
-                        "dimensionAtObservation": "TIME_PERIOD",
-                    }
+        Pairs are requested concurrently via ``fetch_many`` (paced by the
+        token bucket); failed pairs are skipped.
+        """
 
-                    response = await self._request(
-                        "GET",
-                        url,
-                        params=params,
-                        headers={
-                            "Accept": "application/vnd.sdmx.data+json;version=2.0.0"
-                        },
-                    )
-                    data = response.json()
-                    records = self._parse_sdmx_json(data)
-                    all_records.extend(records)
-                except Exception as exc:
-                    logger.debug(
-                        "oecd_country_var_failed",
-                        country=country_oecd,
-                        variable=var_code,
-                        error=str(exc),
-                    )
+        async def fetch_pair(country_oecd: str, var_code: str) -> list[dict[str, Any]]:
+            key = f"{country_oecd}.{var_code}.A"
+            url = f"/data/dataflow/OECD.SDD.NAD/{self.DATAFLOW}/1.1/{key}"
+            params = {
+                "startPeriod": start_period,
+                "endPeriod": end_period,
+                "dimensionAtObservation": "TIME_PERIOD",
+            }
+            response = await self._request(
+                "GET",
+                url,
+                params=params,
+                headers={"Accept": "application/vnd.sdmx.data+json;version=2.0.0"},
+            )
+            return self._parse_sdmx_json(response.json())
 
-                await asyncio.sleep(1.0 / self.RATE_LIMIT_PER_SECOND)
+        jobs = {
+            (country_oecd, var_code): (
+                lambda c=country_oecd, v=var_code: fetch_pair(c, v)
+            )
+            for country_oecd in self.COUNTRIES
+            for var_code in self.VARIABLES
+        }
+        results = await self.fetch_many(jobs)
 
+        all_records: list[dict[str, Any]] = []
+        for pair in jobs:
+            all_records.extend(results.get(pair, []))
         return all_records
 
     def _parse_sdmx_json(self, data: dict) -> list[dict[str, Any]]:
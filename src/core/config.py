@@ -56,6 +56,13 @@ class Settings(BaseSettings):
     minio_secret_key: str = ""
     minio_bucket: str = "macro-data"
 
+    # PIT loader result cache (shared across agents/strategies in a run)
+    loader_cache_max_mb: int = 256
+    loader_cache_ttl_seconds: float = 900.0
+
+    # Incremental EWMA risk state (see src.risk.risk_state)
+    risk_state_path: str = "data/risk_state.json"
+
     # Kafka
     kafka_bootstrap_servers: str = "localhost:9092"
 
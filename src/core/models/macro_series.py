@@ -4,6 +4,8 @@ TimescaleDB hypertable partitioned on 'observation_date' with 1-year chunk inter
 Composite primary key (id, observation_date) as required by TimescaleDB.
 Natural key: (series_id, observation_date, revision_number) for idempotent writes.
 Compression: segmentby=series_id, orderby=observation_date DESC.
+Vintage index: (series_id, observation_date, revision_number DESC) INCLUDE
+(release_time, value) serves PIT "latest revision as of T" queries.
 
 The release_time column (TIMESTAMPTZ) records when this data point became publicly
 available, enabling point-in-time correct backtesting.
@@ -22,6 +24,7 @@ from sqlalchemy import (
     SmallInteger,
     String,
     UniqueConstraint,
+    text,
 )
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -55,5 +58,13 @@ class MacroSeries(Base):
             name="uq_macro_series_natural_key",
         ),
         Index("ix_macro_series_series_id", "series_id"),
+        # Covering index for PIT vintage queries (DISTINCT ON observation_date)
+        Index(
+            "ix_macro_series_vintage",
+            "series_id",
+            "observation_date",
+            text("revision_number DESC"),
+            postgresql_include=["release_time", "value"],
+        ),
         {"comment": "TimescaleDB hypertable partitioned on observation_date"},
     )
@@ -12,11 +12,20 @@ the full computation runs but DB persistence is skipped.
 
 Pipeline run metadata is persisted to the ``pipeline_runs`` table when not
 in dry-run mode.
+
+Agents and strategies share one ``CachedDataLoader`` per run, so series
+read by several of them (SELIC, Focus, DI curve, USDBRL) are queried once.
+The strategies step fans out over a bounded set of worker threads with a
+per-strategy timeout and a step-level deadline; each strategy's latency and outcome lands in
+``PipelineResult.strategy_latency``.
 """
 
 from __future__ import annotations
 
 import json
+import math
+import queue
+import threading
 import time
 import uuid
 from dataclasses import dataclass, field
@@ -26,6 +35,7 @@ from typing import Any, Callable
 import structlog
 
 from src.agents.base import AgentReport
+from src.agents.loader_cache import CachedDataLoader, log_cache_stats
 from src.agents.registry import AgentRegistry
 from src.portfolio.capital_allocator import AllocationResult, CapitalAllocator
 from src.portfolio.portfolio_constructor import PortfolioConstructor, PortfolioTarget
@@ -55,6 +65,9 @@ class PipelineResult:
         leverage: Portfolio leverage ratio.
         var_95: 95th percentile Value-at-Risk.
         risk_alerts: Active risk alerts from the risk monitor.
+        strategy_latency: One row per strategy (``strategy_id``,
+            ``status`` = ok / failed / timeout, ``seconds``, ``positions``),
+            slowest first.
     """
 
     run_id: str = field(default_factory=lambda: str(uuid.uuid4()))
@@ -68,6 +81,7 @@ class PipelineResult:
     leverage: float = 0.0
     var_95: float = 0.0
     risk_alerts: list[str] = field(default_factory=list)
+    strategy_latency: list[dict[str, Any]] = field(default_factory=list)
 
 
 # ---------------------------------------------------------------------------
@@ -79,6 +93,13 @@ class DailyPipeline:
     Args:
         as_of_date: Reference date for the pipeline run.
         dry_run: If True, run full computation but skip DB persistence.
+        strategy_workers: Max strategies generating signals concurrently.
+        strategy_timeout: Seconds a single strategy may run before its
+            result is discarded.
+        step_timeout: Wall-clock budget for the whole strategies step.
+            Strategies still queued or running when it expires are reported
+            as timed out (covers strategies stuck behind a hung worker).
+            Defaults to ``strategy_timeout`` per wave of ``strategy_workers``.
     """
 
     STEP_NAMES = [
@@ -92,9 +113,19 @@ class DailyPipeline:
         "report",
     ]
 
-    def __init__(self, as_of_date: date, dry_run: bool = False) -> None:
+    def __init__(
+        self,
+        as_of_date: date,
+        dry_run: bool = False,
+        strategy_workers: int = 8,
+        strategy_timeout: float = 60.0,
+        step_timeout: float | None = None,
+    ) -> None:
         self.as_of_date = as_of_date
         self.dry_run = dry_run
+        self.strategy_workers = strategy_workers
+        self.strategy_timeout = strategy_timeout
+        self.step_timeout = step_timeout
 
         # Internal state populated by steps
         self._result = PipelineResult(date=as_of_date)
@@ -105,6 +136,7 @@ class DailyPipeline:
         self._allocation_result: AllocationResult | None = None
         self._risk_report: Any = None
         self._step_details: dict[str, str] = {}
+        self._loader = CachedDataLoader()
 
     # ------------------------------------------------------------------
     # Public API
@@ -221,17 +253,17 @@ class DailyPipeline:
         try:
             from src.agents.cross_asset_agent import CrossAssetAgent
             from src.agents.fiscal_agent import FiscalAgent
-            from src.agents.fx_equilibrium_agent import FxEquilibriumAgent
+            from src.agents.fx_agent import FxEquilibriumAgent
             from src.agents.inflation_agent import InflationAgent
-            from src.agents.monetary_policy_agent import MonetaryPolicyAgent
+            from src.agents.monetary_agent import MonetaryPolicyAgent
 
             AgentRegistry.clear()
             agents = [
-                InflationAgent(),
-                MonetaryPolicyAgent(),
-                FiscalAgent(),
-                FxEquilibriumAgent(),
-                CrossAssetAgent(),
+                InflationAgent(loader=self._loader),
+                MonetaryPolicyAgent(loader=self._loader),
+                FiscalAgent(loader=self._loader),
+                FxEquilibriumAgent(loader=self._loader),
+                CrossAssetAgent(loader=self._loader),
             ]
             for agent in agents:
                 AgentRegistry.register(agent)
@@ -261,27 +293,137 @@ class DailyPipeline:
         self._step_details["aggregate"] = f"{asset_classes} asset classes"
 
     def _step_strategies(self) -> None:
-        """Instantiate all 8 strategies and generate signals."""
-        all_positions: list[StrategyPosition] = []
+        """Generate signals for all strategies with bounded concurrency.
 
-        for strategy_id, strategy_cls in ALL_STRATEGIES.items():
+        Strategies read through the run's shared ``CachedDataLoader`` (which
+        hands out copies, so the data snapshot is read-only for them).  A
+        failing or timed-out strategy is isolated: it contributes no
+        positions and the others are unaffected.  Positions are collected
+        in ``ALL_STRATEGIES`` order regardless of completion order.
+        """
+        started: dict[str, float] = {}
+        latency: dict[str, dict[str, Any]] = {}
+        results: dict[str, list[StrategyPosition]] = {}
+
+        work: queue.SimpleQueue = queue.SimpleQueue()
+        for item in ALL_STRATEGIES.items():
+            work.put(item)
+        outcomes: queue.SimpleQueue = queue.SimpleQueue()
+        claim_lock = threading.Lock()
+        abandoned = False
+
+        def worker() -> None:
+            while True:
+                # Claiming under the lock means a strategy is either started
+                # or reported as timed out when the step deadline fires.
+                with claim_lock:
+                    if abandoned:
+                        return
+                    try:
+                        sid, strategy_cls = work.get_nowait()
+                    except queue.Empty:
+                        return
+                    started[sid] = time.monotonic()
+                try:
+                    strategy = strategy_cls(data_loader=self._loader)
+                    outcomes.put((sid, strategy.generate_signals(self.as_of_date), None))
+                except Exception as exc:
+                    outcomes.put((sid, None, exc))
+
+        n_workers = min(max(1, self.strategy_workers), max(1, len(ALL_STRATEGIES)))
+        step_timeout = self.step_timeout
+        if step_timeout is None:
+            step_timeout = self.strategy_timeout * math.ceil(
+                len(ALL_STRATEGIES) / n_workers
+            )
+        deadline = time.monotonic() + step_timeout
+
+        # Daemon threads rather than a ThreadPoolExecutor: a hung strategy
+        # cannot be killed, and executor workers would block interpreter exit.
+        for i in range(n_workers):
+            threading.Thread(target=worker, name=f"strategy_{i}", daemon=True).start()
+
+        pending = set(ALL_STRATEGIES)
+        while pending:
+            now = time.monotonic()
+            for sid in list(pending):
+                t0 = started.get(sid)
+                if t0 is not None and now - t0 > self.strategy_timeout:
+                    # Threads cannot be killed; the result is discarded
+                    pending.discard(sid)
+                    latency[sid] = {"status": "timeout", "seconds": round(now - t0, 3)}
+                    logger.warning(
+                        "strategy_generation_timeout",
+                        strategy_id=sid,
+                        timeout=self.strategy_timeout,
+                    )
+            if not pending:
+                break
+            if now >= deadline:
+                with claim_lock:
+                    abandoned = True
+                for sid in sorted(pending):
+                    t0 = started.get(sid)
+                    latency[sid] = {
+                        "status": "timeout",
+                        "seconds": round(now - t0, 3) if t0 is not None else 0.0,
+                    }
+                logger.warning(
+                    "strategy_step_deadline",
+                    timeout=step_timeout,
+                    timed_out=sorted(pending),
+                    not_started=sorted(s for s in pending if s not in started),
+                )
+                break
+
+            wake = min(
+                [deadline]
+                + [started[s] + self.strategy_timeout for s in pending if s in started]
+            )
             try:
-                strategy = strategy_cls()
-                positions = strategy.generate_signals(self.as_of_date)
-                all_positions.extend(positions)
-            except Exception as exc:
+                sid, positions, exc = outcomes.get(timeout=max(0.0, wake - now))
+            except queue.Empty:
+                continue
+            if sid not in pending:
+                continue
+            pending.discard(sid)
+            elapsed = round(time.monotonic() - started[sid], 3)
+            if exc is None:
+                results[sid] = positions
+                latency[sid] = {"status": "ok", "seconds": elapsed}
+            else:
+                latency[sid] = {"status": "failed", "seconds": elapsed}
                 logger.warning(
                     "strategy_generation_failed",
-                    strategy_id=strategy_id,
+                    strategy_id=sid,
                     error=str(exc),
                 )
 
+        all_positions: list[StrategyPosition] = []
+        for sid in ALL_STRATEGIES:
+            all_positions.extend(results.get(sid, []))
+
+        self._result.strategy_latency = sorted(
+            (
+                {
+                    "strategy_id": sid,
+                    **row,
+                    "positions": len(results.get(sid, [])),
+                }
+                for sid, row in latency.items()
+            ),
+            key=lambda r: r["seconds"],
+            reverse=True,
+        )
+        log_cache_stats("pipeline_loader_cache", self._loader.cache)
         self._strategy_positions = all_positions
         self._result.position_count = len(all_positions)
         strategy_count = len(ALL_STRATEGIES)
-        self._step_details["strategies"] = (
-            f"{strategy_count} strategies, {len(all_positions)} positions"
-        )
+        n_failed = sum(1 for r in latency.values() if r["status"] != "ok")
+        detail = f"{strategy_count} strategies, {len(all_positions)} positions"
+        if n_failed:
+            detail += f", {n_failed} failed/timed out"
+        self._step_details["strategies"] = detail
 
     def _step_portfolio(self) -> None:
         """Construct portfolio from strategy positions and allocate capital."""
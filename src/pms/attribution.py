@@ -12,6 +12,10 @@ All attribution dimensions are additive: each dimension sums to the total P&L
 independently. The engine supports standard periods (daily, WTD, MTD, QTD, YTD,
 inception) and custom date ranges.
 
+Period P&L is read from PositionManager's AttributionLedger, which keeps
+prefix sums per strategy, asset class, position, factor and trade type: the
+P&L of any key over [start, end] is two lookups, however long the history.
+
 This class operates on in-memory data from PositionManager (no DB dependency).
 """
 
@@ -22,6 +26,7 @@ from datetime import date, datetime, timedelta
 
 import structlog
 
+from .attribution_ledger import FACTOR_TAGS, TOTAL
 from .position_manager import PositionManager
 
 logger = structlog.get_logger(__name__)
@@ -42,35 +47,7 @@ class PerformanceAttributionEngine:
         position_manager: PositionManager instance with positions and P&L history.
     """
 
-    # -------------------------------------------------------------------------
-    # Factor tag mapping: strategy_id -> list of factor tags
-    # -------------------------------------------------------------------------
-    FACTOR_TAGS: dict[str, list[str]] = {
-        "RATES_BR_01": ["carry"],
-        "RATES_BR_02": ["macro-discretionary"],
-        "RATES_BR_03": ["momentum", "mean-reversion"],
-        "RATES_BR_04": ["macro-discretionary"],
-        "RATES_03": ["relative-value"],
-        "RATES_04": ["carry", "mean-reversion"],
-        "RATES_05": ["event-driven"],
-        "RATES_06": ["event-driven"],
-        "FX_BR_01": ["carry"],
-        "FX_02": ["carry", "momentum"],
-        "FX_03": ["momentum"],
-        "FX_04": ["relative-value"],
-        "FX_05": ["macro-discretionary"],
-        "INF_BR_01": ["carry"],
-        "INF_02": ["event-driven"],
-        "INF_03": ["carry"],
-        "CUPOM_01": ["carry", "relative-value"],
-        "CUPOM_02": ["relative-value"],
-        "SOV_BR_01": ["macro-discretionary"],
-        "SOV_01": ["momentum"],
-        "SOV_02": ["relative-value"],
-        "SOV_03": ["event-driven"],
-        "CROSS_01": ["macro-discretionary"],
-        "CROSS_02": ["momentum"],
-    }
+    FACTOR_TAGS: dict[str, list[str]] = FACTOR_TAGS
 
     def __init__(self, position_manager: PositionManager | None = None) -> None:
         self.position_manager = position_manager
@@ -107,18 +84,26 @@ class PerformanceAttributionEngine:
         # Collect positions active during the period
         positions = self._get_active_positions(start_date, end_date)
         aum = self.position_manager.aum or 100_000_000.0
+        ledger = self.position_manager.attribution_ledger
+
+        # P&L earned within the period, per position
+        pnl_by_position = {
+            pos["id"]: ledger.pnl(("position", pos["id"]), start_date, end_date)
+            for pos in positions
+        }
 
         # Compute total P&L
-        total_pnl_brl = self._compute_total_pnl(positions)
+        total_pnl_brl = ledger.pnl(TOTAL, start_date, end_date)
         total_return_pct = (total_pnl_brl / aum * 100) if aum > 0 else 0.0
 
         # Build each attribution dimension
-        by_strategy = self._attribute_by_strategy(positions, aum)
-        by_asset_class = self._attribute_by_asset_class(positions, aum)
-        by_instrument = self._attribute_by_instrument(positions)
-        by_factor = self._attribute_by_factor(positions, aum)
+        period = (start_date, end_date)
+        by_strategy = self._attribute_by_strategy(positions, pnl_by_position, period, aum)
+        by_asset_class = self._attribute_by_asset_class(positions, period, aum)
+        by_instrument = self._attribute_by_instrument(positions, pnl_by_position)
+        by_factor = self._attribute_by_factor(positions, period, aum)
         by_time_period = self._attribute_by_time_period(start_date, end_date, aum)
-        by_trade_type = self._attribute_by_trade_type(positions)
+        by_trade_type = self._attribute_by_trade_type(positions, period)
         performance_stats = self._compute_performance_stats(start_date, end_date, aum)
 
         return {
@@ -290,90 +275,40 @@ class PerformanceAttributionEngine:
         """
         if self.position_manager is None:
             return []
-
-        active: list[dict] = []
-        for pos in self.position_manager._positions:
-            entry_date = pos.get("entry_date")
-            if entry_date is None:
-                continue
-
-            # Must have been opened on or before end_date
-            if isinstance(entry_date, datetime):
-                entry_date = entry_date.date()
-            if entry_date > end_date:
-                continue
-
-            # If closed, must have been closed on or after start_date
-            if not pos["is_open"]:
-                closed_at = pos.get("closed_at")
-                if closed_at is not None:
-                    close_date = (
-                        closed_at.date()
-                        if isinstance(closed_at, datetime)
-                        else closed_at
-                    )
-                    if close_date < start_date:
-                        continue
-
-            active.append(pos)
-
-        return active
-
-    # -------------------------------------------------------------------------
-    # Internal: total P&L
-    # -------------------------------------------------------------------------
-
-    def _compute_total_pnl(self, positions: list[dict]) -> float:
-        """Compute total P&L from active positions.
-
-        For closed positions: use realized_pnl_brl.
-        For open positions: use unrealized_pnl_brl.
-        """
-        total = 0.0
-        for pos in positions:
-            if pos["is_open"]:
-                total += pos.get("unrealized_pnl_brl") or 0.0
-            else:
-                total += pos.get("realized_pnl_brl") or 0.0
-        return total
+        return self.position_manager._store.active_between(start_date, end_date)
 
     # -------------------------------------------------------------------------
     # Attribution dimensions
     # -------------------------------------------------------------------------
 
-    def _attribute_by_strategy(self, positions: list[dict], aum: float) -> list[dict]:
+    def _attribute_by_strategy(
+        self,
+        positions: list[dict],
+        pnl_by_position: dict[int, float],
+        period: tuple[date, date],
+        aum: float,
+    ) -> list[dict]:
         """Group P&L by strategy_id. Additive: sums to total."""
+        ledger = self.position_manager.attribution_ledger
         strategy_data: dict[str, dict] = {}
 
+        # Trade counts and wins from each position's strategy split
         for pos in positions:
-            pnl = self._position_pnl(pos)
-            strategy_ids = pos.get("strategy_ids") or ["UNASSIGNED"]
-            strategy_weights = pos.get("strategy_weights") or {}
-
-            # Split P&L across strategies
-            if strategy_weights:
-                total_weight = sum(strategy_weights.values()) or 1.0
-                for sid, weight in strategy_weights.items():
-                    share = pnl * (weight / total_weight)
-                    self._accumulate_strategy(strategy_data, sid, share, pos)
-            else:
-                # Equal split across strategy_ids
-                n = len(strategy_ids)
-                for sid in strategy_ids:
-                    share = pnl / n
-                    self._accumulate_strategy(strategy_data, sid, share, pos)
+            pnl = pnl_by_position[pos["id"]]
+            for (dimension, sid), weight in ledger.splits(pos):
+                if dimension == "strategy":
+                    self._accumulate_strategy(strategy_data, sid, pnl * weight)
 
         result = []
         for sid, data in sorted(strategy_data.items()):
+            pnl = ledger.pnl(("strategy", sid), *period)
             wins = data["wins"]
             total = data["trades"]
             result.append(
                 {
                     "strategy_id": sid,
-                    "pnl_brl": data["pnl"],
-                    "return_contribution_pct": (
-                        (data["pnl"] / aum * 100) if aum > 0 else 0.0
-                    ),
+                    "pnl_brl": pnl,
+                    "return_contribution_pct": (pnl / aum * 100) if aum > 0 else 0.0,
                     "trades_count": total,
                     "win_rate_pct": (wins / total * 100) if total > 0 else 0.0,
                 }
@@ -382,42 +317,39 @@ class PerformanceAttributionEngine:
         return result
 
     def _accumulate_strategy(
-        self, data: dict[str, dict], sid: str, pnl_share: float, pos: dict
+        self, data: dict[str, dict], sid: str, pnl_share: float
     ) -> None:
-        """Helper to accumulate strategy attribution data."""
+        """Helper to accumulate strategy trade counts."""
         if sid not in data:
-            data[sid] = {"pnl": 0.0, "trades": 0, "wins": 0}
-        data[sid]["pnl"] += pnl_share
+            data[sid] = {"trades": 0, "wins": 0}
         data[sid]["trades"] += 1
         if pnl_share > 0:
             data[sid]["wins"] += 1
 
     def _attribute_by_asset_class(
-        self, positions: list[dict], aum: float
+        self, positions: list[dict], period: tuple[date, date], aum: float
     ) -> list[dict]:
         """Group P&L by asset class. Additive: sums to total."""
+        ledger = self.position_manager.attribution_ledger
         ac_data: dict[str, dict] = {}
 
         for pos in positions:
             ac = pos.get("asset_class", "UNKNOWN")
-            pnl = self._position_pnl(pos)
             notional = abs(pos.get("notional_brl") or 0.0)
 
             if ac not in ac_data:
-                ac_data[ac] = {"pnl": 0.0, "notional_sum": 0.0, "count": 0}
-            ac_data[ac]["pnl"] += pnl
+                ac_data[ac] = {"notional_sum": 0.0, "count": 0}
             ac_data[ac]["notional_sum"] += notional
             ac_data[ac]["count"] += 1
 
         result = []
         for ac, data in sorted(ac_data.items()):
+            pnl = ledger.pnl(("asset_class", ac), *period)
             result.append(
                 {
                     "asset_class": ac,
-                    "pnl_brl": data["pnl"],
-                    "return_contribution_pct": (
-                        (data["pnl"] / aum * 100) if aum > 0 else 0.0
-                    ),
+                    "pnl_brl": pnl,
+                    "return_contribution_pct": (pnl / aum * 100) if aum > 0 else 0.0,
                     "avg_notional_brl": (
                         data["notional_sum"] / data["count"]
                         if data["count"] > 0
@@ -428,11 +360,13 @@ class PerformanceAttributionEngine:
 
         return result
 
-    def _attribute_by_instrument(self, positions: list[dict]) -> list[dict]:
+    def _attribute_by_instrument(
+        self, positions: list[dict], pnl_by_position: dict[int, float]
+    ) -> list[dict]:
         """Per-position attribution. Additive: sums to total."""
         result = []
         for pos in positions:
-            pnl = self._position_pnl(pos)
+            pnl = pnl_by_position[pos["id"]]
             entry_date = pos.get("entry_date", date.today())
             if isinstance(entry_date, datetime):
                 entry_date = entry_date.date()
@@ -468,43 +402,32 @@ class PerformanceAttributionEngine:
 
         return result
 
-    def _attribute_by_factor(self, positions: list[dict], aum: float) -> list[dict]:
+    def _attribute_by_factor(
+        self, positions: list[dict], period: tuple[date, date], aum: float
+    ) -> list[dict]:
         """Factor-based attribution using FACTOR_TAGS. Additive: sums to total."""
-        factor_data: dict[str, dict] = {}
+        ledger = self.position_manager.attribution_ledger
+        factor_strategies: dict[str, set[str]] = {}
 
         for pos in positions:
-            pnl = self._position_pnl(pos)
             strategy_ids = pos.get("strategy_ids") or ["UNASSIGNED"]
-
-            # Collect all factors for this position
-            all_factors: list[str] = []
-            for sid in strategy_ids:
-                all_factors.extend(self._get_factor_tags(sid))
-
-            # Deduplicate
-            unique_factors = list(set(all_factors))
-            n_factors = len(unique_factors)
-
-            # Split P&L equally across factors
-            for factor in unique_factors:
-                share = pnl / n_factors
-                if factor not in factor_data:
-                    factor_data[factor] = {"pnl": 0.0, "strategies": set()}
-                factor_data[factor]["pnl"] += share
+            for (dimension, factor), _ in ledger.splits(pos):
+                if dimension != "factor":
+                    continue
+                strategies = factor_strategies.setdefault(factor, set())
                 for sid in strategy_ids:
                     if factor in self._get_factor_tags(sid):
-                        factor_data[factor]["strategies"].add(sid)
+                        strategies.add(sid)
 
         result = []
-        for factor, data in sorted(factor_data.items()):
+        for factor, strategies in sorted(factor_strategies.items()):
+            pnl = ledger.pnl(("factor", factor), *period)
             result.append(
                 {
                     "factor": factor,
-                    "pnl_brl": data["pnl"],
-                    "return_contribution_pct": (
-                        (data["pnl"] / aum * 100) if aum > 0 else 0.0
-                    ),
-                    "strategies_count": len(data["strategies"]),
+                    "pnl_brl": pnl,
+                    "return_contribution_pct": (pnl / aum * 100) if aum > 0 else 0.0,
+                    "strategies_count": len(strategies),
                 }
             )
 
@@ -528,13 +451,11 @@ class PerformanceAttributionEngine:
         else:
             buckets = self._build_monthly_buckets(start_date, end_date)
 
-        # Assign daily P&L to buckets
+        # Bucket P&L straight from the ledger's prefix sums
+        ledger = self.position_manager.attribution_ledger
         cumulative = 0.0
         for bucket in buckets:
-            bucket_pnl = 0.0
-            for d in sorted(daily_pnl.keys()):
-                if bucket["period_start"] <= d <= bucket["period_end"]:
-                    bucket_pnl += daily_pnl[d]
+            bucket_pnl = ledger.pnl(TOTAL, bucket["period_start"], bucket["period_end"])
             cumulative += bucket_pnl
             bucket["pnl_brl"] = bucket_pnl
             bucket["return_pct"] = (bucket_pnl / aum * 100) if aum > 0 else 0.0
@@ -611,34 +532,27 @@ class PerformanceAttributionEngine:
 
         return buckets
 
-    def _attribute_by_trade_type(self, positions: list[dict]) -> dict:
-        """Attribution by trade type: systematic vs discretionary."""
-        systematic_pnl = 0.0
-        systematic_count = 0
-        discretionary_pnl = 0.0
-        discretionary_count = 0
+    def _attribute_by_trade_type(
+        self, positions: list[dict], period: tuple[date, date]
+    ) -> dict:
+        """Attribution by trade type: systematic vs discretionary.
 
+        Positions with notes containing "discretionary" or without
+        strategy_ids are discretionary; otherwise systematic.
+        """
+        ledger = self.position_manager.attribution_ledger
+        counts = {"systematic": 0, "discretionary": 0}
         for pos in positions:
-            pnl = self._position_pnl(pos)
-            # Check if this position originated from a discretionary proposal
-            # For simplicity, positions with notes containing "discretionary" or
-            # without strategy_ids are discretionary; otherwise systematic
-            notes = (pos.get("notes") or "").lower()
-            strategy_ids = pos.get("strategy_ids") or []
-
-            if "discretionary" in notes or not strategy_ids:
-                discretionary_pnl += pnl
-                discretionary_count += 1
-            else:
-                systematic_pnl += pnl
-                systematic_count += 1
+            for (dimension, trade_type), _ in ledger.splits(pos):
+                if dimension == "trade_type":
+                    counts[trade_type] += 1
 
         return {
-            "systematic": {"pnl_brl": systematic_pnl, "count": systematic_count},
-            "discretionary": {
-                "pnl_brl": discretionary_pnl,
-                "count": discretionary_count,
-            },
+            trade_type: {
+                "pnl_brl": ledger.pnl(("trade_type", trade_type), *period),
+                "count": count,
+            }
+            for trade_type, count in counts.items()
         }
 
     # -------------------------------------------------------------------------
@@ -751,31 +665,13 @@ class PerformanceAttributionEngine:
     # Helpers
     # -------------------------------------------------------------------------
 
-    def _position_pnl(self, pos: dict) -> float:
-        """Get P&L for a position (realized if closed, unrealized if open)."""
-        if pos["is_open"]:
-            return pos.get("unrealized_pnl_brl") or 0.0
-        return pos.get("realized_pnl_brl") or 0.0
-
     def _aggregate_daily_pnl(
         self, start_date: date, end_date: date
     ) -> dict[date, float]:
-        """Aggregate daily P&L from _pnl_history within the date range."""
+        """Portfolio daily P&L within the date range, from the ledger."""
         if self.position_manager is None:
             return {}
-
-        daily: dict[date, float] = {}
-        for snap in self.position_manager._pnl_history:
-            snap_date = snap.get("snapshot_date")
-            if snap_date is None:
-                continue
-            if isinstance(snap_date, datetime):
-                snap_date = snap_date.date()
-            if start_date <= snap_date <= end_date:
-                daily_pnl = snap.get("daily_pnl_brl") or 0.0
-                daily[snap_date] = daily.get(snap_date, 0.0) + daily_pnl
-
-        return daily
+        return self.position_manager.attribution_ledger.daily(start_date, end_date)
 
     def _get_inception_date(self) -> date:
         """Get the earliest position entry date for inception period."""
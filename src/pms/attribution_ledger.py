@@ -0,0 +1,261 @@
+"""Append-only, prefix-summed P&L ledger for performance attribution.
+
+``PerformanceAttributionEngine`` used to rebuild every period (daily, WTD,
+MTD, QTD, YTD, inception) from scratch: scan every position ever held,
+then scan the whole P&L history.  Here every P&L change of a position is
+posted once, dated, and split into the keys the engine reports on:
+
+- ``("total", None)``
+- ``("position", id)``
+- ``("strategy", sid)`` -- by ``strategy_weights``, else equally over
+  ``strategy_ids`` (``UNASSIGNED`` when there are none)
+- ``("asset_class", ac)``
+- ``("factor", tag)`` -- equally over the position's unique factor tags
+- ``("trade_type", "systematic" | "discretionary")``
+
+Each key keeps cumulative P&L by business date, so the P&L of any
+``[start, end]`` range is ``cum(end) - cum(start - 1)``: two bisects per
+key, independent of how many years of history exist.
+
+Postings come from ``PositionManager``: every mark posts each position's
+daily P&L, a close posts realized P&L minus what was already posted (exit
+cost, close-price move), and hydration replays each position's
+``position_pnl_history`` snapshots (see ``post_opening_balance``).  So the
+postings of a position always sum to its current P&L (unrealized if open,
+realized if closed).
+"""
+
+from __future__ import annotations
+
+import bisect
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from typing import Any, Hashable, Iterable, Mapping, Sequence
+
+# Factor tag mapping: strategy_id -> list of factor tags
+FACTOR_TAGS: dict[str, list[str]] = {
+    "RATES_BR_01": ["carry"],
+    "RATES_BR_02": ["macro-discretionary"],
+    "RATES_BR_03": ["momentum", "mean-reversion"],
+    "RATES_BR_04": ["macro-discretionary"],
+    "RATES_03": ["relative-value"],
+    "RATES_04": ["carry", "mean-reversion"],
+    "RATES_05": ["event-driven"],
+    "RATES_06": ["event-driven"],
+    "FX_BR_01": ["carry"],
+    "FX_02": ["carry", "momentum"],
+    "FX_03": ["momentum"],
+    "FX_04": ["relative-value"],
+    "FX_05": ["macro-discretionary"],
+    "INF_BR_01": ["carry"],
+    "INF_02": ["event-driven"],
+    "INF_03": ["carry"],
+    "CUPOM_01": ["carry", "relative-value"],
+    "CUPOM_02": ["relative-value"],
+    "SOV_BR_01": ["macro-discretionary"],
+    "SOV_01": ["momentum"],
+    "SOV_02": ["relative-value"],
+    "SOV_03": ["event-driven"],
+    "CROSS_01": ["macro-discretionary"],
+    "CROSS_02": ["momentum"],
+}
+
+TOTAL: tuple[str, None] = ("total", None)
+
+Key = tuple[str, Hashable]
+
+
+def _as_date(value: date | datetime) -> date:
+    return value.date() if isinstance(value, datetime) else value
+
+
+class _CumSeries:
+    """Cumulative sums by date; appends are O(1), backfills O(n)."""
+
+    __slots__ = ("dates", "cum")
+
+    def __init__(self) -> None:
+        self.dates: list[date] = []
+        self.cum: list[float] = []
+
+    def add(self, day: date, amount: float) -> None:
+        if self.dates and self.dates[-1] == day:
+            self.cum[-1] += amount
+        elif not self.dates or day > self.dates[-1]:
+            self.dates.append(day)
+            self.cum.append((self.cum[-1] if self.cum else 0.0) + amount)
+        else:
+            # Backfill: insert and shift every later cumulative value
+            i = bisect.bisect_left(self.dates, day)
+            if self.dates[i] != day:
+                self.dates.insert(i, day)
+                self.cum.insert(i, self.cum[i - 1] if i else 0.0)
+            for j in range(i, len(self.cum)):
+                self.cum[j] += amount
+
+    def through(self, day: date) -> float:
+        """Cumulative P&L up to and including ``day``."""
+        i = bisect.bisect_right(self.dates, day)
+        return self.cum[i - 1] if i else 0.0
+
+    def between(self, start: date, end: date) -> float:
+        return self.through(end) - self.through(start - timedelta(days=1))
+
+    def daily(self, start: date, end: date) -> dict[date, float]:
+        """Per-date P&L for the posting dates in ``[start, end]``."""
+        lo = bisect.bisect_left(self.dates, start)
+        hi = bisect.bisect_right(self.dates, end)
+        prev = self.cum[lo - 1] if lo else 0.0
+        out: dict[date, float] = {}
+        for i in range(lo, hi):
+            out[self.dates[i]] = self.cum[i] - prev
+            prev = self.cum[i]
+        return out
+
+
+class AttributionLedger:
+    """Prefix-summed P&L per attribution key, fed by ``PositionManager``.
+
+    Args:
+        factor_tags: strategy_id -> factor tags (defaults to ``FACTOR_TAGS``).
+    """
+
+    def __init__(self, factor_tags: Mapping[str, list[str]] | None = None) -> None:
+        self.factor_tags = FACTOR_TAGS if factor_tags is None else factor_tags
+        self._series: dict[Key, _CumSeries] = {}
+        self._keys_by_dimension: dict[str, list[Hashable]] = defaultdict(list)
+        self._splits: dict[Any, list[tuple[Key, float]]] = {}
+
+    # ------------------------------------------------------------------
+    # Dimension splits
+    # ------------------------------------------------------------------
+
+    def get_factor_tags(self, strategy_id: str) -> list[str]:
+        return self.factor_tags.get(strategy_id, ["untagged"])
+
+    def splits(self, position: dict) -> list[tuple[Key, float]]:
+        """``(key, weight)`` pairs a position's P&L is posted to (cached)."""
+        cached = self._splits.get(position["id"])
+        if cached is not None:
+            return cached
+
+        strategy_ids = position.get("strategy_ids") or ["UNASSIGNED"]
+        strategy_weights = position.get("strategy_weights") or {}
+        splits: list[tuple[Key, float]] = [
+            (TOTAL, 1.0),
+            (("position", position["id"]), 1.0),
+            (("asset_class", position.get("asset_class", "UNKNOWN")), 1.0),
+        ]
+
+        if strategy_weights:
+            total_weight = sum(strategy_weights.values()) or 1.0
+            splits += [
+                (("strategy", sid), weight / total_weight)
+                for sid, weight in strategy_weights.items()
+            ]
+        else:
+            splits += [(("strategy", sid), 1.0 / len(strategy_ids)) for sid in strategy_ids]
+
+        factors = sorted({f for sid in strategy_ids for f in self.get_factor_tags(sid)})
+        splits += [(("factor", f), 1.0 / len(factors)) for f in factors]
+
+        notes = (position.get("notes") or "").lower()
+        discretionary = "discretionary" in notes or not position.get("strategy_ids")
+        trade_type = "discretionary" if discretionary else "systematic"
+        splits.append((("trade_type", trade_type), 1.0))
+
+        self._splits[position["id"]] = splits
+        return splits
+
+    # ------------------------------------------------------------------
+    # Posting
+    # ------------------------------------------------------------------
+
+    def post(self, day: date | datetime, position: dict, amount: float) -> None:
+        """Post one P&L change of ``position`` dated ``day``."""
+        self.post_batch(day, [position], [amount])
+
+    def post_batch(
+        self,
+        day: date | datetime,
+        positions: Sequence[dict],
+        amounts: Iterable[float],
+    ) -> None:
+        """Post P&L changes for many positions on one date (e.g. an MTM)."""
+        day = _as_date(day)
+        per_key: dict[Key, float] = defaultdict(float)
+        for position, amount in zip(positions, amounts):
+            if not amount:
+                continue
+            for key, weight in self.splits(position):
+                per_key[key] += amount * weight
+        for key, amount in per_key.items():
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = _CumSeries()
+                self._keys_by_dimension[key[0]].append(key[1])
+            series.add(day, amount)
+
+    def post_close(self, day: date | datetime, position: dict, realized: float) -> None:
+        """Post the close: realized P&L minus what the position already posted."""
+        posted = self.position_total(position["id"])
+        self.post(day, position, realized - posted)
+
+    def post_opening_balance(
+        self, position: dict, snapshots: Sequence[dict] = ()
+    ) -> None:
+        """Seed a hydrated position from its P&L snapshots.
+
+        Each ``position_pnl_history`` snapshot posts the change in
+        unrealized P&L since the previous one, on its ``snapshot_date``.
+        Whatever the snapshots do not explain (realized P&L on close, a
+        mark that was not snapshotted) is posted at ``closed_at`` /
+        ``updated_at``.  A position with no snapshots has no P&L path, so
+        its whole current P&L is dated at ``entry_date``: it counts toward
+        inception and any period covering the entry, not toward recent
+        daily/MTD figures.
+        """
+        if position.get("is_open"):
+            amount = float(position.get("unrealized_pnl_brl") or 0.0)
+            when = position.get("updated_at")
+        else:
+            amount = float(position.get("realized_pnl_brl") or 0.0)
+            when = position.get("closed_at")
+
+        posted = 0.0
+        for snapshot in sorted(snapshots, key=lambda s: s["snapshot_date"]):
+            unrealized = float(snapshot.get("unrealized_pnl_brl") or 0.0)
+            self.post(snapshot["snapshot_date"], position, unrealized - posted)
+            posted = unrealized
+
+        if not snapshots:
+            when = position.get("entry_date")
+        residual = amount - posted
+        if residual and when is not None:
+            self.post(when, position, residual)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def pnl(self, key: Key, start: date, end: date) -> float:
+        """P&L posted to ``key`` over ``[start, end]``."""
+        series = self._series.get(key)
+        return series.between(start, end) if series is not None else 0.0
+
+    def position_total(self, position_id: Any) -> float:
+        """Everything posted for a position so far."""
+        series = self._series.get(("position", position_id))
+        return series.cum[-1] if series is not None and series.cum else 0.0
+
+    def breakdown(self, dimension: str, start: date, end: date) -> dict[Hashable, float]:
+        """P&L per key of ``dimension`` over ``[start, end]``."""
+        return {
+            name: self._series[(dimension, name)].between(start, end)
+            for name in self._keys_by_dimension.get(dimension, ())
+        }
+
+    def daily(self, start: date, end: date, key: Key = TOTAL) -> dict[date, float]:
+        """Per-date P&L of ``key`` for posting dates in ``[start, end]``."""
+        series = self._series.get(key)
+        return series.daily(start, end) if series is not None else {}
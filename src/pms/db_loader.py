@@ -99,6 +99,37 @@ def load_positions() -> list[dict]:
         return []
 
 
+def load_pnl_history() -> list[dict]:
+    """Load all position P&L snapshots from the database.
+
+    Returns:
+        List of snapshot dicts compatible with PositionManager._pnl_history,
+        ordered by snapshot date.
+    """
+    try:
+        import psycopg2.extras
+
+        conn = _get_connection()
+        with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
+            cur.execute("""
+                SELECT id, snapshot_date, position_id, instrument, mark_price,
+                       unrealized_pnl_brl, unrealized_pnl_usd, daily_pnl_brl,
+                       daily_pnl_usd, cumulative_pnl_brl, dv01, delta,
+                       var_contribution, fx_rate, is_manual_override
+                FROM position_pnl_history
+                ORDER BY snapshot_date, position_id
+            """)
+            rows = [dict(row) for row in cur.fetchall()]
+        conn.close()
+
+        logger.info("Loaded %d P&L snapshots from DB", len(rows))
+        return rows
+
+    except Exception as exc:
+        logger.warning("Failed to load P&L history from DB: %s", exc)
+        return []
+
+
 def load_trade_proposals() -> list[dict]:
     """Load all trade proposals from the database.
 
@@ -243,8 +274,13 @@ def hydrate_position_manager(pm) -> None:
     """
     positions = load_positions()
     if positions:
-        pm._positions = positions
-        logger.info("Hydrated PositionManager with %d positions", len(positions))
+        pnl_history = load_pnl_history()
+        pm.hydrate(positions, pnl_history)
+        logger.info(
+            "Hydrated PositionManager with %d positions, %d P&L snapshots",
+            len(positions),
+            len(pnl_history),
+        )
 
 
 def hydrate_trade_workflow(wf) -> None:
@@ -6,14 +6,25 @@ an LLM-powered macro narrative with template-based fallback.
 
 MorningPackService is the daily command center for the portfolio manager,
 providing a single-view summary of everything needed to start the trading day.
+
+The independent sections are collected concurrently on a small thread pool,
+each with its own timeout; a section that times out or raises degrades to
+``{"status": "unavailable", "reason": ...}`` instead of holding up the pack.
+Each section is cached with a fingerprint of its inputs (book version,
+agent report timestamps, signal batches, ...), so a ``force=True``
+regeneration only recollects -- and only re-asks the LLM for -- what
+changed.  Per-section timings are recorded under ``section_timings``.
 """
 
 from __future__ import annotations
 
 import os
+import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from datetime import date, datetime, timezone
-from typing import Any
+from typing import Any, Callable, Hashable
 
 import structlog
 
@@ -25,6 +36,29 @@ logger = structlog.get_logger(__name__)
 # Priority ordering for action items (lower index = higher priority)
 _PRIORITY_ORDER = {"CRITICAL": 0, "HIGH": 1, "MEDIUM": 2, "LOW": 3}
 
+_AGENT_IDS = (
+    "inflation_agent",
+    "monetary_agent",
+    "fiscal_agent",
+    "fx_agent",
+    "cross_asset_agent",
+)
+
+# Per-section collection timeouts (seconds); the narrative's LLM call has
+# its own HTTP timeout
+SECTION_TIMEOUT_SECONDS: dict[str, float] = {
+    "trade_proposals": 5.0,
+    "portfolio_state": 5.0,
+    "agent_views": 5.0,
+    "regime": 5.0,
+    "top_signals": 5.0,
+    "signal_changes": 5.0,
+    "market_snapshot": 10.0,
+}
+
+# Macro series land on ingestion schedules; reuse a snapshot this long
+MARKET_SNAPSHOT_TTL_SECONDS = 300.0
+
 
 class MorningPackService:
     """Generates structured daily briefings for the portfolio manager.
@@ -68,6 +102,12 @@ class MorningPackService:
         self.var_calculator = var_calculator
         self.stress_tester = stress_tester
         self._briefings: list[dict] = []
+        # section -> (fingerprint, value) of the last healthy collection
+        self._section_cache: dict[str, tuple[Hashable, Any]] = {}
+        self._executor = ThreadPoolExecutor(
+            max_workers=len(SECTION_TIMEOUT_SECONDS),
+            thread_name_prefix="morning-pack",
+        )
 
     # -------------------------------------------------------------------------
     # Core: generate daily briefing
@@ -97,24 +137,63 @@ class MorningPackService:
                 return existing
 
         now = datetime.now(timezone.utc)
-
-        # Collect all sections with graceful degradation
-        trade_proposals = self._collect_trade_proposals(briefing_date)
-        portfolio_state = self._collect_portfolio_state(briefing_date)
-        agent_views = self._collect_agent_views()
-        regime = self._collect_regime()
-        top_signals = self._collect_top_signals()
-        signal_changes = self._collect_signal_changes()
-        market_snapshot = self._collect_market_snapshot()
-
-        # Build action items from collected data (must come after other sections)
+        timings: dict[str, dict] = {}
+
+        # Collect independent sections concurrently (cached when unchanged)
+        fingerprints = self._section_fingerprints(briefing_date)
+        sections = self._collect_sections(
+            {
+                "trade_proposals": lambda: self._collect_trade_proposals(
+                    briefing_date
+                ),
+                "portfolio_state": lambda: self._collect_portfolio_state(
+                    briefing_date
+                ),
+                "agent_views": self._collect_agent_views,
+                "regime": self._collect_regime,
+                "top_signals": self._collect_top_signals,
+                "signal_changes": self._collect_signal_changes,
+                "market_snapshot": self._collect_market_snapshot,
+            },
+            fingerprints,
+            timings,
+        )
+        trade_proposals = sections["trade_proposals"]
+        portfolio_state = sections["portfolio_state"]
+        agent_views = sections["agent_views"]
+        regime = sections["regime"]
+        top_signals = sections["top_signals"]
+        signal_changes = sections["signal_changes"]
+        market_snapshot = sections["market_snapshot"]
+
+        # Build action items from collected data (must come after other sections;
+        # not cached -- the risk limit check is live)
+        t0 = time.perf_counter()
         action_items = self._build_action_items(
             trade_proposals, signal_changes, portfolio_state, regime
         )
-
-        # Generate macro narrative (LLM with template fallback)
-        macro_narrative = self._generate_macro_narrative(
-            agent_views, regime, top_signals, portfolio_state, briefing_date
+        timings["action_items"] = _timing(t0, cached=False, status="ok")
+
+        # Generate macro narrative (LLM with template fallback); reused while
+        # its inputs are unchanged and were collected healthily
+        narrative_inputs = ("agent_views", "regime", "top_signals", "portfolio_state")
+        narrative_fingerprint = None
+        if all(
+            timings[name]["status"] == "ok" and fingerprints.get(name) is not None
+            for name in narrative_inputs
+        ):
+            narrative_fingerprint = (
+                briefing_date,
+                bool(os.environ.get("ANTHROPIC_API_KEY")),
+                *(fingerprints.get(name) for name in narrative_inputs),
+            )
+        macro_narrative = self._cached_section(
+            "macro_narrative",
+            narrative_fingerprint,
+            lambda: self._generate_macro_narrative(
+                agent_views, regime, top_signals, portfolio_state, briefing_date
+            ),
+            timings,
         )
 
         # Assemble briefing with action-first ordering
@@ -131,6 +210,7 @@ class MorningPackService:
             "signal_changes": signal_changes,
             "portfolio_state": portfolio_state,
             "macro_narrative": macro_narrative,
+            "section_timings": timings,
         }
 
         # Auto-persist
@@ -142,11 +222,166 @@ class MorningPackService:
             action_items_count=(
                 len(action_items) if isinstance(action_items, list) else 0
             ),
-            sections=len(briefing) - 3,  # exclude id, date, created_at
+            sections=len(briefing) - 4,  # exclude id, date, created_at, timings
+            collected_s=round(sum(t["seconds"] for t in timings.values()), 3),
+            cached=[name for name, t in timings.items() if t["cached"]],
         )
 
         return briefing
 
+    # -------------------------------------------------------------------------
+    # Concurrent section collection and per-section caching
+    # -------------------------------------------------------------------------
+
+    def _collect_sections(
+        self,
+        collectors: dict[str, Callable[[], Any]],
+        fingerprints: dict[str, Hashable],
+        timings: dict[str, dict],
+    ) -> dict[str, Any]:
+        """Run section collectors concurrently, serving unchanged ones from cache.
+
+        A collector that exceeds its ``SECTION_TIMEOUT_SECONDS`` budget or
+        raises degrades to an unavailable marker; its thread is left to
+        finish in the background and the result is discarded.
+        """
+        results: dict[str, Any] = {}
+        pending: dict[str, tuple[Any, float]] = {}
+        for name, collect in collectors.items():
+            hit = self._cache_lookup(name, fingerprints.get(name))
+            if hit is not None:
+                results[name] = hit[0]
+                timings[name] = {"seconds": 0.0, "cached": True, "status": "ok"}
+            else:
+                future = self._executor.submit(collect)
+                pending[name] = (future, time.perf_counter())
+
+        for name, (future, started) in pending.items():
+            timeout = SECTION_TIMEOUT_SECONDS.get(name, 5.0)
+            remaining = max(started + timeout - time.perf_counter(), 0.0)
+            try:
+                value = future.result(timeout=remaining)
+            except FutureTimeoutError:
+                logger.warning("briefing_section_timeout", section=name, timeout=timeout)
+                results[name] = {
+                    "status": "unavailable",
+                    "reason": f"{name} timed out after {timeout:.1f}s",
+                }
+                timings[name] = _timing(started, cached=False, status="timeout")
+                continue
+            except Exception as exc:
+                logger.warning("briefing_section_failed", section=name, error=str(exc))
+                results[name] = {"status": "unavailable", "reason": str(exc)}
+                timings[name] = _timing(started, cached=False, status="error")
+                continue
+            results[name] = value
+            timings[name] = self._store_section(
+                name, fingerprints.get(name), value, started
+            )
+        return results
+
+    def _cached_section(
+        self,
+        name: str,
+        fingerprint: Hashable | None,
+        build: Callable[[], Any],
+        timings: dict[str, dict],
+    ) -> Any:
+        """Serial counterpart of ``_collect_sections`` for dependent sections."""
+        hit = self._cache_lookup(name, fingerprint)
+        if hit is not None:
+            timings[name] = {"seconds": 0.0, "cached": True, "status": "ok"}
+            return hit[0]
+        started = time.perf_counter()
+        value = build()
+        timings[name] = self._store_section(name, fingerprint, value, started)
+        return value
+
+    def _cache_lookup(self, name: str, fingerprint: Hashable | None) -> tuple | None:
+        """``(value,)`` if ``name`` was cached under ``fingerprint``, else None."""
+        cached = self._section_cache.get(name)
+        if fingerprint is None or cached is None or cached[0] != fingerprint:
+            return None
+        return (cached[1],)
+
+    def _store_section(
+        self, name: str, fingerprint: Hashable | None, value: Any, started: float
+    ) -> dict:
+        """Cache a healthy section result and return its timing entry."""
+        status = value.get("status") if isinstance(value, dict) else None
+        degraded = status in ("unavailable", "partial")
+        if fingerprint is not None and not degraded:
+            self._section_cache[name] = (fingerprint, value)
+        return _timing(started, cached=False, status=status if degraded else "ok")
+
+    def _section_fingerprints(self, briefing_date: date) -> dict[str, Hashable]:
+        """Cheap fingerprints of each section's inputs (None = do not cache).
+
+        Fingerprints read in-memory state only -- versions, timestamps and
+        object identities -- never the data the collectors load.
+        """
+        fingerprints: dict[str, Hashable] = {}
+
+        if self.trade_workflow is not None:
+            fingerprints["trade_proposals"] = (
+                briefing_date,
+                tuple(
+                    (p.get("id"), p.get("status"), p.get("updated_at"))
+                    for p in getattr(self.trade_workflow, "_proposals", [])
+                ),
+            )
+
+        if self.position_manager is not None:
+            fingerprints["portfolio_state"] = (
+                briefing_date,
+                self.position_manager._store.version,
+                len(self.position_manager._pnl_history),
+            )
+
+        reports = self._agent_report_stamps()
+        if reports is not None:
+            fingerprints["agent_views"] = reports
+            fingerprints["regime"] = reports[-1]  # cross_asset_agent
+
+        if self.signal_aggregator is not None:
+            latest = getattr(self.signal_aggregator, "_latest_results", None)
+            fingerprints["top_signals"] = (id(latest), len(latest or ()))
+
+        if self.signal_monitor is not None:
+            flips = getattr(self.signal_monitor, "_latest_flips", [])
+            surges = getattr(self.signal_monitor, "_latest_surges", [])
+            fingerprints["signal_changes"] = (
+                id(flips),
+                len(flips),
+                id(surges),
+                len(surges),
+            )
+
+        fingerprints["market_snapshot"] = int(
+            time.time() // MARKET_SNAPSHOT_TTL_SECONDS
+        )
+        return fingerprints
+
+    def _agent_report_stamps(self) -> tuple | None:
+        """``(id, generated_at)`` of each agent's latest report, in _AGENT_IDS order."""
+        try:
+            from src.agents.registry import AgentRegistry
+        except ImportError:
+            return None
+
+        stamps = []
+        for agent_id in _AGENT_IDS:
+            try:
+                report = getattr(AgentRegistry.get(agent_id), "latest_report", None)
+            except Exception:
+                report = None
+            stamps.append(
+                (id(report), getattr(report, "generated_at", None))
+                if report is not None
+                else None
+            )
+        return tuple(stamps)
+
     # -------------------------------------------------------------------------
     # Retrieval methods
     # -------------------------------------------------------------------------
@@ -245,16 +480,8 @@ class MorningPackService:
         try:
             from src.agents.registry import AgentRegistry
 
-            agent_ids = [
-                "inflation_agent",
-                "monetary_agent",
-                "fiscal_agent",
-                "fx_agent",
-                "cross_asset_agent",
-            ]
-
             views = []
-            for agent_id in agent_ids:
+            for agent_id in _AGENT_IDS:
                 try:
                     agent = AgentRegistry.get(agent_id)
                     # Try to get the latest report if available
@@ -826,3 +1053,12 @@ class MorningPackService:
         )
 
         return "\n\n".join(paragraphs)
+
+
+def _timing(started: float, cached: bool, status: str) -> dict:
+    """Timing entry for ``section_timings``."""
+    return {
+        "seconds": round(time.perf_counter() - started, 4),
+        "cached": cached,
+        "status": status,
+    }
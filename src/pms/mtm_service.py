@@ -5,22 +5,38 @@ staleness detection, and risk metric computation (DV01, delta, VaR contribution)
 
 Price resolution order:
 1. Manual override (price_overrides param)
-2. Live DB lookup from TimescaleDB market_data table
+2. Live DB lookup from TimescaleDB market_data table (one ``DISTINCT ON``
+   query on the shared engine, fronted by a short-lived in-process
+   ``LatestPriceCache`` that ingestion invalidates)
 3. Carry-forward entry_price with staleness alert
+
+``compute_book_mtm`` marks a whole book in one pass of vectorized pricing
+(``pricing.*_array``) and returns a columnar ``MTMBatch``;
+``compute_position_mtm`` is the scalar single-position equivalent.
 """
 
 from __future__ import annotations
 
 import importlib.util
 import os
+import threading
+import time
+from dataclasses import dataclass
 from datetime import date
+from typing import Callable, Hashable, Iterable, Sequence
+
+import numpy as np
 import structlog
 
 from .pricing import (
+    compute_dv01_array,
     compute_dv01_from_pu,
     compute_fx_delta,
+    compute_fx_delta_array,
     compute_pnl_brl,
+    compute_pnl_brl_array,
     compute_pnl_usd,
+    compute_pnl_usd_array,
     rate_to_pu,
 )
 
@@ -39,43 +55,126 @@ TransactionCostModel = _costs_mod.TransactionCostModel
 logger = structlog.get_logger(__name__)
 
 
-def _fetch_db_prices(tickers: list[str], as_of_date: date) -> dict[str, tuple[float, date]]:
+PRICE_CACHE_TTL_SECONDS = 60.0
+
+PriceMap = dict[str, tuple[float, date]]
+
+
+class LatestPriceCache:
+    """Short-lived in-process cache of last closes, keyed by (ticker, as_of).
+
+    Only the tickers missing (or expired) for a date reach ``fetch_fn``, in
+    one batched call.  Tickers the database has no close for are cached
+    as misses too, so repeated MTM runs over unpriced instruments do not
+    requery.  A failed fetch is not cached.
+
+    Entries are dropped by ``invalidate`` (called when market data is
+    ingested in this process), by ``observe_version`` when the shared price
+    version moves (ingestion in another process), or after ``ttl_seconds``.
+
+    Args:
+        fetch_fn: ``(tickers, as_of_date) -> {ticker: (close, price_date)}``.
+        ttl_seconds: Maximum age of an entry.
+    """
+
+    def __init__(
+        self,
+        fetch_fn: Callable[[list[str], date], PriceMap],
+        ttl_seconds: float = PRICE_CACHE_TTL_SECONDS,
+    ) -> None:
+        self._fetch_fn = fetch_fn
+        self.ttl_seconds = ttl_seconds
+        self._entries: dict[tuple[str, date], tuple[tuple[float, date] | None, float]] = {}
+        self._version: Hashable | None = None
+        self._lock = threading.Lock()
+        self.fetches = 0
+
+    def get_many(self, tickers: Iterable[str], as_of_date: date) -> PriceMap:
+        """Last close per ticker as of ``as_of_date`` (missing tickers omitted)."""
+        now = time.monotonic()
+        result: PriceMap = {}
+        missing: list[str] = []
+        with self._lock:
+            for ticker in dict.fromkeys(tickers):
+                entry = self._entries.get((ticker, as_of_date))
+                if entry is None or now - entry[1] >= self.ttl_seconds:
+                    missing.append(ticker)
+                elif entry[0] is not None:
+                    result[ticker] = entry[0]
+        if not missing:
+            return result
+
+        fetched = self._fetch_fn(missing, as_of_date)
+        self.fetches += 1
+        stored_at = time.monotonic()
+        with self._lock:
+            for ticker in missing:
+                value = fetched.get(ticker)
+                self._entries[(ticker, as_of_date)] = (value, stored_at)
+                if value is not None:
+                    result[ticker] = value
+        return result
+
+    def invalidate(self, tickers: Iterable[str] | None = None) -> None:
+        """Drop cached prices for ``tickers`` (all tickers when None)."""
+        with self._lock:
+            if tickers is None:
+                self._entries.clear()
+                return
+            drop = set(tickers)
+            for key in [k for k in self._entries if k[0] in drop]:
+                del self._entries[key]
+
+    def observe_version(self, version: Hashable) -> None:
+        """Clear the cache if the shared price version changed."""
+        with self._lock:
+            if version != self._version:
+                if self._version is not None:
+                    self._entries.clear()
+                self._version = version
+
+
+_loader = None
+
+
+def _query_last_prices(tickers: list[str], as_of_date: date) -> PriceMap:
+    """One ``DISTINCT ON`` query via ``PointInTimeDataLoader.get_last_prices``."""
+    global _loader
+    if _loader is None:
+        from src.agents.data_loader import PointInTimeDataLoader
+
+        _loader = PointInTimeDataLoader()
+    return _loader.get_last_prices(tickers, as_of_date)
+
+
+_price_cache = LatestPriceCache(_query_last_prices)
+
+
+def get_price_cache() -> LatestPriceCache:
+    """Process-wide latest-price cache used by ``MarkToMarketService``."""
+    return _price_cache
+
+
+def invalidate_price_cache(tickers: Iterable[str] | None = None) -> None:
+    """Drop cached latest prices (call after ingesting market data)."""
+    _price_cache.invalidate(tickers)
+
+
+def _fetch_db_prices(tickers: list[str], as_of_date: date) -> PriceMap:
     """Query TimescaleDB for the latest close price for each ticker.
 
+    Served from the process-wide ``LatestPriceCache``; misses go to
+    ``PointInTimeDataLoader.get_last_prices`` -- one ``DISTINCT ON`` query
+    returning a single row per ticker on the shared sync engine, so cost
+    scales with the number of tickers rather than their price history.
+
     Returns dict of {ticker: (close_price, price_date)} for tickers found.
     Silently returns empty dict if DB is unavailable.
     """
     if not tickers:
         return {}
     try:
-        from sqlalchemy import create_engine, text
-
-        from src.core.config import get_settings
-
-        settings = get_settings()
-        engine = create_engine(settings.database_url)
-        with engine.connect() as conn:
-            result = conn.execute(
-                text(
-                    "SELECT i.ticker, md.close, md.date "
-                    "FROM market_data md "
-                    "JOIN instruments i ON i.id = md.instrument_id "
-                    "WHERE i.ticker = ANY(:tickers) AND md.date <= :as_of "
-                    "ORDER BY md.date DESC"
-                ),
-                {"tickers": tickers, "as_of": as_of_date},
-            )
-            rows = result.fetchall()
-
-        # Keep only the most recent row per ticker
-        prices: dict[str, tuple[float, date]] = {}
-        for row in rows:
-            ticker, close, price_date = row[0], row[1], row[2]
-            if ticker not in prices and close is not None:
-                if hasattr(price_date, "date"):
-                    price_date = price_date.date()
-                prices[ticker] = (float(close), price_date)
-
+        prices = _price_cache.get_many(tickers, as_of_date)
         if prices:
             logger.debug("db_prices_fetched", n_tickers=len(prices), as_of=str(as_of_date))
         return prices
@@ -84,6 +183,51 @@ def _fetch_db_prices(tickers: list[str], as_of_date: date) -> dict[str, tuple[fl
         return {}
 
 
+@dataclass
+class MTMBatch:
+    """Columnar MTM result for a batch of positions (input order).
+
+    Every array has one entry per position; ``row(i)`` returns the same
+    dict as ``MarkToMarketService.compute_position_mtm`` for position i.
+    """
+
+    position_ids: list
+    mark_price: np.ndarray
+    unrealized_pnl_brl: np.ndarray
+    unrealized_pnl_usd: np.ndarray
+    daily_pnl_brl: np.ndarray
+    daily_pnl_usd: np.ndarray
+    current_dv01: np.ndarray
+    current_delta: np.ndarray
+    fx_rate: np.ndarray
+
+    _FIELDS = (
+        "unrealized_pnl_brl",
+        "unrealized_pnl_usd",
+        "daily_pnl_brl",
+        "daily_pnl_usd",
+        "current_dv01",
+        "current_delta",
+        "mark_price",
+        "fx_rate",
+    )
+
+    def __len__(self) -> int:
+        return len(self.position_ids)
+
+    def row(self, i: int) -> dict:
+        return {name: float(getattr(self, name)[i]) for name in self._FIELDS}
+
+    def columns(self) -> dict[str, list[float]]:
+        """Field name -> Python list, for building records in bulk."""
+        return {name: getattr(self, name).tolist() for name in self._FIELDS}
+
+
+def _float_column(positions: Sequence[dict], key: str, default: float = 0.0) -> np.ndarray:
+    """Column of ``position[key]`` as float64 (missing -> default, None -> 0.0)."""
+    return np.array([p.get(key, default) or 0.0 for p in positions], dtype=np.float64)
+
+
 class MarkToMarketService:
     """Service for mark-to-market pricing of portfolio positions.
 
@@ -140,6 +284,9 @@ class MarkToMarketService:
             instrument = pos.get("instrument", "UNKNOWN")
             entry_price = pos.get("entry_price", 0.0)
 
+            if instrument in result:
+                # Already resolved this instrument from a previous position
+                continue
             if instrument in overrides:
                 result[instrument] = {
                     "price": overrides[instrument],
@@ -153,9 +300,6 @@ class MarkToMarketService:
                     instrument=instrument,
                     price=overrides[instrument],
                 )
-            elif instrument in result:
-                # Already resolved this instrument from a previous position
-                continue
             elif instrument in db_prices:
                 # Live price from TimescaleDB market_data table
                 db_price, price_date = db_prices[instrument]
@@ -266,6 +410,73 @@ class MarkToMarketService:
             "fx_rate": fx_rate,
         }
 
+    def compute_book_mtm(
+        self,
+        positions: Sequence[dict],
+        current_prices: Sequence[float] | np.ndarray,
+        current_fx_rate: float | None = None,
+    ) -> MTMBatch:
+        """Vectorized ``compute_position_mtm`` over a batch of positions.
+
+        Positions are split into column arrays once; RATES legs get PU
+        P&L and DV01 from their rate / business days, FX legs get delta,
+        and everything else (CREDIT spread-quoted, EQUITY, SOVEREIGN, ...)
+        gets price-return P&L -- the same dispatch as the scalar method,
+        applied through boolean masks instead of per-position branches.
+
+        Args:
+            positions: Position dicts (as for ``compute_position_mtm``).
+            current_prices: Mark price per position, aligned with positions.
+            current_fx_rate: USDBRL for USD conversion (falls back to each
+                position's entry_fx_rate, then 5.0).
+
+        Returns:
+            MTMBatch with one entry per position.
+        """
+        n = len(positions)
+        asset_class = np.array(
+            [str(p.get("asset_class", "GENERAL")).upper() for p in positions],
+            dtype=object,
+        )
+        is_rates = asset_class == "RATES"
+        is_fx = asset_class == "FX"
+        sign = np.array(
+            [1.0 if p.get("direction", "LONG").upper() == "LONG" else -1.0 for p in positions]
+        )
+        entry_price = _float_column(positions, "entry_price")
+        notional = _float_column(positions, "notional_brl")
+        previous = _float_column(positions, "unrealized_pnl_brl")
+        mark = np.asarray(current_prices, dtype=np.float64).reshape(n)
+        fx_rate = np.array(
+            [current_fx_rate or p.get("entry_fx_rate") or 5.0 for p in positions],
+            dtype=np.float64,
+        )
+
+        unrealized_brl = compute_pnl_brl_array(entry_price, mark, notional, sign, is_rates)
+        daily_brl = unrealized_brl - previous
+
+        # DV01 only where rate and business days are both set (and non-zero)
+        rate_pct = _float_column(positions, "rate_pct")
+        business_days = _float_column(positions, "business_days", 252.0)
+        has_curve = is_rates & (rate_pct != 0) & (business_days != 0)
+        dv01 = np.zeros(n)
+        if has_curve.any():
+            dv01[has_curve] = compute_dv01_array(
+                rate_pct[has_curve], business_days[has_curve], notional[has_curve]
+            )
+
+        return MTMBatch(
+            position_ids=[p.get("id") for p in positions],
+            mark_price=mark,
+            unrealized_pnl_brl=unrealized_brl,
+            unrealized_pnl_usd=compute_pnl_usd_array(unrealized_brl, fx_rate),
+            daily_pnl_brl=daily_brl,
+            daily_pnl_usd=compute_pnl_usd_array(daily_brl, fx_rate),
+            current_dv01=dv01,
+            current_delta=np.where(is_fx, compute_fx_delta_array(notional, fx_rate), 0.0),
+            fx_rate=fx_rate,
+        )
+
     def compute_dv01(
         self,
         instrument: str,
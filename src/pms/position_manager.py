@@ -6,6 +6,10 @@ All position changes are journaled automatically in the DecisionJournal.
 This class operates on dicts representing positions (not ORM objects directly)
 to decouple from SQLAlchemy sessions. The caller (API layer or Dagster pipeline)
 is responsible for session management and persistence.
+
+Positions live in a ``PositionStore`` (id index, open bitmask, numeric
+columns) and P&L snapshots feed a ``PnLLedger`` pre-aggregated by date,
+month and year, so lookups and ``get_book`` do not scan the full history.
 """
 
 from __future__ import annotations
@@ -21,7 +25,9 @@ from typing import Any
 
 import structlog
 
+from .attribution_ledger import AttributionLedger
 from .mtm_service import MarkToMarketService
+from .position_store import PnLLedger, PositionStore
 from .pricing import (
     compute_dv01_from_pu,
     compute_fx_delta,
@@ -63,11 +69,55 @@ class PositionManager:
         self.mtm_service = mtm_service or MarkToMarketService()
         self.cost_model = cost_model or TransactionCostModel()
         self.aum = aum
-        self._positions: list[dict] = (
-            []
-        )  # In-memory position store (DB wiring in Phase 21)
+        self._store = PositionStore()  # In-memory position store (DB wiring in Phase 21)
         self._journal: list[dict] = []  # In-memory journal store
         self._pnl_history: list[dict] = []  # In-memory P&L snapshots
+        self._pnl_ledger = PnLLedger()
+        self._attribution = AttributionLedger()
+
+    @property
+    def attribution_ledger(self) -> AttributionLedger:
+        """Prefix-summed P&L by attribution dimension (see attribution_ledger)."""
+        return self._attribution
+
+    def open_positions(self) -> list[dict]:
+        """Open position dicts, read from the store's open-row bitmask."""
+        return self._store.open_positions()
+
+    @property
+    def _positions(self) -> list[dict]:
+        """All position dicts (open and closed), in insertion order."""
+        return self._store.records
+
+    @_positions.setter
+    def _positions(self, positions: list[dict]) -> None:
+        self.hydrate(positions)
+
+    def hydrate(self, positions: list[dict], pnl_history: list[dict] | None = None) -> None:
+        """Replace the book with DB-loaded positions and P&L snapshots.
+
+        Rebuilds the store indexes and the P&L ledger, and seeds the
+        attribution ledger by replaying each position's snapshots, so
+        period totals (daily, MTD, YTD) match what the live marks posted.
+
+        Args:
+            positions: Position dicts (e.g. from ``db_loader.load_positions``).
+            pnl_history: ``position_pnl_history`` rows for those positions.
+                ``None`` keeps the snapshots already held in memory.
+        """
+        self._store = PositionStore(positions)
+        if pnl_history is not None:
+            self._pnl_history = list(pnl_history)
+            self._pnl_ledger = PnLLedger()
+            for snapshot in self._pnl_history:
+                self._pnl_ledger.record(snapshot)
+
+        by_position: dict[Any, list[dict]] = {}
+        for snapshot in self._pnl_history:
+            by_position.setdefault(snapshot.get("position_id"), []).append(snapshot)
+        self._attribution = AttributionLedger()
+        for position in self._store:
+            self._attribution.post_opening_balance(position, by_position.get(position["id"], ()))
 
     # -------------------------------------------------------------------------
     # Open position
@@ -179,7 +229,7 @@ class PositionManager:
             "business_days": business_days,
         }
 
-        self._positions.append(position)
+        self._store.add(position)
 
         # Create journal entry
         journal_content = {
@@ -282,17 +332,20 @@ class PositionManager:
         realized_pnl_usd = compute_pnl_usd(realized_pnl_brl, fx_rate)
 
         # Update position
-        position["is_open"] = False
-        position["closed_at"] = now
-        position["close_price"] = close_price
-        position["realized_pnl_brl"] = realized_pnl_brl
-        position["realized_pnl_usd"] = realized_pnl_usd
-        position["unrealized_pnl_brl"] = 0.0
-        position["unrealized_pnl_usd"] = 0.0
-        position["updated_at"] = now
-        position["transaction_cost_brl"] = (
-            position.get("transaction_cost_brl") or 0.0
-        ) + exit_cost
+        self._store.update(
+            position_id,
+            is_open=False,
+            closed_at=now,
+            close_price=close_price,
+            realized_pnl_brl=realized_pnl_brl,
+            realized_pnl_usd=realized_pnl_usd,
+            unrealized_pnl_brl=0.0,
+            unrealized_pnl_usd=0.0,
+            updated_at=now,
+            transaction_cost_brl=(position.get("transaction_cost_brl") or 0.0)
+            + exit_cost,
+        )
+        self._attribution.post_close(now, position, realized_pnl_brl)
 
         # Create journal entry
         journal_content = {
@@ -361,7 +414,7 @@ class PositionManager:
         Returns:
             List of updated position dicts for open positions.
         """
-        open_positions = [p for p in self._positions if p["is_open"]]
+        open_positions = self._store.open_positions()
         if not open_positions:
             return []
 
@@ -373,57 +426,63 @@ class PositionManager:
             open_positions, price_overrides, ref_date
         )
 
-        updated = []
+        # Resolve one mark per position, then price the book in one batch
+        overrides = price_overrides or {}
+        marks = []
         for pos in open_positions:
             instrument = pos["instrument"]
-            price_info = prices.get(instrument, {})
-            current_price = price_info.get("price", pos["entry_price"])
-
-            # Use override if available
-            if price_overrides and instrument in price_overrides:
-                current_price = price_overrides[instrument]
-
-            # Compute MTM
-            mtm = self.mtm_service.compute_position_mtm(pos, current_price, fx_rate)
-
-            # Update position
-            pos["current_price"] = current_price
-            pos["unrealized_pnl_brl"] = mtm["unrealized_pnl_brl"]
-            pos["unrealized_pnl_usd"] = mtm["unrealized_pnl_usd"]
-            pos["updated_at"] = datetime.now(timezone.utc)
-
-            # Persist snapshot
-            if persist_snapshot:
-                snapshot = {
-                    "id": len(self._pnl_history) + 1,
-                    "snapshot_date": ref_date,
-                    "position_id": pos["id"],
-                    "instrument": instrument,
-                    "mark_price": current_price,
-                    "unrealized_pnl_brl": mtm["unrealized_pnl_brl"],
-                    "unrealized_pnl_usd": mtm["unrealized_pnl_usd"],
-                    "daily_pnl_brl": mtm["daily_pnl_brl"],
-                    "daily_pnl_usd": mtm["daily_pnl_usd"],
-                    "cumulative_pnl_brl": mtm["unrealized_pnl_brl"],
-                    "dv01": mtm["current_dv01"],
-                    "delta": mtm["current_delta"],
-                    "var_contribution": None,
-                    "fx_rate": fx_rate,
-                    "is_manual_override": bool(
-                        price_overrides and instrument in price_overrides
-                    ),
-                }
-                self._pnl_history.append(snapshot)
-
-            updated.append(pos)
+            if instrument in overrides:
+                marks.append(overrides[instrument])
+            else:
+                marks.append(prices.get(instrument, {}).get("price", pos["entry_price"]))
+
+        batch = self.mtm_service.compute_book_mtm(open_positions, marks, fx_rate)
+        cols = batch.columns()
+
+        self._store.update_many(
+            batch.position_ids,
+            current_price=marks,
+            unrealized_pnl_brl=cols["unrealized_pnl_brl"],
+            unrealized_pnl_usd=cols["unrealized_pnl_usd"],
+            updated_at=datetime.now(timezone.utc),
+        )
+        self._attribution.post_batch(ref_date, open_positions, cols["daily_pnl_brl"])
+
+        # Persist snapshots
+        if persist_snapshot:
+            next_id = len(self._pnl_history) + 1
+            snapshots = []
+            for k, pos in enumerate(open_positions):
+                instrument = pos["instrument"]
+                snapshots.append(
+                    {
+                        "id": next_id + k,
+                        "snapshot_date": ref_date,
+                        "position_id": pos["id"],
+                        "instrument": instrument,
+                        "mark_price": marks[k],
+                        "unrealized_pnl_brl": cols["unrealized_pnl_brl"][k],
+                        "unrealized_pnl_usd": cols["unrealized_pnl_usd"][k],
+                        "daily_pnl_brl": cols["daily_pnl_brl"][k],
+                        "daily_pnl_usd": cols["daily_pnl_usd"][k],
+                        "cumulative_pnl_brl": cols["unrealized_pnl_brl"][k],
+                        "dv01": cols["current_dv01"][k],
+                        "delta": cols["current_delta"][k],
+                        "var_contribution": None,
+                        "fx_rate": fx_rate,
+                        "is_manual_override": instrument in overrides,
+                    }
+                )
+            self._pnl_history.extend(snapshots)
+            self._pnl_ledger.record_batch(ref_date, snapshots)
 
         logger.info(
             "mtm_completed",
-            n_positions=len(updated),
+            n_positions=len(open_positions),
             as_of_date=str(ref_date),
         )
 
-        return updated
+        return open_positions
 
     # -------------------------------------------------------------------------
     # Get book
@@ -440,96 +499,36 @@ class PositionManager:
         """
         ref_date = as_of_date or date.today()
 
-        open_positions = [p for p in self._positions if p["is_open"]]
-        closed_positions = [p for p in self._positions if not p["is_open"]]
+        open_positions = self._store.open_positions()
+        closed_today = self._store.closed_on(ref_date)
 
-        # Closed today
-        closed_today = []
-        for p in closed_positions:
-            closed_at = p.get("closed_at")
-            if closed_at is not None:
-                close_date = (
-                    closed_at.date() if isinstance(closed_at, datetime) else closed_at
-                )
-                if close_date == ref_date:
-                    closed_today.append(p)
-
-        # Summary calculations
-        total_notional = sum(abs(p["notional_brl"]) for p in open_positions)
+        # Summary calculations (column reductions over the open mask)
+        totals = self._store.totals()
+        total_notional = totals["total_notional_brl"]
         leverage = total_notional / self.aum if self.aum > 0 else 0.0
 
-        total_unrealized_pnl_brl = sum(
-            (p.get("unrealized_pnl_brl") or 0.0) for p in open_positions
-        )
-        total_unrealized_pnl_usd = sum(
-            (p.get("unrealized_pnl_usd") or 0.0) for p in open_positions
-        )
-        total_realized_pnl_brl = sum(
-            (p.get("realized_pnl_brl") or 0.0) for p in closed_positions
-        )
+        # P&L today/MTD/YTD from the pre-aggregated ledger
+        pnl_today_brl, pnl_today_usd = self._pnl_ledger.day(ref_date)
+        pnl_mtd_brl, pnl_mtd_usd = self._pnl_ledger.month(ref_date)
+        pnl_ytd_brl, pnl_ytd_usd = self._pnl_ledger.year(ref_date)
 
-        # P&L today/MTD/YTD from pnl_history
-        pnl_today_brl = 0.0
-        pnl_today_usd = 0.0
-        pnl_mtd_brl = 0.0
-        pnl_ytd_brl = 0.0
-        pnl_mtd_usd = 0.0
-        pnl_ytd_usd = 0.0
-
-        for snap in self._pnl_history:
-            snap_date = snap.get("snapshot_date")
-            if not snap_date:
-                continue
-            daily_brl = snap.get("daily_pnl_brl") or 0.0
-            daily_usd = snap.get("daily_pnl_usd") or 0.0
-
-            if snap_date == ref_date:
-                pnl_today_brl += daily_brl
-                pnl_today_usd += daily_usd
-
-            if (
-                isinstance(snap_date, date)
-                and snap_date.year == ref_date.year
-                and snap_date.month == ref_date.month
-            ):
-                pnl_mtd_brl += daily_brl
-                pnl_mtd_usd += daily_usd
-
-            if isinstance(snap_date, date) and snap_date.year == ref_date.year:
-                pnl_ytd_brl += daily_brl
-                pnl_ytd_usd += daily_usd
-
-        # By asset class breakdown
-        by_asset_class: dict[str, dict] = {}
-        for p in open_positions:
-            ac = p.get("asset_class", "UNKNOWN")
-            if ac not in by_asset_class:
-                by_asset_class[ac] = {
-                    "count": 0,
-                    "notional_brl": 0.0,
-                    "unrealized_pnl_brl": 0.0,
-                }
-            by_asset_class[ac]["count"] += 1
-            by_asset_class[ac]["notional_brl"] += abs(p["notional_brl"])
-            by_asset_class[ac]["unrealized_pnl_brl"] += (
-                p.get("unrealized_pnl_brl") or 0.0
-            )
+        by_asset_class = self._store.by_asset_class()
 
         return {
             "summary": {
                 "aum": self.aum,
                 "total_notional_brl": total_notional,
                 "leverage": leverage,
-                "open_positions": len(open_positions),
+                "open_positions": totals["open_positions"],
                 "pnl_today_brl": pnl_today_brl,
                 "pnl_mtd_brl": pnl_mtd_brl,
                 "pnl_ytd_brl": pnl_ytd_brl,
                 "pnl_today_usd": pnl_today_usd,
                 "pnl_mtd_usd": pnl_mtd_usd,
                 "pnl_ytd_usd": pnl_ytd_usd,
-                "total_unrealized_pnl_brl": total_unrealized_pnl_brl,
-                "total_unrealized_pnl_usd": total_unrealized_pnl_usd,
-                "total_realized_pnl_brl": total_realized_pnl_brl,
+                "total_unrealized_pnl_brl": totals["total_unrealized_pnl_brl"],
+                "total_unrealized_pnl_usd": totals["total_unrealized_pnl_usd"],
+                "total_realized_pnl_brl": totals["total_realized_pnl_brl"],
             },
             "positions": open_positions,
             "by_asset_class": by_asset_class,
@@ -556,10 +555,11 @@ class PositionManager:
         Returns:
             List of P&L snapshot dicts, filtered and optionally aggregated.
         """
-        filtered = self._pnl_history
+        if position_id is None:
+            # Portfolio-level: per-date aggregates kept by the ledger
+            return self._pnl_ledger.portfolio_series(start_date, end_date)
 
-        if position_id is not None:
-            filtered = [s for s in filtered if s.get("position_id") == position_id]
+        filtered = self._pnl_ledger.for_position(position_id)
 
         if start_date is not None:
             filtered = [
@@ -575,44 +575,15 @@ class PositionManager:
                 if s.get("snapshot_date") and s["snapshot_date"] <= end_date
             ]
 
-        if position_id is not None:
-            return sorted(filtered, key=lambda s: s.get("snapshot_date", date.min))
-
-        # Portfolio-level: aggregate by date
-        by_date: dict[date, dict] = {}
-        for snap in filtered:
-            snap_date = snap.get("snapshot_date")
-            if snap_date is None:
-                continue
-            if snap_date not in by_date:
-                by_date[snap_date] = {
-                    "snapshot_date": snap_date,
-                    "daily_pnl_brl": 0.0,
-                    "daily_pnl_usd": 0.0,
-                    "cumulative_pnl_brl": 0.0,
-                    "unrealized_pnl_brl": 0.0,
-                }
-            by_date[snap_date]["daily_pnl_brl"] += snap.get("daily_pnl_brl") or 0.0
-            by_date[snap_date]["daily_pnl_usd"] += snap.get("daily_pnl_usd") or 0.0
-            by_date[snap_date]["cumulative_pnl_brl"] += (
-                snap.get("cumulative_pnl_brl") or 0.0
-            )
-            by_date[snap_date]["unrealized_pnl_brl"] += (
-                snap.get("unrealized_pnl_brl") or 0.0
-            )
-
-        return sorted(by_date.values(), key=lambda s: s.get("snapshot_date", date.min))
+        return sorted(filtered, key=lambda s: s.get("snapshot_date", date.min))
 
     # -------------------------------------------------------------------------
     # Private helpers
     # -------------------------------------------------------------------------
 
     def _find_position(self, position_id: int) -> dict | None:
-        """Find position by ID."""
-        for p in self._positions:
-            if p["id"] == position_id:
-                return p
-        return None
+        """Find position by ID (O(1) index lookup)."""
+        return self._store.get(position_id)
 
     def _compute_content_hash(self, **fields: Any) -> str:
         """Compute SHA256 content hash for journal entry integrity.
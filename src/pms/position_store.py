@@ -0,0 +1,372 @@
+"""Columnar position store and pre-aggregated P&L ledger for PositionManager.
+
+``PositionManager`` used to keep positions in a plain list and scan it on
+every lookup, close, mark and book query, and to walk the whole P&L
+history to compute today / MTD / YTD P&L.  The two classes here keep the
+same records but index them:
+
+- ``PositionStore`` -- position dicts (still the public record format:
+  API schemas, caches and the journal consume them) plus an id -> row map,
+  an open/closed bitmask, numeric columns for the summed fields and an
+  asset-class code column.  Book totals and the asset-class breakdown are
+  masked numpy reductions; lookups are O(1).
+- ``PnLLedger`` -- daily P&L snapshots pre-aggregated by date, month and
+  year as they are recorded, plus a per-position snapshot index, so
+  today / MTD / YTD figures are dictionary reads regardless of how many
+  years of snapshots have accumulated.
+
+Fields that feed the columns must be changed through
+``PositionStore.update`` / ``update_many`` so the columns stay in sync
+with the records (and ``PositionStore.version`` moves, which downstream
+caches use as a book fingerprint).
+"""
+
+from __future__ import annotations
+
+import bisect
+import itertools
+from datetime import date, datetime
+from typing import Any, Iterable, Iterator, Sequence
+
+import numpy as np
+
+# Numeric record fields mirrored in columns (None counts as 0.0)
+_COLUMNS = ("notional_brl", "unrealized_pnl_brl", "unrealized_pnl_usd", "realized_pnl_brl")
+
+# Process-wide so a rebuilt store never reuses an earlier store's version
+_VERSIONS = itertools.count(1)
+
+
+def _as_date(value: date | datetime | None) -> date | None:
+    if isinstance(value, datetime):
+        return value.date()
+    return value
+
+
+class PositionStore:
+    """Position records with an id index, open bitmask and numeric columns.
+
+    ``version`` changes on every mutation, so it fingerprints the book.
+
+    Args:
+        records: Initial position dicts (e.g. hydrated from the database).
+    """
+
+    def __init__(self, records: Iterable[dict] = ()) -> None:
+        self.version = next(_VERSIONS)
+        self._records: list[dict] = []
+        self._row: dict[int, int] = {}
+        self._open = np.zeros(0, dtype=bool)
+        self._cols = {name: np.zeros(0) for name in _COLUMNS}
+        self._class_code = np.zeros(0, dtype=np.int64)
+        self._class_names: list[str] = []
+        self._class_index: dict[str, int] = {}
+        self._closed_on: dict[date, list[int]] = {}
+        self._closed_dates: list[date] = []
+        for record in records:
+            self.add(record)
+
+    # ------------------------------------------------------------------
+    # Record access
+    # ------------------------------------------------------------------
+
+    @property
+    def records(self) -> list[dict]:
+        """All position dicts, in insertion order (open and closed)."""
+        return self._records
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __iter__(self) -> Iterator[dict]:
+        return iter(self._records)
+
+    def get(self, position_id: int) -> dict | None:
+        row = self._row.get(position_id)
+        return None if row is None else self._records[row]
+
+    # ------------------------------------------------------------------
+    # Mutation
+    # ------------------------------------------------------------------
+
+    def add(self, record: dict) -> None:
+        """Append a position record and index it."""
+        self.version = next(_VERSIONS)
+        row = len(self._records)
+        if row == len(self._open):
+            self._grow(max(64, 2 * row))
+        self._records.append(record)
+        self._row[record["id"]] = row
+
+        asset_class = record.get("asset_class") or "UNKNOWN"
+        code = self._class_index.get(asset_class)
+        if code is None:
+            code = self._class_index[asset_class] = len(self._class_names)
+            self._class_names.append(asset_class)
+        self._class_code[row] = code
+        self._open[row] = bool(record.get("is_open"))
+        for name in _COLUMNS:
+            self._cols[name][row] = record.get(name) or 0.0
+        self._index_close(row, record)
+
+    def update(self, position_id: int, **fields: Any) -> dict:
+        """Set fields on a position, keeping columns and masks in sync.
+
+        Raises:
+            KeyError: If the position id is unknown.
+        """
+        row = self._row[position_id]
+        record = self._records[row]
+        record.update(fields)
+        self.version = next(_VERSIONS)
+        for name in _COLUMNS:
+            if name in fields:
+                self._cols[name][row] = fields[name] or 0.0
+        if "is_open" in fields:
+            self._open[row] = bool(fields["is_open"])
+        if "closed_at" in fields:
+            self._index_close(row, record)
+        return record
+
+    def update_many(self, position_ids: Sequence[int], **fields: Any) -> None:
+        """Set fields on many positions; columns are assigned vectorized.
+
+        Each value is either a list / array aligned with ``position_ids``
+        or a scalar applied to every position.  ``is_open`` / ``closed_at``
+        changes go through ``update`` (closing is not a batch operation).
+        """
+        for name in ("is_open", "closed_at"):
+            if name in fields:
+                raise ValueError(f"{name} cannot be batch-updated; use update()")
+        self.version = next(_VERSIONS)
+        rows = np.fromiter(
+            (self._row[pid] for pid in position_ids),
+            dtype=np.int64,
+            count=len(position_ids),
+        )
+        per_row = {
+            name: value.tolist() if isinstance(value, np.ndarray) else value
+            for name, value in fields.items()
+        }
+        for name, value in per_row.items():
+            if name in self._cols:
+                if isinstance(value, list):
+                    self._cols[name][rows] = [v or 0.0 for v in value]
+                else:
+                    self._cols[name][rows] = value or 0.0
+        for k, row in enumerate(rows.tolist()):
+            record = self._records[row]
+            for name, value in per_row.items():
+                record[name] = value[k] if isinstance(value, list) else value
+
+    def _index_close(self, row: int, record: dict) -> None:
+        closed = _as_date(record.get("closed_at"))
+        if closed is not None:
+            if closed not in self._closed_on:
+                self._closed_on[closed] = []
+                bisect.insort(self._closed_dates, closed)
+            self._closed_on[closed].append(row)
+
+    def _grow(self, capacity: int) -> None:
+        n = len(self._open)
+        self._open = np.concatenate([self._open, np.zeros(capacity - n, dtype=bool)])
+        self._class_code = np.concatenate(
+            [self._class_code, np.zeros(capacity - n, dtype=np.int64)]
+        )
+        for name in _COLUMNS:
+            self._cols[name] = np.concatenate([self._cols[name], np.zeros(capacity - n)])
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def _open_mask(self) -> np.ndarray:
+        return self._open[: len(self._records)]
+
+    def open_positions(self) -> list[dict]:
+        return [self._records[i] for i in np.flatnonzero(self._open_mask())]
+
+    def closed_on(self, day: date) -> list[dict]:
+        """Positions closed on ``day`` (and still closed)."""
+        rows = self._closed_on.get(day, ())
+        return [
+            self._records[i]
+            for i in rows
+            if not self._open[i] and _as_date(self._records[i].get("closed_at")) == day
+        ]
+
+    def active_between(self, start: date, end: date) -> list[dict]:
+        """Positions entered by ``end`` that were open at some point from ``start``.
+
+        Open positions come from the bitmask, closed ones from the close
+        date index, so the years of positions closed before ``start`` are
+        never visited.
+        """
+        rows = set(np.flatnonzero(self._open_mask()).tolist())
+        lo = bisect.bisect_left(self._closed_dates, start)
+        for day in self._closed_dates[lo:]:
+            rows.update(i for i in self._closed_on[day] if not self._open[i])
+        active = []
+        for i in sorted(rows):
+            record = self._records[i]
+            entry = _as_date(record.get("entry_date"))
+            if entry is None or entry > end:
+                continue
+            closed = _as_date(record.get("closed_at"))
+            if not self._open[i] and (closed is None or closed < start):
+                continue  # stale close-index entry
+            active.append(record)
+        return active
+
+    def totals(self) -> dict[str, float | int]:
+        """Open-book sums plus realized P&L of closed positions."""
+        n = len(self._records)
+        mask = self._open_mask()
+        cols = {name: col[:n] for name, col in self._cols.items()}
+        return {
+            "open_positions": int(mask.sum()),
+            "total_notional_brl": float(np.abs(cols["notional_brl"][mask]).sum()),
+            "total_unrealized_pnl_brl": float(cols["unrealized_pnl_brl"][mask].sum()),
+            "total_unrealized_pnl_usd": float(cols["unrealized_pnl_usd"][mask].sum()),
+            "total_realized_pnl_brl": float(cols["realized_pnl_brl"][~mask].sum()),
+        }
+
+    def by_asset_class(self) -> dict[str, dict]:
+        """Open count, gross notional and unrealized P&L per asset class."""
+        n = len(self._records)
+        mask = self._open_mask()
+        if not mask.any():
+            return {}
+        codes = self._class_code[:n][mask]
+        size = len(self._class_names)
+        counts = np.bincount(codes, minlength=size)
+        notional = np.bincount(
+            codes, weights=np.abs(self._cols["notional_brl"][:n][mask]), minlength=size
+        )
+        unrealized = np.bincount(
+            codes, weights=self._cols["unrealized_pnl_brl"][:n][mask], minlength=size
+        )
+        return {
+            self._class_names[c]: {
+                "count": int(counts[c]),
+                "notional_brl": float(notional[c]),
+                "unrealized_pnl_brl": float(unrealized[c]),
+            }
+            for c in np.flatnonzero(counts)
+        }
+
+
+class PnLLedger:
+    """Daily P&L snapshots pre-aggregated by date, month and year.
+
+    ``record`` is called once per snapshot; all queries are dictionary
+    reads (plus a bisect over distinct dates for ranged timeseries).
+    """
+
+    def __init__(self) -> None:
+        # date -> [daily_brl, daily_usd, cumulative_brl, unrealized_brl]
+        self._by_date: dict[date, list[float]] = {}
+        self._dates: list[date] = []
+        self._by_month: dict[tuple[int, int], list[float]] = {}
+        self._by_year: dict[int, list[float]] = {}
+        self._by_position: dict[Any, list[dict]] = {}
+
+    def record(self, snapshot: dict) -> None:
+        self._by_position.setdefault(snapshot.get("position_id"), []).append(snapshot)
+        day = snapshot.get("snapshot_date")
+        if not day:
+            return
+        self._add(
+            day,
+            snapshot.get("daily_pnl_brl") or 0.0,
+            snapshot.get("daily_pnl_usd") or 0.0,
+            snapshot.get("cumulative_pnl_brl") or 0.0,
+            snapshot.get("unrealized_pnl_brl") or 0.0,
+        )
+
+    def record_batch(self, day: date, snapshots: Sequence[dict]) -> None:
+        """Record one mark's snapshots (all dated ``day``) in one step."""
+        if not snapshots:
+            return
+        for snapshot in snapshots:
+            self._by_position.setdefault(snapshot["position_id"], []).append(snapshot)
+        sums = np.array(
+            [
+                (
+                    s["daily_pnl_brl"],
+                    s["daily_pnl_usd"],
+                    s["cumulative_pnl_brl"],
+                    s["unrealized_pnl_brl"],
+                )
+                for s in snapshots
+            ],
+            dtype=np.float64,
+        ).sum(axis=0)
+        self._add(day, *sums.tolist())
+
+    def _add(
+        self,
+        day: date,
+        daily_brl: float,
+        daily_usd: float,
+        cumulative_brl: float,
+        unrealized_brl: float,
+    ) -> None:
+        totals = self._by_date.get(day)
+        if totals is None:
+            totals = self._by_date[day] = [0.0, 0.0, 0.0, 0.0]
+            bisect.insort(self._dates, day)
+        totals[0] += daily_brl
+        totals[1] += daily_usd
+        totals[2] += cumulative_brl
+        totals[3] += unrealized_brl
+
+        if isinstance(day, date):
+            month = self._by_month.setdefault((day.year, day.month), [0.0, 0.0])
+            month[0] += daily_brl
+            month[1] += daily_usd
+            year = self._by_year.setdefault(day.year, [0.0, 0.0])
+            year[0] += daily_brl
+            year[1] += daily_usd
+
+    def day(self, day: date) -> tuple[float, float]:
+        """``(brl, usd)`` daily P&L summed over positions on ``day``."""
+        totals = self._by_date.get(day)
+        return (totals[0], totals[1]) if totals else (0.0, 0.0)
+
+    def month(self, day: date) -> tuple[float, float]:
+        """``(brl, usd)`` P&L of every snapshot in ``day``'s month."""
+        totals = self._by_month.get((day.year, day.month))
+        return (totals[0], totals[1]) if totals else (0.0, 0.0)
+
+    def year(self, day: date) -> tuple[float, float]:
+        """``(brl, usd)`` P&L of every snapshot in ``day``'s year."""
+        totals = self._by_year.get(day.year)
+        return (totals[0], totals[1]) if totals else (0.0, 0.0)
+
+    def for_position(self, position_id: int) -> list[dict]:
+        return self._by_position.get(position_id, [])
+
+    def portfolio_series(
+        self, start_date: date | None = None, end_date: date | None = None
+    ) -> list[dict]:
+        """Portfolio-level daily aggregates in date order, optionally ranged."""
+        lo = 0 if start_date is None else bisect.bisect_left(self._dates, start_date)
+        hi = (
+            len(self._dates)
+            if end_date is None
+            else bisect.bisect_right(self._dates, end_date)
+        )
+        series = []
+        for day in self._dates[lo:hi]:
+            daily_brl, daily_usd, cumulative, unrealized = self._by_date[day]
+            series.append(
+                {
+                    "snapshot_date": day,
+                    "daily_pnl_brl": daily_brl,
+                    "daily_pnl_usd": daily_usd,
+                    "cumulative_pnl_brl": cumulative,
+                    "unrealized_pnl_brl": unrealized,
+                }
+            )
+        return series
@@ -4,10 +4,15 @@ Pure computation module -- no DB or I/O. All functions are stateless.
 
 Implements B3 DI futures convention (rate -> PU -> DV01), NTN-B real-yield
 pricing, CDS spread-to-price, FX delta, and instrument-aware P&L in BRL/USD.
+
+The ``*_array`` variants at the bottom apply the same formulas elementwise
+to numpy arrays for whole-book marks (see ``MarkToMarketService.compute_book_mtm``).
 """
 
 from __future__ import annotations
 
+import numpy as np
+
 
 def rate_to_pu(rate_pct: float, business_days: int) -> float:
     """Convert annual rate (percent) to preco unitario (PU) using B3 DI convention.
@@ -199,3 +204,75 @@ def compute_pnl_usd(pnl_brl: float, current_fx_rate: float) -> float:
     if current_fx_rate <= 0:
         return 0.0
     return pnl_brl / current_fx_rate
+
+
+# ---------------------------------------------------------------------------
+# Vectorized variants (same formulas and edge cases, elementwise)
+# ---------------------------------------------------------------------------
+
+
+def rate_to_pu_array(rate_pct: np.ndarray, business_days: np.ndarray) -> np.ndarray:
+    """Elementwise ``rate_to_pu``; PU is par (100_000) where business_days <= 0."""
+    rate_pct = np.asarray(rate_pct, dtype=np.float64)
+    business_days = np.asarray(business_days, dtype=np.float64)
+    live = business_days > 0
+    with np.errstate(invalid="ignore", divide="ignore", over="ignore"):
+        pu = 100_000.0 / (1.0 + rate_pct / 100.0) ** (business_days / 252.0)
+    return np.where(live, pu, 100_000.0)
+
+
+def compute_dv01_array(
+    rate_pct: np.ndarray,
+    business_days: np.ndarray,
+    notional_brl: np.ndarray,
+) -> np.ndarray:
+    """Elementwise ``compute_dv01_from_pu`` at the PU implied by ``rate_pct``."""
+    business_days = np.asarray(business_days, dtype=np.float64)
+    pu = rate_to_pu_array(rate_pct, business_days)
+    pu_shifted = rate_to_pu_array(np.asarray(rate_pct) + 0.01, business_days)
+    dv01 = np.abs(pu_shifted - pu) * (np.asarray(notional_brl) / 100_000.0)
+    return np.where(business_days > 0, dv01, 0.0)
+
+
+def compute_fx_delta_array(notional_brl: np.ndarray, spot_rate: np.ndarray) -> np.ndarray:
+    """Elementwise ``compute_fx_delta`` (0.0 where spot_rate <= 0)."""
+    spot_rate = np.asarray(spot_rate, dtype=np.float64)
+    safe = np.where(spot_rate > 0, spot_rate, 1.0)
+    return np.where(spot_rate > 0, np.asarray(notional_brl) / safe, 0.0)
+
+
+def compute_pnl_brl_array(
+    entry_price: np.ndarray,
+    current_price: np.ndarray,
+    notional_brl: np.ndarray,
+    direction_sign: np.ndarray,
+    is_rates: np.ndarray,
+) -> np.ndarray:
+    """Elementwise ``compute_pnl_brl``.
+
+    Args:
+        entry_price: Entry prices (PU for rates).
+        current_price: Current prices.
+        notional_brl: Notionals in BRL.
+        direction_sign: +1.0 for LONG, -1.0 for SHORT.
+        is_rates: True where the asset class is RATES (PU P&L).
+
+    Returns:
+        P&L in BRL (0.0 where entry_price == 0).
+    """
+    entry_price = np.asarray(entry_price, dtype=np.float64)
+    current_price = np.asarray(current_price, dtype=np.float64)
+    notional_brl = np.asarray(notional_brl, dtype=np.float64)
+    zero_entry = entry_price == 0
+    safe_entry = np.where(zero_entry, 1.0, entry_price)
+    rates_pnl = (current_price - entry_price) * (notional_brl / 100_000.0)
+    general_pnl = notional_brl * (current_price / safe_entry - 1.0)
+    pnl = np.where(is_rates, rates_pnl, general_pnl) * direction_sign
+    return np.where(zero_entry, 0.0, pnl)
+
+
+def compute_pnl_usd_array(pnl_brl: np.ndarray, current_fx_rate: np.ndarray) -> np.ndarray:
+    """Elementwise ``compute_pnl_usd`` (0.0 where the rate <= 0)."""
+    current_fx_rate = np.asarray(current_fx_rate, dtype=np.float64)
+    safe = np.where(current_fx_rate > 0, current_fx_rate, 1.0)
+    return np.where(current_fx_rate > 0, np.asarray(pnl_brl) / safe, 0.0)
@@ -57,6 +57,11 @@ class RiskMonitorService:
         var_calculator: Optional VaRCalculator for parametric/MC VaR.
         stress_tester: Optional StressTester for scenario analysis.
         pms_limits: PMSRiskLimits config. Defaults to PMSRiskLimits().
+        risk_state: Optional EWMARiskState, or a zero-argument callable
+            returning one (e.g. ``get_shared_risk_state``) so every check
+            reads the latest published state. When it holds enough history,
+            parametric VaR is read from it for the open book instead of
+            being refit from the P&L series.
     """
 
     def __init__(
@@ -66,12 +71,14 @@ class RiskMonitorService:
         var_calculator: Any | None = None,
         stress_tester: Any | None = None,
         pms_limits: PMSRiskLimits | None = None,
+        risk_state: Any | None = None,
     ) -> None:
         self.position_manager = position_manager
         self.risk_limits_manager = risk_limits_manager
         self.var_calculator = var_calculator
         self.stress_tester = stress_tester
         self.pms_limits = pms_limits or PMSRiskLimits()
+        self.risk_state = risk_state
         self._risk_snapshots: deque[dict] = deque(maxlen=30)
 
     # ------------------------------------------------------------------
@@ -328,6 +335,11 @@ class RiskMonitorService:
         mc_95 = None
         mc_99 = None
 
+        # Incremental EWMA state: a read, no refit
+        state_var = self._var_from_risk_state(aum)
+        if state_var is not None:
+            var_95_pct, var_99_pct = state_var
+
         # Compute parametric VaR from daily P&L snapshots
         if self.position_manager is not None:
             pnl_ts = self.position_manager.get_pnl_timeseries()
@@ -336,7 +348,9 @@ class RiskMonitorService:
                 daily_returns = [
                     snap.get("daily_pnl_brl", 0.0) / aum for snap in pnl_ts
                 ]
-                if self.var_calculator is not None:
+                if state_var is not None:
+                    pass  # Already read from the incremental risk state
+                elif self.var_calculator is not None:
                     result = self.var_calculator.calculate(
                         __import__("numpy").array(daily_returns),
                         method="parametric",
@@ -399,6 +413,29 @@ class RiskMonitorService:
             "utilization_99_pct": util_99,
         }
 
+    def _var_from_risk_state(self, aum: float) -> tuple[float, float] | None:
+        """Parametric VaR 95/99 (% of AUM) for the open book from risk_state.
+
+        Returns None when no state is attached or it has fewer than 20 bars.
+        """
+        state = self.risk_state() if callable(self.risk_state) else self.risk_state
+        if state is None or self.position_manager is None or aum <= 0:
+            return None
+        if state.n_updates < 20:
+            return None
+
+        weights: dict[str, float] = {}
+        for p in self.position_manager._positions:
+            if not p.get("is_open"):
+                continue
+            sign = 1.0 if p.get("direction") == "LONG" else -1.0
+            notional = sign * abs(p.get("notional_brl", 0.0))
+            instrument = p.get("instrument", "")
+            weights[instrument] = weights.get(instrument, 0.0) + notional / aum
+
+        result = state.calculate(weights, method="parametric")
+        return abs(result.var_95) * 100.0, abs(result.var_99) * 100.0
+
     def _compute_leverage_section(
         self,
         summary: dict,
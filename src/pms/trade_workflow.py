@@ -38,14 +38,24 @@ class TradeWorkflowService:
     FLIP_THRESHOLD: float = 0.60
     MAX_PROPOSALS_PER_DAY: int = 5
 
-    def __init__(self, position_manager: PositionManager | None = None) -> None:
+    def __init__(
+        self,
+        position_manager: PositionManager | None = None,
+        risk_state: Any | None = None,
+    ) -> None:
         """Initialize TradeWorkflowService.
 
         Args:
             position_manager: Optional PositionManager instance. Creates a new
                 one with default 100M BRL AUM if not provided.
+            risk_state: Optional EWMARiskState, or a zero-argument callable
+                returning one (e.g. ``get_shared_risk_state``) that is called
+                per batch of proposals. When a state is available, proposals
+                carry pre-trade delta VaR / ES and stress delta P&L in
+                risk_impact.
         """
         self.position_manager = position_manager or PositionManager()
+        self.risk_state = risk_state
         self._proposals: list[dict] = []
 
     # -------------------------------------------------------------------------
@@ -82,18 +92,21 @@ class TradeWorkflowService:
         qualifying.sort(key=lambda s: s.get("conviction", 0), reverse=True)
         qualifying = qualifying[: self.MAX_PROPOSALS_PER_DAY]
 
+        # Incremental risk for the whole batch against one book snapshot
+        risk_impacts = self._estimate_risk_impacts(qualifying)
+
+        open_positions = self.position_manager.open_positions()
         created_proposals: list[dict] = []
-        for signal in qualifying:
+        for signal, risk_impact in zip(qualifying, risk_impacts):
             # Detect flip: conviction >= FLIP_THRESHOLD and opposite open position
             is_flip = False
             if signal.get("conviction", 0) >= self.FLIP_THRESHOLD:
                 opposite_dir = (
                     "SHORT" if signal.get("direction", "").upper() == "LONG" else "LONG"
                 )
-                for pos in self.position_manager._positions:
+                for pos in open_positions:
                     if (
-                        pos["is_open"]
-                        and pos["instrument"] == signal["instrument"]
+                        pos["instrument"] == signal["instrument"]
                         and pos["direction"] == opposite_dir
                     ):
                         is_flip = True
@@ -117,7 +130,7 @@ class TradeWorkflowService:
                 "signal_source": signal.get("signal_source", "aggregator"),
                 "strategy_ids": signal.get("strategy_ids", []),
                 "rationale": self._generate_trade_rationale(signal),
-                "risk_impact": self._estimate_portfolio_impact(signal),
+                "risk_impact": risk_impact,
                 "status": "PENDING",
                 "is_flip": is_flip,
                 "reviewed_by": None,
@@ -164,6 +177,26 @@ class TradeWorkflowService:
         pending.sort(key=lambda p: p.get("conviction", 0), reverse=True)
         return pending
 
+    def evaluate_pending_risk(self, as_of_date: date | None = None) -> dict[int, dict]:
+        """Refresh risk_impact for all PENDING proposals in one batch.
+
+        The book's covariance exposure and stress P&L are computed once;
+        each proposal is then scored incrementally.
+
+        Args:
+            as_of_date: Optional date filter (matches proposal's as_of_date).
+
+        Returns:
+            Mapping proposal id -> refreshed risk_impact dict.
+        """
+        pending = self.get_pending_proposals(as_of_date)
+        impacts = self._estimate_risk_impacts(pending)
+        now = datetime.now(timezone.utc)
+        for proposal, impact in zip(pending, impacts):
+            proposal["risk_impact"] = impact
+            proposal["updated_at"] = now
+        return {p["id"]: p["risk_impact"] for p in pending}
+
     # -------------------------------------------------------------------------
     # Method 3: Approve proposal
     # -------------------------------------------------------------------------
@@ -644,7 +677,7 @@ class TradeWorkflowService:
         aum = self.position_manager.aum
         suggested_notional = signal.get("suggested_notional_brl", 10_000_000.0)
 
-        open_positions = [p for p in self.position_manager._positions if p["is_open"]]
+        open_positions = self.position_manager.open_positions()
 
         same_instrument_exposure = sum(
             p["notional_brl"]
@@ -665,6 +698,41 @@ class TradeWorkflowService:
             "asset_class_concentration": asset_class_notional / aum if aum > 0 else 0.0,
         }
 
+    def _estimate_risk_impacts(self, signals: list[dict]) -> list[dict]:
+        """Exposure analytics plus incremental VaR / ES / stress per signal.
+
+        Without a risk_state only the exposure analytics of
+        _estimate_portfolio_impact are returned.
+        """
+        impacts = [self._estimate_portfolio_impact(s) for s in signals]
+        state = self.risk_state() if callable(self.risk_state) else self.risk_state
+        if state is None or not signals:
+            return impacts
+
+        from src.risk.incremental_risk import IncrementalRiskModel
+
+        aum = self.position_manager.aum
+        book: dict[str, float] = {}
+        for p in self.position_manager.open_positions():
+            sign = 1.0 if p["direction"] == "LONG" else -1.0
+            book[p["instrument"]] = book.get(p["instrument"], 0.0) + sign * abs(
+                p["notional_brl"]
+            )
+
+        trades = []
+        for s in signals:
+            sign = -1.0 if str(s.get("direction", "LONG")).upper() == "SHORT" else 1.0
+            notional = s.get("suggested_notional_brl", 10_000_000.0)
+            trades.append((s["instrument"], sign * abs(notional)))
+
+        try:
+            model = IncrementalRiskModel.from_state(state, book, aum)
+            for impact, trade in zip(impacts, model.evaluate(trades)):
+                impact.update(trade.to_dict())
+        except Exception:
+            logger.warning("incremental_risk_failed", exc_info=True)
+        return impacts
+
     # -------------------------------------------------------------------------
     # Method 9: Generate trade rationale (private)
     # -------------------------------------------------------------------------
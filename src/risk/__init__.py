@@ -9,6 +9,12 @@ from src.risk.drawdown_manager import (
     DrawdownManager,
     StrategyLossTracker,
 )
+from src.risk.incremental_risk import IncrementalRiskModel, TradeImpact
+from src.risk.monte_carlo import (
+    MonteCarloEngine,
+    MonteCarloModelCache,
+    MonteCarloResult,
+)
 from src.risk.risk_limits import (
     LimitCheckResult,
     RiskLimitChecker,
@@ -21,13 +27,20 @@ from src.risk.risk_limits_v2 import (
     RiskLimitsManagerConfig,
 )
 from src.risk.risk_monitor import RiskMonitor, RiskReport
+from src.risk.risk_state import EWMARiskState
 from src.risk.stress_tester import (
     DEFAULT_SCENARIOS,
+    DrawdownWindow,
     StressResult,
     StressScenario,
     StressTester,
 )
-from src.risk.var_calculator import VaRCalculator, VaRDecomposition, VaRResult
+from src.risk.var_calculator import (
+    EulerDecomposition,
+    VaRCalculator,
+    VaRDecomposition,
+    VaRResult,
+)
 
 __all__ = [
     "AlertDispatcher",
@@ -37,8 +50,15 @@ __all__ = [
     "CircuitBreakerState",
     "DEFAULT_SCENARIOS",
     "DrawdownManager",
+    "DrawdownWindow",
+    "EWMARiskState",
+    "EulerDecomposition",
+    "IncrementalRiskModel",
     "LimitCheckResult",
     "LossRecord",
+    "MonteCarloEngine",
+    "MonteCarloModelCache",
+    "MonteCarloResult",
     "RiskBudgetReport",
     "RiskLimitChecker",
     "RiskLimitsConfig",
@@ -50,6 +70,7 @@ __all__ = [
     "StressScenario",
     "StressTester",
     "StrategyLossTracker",
+    "TradeImpact",
     "VaRCalculator",
     "VaRDecomposition",
     "VaRResult",
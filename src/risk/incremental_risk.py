@@ -0,0 +1,286 @@
+"""Pre-trade incremental risk: delta VaR, delta ES and stress delta P&L.
+
+Scoring a trade proposal by recomputing portfolio VaR from scratch costs a
+covariance fit per proposal.  ``IncrementalRiskModel`` precomputes, once
+per book, the covariance-weighted exposure vector ``g = Sigma w``, the
+portfolio variance ``w' Sigma w`` and the stress scenarios' base P&L.  A
+trade of ``d`` (fraction of AUM) in instrument ``i`` then moves the
+variance by the first-order term plus its quadratic correction::
+
+    sigma_after^2 = w' Sigma w + 2 d g_i + d^2 Sigma_ii
+
+which is exact for a single-instrument trade, so delta VaR and delta ES
+(Gaussian, same formulas as ``compute_parametric_var``) cost O(1) per
+trade after the O(n^2) setup, and a whole batch of proposals is a handful
+of vector operations.  Stress delta P&L adds each trade's resolved shock
+times its notional to every scenario's base P&L.
+
+All functions are pure computation -- no I/O or database access.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Mapping, Sequence
+
+import numpy as np
+import structlog
+from scipy import stats
+
+from src.risk.stress_matrix import CompiledScenarios
+from src.risk.stress_tester import DEFAULT_SCENARIOS
+from src.risk.var_calculator import ledoit_wolf_covariance
+
+logger = structlog.get_logger(__name__)
+
+
+@dataclass
+class TradeImpact:
+    """Risk impact of one candidate trade on the current book.
+
+    VaR / CVaR are fractions of AUM (negative = loss); stress P&L is in
+    BRL at the worst scenario.  ``covered`` is False when the instrument
+    has no covariance entry -- VaR fields are then None and only the
+    stress impact is reported.
+
+    Attributes:
+        instrument: Traded instrument.
+        delta_notional: Signed notional of the trade (BRL, SHORT < 0).
+        covered: Whether the instrument is in the covariance universe.
+        var_before / var_after: Portfolio VaR before and after the trade.
+        cvar_before / cvar_after: Portfolio CVaR (ES) before and after.
+        marginal_var: dVaR/dw for the instrument at the current book.
+        stress_pnl_before / stress_pnl_after: Worst-scenario P&L (BRL).
+        worst_scenario_after: Name of the worst scenario after the trade.
+    """
+
+    instrument: str
+    delta_notional: float
+    covered: bool
+    var_before: float
+    var_after: float | None
+    cvar_before: float
+    cvar_after: float | None
+    marginal_var: float | None
+    stress_pnl_before: float
+    stress_pnl_after: float
+    worst_scenario_after: str | None
+
+    @property
+    def delta_var(self) -> float | None:
+        return None if self.var_after is None else self.var_after - self.var_before
+
+    @property
+    def delta_cvar(self) -> float | None:
+        return None if self.cvar_after is None else self.cvar_after - self.cvar_before
+
+    @property
+    def stress_delta_pnl(self) -> float:
+        return self.stress_pnl_after - self.stress_pnl_before
+
+    def to_dict(self) -> dict:
+        """Blotter-facing view: VaR / ES as positive % of AUM."""
+
+        def pct(value: float | None) -> float | None:
+            return None if value is None else round(abs(value) * 100.0, 4)
+
+        def delta_pct(value: float | None) -> float | None:
+            # Positive = more risk
+            return None if value is None else round(-value * 100.0, 4)
+
+        return {
+            "var_before": pct(self.var_before),
+            "var_after": pct(self.var_after),
+            "delta_var_pct": delta_pct(self.delta_var),
+            "es_before": pct(self.cvar_before),
+            "es_after": pct(self.cvar_after),
+            "delta_es_pct": delta_pct(self.delta_cvar),
+            "stress_pnl_before_brl": round(self.stress_pnl_before, 2),
+            "stress_pnl_after_brl": round(self.stress_pnl_after, 2),
+            "stress_delta_pnl_brl": round(self.stress_delta_pnl, 2),
+            "worst_stress_scenario": self.worst_scenario_after,
+            "risk_model_covered": self.covered,
+        }
+
+
+class IncrementalRiskModel:
+    """Book-level risk precomputed once, scoring trades incrementally.
+
+    Args:
+        instruments: Covariance universe (order of ``cov`` / ``mean``).
+        cov: Shape (n, n) daily return covariance.
+        positions: Current book, instrument -> signed notional (BRL).
+        aum: Assets under management (BRL); weights are notional / aum.
+        mean: Shape (n,) daily mean returns (defaults to zero).
+        confidence: VaR / ES confidence level.
+        scenarios: Stress scenarios (defaults to ``DEFAULT_SCENARIOS``).
+    """
+
+    def __init__(
+        self,
+        instruments: Sequence[str],
+        cov: np.ndarray,
+        positions: Mapping[str, float],
+        aum: float,
+        mean: np.ndarray | None = None,
+        confidence: float = 0.95,
+        scenarios: Sequence | None = None,
+    ) -> None:
+        if aum <= 0:
+            raise ValueError(f"aum must be positive, got {aum}")
+        self.instruments = list(instruments)
+        self.aum = aum
+        self.confidence = confidence
+        self._index = {name: i for i, name in enumerate(self.instruments)}
+        n = len(self.instruments)
+        self.cov = np.asarray(cov, dtype=np.float64).reshape(n, n)
+        self.mean = (
+            np.zeros(n) if mean is None else np.asarray(mean, dtype=np.float64)
+        )
+
+        self.weights = np.zeros(n)
+        uncovered = []
+        for name, notional in positions.items():
+            i = self._index.get(name)
+            if i is None:
+                uncovered.append(name)
+            else:
+                self.weights[i] += notional / aum
+        if uncovered:
+            logger.warning("incremental_risk_uncovered_positions", instruments=uncovered)
+
+        # O(n^2), once per book
+        self._g = self.cov @ self.weights
+        self._variance = float(self.weights @ self._g)
+        self._mu = float(self.weights @ self.mean)
+        self._z = float(stats.norm.ppf(1.0 - confidence))
+        self._es_k = float(stats.norm.pdf(self._z) / (1.0 - confidence))
+        sigma = math.sqrt(max(self._variance, 0.0))
+        self.var_before = self._mu + self._z * sigma
+        self.cvar_before = self._mu - self._es_k * sigma
+        # Euler gradient dVaR/dw (zero-vol book: no defined gradient)
+        self.marginal_var = (
+            self.mean + self._z * self._g / sigma if sigma > 1e-12 else None
+        )
+
+        self._scenarios = CompiledScenarios(
+            DEFAULT_SCENARIOS if scenarios is None else scenarios
+        )
+        self._scenario_names = [s.name for s in self._scenarios.scenarios]
+        self._stress_base = self._scenarios.resolve(dict(positions)).portfolio_pnl()
+
+    @classmethod
+    def from_state(
+        cls,
+        state,
+        positions: Mapping[str, float],
+        aum: float,
+        confidence: float = 0.95,
+        scenarios: Sequence | None = None,
+    ) -> IncrementalRiskModel:
+        """Build from an ``EWMARiskState`` (no refit)."""
+        return cls(
+            state.instruments,
+            state.cov,
+            positions,
+            aum,
+            mean=state.mean,
+            confidence=confidence,
+            scenarios=scenarios,
+        )
+
+    @classmethod
+    def from_returns(
+        cls,
+        returns_matrix: np.ndarray,
+        instruments: Sequence[str],
+        positions: Mapping[str, float],
+        aum: float,
+        confidence: float = 0.95,
+        scenarios: Sequence | None = None,
+    ) -> IncrementalRiskModel:
+        """Build from a returns window with one Ledoit-Wolf fit."""
+        returns_matrix = np.asarray(returns_matrix, dtype=np.float64)
+        return cls(
+            instruments,
+            ledoit_wolf_covariance(returns_matrix),
+            positions,
+            aum,
+            mean=returns_matrix.mean(axis=0),
+            confidence=confidence,
+            scenarios=scenarios,
+        )
+
+    def evaluate(self, trades: Sequence[tuple[str, float]]) -> list[TradeImpact]:
+        """Score a batch of single-instrument trades against the book.
+
+        Each trade is scored independently against the current book.
+
+        Args:
+            trades: ``(instrument, signed_notional_brl)`` pairs.
+
+        Returns:
+            One TradeImpact per trade, in input order.
+        """
+        if not trades:
+            return []
+        names = [name for name, _ in trades]
+        notionals = np.array([float(delta) for _, delta in trades])
+        idx = np.array([self._index.get(name, -1) for name in names])
+        covered = idx >= 0
+        safe = np.where(covered, idx, 0)
+
+        # Variance: first-order term plus quadratic correction
+        d = notionals / self.aum
+        variance = (
+            self._variance
+            + 2.0 * d * self._g[safe]
+            + d * d * self.cov[safe, safe]
+        )
+        sigma_after = np.sqrt(np.maximum(variance, 0.0))
+        mu_after = self._mu + d * self.mean[safe]
+        var_after = mu_after + self._z * sigma_after
+        cvar_after = mu_after - self._es_k * sigma_after
+
+        # Stress: base scenario P&L plus the trade's shocked notional
+        if self._scenarios.n_scenarios:
+            shocks = self._scenarios.resolve(dict.fromkeys(names, 0.0))
+            column = {name: j for j, name in enumerate(shocks.instruments)}
+            cols = [column[name] for name in names]
+            stressed = self._stress_base[:, None] + shocks.shocks[:, cols] * notionals
+            worst_before = float(self._stress_base.min())
+            worst_rows = stressed.argmin(axis=0)
+            worst_after = stressed[worst_rows, np.arange(len(names))]
+        else:
+            worst_before = 0.0
+            worst_rows = None
+            worst_after = np.zeros(len(names))
+
+        impacts = []
+        for k, name in enumerate(names):
+            ok = bool(covered[k])
+            impacts.append(
+                TradeImpact(
+                    instrument=name,
+                    delta_notional=float(notionals[k]),
+                    covered=ok,
+                    var_before=self.var_before,
+                    var_after=float(var_after[k]) if ok else None,
+                    cvar_before=self.cvar_before,
+                    cvar_after=float(cvar_after[k]) if ok else None,
+                    marginal_var=(
+                        float(self.marginal_var[idx[k]])
+                        if ok and self.marginal_var is not None
+                        else None
+                    ),
+                    stress_pnl_before=worst_before,
+                    stress_pnl_after=float(worst_after[k]),
+                    worst_scenario_after=(
+                        self._scenario_names[worst_rows[k]]
+                        if worst_rows is not None
+                        else None
+                    ),
+                )
+            )
+        return impacts
@@ -0,0 +1,479 @@
+"""Persistent incremental risk state: EWMA covariance and rolling P&L buffer.
+
+``VaRCalculator``, ``RiskMonitorService`` and the risk API rebuild a
+covariance (Ledoit-Wolf) from the full return window on every call.
+``EWMARiskState`` instead carries the estimate forward one bar at a time:
+
+- an exponentially weighted mean and covariance (RiskMetrics decay,
+  default 0.94), updated in O(n_assets^2) per new day with the weighted
+  form of West's incremental update, so a state warmed from history is
+  identical to one replayed bar by bar;
+- a ring buffer of the last ``history_days`` asset-return vectors, from
+  which the historical P&L of any weight vector is one matrix-vector
+  product.
+
+VaR / CVaR for a book are then reads -- ``w' mu`` and ``w' Sigma w`` for
+the parametric numbers, ``buffer @ w`` for the historical ones -- with no
+refit per request.  The state serializes to JSON on disk and in Redis so
+API processes start warm (``warm_shared_risk_state``) and pick up each
+newly published state (``get_shared_risk_state`` watches the file,
+``watch_shared_risk_state`` the Redis version key).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import math
+import os
+import threading
+from datetime import date
+from pathlib import Path
+from typing import Any, Mapping, Sequence
+
+import numpy as np
+import pandas as pd
+import structlog
+from scipy import stats
+
+from src.risk.var_calculator import VaRResult, compute_historical_var
+
+logger = structlog.get_logger(__name__)
+
+REDIS_KEY = "risk:state"
+REDIS_VERSION_KEY = "risk:state:version"
+_STATE_VERSION = 1
+
+
+class EWMARiskState:
+    """Exponentially weighted mean / covariance plus a rolling return buffer.
+
+    Args:
+        instruments: Asset names, fixing the column order of every vector.
+        decay: EWMA decay factor lambda (0 < lambda < 1).
+        history_days: Capacity of the historical return buffer.
+    """
+
+    def __init__(
+        self,
+        instruments: Sequence[str],
+        decay: float = 0.94,
+        history_days: int = 756,
+    ) -> None:
+        if not 0.0 < decay < 1.0:
+            raise ValueError(f"decay must be in (0, 1), got {decay}")
+        if history_days < 1:
+            raise ValueError(f"history_days must be >= 1, got {history_days}")
+        self.instruments = list(instruments)
+        self.decay = decay
+        self.history_days = history_days
+        self._index = {name: i for i, name in enumerate(self.instruments)}
+
+        n = len(self.instruments)
+        self.mean = np.zeros(n)
+        self.cov = np.zeros((n, n))
+        self.n_updates = 0
+        self.last_date: date | None = None
+        # Sum of the (decayed) observation weights; 1 / (1 - decay) in the limit
+        self._weight_sum = 0.0
+        self._buffer = np.zeros((history_days, n))
+        self._head = 0  # next row to write
+        self._filled = 0
+
+    @property
+    def n_assets(self) -> int:
+        return len(self.instruments)
+
+    @property
+    def n_history(self) -> int:
+        """Number of return vectors currently held in the buffer."""
+        return self._filled
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+
+    def update(
+        self, as_of: date, returns: Mapping[str, float] | np.ndarray
+    ) -> bool:
+        """Fold one day's asset returns into the state.
+
+        Bars dated on or before ``last_date`` are ignored, so replaying a
+        day is harmless.  Instruments missing from a mapping (or NaN)
+        count as a zero return, i.e. a carried-forward price.
+
+        Args:
+            as_of: Date of the bar.
+            returns: Mapping instrument -> return, or an array in
+                ``instruments`` order.
+
+        Returns:
+            True if the state was updated, False if the bar was stale.
+        """
+        if self.last_date is not None and as_of <= self.last_date:
+            return False
+
+        r = self._returns_vector(returns)
+        d = r - self.mean
+        prior = self.decay * self._weight_sum
+        total = prior + 1.0
+        self.mean = self.mean + d / total
+        self.cov = (prior / total) * (self.cov + np.outer(d, d) / total)
+        self._weight_sum = total
+
+        self._buffer[self._head] = r
+        self._head = (self._head + 1) % self.history_days
+        self._filled = min(self._filled + 1, self.history_days)
+        self.n_updates += 1
+        self.last_date = as_of
+        return True
+
+    @classmethod
+    def from_history(
+        cls,
+        returns: pd.DataFrame,
+        decay: float = 0.94,
+        history_days: int = 756,
+    ) -> EWMARiskState:
+        """Warm a state from a date-indexed frame of asset returns.
+
+        Equivalent to calling ``update`` once per row, but the EWMA moments
+        are computed in one weighted pass.
+
+        Args:
+            returns: DataFrame indexed by date with one column per instrument.
+            decay: EWMA decay factor.
+            history_days: Capacity of the historical return buffer.
+        """
+        state = cls(list(returns.columns), decay=decay, history_days=history_days)
+        if returns.empty:
+            return state
+
+        values = returns.to_numpy(dtype=np.float64, na_value=0.0)
+        values = np.nan_to_num(values, nan=0.0)
+        n_obs = len(values)
+        weights = decay ** np.arange(n_obs - 1, -1, -1, dtype=np.float64)
+        total = float(weights.sum())
+        mean = weights @ values / total
+        centred = values - mean
+        state.mean = mean
+        state.cov = (centred * weights[:, None]).T @ centred / total
+        state._weight_sum = total
+
+        tail = values[-history_days:]
+        state._buffer[: len(tail)] = tail
+        state._filled = len(tail)
+        state._head = len(tail) % history_days
+        state.n_updates = n_obs
+        last = returns.index[-1]
+        state.last_date = last.date() if hasattr(last, "date") else last
+        return state
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def weight_vector(self, weights: Mapping[str, float] | np.ndarray) -> np.ndarray:
+        """Align weights to ``instruments``; unknown instruments are dropped."""
+        if isinstance(weights, Mapping):
+            w = np.zeros(self.n_assets)
+            unknown = []
+            for name, value in weights.items():
+                i = self._index.get(name)
+                if i is None:
+                    unknown.append(name)
+                else:
+                    w[i] = float(value)
+            if unknown:
+                logger.debug("risk_state_unknown_instruments", instruments=unknown)
+            return w
+        w = np.asarray(weights, dtype=np.float64)
+        if w.shape != (self.n_assets,):
+            raise ValueError(
+                f"weights has shape {w.shape}, expected ({self.n_assets},)"
+            )
+        return w
+
+    def history(self) -> np.ndarray:
+        """Shape (n_history, n_assets) buffered returns, oldest first."""
+        if self._filled < self.history_days:
+            return self._buffer[: self._filled].copy()
+        return np.roll(self._buffer, -self._head, axis=0)
+
+    def portfolio_moments(
+        self, weights: Mapping[str, float] | np.ndarray
+    ) -> tuple[float, float]:
+        """EWMA portfolio mean and volatility ``(w' mu, sqrt(w' Sigma w))``."""
+        w = self.weight_vector(weights)
+        variance = float(w @ self.cov @ w)
+        return float(w @ self.mean), math.sqrt(max(variance, 0.0))
+
+    def portfolio_pnl(self, weights: Mapping[str, float] | np.ndarray) -> np.ndarray:
+        """Historical portfolio returns for ``weights`` over the buffer."""
+        return self.history() @ self.weight_vector(weights)
+
+    def parametric_var(
+        self, weights: Mapping[str, float] | np.ndarray, confidence: float = 0.95
+    ) -> tuple[float, float]:
+        """Gaussian VaR and CVaR from the EWMA moments (negative = loss)."""
+        mu, sigma = self.portfolio_moments(weights)
+        if sigma < 1e-12:
+            return 0.0, 0.0
+        z_alpha = stats.norm.ppf(1.0 - confidence)
+        var = mu + sigma * z_alpha
+        cvar = mu - sigma * stats.norm.pdf(z_alpha) / (1.0 - confidence)
+        return float(var), float(cvar)
+
+    def historical_var(
+        self, weights: Mapping[str, float] | np.ndarray, confidence: float = 0.95
+    ) -> tuple[float, float]:
+        """Historical VaR and CVaR over the buffered returns."""
+        return compute_historical_var(self.portfolio_pnl(weights), confidence)
+
+    def calculate(
+        self,
+        weights: Mapping[str, float] | np.ndarray,
+        method: str = "parametric",
+    ) -> VaRResult:
+        """VaR/CVaR at 95% and 99% for a book, read from the state.
+
+        Args:
+            weights: Mapping instrument -> weight (fraction of NAV), or an
+                array in ``instruments`` order.
+            method: "parametric" (EWMA moments) or "historical" (buffer).
+
+        Returns:
+            VaRResult with method "ewma" or "historical".
+        """
+        if method == "parametric":
+            compute, label, n_obs = self.parametric_var, "ewma", self.n_updates
+        elif method == "historical":
+            compute, label, n_obs = self.historical_var, "historical", self._filled
+        else:
+            raise ValueError(
+                f"Unknown method '{method}'. Use 'parametric' or 'historical'."
+            )
+        w = self.weight_vector(weights)
+        var_95, cvar_95 = compute(w, 0.95)
+        var_99, cvar_99 = compute(w, 0.99)
+        return VaRResult(
+            var_95=var_95,
+            var_99=var_99,
+            cvar_95=cvar_95,
+            cvar_99=cvar_99,
+            method=label,
+            n_observations=n_obs,
+        )
+
+    # ------------------------------------------------------------------
+    # Serialization
+    # ------------------------------------------------------------------
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "version": _STATE_VERSION,
+            "instruments": self.instruments,
+            "decay": self.decay,
+            "history_days": self.history_days,
+            "n_updates": self.n_updates,
+            "last_date": self.last_date.isoformat() if self.last_date else None,
+            "weight_sum": self._weight_sum,
+            "mean": self.mean.tolist(),
+            "cov": self.cov.tolist(),
+            "history": self.history().tolist(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> EWMARiskState:
+        version = data.get("version")
+        if version != _STATE_VERSION:
+            raise ValueError(f"Unsupported risk state version: {version}")
+        state = cls(
+            data["instruments"],
+            decay=float(data["decay"]),
+            history_days=int(data["history_days"]),
+        )
+        n = state.n_assets
+        state.mean = np.asarray(data["mean"], dtype=np.float64).reshape(n)
+        state.cov = np.asarray(data["cov"], dtype=np.float64).reshape(n, n)
+        state.n_updates = int(data["n_updates"])
+        state._weight_sum = float(data["weight_sum"])
+        if data.get("last_date"):
+            state.last_date = date.fromisoformat(data["last_date"])
+        history = np.asarray(data["history"], dtype=np.float64).reshape(-1, n)
+        state._buffer[: len(history)] = history
+        state._filled = len(history)
+        state._head = len(history) % state.history_days
+        return state
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict())
+
+    @classmethod
+    def from_json(cls, payload: str) -> EWMARiskState:
+        return cls.from_dict(json.loads(payload))
+
+    def save(self, path: str | Path) -> None:
+        """Write the state to ``path`` atomically (temp file + rename)."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        tmp.write_text(self.to_json(), encoding="utf-8")
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str | Path) -> EWMARiskState:
+        return cls.from_json(Path(path).read_text(encoding="utf-8"))
+
+    async def save_redis(
+        self,
+        redis: Any = None,
+        key: str = REDIS_KEY,
+        version_key: str = REDIS_VERSION_KEY,
+    ) -> None:
+        """Store the state in Redis and bump its published version."""
+        if redis is None:
+            from src.core.redis import get_redis
+
+            redis = await get_redis()
+        await redis.set(key, self.to_json())
+        await redis.incr(version_key)
+
+    @classmethod
+    async def load_redis(
+        cls, redis: Any = None, key: str = REDIS_KEY
+    ) -> EWMARiskState | None:
+        """Load the state from Redis; None if the key is absent."""
+        if redis is None:
+            from src.core.redis import get_redis
+
+            redis = await get_redis()
+        payload = await redis.get(key)
+        if payload is None:
+            return None
+        return cls.from_json(payload)
+
+    def _returns_vector(self, returns: Mapping[str, float] | np.ndarray) -> np.ndarray:
+        if isinstance(returns, Mapping):
+            r = np.fromiter(
+                (returns.get(name, 0.0) for name in self.instruments),
+                dtype=np.float64,
+                count=self.n_assets,
+            )
+        else:
+            r = np.asarray(returns, dtype=np.float64).reshape(self.n_assets)
+        return np.nan_to_num(r, nan=0.0)
+
+
+# ---------------------------------------------------------------------------
+# Process-wide shared state
+# ---------------------------------------------------------------------------
+
+_shared_state: EWMARiskState | None = None
+_shared_mtime_ns: int | None = None
+_shared_redis_version: str | None = None
+_shared_lock = threading.Lock()
+
+
+def _install_shared(state: EWMARiskState, source: str) -> None:
+    """Make ``state`` the shared state unless it is older than the current one."""
+    global _shared_state
+    current = _shared_state
+    if (
+        current is not None
+        and current.last_date is not None
+        and state.last_date is not None
+        and state.last_date < current.last_date
+    ):
+        return
+    _shared_state = state
+    logger.info(
+        "risk_state_loaded",
+        source=source,
+        n_assets=state.n_assets,
+        last_date=str(state.last_date),
+    )
+
+
+def get_shared_risk_state() -> EWMARiskState | None:
+    """Return the process-wide risk state, reloading it when it is republished.
+
+    Stats ``settings.risk_state_path`` on every call and reloads the file
+    when its mtime changes, so a state published by
+    ``scripts/update_risk_state.py`` is picked up without a restart.
+    Returns None when no state has been published yet.  Callers should
+    call this per use rather than keep the returned object.
+    """
+    global _shared_mtime_ns
+    from src.core.config import settings
+
+    path = Path(settings.risk_state_path)
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except OSError:
+        return _shared_state
+    if mtime_ns != _shared_mtime_ns:
+        with _shared_lock:
+            if mtime_ns != _shared_mtime_ns:
+                _shared_mtime_ns = mtime_ns
+                try:
+                    _install_shared(EWMARiskState.load(path), source="disk")
+                except (OSError, ValueError, KeyError) as exc:
+                    logger.warning("risk_state_load_failed", path=str(path), error=str(exc))
+    return _shared_state
+
+
+def set_shared_risk_state(state: EWMARiskState | None) -> None:
+    """Install ``state`` as the process-wide risk state.
+
+    It stays installed until the state on disk or in Redis is republished.
+    """
+    global _shared_state, _shared_mtime_ns
+    from src.core.config import settings
+
+    with _shared_lock:
+        _shared_state = state
+        try:
+            _shared_mtime_ns = Path(settings.risk_state_path).stat().st_mtime_ns
+        except OSError:
+            _shared_mtime_ns = None
+
+
+async def refresh_shared_risk_state(redis: Any = None) -> EWMARiskState | None:
+    """Reload the shared state from Redis if its published version changed.
+
+    Compares ``REDIS_VERSION_KEY`` with the version last loaded, so an
+    unchanged state costs one GET.  Falls back to disk when Redis is
+    unavailable.
+    """
+    global _shared_redis_version
+    try:
+        if redis is None:
+            from src.core.redis import get_redis
+
+            redis = await get_redis()
+        version = await redis.get(REDIS_VERSION_KEY)
+        version = "unversioned" if version is None else str(version)
+        if version != _shared_redis_version:
+            state = await EWMARiskState.load_redis(redis)
+            _shared_redis_version = version
+            if state is not None:
+                _install_shared(state, source="redis")
+    except Exception as exc:
+        logger.warning("risk_state_redis_unavailable", error=str(exc))
+    return get_shared_risk_state()
+
+
+async def warm_shared_risk_state() -> EWMARiskState | None:
+    """Load the shared state from Redis, falling back to disk.
+
+    Called at API startup so the first request is already a read.
+    """
+    return await refresh_shared_risk_state()
+
+
+async def watch_shared_risk_state(poll_seconds: float = 30.0) -> None:
+    """Background task: pick up states published to Redis after startup."""
+    while True:
+        await asyncio.sleep(poll_seconds)
+        await refresh_shared_risk_state()
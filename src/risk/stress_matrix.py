@@ -0,0 +1,181 @@
+"""Compiled scenario x position shock matrix for vectorized stress testing.
+
+``StressTester`` used to resolve every instrument's shock with
+``_find_shock`` (exact lookup, then a linear prefix scan over the
+scenario's shock keys) once per scenario, and repeat it in ``run_all``,
+``reverse_stress_test`` and ``run_all_v2``.  ``CompiledScenarios`` does
+that work once:
+
+1. **Compile** (per scenario set): every shock key across all scenarios
+   goes into a prefix trie, and the scenario set becomes two sparse
+   ``(n_scenarios, n_keys)`` matrices -- shock values and each key's
+   insertion rank within its scenario.
+2. **Resolve** (per book): each instrument walks the trie once to collect
+   the keys that are prefixes of it, then one column gather picks, per
+   scenario, the key ``_find_shock`` would pick (exact match first, else
+   the earliest-inserted prefix).  The result is a dense
+   ``(n_scenarios, n_positions)`` shock matrix.
+3. **Evaluate**: all scenarios' P&L is one matrix-vector product
+   ``shocks @ notionals``.
+
+All functions are pure computation -- no I/O or database access.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Sequence
+
+import numpy as np
+from scipy import sparse
+
+# Trie node: child character -> node; _TERMINAL -> key index
+_TERMINAL = ""
+
+
+class ShockKeyTrie:
+    """Prefix trie over shock keys (instrument IDs or ID prefixes)."""
+
+    def __init__(self) -> None:
+        self._root: dict = {}
+        self.keys: list[str] = []
+
+    def add(self, key: str) -> int:
+        """Insert ``key`` (idempotent); returns its column index."""
+        node = self._root
+        for ch in key:
+            node = node.setdefault(ch, {})
+        if _TERMINAL not in node:
+            node[_TERMINAL] = len(self.keys)
+            self.keys.append(key)
+        return node[_TERMINAL]
+
+    def prefixes_of(self, instrument: str) -> tuple[int | None, list[int]]:
+        """Keys that are prefixes of ``instrument``.
+
+        Returns:
+            ``(exact, prefixes)`` -- the index of the key equal to
+            ``instrument`` (or None) and the indices of the shorter keys
+            that prefix it, shortest first.
+        """
+        node = self._root
+        prefixes: list[int] = []
+        for ch in instrument:
+            if _TERMINAL in node:
+                prefixes.append(node[_TERMINAL])
+            node = node.get(ch)
+            if node is None:
+                return None, prefixes
+        return node.get(_TERMINAL), prefixes
+
+
+@dataclass
+class ShockMatrix:
+    """Shocks resolved for one book.
+
+    Attributes:
+        instruments: Position instrument IDs (column order).
+        notionals: Shape (n_positions,) notionals.
+        shocks: Shape (n_scenarios, n_positions) resolved shock per cell
+            (0.0 where no shock applies).
+        impacted: Shape (n_scenarios, n_positions) True where a shock key
+            matched (even if its value is 0.0).
+    """
+
+    instruments: list[str]
+    notionals: np.ndarray
+    shocks: np.ndarray
+    impacted: np.ndarray
+
+    def position_pnl(self) -> np.ndarray:
+        """Shape (n_scenarios, n_positions) P&L per scenario and position."""
+        return self.shocks * self.notionals
+
+    def portfolio_pnl(self) -> np.ndarray:
+        """Shape (n_scenarios,) total P&L per scenario."""
+        return self.shocks @ self.notionals
+
+
+class CompiledScenarios:
+    """A stress scenario set compiled into sparse shock / rank matrices.
+
+    Args:
+        scenarios: Objects with a ``shocks`` mapping of key -> move
+            (``StressScenario``).
+    """
+
+    def __init__(self, scenarios: Sequence) -> None:
+        self.scenarios = list(scenarios)
+        self.trie = ShockKeyTrie()
+        rows: list[int] = []
+        cols: list[int] = []
+        values: list[float] = []
+        ranks: list[int] = []
+        for s, scenario in enumerate(self.scenarios):
+            for rank, (key, shock) in enumerate(scenario.shocks.items(), start=1):
+                rows.append(s)
+                cols.append(self.trie.add(key))
+                values.append(float(shock))
+                ranks.append(rank)
+
+        shape = (len(self.scenarios), len(self.trie.keys))
+        # CSC: resolution gathers a few key columns per instrument
+        self._shocks = sparse.csc_matrix((values, (rows, cols)), shape=shape)
+        # Rank 0 = key absent from the scenario
+        self._ranks = sparse.csc_matrix((ranks, (rows, cols)), shape=shape)
+        self._resolved: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+
+    @property
+    def n_scenarios(self) -> int:
+        return len(self.scenarios)
+
+    def _resolve(self, instrument: str) -> tuple[np.ndarray, np.ndarray]:
+        """Per-scenario shock and match mask for one instrument (memoized)."""
+        cached = self._resolved.get(instrument)
+        if cached is not None:
+            return cached
+
+        n = self.n_scenarios
+        exact, prefixes = self.trie.prefixes_of(instrument)
+        cols = ([exact] if exact is not None else []) + prefixes
+        if not cols:
+            resolved = (np.zeros(n), np.zeros(n, dtype=bool))
+        else:
+            ranks = self._ranks[:, cols].toarray().astype(np.float64)
+            values = self._shocks[:, cols].toarray()
+            present = ranks > 0
+            # _find_shock order: exact key first, then earliest-inserted prefix
+            priority = np.where(present, ranks, np.inf)
+            if exact is not None:
+                priority[:, 0] = np.where(present[:, 0], 0.0, np.inf)
+            pick = np.argmin(priority, axis=1)
+            rows = np.arange(n)
+            hit = present[rows, pick]
+            resolved = (np.where(hit, values[rows, pick], 0.0), hit)
+        self._resolved[instrument] = resolved
+        return resolved
+
+    def resolve(self, positions: dict[str, float]) -> ShockMatrix:
+        """Resolve every position's shock under every scenario.
+
+        Args:
+            positions: Mapping of instrument_id -> notional value.
+
+        Returns:
+            ShockMatrix with columns in ``positions`` order.
+        """
+        instruments = list(positions)
+        n = self.n_scenarios
+        shocks = np.zeros((n, len(instruments)))
+        impacted = np.zeros((n, len(instruments)), dtype=bool)
+        for j, instrument in enumerate(instruments):
+            shocks[:, j], impacted[:, j] = self._resolve(instrument)
+        notionals = np.fromiter(
+            (positions[i] for i in instruments), dtype=np.float64, count=len(instruments)
+        )
+        return ShockMatrix(
+            instruments=instruments,
+            notionals=notionals,
+            shocks=shocks,
+            impacted=impacted,
+        )
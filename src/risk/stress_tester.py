@@ -6,7 +6,13 @@ their shocks to current portfolio positions to estimate position-level and
 portfolio-level P&L impact.
 
 Enhanced with reverse stress testing (find scenarios producing a target max
-loss) and historical replay (apply actual daily returns from a crisis period).
+loss), historical replay (apply actual daily returns from a crisis period)
+and a full-history sweep that finds the worst rolling N-day windows in a
+daily return panel (``historical_sweep``).
+
+``run_all``, ``reverse_stress_test`` and ``run_all_v2`` evaluate every
+scenario at once through a compiled scenario x position shock matrix (see
+``src.risk.stress_matrix``), so large generated scenario sets stay cheap.
 
 Stress tests are advisory only -- they report results but do not
 trigger position changes. All functions are pure computation.
@@ -15,11 +21,14 @@ trigger position changes. All functions are pure computation.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import date, datetime
 
 import numpy as np
+import pandas as pd
 import structlog
 
+from src.risk.stress_matrix import CompiledScenarios, ShockMatrix
+
 logger = structlog.get_logger(__name__)
 
 
@@ -73,6 +82,40 @@ class StressResult:
     timestamp: datetime = field(default_factory=datetime.utcnow)
 
 
+@dataclass
+class DrawdownWindow:
+    """One of the worst rolling windows found by ``historical_sweep``.
+
+    Attributes:
+        start_date: First day of the window.
+        end_date: Last day of the window.
+        trough_date: Day of the worst cumulative P&L within the window.
+        result: StressResult at the trough (P&L since window start, with
+            per-position attribution).
+        shocks: Per-instrument cumulative return from window start to the
+            trough (sum of daily returns, as in ``historical_replay``).
+    """
+
+    start_date: date
+    end_date: date
+    trough_date: date
+    result: StressResult
+    shocks: dict[str, float]
+
+    def as_scenario(self) -> StressScenario:
+        """Turn the window into a StressScenario for ``run_all``."""
+        return StressScenario(
+            name=self.result.scenario_name,
+            description=(
+                f"Worst historical window, trough on {self.trough_date.isoformat()}"
+            ),
+            shocks=dict(self.shocks),
+            historical_period=(
+                f"{self.start_date.isoformat()} - {self.end_date.isoformat()}"
+            ),
+        )
+
+
 # ---------------------------------------------------------------------------
 # Default historical scenarios (locked)
 # ---------------------------------------------------------------------------
@@ -214,6 +257,32 @@ class StressTester:
         scenarios: list[StressScenario] | None = None,
     ) -> None:
         self.scenarios = scenarios if scenarios is not None else list(DEFAULT_SCENARIOS)
+        self._compiled: CompiledScenarios | None = None
+
+    def _compiled_scenarios(self) -> CompiledScenarios:
+        """Compile ``self.scenarios`` once; recompile if the list changes."""
+        compiled = self._compiled
+        if compiled is None or len(compiled.scenarios) != len(self.scenarios) or any(
+            a is not b for a, b in zip(compiled.scenarios, self.scenarios)
+        ):
+            compiled = self._compiled = CompiledScenarios(self.scenarios)
+        return compiled
+
+    def run_matrix(self, positions: dict[str, float]) -> ShockMatrix:
+        """Resolve every configured scenario's shocks against the book.
+
+        For bulk use (thousands of scenarios) where per-scenario
+        ``StressResult`` objects are not needed:
+        ``run_matrix(positions).portfolio_pnl()`` is the P&L of every
+        scenario in ``self.scenarios`` order.
+
+        Args:
+            positions: Mapping of instrument_id -> notional value.
+
+        Returns:
+            ShockMatrix (scenarios x positions).
+        """
+        return self._compiled_scenarios().resolve(positions)
 
     def run_scenario(
         self,
@@ -301,10 +370,61 @@ class StressTester:
         Returns:
             List of StressResult, one per scenario.
         """
-        return [
-            self.run_scenario(positions, scenario, portfolio_value)
-            for scenario in self.scenarios
-        ]
+        return self._results_from_matrix(self.run_matrix(positions), portfolio_value)
+
+    def _results_from_matrix(
+        self,
+        matrix: ShockMatrix,
+        portfolio_value: float | None,
+    ) -> list[StressResult]:
+        """Materialize one StressResult per scenario from a resolved matrix."""
+        position_pnl = matrix.position_pnl()
+        portfolio_pnl = matrix.portfolio_pnl()
+        impacted = matrix.impacted.sum(axis=1)
+        n_positions = len(matrix.instruments)
+
+        if portfolio_value is not None and abs(portfolio_value) > 1e-12:
+            denominator = portfolio_value
+        else:
+            abs_notional = float(np.abs(matrix.notionals).sum())
+            denominator = abs_notional if abs_notional > 1e-12 else None
+
+        results: list[StressResult] = []
+        for s, scenario in enumerate(self.scenarios):
+            n_impacted = int(impacted[s])
+            unaffected = n_positions - n_impacted
+            if n_positions > 0 and unaffected / n_positions > 0.5:
+                logger.warning(
+                    "stress_test_low_coverage",
+                    scenario=scenario.name,
+                    positions_unaffected=unaffected,
+                    total_positions=n_positions,
+                    pct_unaffected=round(unaffected / n_positions * 100, 1),
+                )
+
+            row = position_pnl[s]
+            if n_positions:
+                worst = int(np.argmin(row))
+                worst_instrument = matrix.instruments[worst]
+                worst_pnl = float(row[worst])
+            else:
+                worst_instrument = ""
+                worst_pnl = 0.0
+
+            pnl = float(portfolio_pnl[s])
+            results.append(
+                StressResult(
+                    scenario_name=scenario.name,
+                    portfolio_pnl=pnl,
+                    portfolio_pnl_pct=pnl / denominator if denominator else 0.0,
+                    position_pnl=dict(zip(matrix.instruments, row.tolist())),
+                    worst_position=worst_instrument,
+                    worst_position_pnl=worst_pnl,
+                    positions_impacted=n_impacted,
+                    positions_unaffected=unaffected,
+                )
+            )
+        return results
 
     def worst_case(self, results: list[StressResult]) -> StressResult:
         """Return the scenario with the most negative portfolio P&L.
@@ -332,17 +452,19 @@ class StressTester:
     ) -> dict[str, dict]:
         """Find shock multipliers that produce exactly ``max_loss_pct`` portfolio loss.
 
-        For each configured scenario, runs a binary search over multipliers
-        (between 0.01 and 5.0) to find the multiplier *k* such that::
+        Scenario P&L is linear in the shock multiplier *k*, so for each
+        configured scenario *k* is solved in closed form::
 
-            sum(position_i * shock_i * k) / portfolio_value == max_loss_pct
+            k = max_loss_pct * portfolio_value / sum(position_i * shock_i)
+
+        Multipliers above 5.0 are reported as infeasible (capped at 5x).
 
         Args:
             positions: Mapping of instrument_id -> notional value.
             portfolio_value: Total portfolio value for percentage computation.
             max_loss_pct: Target loss as a negative fraction (e.g., -0.10 = -10%).
-            step_size: Unused (kept for API compatibility). Binary search is used.
-            max_iterations: Maximum binary search iterations per scenario.
+            step_size: Unused (kept for API compatibility).
+            max_iterations: Unused (kept for API compatibility).
 
         Returns:
             Dict keyed by scenario name, each value a dict with:
@@ -351,88 +473,61 @@ class StressTester:
             - ``resulting_loss_pct``: Actual loss percentage achieved.
             - ``feasible``: Whether the target loss is achievable within 5x.
         """
+        return self._reverse_from_matrix(
+            self.run_matrix(positions), portfolio_value, max_loss_pct
+        )
+
+    def _reverse_from_matrix(
+        self,
+        matrix: ShockMatrix,
+        portfolio_value: float,
+        max_loss_pct: float,
+    ) -> dict[str, dict]:
+        """Closed-form reverse stress over a resolved matrix."""
+        max_multiplier = 5.0
         target_pnl = max_loss_pct * portfolio_value  # negative number
+        base_pnl = matrix.portfolio_pnl()
+        exposed = matrix.impacted.any(axis=1)
+
+        def infeasible() -> dict:
+            # Built per scenario so results share no mutable state
+            return {
+                "multiplier": 0.0,
+                "required_shocks": {},
+                "resulting_loss_pct": 0.0,
+                "feasible": False,
+            }
 
         results: dict[str, dict] = {}
-
-        for scenario in self.scenarios:
-            # Compute base P&L at 1x multiplier for this scenario's shocks
-            base_pnl = 0.0
-            exposed_instruments: list[str] = []
-            for instrument, notional in positions.items():
-                shock = _find_shock(instrument, scenario.shocks)
-                if shock is not None:
-                    base_pnl += notional * shock
-                    exposed_instruments.append(instrument)
-
-            # If no exposure at all, mark infeasible
-            if abs(base_pnl) < 1e-12 or not exposed_instruments:
-                results[scenario.name] = {
-                    "multiplier": 0.0,
-                    "required_shocks": {},
-                    "resulting_loss_pct": 0.0,
-                    "feasible": False,
-                }
+        for s, scenario in enumerate(self.scenarios):
+            base = float(base_pnl[s])
+            # No exposure, or the scenario helps the portfolio: no loss reachable
+            if abs(base) < 1e-12 or not exposed[s] or (base >= 0.0 and target_pnl < 0.0):
+                results[scenario.name] = infeasible()
                 continue
 
-            # If base P&L is positive (scenario helps portfolio), scenario
-            # can never produce a loss -- infeasible
-            if base_pnl >= 0.0 and target_pnl < 0.0:
+            multiplier = target_pnl / base
+            if multiplier <= 0.0:
+                results[scenario.name] = infeasible()
+            elif multiplier > max_multiplier:
+                # Cannot reach target even at max multiplier
                 results[scenario.name] = {
-                    "multiplier": 0.0,
-                    "required_shocks": {},
-                    "resulting_loss_pct": 0.0,
+                    "multiplier": max_multiplier,
+                    "required_shocks": {
+                        k: v * max_multiplier for k, v in scenario.shocks.items()
+                    },
+                    "resulting_loss_pct": base * max_multiplier / portfolio_value,
                     "feasible": False,
                 }
-                continue
-
-            # Binary search for multiplier k such that base_pnl * k == target_pnl
-            lo, hi = 0.01, 5.0
-
-            # Check if 5x multiplier can reach the target
-            pnl_at_max = base_pnl * hi
-            if base_pnl < 0.0 and pnl_at_max > target_pnl:
-                # Cannot reach target even at max multiplier
+            else:
                 results[scenario.name] = {
-                    "multiplier": hi,
-                    "required_shocks": {k: v * hi for k, v in scenario.shocks.items()},
-                    "resulting_loss_pct": pnl_at_max / portfolio_value,
-                    "feasible": False,
+                    "multiplier": round(multiplier, 6),
+                    "required_shocks": {
+                        k: round(v * multiplier, 6) for k, v in scenario.shocks.items()
+                    },
+                    "resulting_loss_pct": round(base * multiplier / portfolio_value, 6),
+                    "feasible": True,
                 }
-                continue
-
-            for _ in range(max_iterations):
-                mid = (lo + hi) / 2.0
-                pnl_mid = base_pnl * mid
-
-                if abs(pnl_mid - target_pnl) / abs(portfolio_value) < 1e-6:
-                    break
-
-                if base_pnl < 0.0:
-                    # base_pnl is negative, so pnl_mid becomes more negative as mid increases
-                    if pnl_mid > target_pnl:
-                        lo = mid  # Need more loss -> increase multiplier
-                    else:
-                        hi = mid  # Overshot -> decrease multiplier
-                else:
-                    # base_pnl is positive (unusual), pnl_mid becomes more positive
-                    if pnl_mid < target_pnl:
-                        lo = mid
-                    else:
-                        hi = mid
-
-            final_multiplier = (lo + hi) / 2.0
-            final_pnl = base_pnl * final_multiplier
-
-            results[scenario.name] = {
-                "multiplier": round(final_multiplier, 6),
-                "required_shocks": {
-                    k: round(v * final_multiplier, 6)
-                    for k, v in scenario.shocks.items()
-                },
-                "resulting_loss_pct": round(final_pnl / portfolio_value, 6),
-                "feasible": True,
-            }
 
         return results
 
@@ -535,6 +630,116 @@ class StressTester:
             positions_unaffected=unaffected,
         )
 
+    def historical_sweep(
+        self,
+        positions: dict[str, float],
+        returns: pd.DataFrame,
+        portfolio_value: float,
+        window_days: int = 20,
+        top_k: int = 5,
+    ) -> list[DrawdownWindow]:
+        """Find the worst rolling ``window_days`` windows over a return panel.
+
+        Every window is evaluated like ``historical_replay`` (worst
+        cumulative P&L from the window start) in one vectorized pass:
+        prefix sums of daily portfolio P&L give each window's path as a
+        strided view, so no per-window or per-instrument loop is needed.
+        Overlapping windows are suppressed so the result is ``top_k``
+        distinct drawdown episodes, worst first.
+
+        Args:
+            positions: Mapping of instrument_id -> notional value.
+            returns: Daily returns, DatetimeIndex x instrument columns.
+                Missing values count as 0; instruments not in the panel
+                are unaffected.
+            portfolio_value: Total portfolio value for percentage computation.
+            window_days: Rolling window length in trading days.
+            top_k: Number of non-overlapping windows to return.
+
+        Returns:
+            Up to ``top_k`` DrawdownWindow (only windows with a loss).
+        """
+        if window_days < 1:
+            raise ValueError(f"window_days must be >= 1, got {window_days}")
+
+        instruments = list(positions)
+        covered = [i for i in instruments if i in returns.columns]
+        n_days = len(returns)
+        if n_days < window_days or top_k < 1:
+            return []
+
+        column = {inst: j for j, inst in enumerate(instruments)}
+        rets = np.zeros((n_days, len(instruments)))
+        if covered:
+            cols = [column[i] for i in covered]
+            rets[:, cols] = returns[covered].fillna(0.0).to_numpy(dtype=np.float64)
+        notionals = np.array([positions[i] for i in instruments], dtype=np.float64)
+
+        # Prefix sums with a leading zero row: sum over days [a, b) = C[b] - C[a]
+        zero = np.zeros((1, len(instruments)))
+        cum_ret = np.vstack([zero, np.cumsum(rets, axis=0)])
+        cum_pos_pnl = cum_ret * notionals
+        cum_pnl = cum_pos_pnl.sum(axis=1)
+
+        # paths[s, h] = P&L from start of window s through day s + h
+        n_windows = n_days - window_days + 1
+        paths = np.lib.stride_tricks.sliding_window_view(cum_pnl[1:], window_days)
+        paths = paths - cum_pnl[:n_windows, None]
+        trough_offset = np.argmin(paths, axis=1)
+        worst = paths[np.arange(n_windows), trough_offset]
+
+        picked: list[int] = []
+        for start in np.argsort(worst, kind="stable"):
+            if worst[start] >= 0.0 or len(picked) == top_k:
+                break
+            if all(abs(start - p) >= window_days for p in picked):
+                picked.append(int(start))
+
+        dates = pd.DatetimeIndex(returns.index)
+        windows: list[DrawdownWindow] = []
+        for start in picked:
+            trough = start + int(trough_offset[start])
+            attribution = cum_pos_pnl[trough + 1] - cum_pos_pnl[start]
+            moves = cum_ret[trough + 1] - cum_ret[start]
+            position_pnl = dict(zip(instruments, attribution.tolist()))
+            worst_idx = int(np.argmin(attribution)) if instruments else 0
+            start_date = dates[start].date()
+            end_date = dates[start + window_days - 1].date()
+            pnl = float(worst[start])
+            result = StressResult(
+                scenario_name=(
+                    f"Historical Window: {start_date.isoformat()} to "
+                    f"{end_date.isoformat()}"
+                ),
+                portfolio_pnl=pnl,
+                portfolio_pnl_pct=(
+                    pnl / portfolio_value if abs(portfolio_value) > 1e-12 else 0.0
+                ),
+                position_pnl=position_pnl,
+                worst_position=instruments[worst_idx] if instruments else "",
+                worst_position_pnl=float(attribution[worst_idx]) if instruments else 0.0,
+                positions_impacted=len(covered),
+                positions_unaffected=len(instruments) - len(covered),
+            )
+            windows.append(
+                DrawdownWindow(
+                    start_date=start_date,
+                    end_date=end_date,
+                    trough_date=dates[trough].date(),
+                    result=result,
+                    shocks={i: float(moves[column[i]]) for i in covered},
+                )
+            )
+
+        logger.info(
+            "historical_sweep_complete",
+            n_days=n_days,
+            window_days=window_days,
+            n_windows=n_windows,
+            returned=len(windows),
+        )
+        return windows
+
     def run_all_v2(
         self,
         positions: dict[str, float],
@@ -559,12 +764,14 @@ class StressTester:
             - ``reverse``: reverse stress test results (or None).
             - ``worst_case``: StressResult with worst portfolio P&L.
         """
-        scenario_results = self.run_all(positions, portfolio_value)
+        # Resolve shocks once for both the forward and reverse passes
+        matrix = self.run_matrix(positions)
+        scenario_results = self._results_from_matrix(matrix, portfolio_value)
 
         reverse_results = None
         if include_reverse:
-            reverse_results = self.reverse_stress_test(
-                positions, portfolio_value, max_loss_pct=max_loss_pct
+            reverse_results = self._reverse_from_matrix(
+                matrix, portfolio_value, max_loss_pct
             )
 
         worst = self.worst_case(scenario_results) if scenario_results else None
@@ -3,7 +3,8 @@
 Provides three VaR methodologies:
 - Historical: empirical quantile of portfolio return series
 - Parametric: Gaussian assumption with analytical CVaR formula (Ledoit-Wolf shrinkage)
-- Monte Carlo: Student-t fitted marginals with Gaussian copula (Cholesky decomposition)
+- Monte Carlo: Student-t fitted marginals with Gaussian copula (Cholesky decomposition),
+  cached per returns window and simulated in chunks (see ``src.risk.monte_carlo``)
 
 Enhanced with marginal VaR and component VaR decomposition, 756-day lookback,
 and always-report-both-VaR-and-CVaR at 95% and 99% confidence levels.
@@ -21,6 +22,8 @@ import structlog
 from scipy import stats
 from sklearn.covariance import LedoitWolf
 
+from src.risk.monte_carlo import MonteCarloEngine
+
 logger = structlog.get_logger(__name__)
 
 
@@ -36,6 +39,8 @@ class VaRResult:
     n_observations: int
     confidence_warning: str | None = None
     timestamp: datetime = field(default_factory=datetime.utcnow)
+    # Monte Carlo only: {"var_95": se, "cvar_95": se, "var_99": ..., "cvar_99": ...}
+    standard_errors: dict[str, float] = field(default_factory=dict)
 
 
 @dataclass
@@ -51,6 +56,9 @@ class VaRDecomposition:
         component_var: Per-instrument component VaR (weight * marginal VaR).
             Sum of all component VaRs approximately equals total VaR.
         pct_contribution: Per-instrument percentage contribution to total VaR.
+        method: "parametric" or "historical".
+        marginal_cvar: Per-instrument marginal CVaR (Euler gradient of ES).
+        component_cvar: Per-instrument component CVaR (weight * marginal CVaR).
     """
 
     total_var: float
@@ -59,6 +67,9 @@ class VaRDecomposition:
     marginal_var: dict[str, float]
     component_var: dict[str, float]
     pct_contribution: dict[str, float]
+    method: str = "parametric"
+    marginal_cvar: dict[str, float] = field(default_factory=dict)
+    component_cvar: dict[str, float] = field(default_factory=dict)
 
 
 # ---------------------------------------------------------------------------
@@ -131,12 +142,9 @@ def compute_monte_carlo_var(
 ) -> tuple[float, float]:
     """Monte Carlo VaR using Student-t marginals with Cholesky correlation.
 
-    Steps:
-        1. Fit Student-t distribution to each asset's returns.
-        2. Estimate correlation matrix via Ledoit-Wolf shrinkage.
-        3. Cholesky decomposition (with eigenvalue floor fallback).
-        4. Generate correlated normal samples -> uniform via CDF -> t-marginals.
-        5. Compute portfolio returns and extract VaR/CVaR.
+    Thin wrapper over ``MonteCarloEngine`` (see ``src.risk.monte_carlo``):
+    the fitted marginals and Cholesky factor are cached per returns window,
+    and draws are simulated in bounded-memory chunks.
 
     Args:
         returns_matrix: Shape (n_obs, n_assets) array of asset returns.
@@ -148,94 +156,10 @@ def compute_monte_carlo_var(
     Returns:
         (var, cvar) -- both negative numbers representing losses.
     """
-    if rng is None:
-        rng = np.random.default_rng(seed=42)
-
-    n_obs, n_assets = returns_matrix.shape
-
-    # Step 1: Fit Student-t distribution to each asset's returns
-    t_params: list[tuple[float, float, float]] = []
-    for i in range(n_assets):
-        asset_returns = returns_matrix[:, i]
-        if n_obs < 30:
-            # Fall back to normal (df=inf equivalent: very large df)
-            loc = float(np.mean(asset_returns))
-            scale = float(np.std(asset_returns, ddof=1))
-            if scale < 1e-12:
-                scale = 1e-12
-            t_params.append((1e6, loc, scale))
-            logger.warning(
-                "monte_carlo_var_short_history",
-                asset_index=i,
-                n_obs=n_obs,
-                fallback="normal",
-            )
-        else:
-            try:
-                df, loc, scale = stats.t.fit(asset_returns)
-                if scale < 1e-12:
-                    scale = 1e-12
-                t_params.append((df, loc, scale))
-            except Exception:
-                loc = float(np.mean(asset_returns))
-                scale = float(np.std(asset_returns, ddof=1))
-                if scale < 1e-12:
-                    scale = 1e-12
-                t_params.append((1e6, loc, scale))
-                logger.warning(
-                    "monte_carlo_var_fit_failed",
-                    asset_index=i,
-                    fallback="normal",
-                )
-
-    # Step 2: Robust covariance -> correlation matrix via Ledoit-Wolf
-    lw = LedoitWolf().fit(returns_matrix)
-    cov = lw.covariance_
-    std_diag = np.sqrt(np.diag(cov))
-    std_diag[std_diag < 1e-10] = 1e-10
-    corr = cov / np.outer(std_diag, std_diag)
-    np.fill_diagonal(corr, 1.0)
-
-    # Step 3: Cholesky decomposition with eigenvalue floor fallback
-    try:
-        chol_lower = np.linalg.cholesky(corr)
-    except np.linalg.LinAlgError:
-        logger.warning(
-            "monte_carlo_var_eigenvalue_floor",
-            message="Correlation matrix not positive-definite, applying eigenvalue floor",
-        )
-        eigenvalues, eigenvectors = np.linalg.eigh(corr)
-        eigenvalues = np.maximum(eigenvalues, 1e-8)
-        corr_fixed = eigenvectors @ np.diag(eigenvalues) @ eigenvectors.T
-        # Re-normalize to correlation
-        d = np.sqrt(np.diag(corr_fixed))
-        d[d < 1e-10] = 1e-10
-        corr_fixed = corr_fixed / np.outer(d, d)
-        np.fill_diagonal(corr_fixed, 1.0)
-        chol_lower = np.linalg.cholesky(corr_fixed)
-
-    # Step 4: Generate correlated normal samples
-    z = rng.standard_normal((n_simulations, n_assets))
-    corr_z = z @ chol_lower.T
-
-    # Step 5: Transform to uniform via normal CDF, then to t-marginals
-    uniform = stats.norm.cdf(corr_z)
-    # Clamp to avoid 0/1 which cause inf in ppf
-    uniform = np.clip(uniform, 1e-6, 1.0 - 1e-6)
-
-    sim_returns = np.zeros_like(uniform)
-    for i, (df, loc, scale) in enumerate(t_params):
-        sim_returns[:, i] = stats.t.ppf(uniform[:, i], df, loc=loc, scale=scale)
-
-    # Step 6: Compute portfolio returns and extract VaR/CVaR
-    portfolio_returns = sim_returns @ weights
-
-    alpha = 1.0 - confidence
-    var = float(np.percentile(portfolio_returns, alpha * 100.0))
-    tail = portfolio_returns[portfolio_returns <= var]
-    cvar = float(tail.mean()) if len(tail) > 0 else var
-
-    return var, cvar
+    result = MonteCarloEngine(n_simulations=n_simulations).run(
+        returns_matrix, weights, (confidence,), rng=rng
+    )
+    return result.var[confidence], result.cvar[confidence]
 
 
 # ---------------------------------------------------------------------------
@@ -243,75 +167,186 @@ def compute_monte_carlo_var(
 # ---------------------------------------------------------------------------
 
 
+@dataclass
+class EulerDecomposition:
+    """Per-asset Euler allocation of VaR and CVaR (index-aligned arrays).
+
+    ``component_* = weights * marginal_*``; components sum to the total
+    exactly for historical CVaR and historical VaR, and to the
+    volatility-only parametric VaR / CVaR for the parametric method.
+
+    Attributes:
+        total_var: Portfolio VaR (negative = loss).
+        total_cvar: Portfolio CVaR (negative = loss).
+        marginal_var: Shape (n_assets,) dVaR / dw_i.
+        component_var: Shape (n_assets,) w_i * marginal_var_i.
+        marginal_cvar: Shape (n_assets,) dCVaR / dw_i.
+        component_cvar: Shape (n_assets,) w_i * marginal_cvar_i.
+    """
+
+    total_var: float
+    total_cvar: float
+    marginal_var: np.ndarray
+    component_var: np.ndarray
+    marginal_cvar: np.ndarray
+    component_cvar: np.ndarray
+
+
+def ledoit_wolf_covariance(returns_matrix: np.ndarray) -> np.ndarray:
+    """Ledoit-Wolf shrinkage covariance, shared by the parametric methods."""
+    return LedoitWolf().fit(np.asarray(returns_matrix, dtype=np.float64)).covariance_
+
+
+def compute_parametric_decomposition(
+    returns_matrix: np.ndarray,
+    weights: np.ndarray,
+    confidence: float = 0.95,
+    cov: np.ndarray | None = None,
+) -> EulerDecomposition:
+    """Analytic Gaussian marginal / component VaR and CVaR.
+
+    ``MarginalVaR = (Sigma @ w) / sigma_p * z_alpha`` and
+    ``MarginalCVaR = -(Sigma @ w) / sigma_p * phi(z_alpha) / alpha``.
+    Totals are the volatility-only figures ``sigma_p * z_alpha`` and
+    ``-sigma_p * phi(z_alpha) / alpha``.
+
+    Args:
+        returns_matrix: Shape (n_obs, n_assets) array of asset returns.
+        weights: Shape (n_assets,) portfolio weights.
+        confidence: Confidence level (0.95 or 0.99).
+        cov: Precomputed covariance; defaults to one Ledoit-Wolf fit.
+    """
+    weights = np.asarray(weights, dtype=np.float64)
+    if cov is None:
+        cov = ledoit_wolf_covariance(returns_matrix)
+    alpha = 1.0 - confidence
+    z_alpha = stats.norm.ppf(alpha)  # negative
+
+    sigma_w = cov @ weights
+    port_vol = float(np.sqrt(weights @ sigma_w))
+    if port_vol < 1e-12:
+        zeros = np.zeros_like(weights)
+        return EulerDecomposition(0.0, 0.0, zeros, zeros, zeros, zeros)
+
+    beta = sigma_w / port_vol
+    es_factor = -stats.norm.pdf(z_alpha) / alpha
+    marginal_var = beta * z_alpha
+    marginal_cvar = beta * es_factor
+    return EulerDecomposition(
+        total_var=float(port_vol * z_alpha),
+        total_cvar=float(port_vol * es_factor),
+        marginal_var=marginal_var,
+        component_var=weights * marginal_var,
+        marginal_cvar=marginal_cvar,
+        component_cvar=weights * marginal_cvar,
+    )
+
+
+def compute_historical_decomposition(
+    returns_matrix: np.ndarray,
+    weights: np.ndarray,
+    confidence: float = 0.95,
+) -> EulerDecomposition:
+    """Historical marginal / component VaR and CVaR in one vectorized pass.
+
+    Euler allocation over the historical scenarios:
+
+    - VaR is the ``np.percentile`` interpolation between two order
+      statistics of the portfolio P&L, so its exact gradient is the same
+      interpolation of the asset returns in those two scenarios.
+    - CVaR is the mean over the tail scenarios (portfolio return <= VaR),
+      so its gradient is the mean asset return over that tail.
+
+    Both sum exactly to the totals of ``compute_historical_var``.  Cost is
+    one ``returns_matrix @ w``, one ``argpartition`` and one masked mean.
+
+    Args:
+        returns_matrix: Shape (n_obs, n_assets) array of asset returns.
+        weights: Shape (n_assets,) portfolio weights.
+        confidence: Confidence level (0.95 or 0.99).
+    """
+    returns_matrix = np.asarray(returns_matrix, dtype=np.float64)
+    weights = np.asarray(weights, dtype=np.float64)
+    n_obs = returns_matrix.shape[0]
+    if n_obs < 10:
+        zeros = np.zeros_like(weights)
+        return EulerDecomposition(0.0, 0.0, zeros, zeros, zeros, zeros)
+
+    portfolio_returns = returns_matrix @ weights
+    pos = (1.0 - confidence) * (n_obs - 1)
+    lo = int(np.floor(pos))
+    hi = min(lo + 1, n_obs - 1)
+    frac = pos - lo
+    order = np.argpartition(portfolio_returns, [lo, hi])
+    s_lo, s_hi = order[lo], order[hi]
+
+    total_var = float(
+        portfolio_returns[s_lo] + frac * (portfolio_returns[s_hi] - portfolio_returns[s_lo])
+    )
+    marginal_var = (1.0 - frac) * returns_matrix[s_lo] + frac * returns_matrix[s_hi]
+
+    tail = portfolio_returns <= total_var
+    if tail.any():
+        total_cvar = float(portfolio_returns[tail].mean())
+        marginal_cvar = returns_matrix[tail].mean(axis=0)
+    else:
+        total_cvar = total_var
+        marginal_cvar = marginal_var
+
+    return EulerDecomposition(
+        total_var=total_var,
+        total_cvar=total_cvar,
+        marginal_var=marginal_var,
+        component_var=weights * marginal_var,
+        marginal_cvar=marginal_cvar,
+        component_cvar=weights * marginal_cvar,
+    )
+
+
 def compute_marginal_var(
     returns_matrix: np.ndarray,
     weights: np.ndarray,
     confidence: float = 0.95,
     method: str = "parametric",
+    cov: np.ndarray | None = None,
 ) -> dict[int, float]:
     """Compute marginal VaR for each position.
 
     Marginal VaR measures the change in portfolio VaR from a small increase
-    in each position's weight. Uses finite-difference approximation:
-    MarginalVaR_i = (VaR(w + eps*e_i) - VaR(w - eps*e_i)) / (2 * eps)
+    in each position's weight (dVaR / dw_i).
 
-    For parametric method, uses Ledoit-Wolf shrinkage covariance for robust
-    estimation.
+    - ``parametric``: analytic Gaussian gradient on the Ledoit-Wolf
+      covariance (pass ``cov`` to reuse an existing fit).
+    - ``historical``: exact gradient of the historical quantile -- the
+      asset returns in the scenario(s) at the VaR order statistic -- which
+      is the limit of the old finite-difference estimate.
 
     Args:
         returns_matrix: Shape (n_obs, n_assets) array of asset returns.
         weights: Shape (n_assets,) portfolio weights.
         confidence: Confidence level (0.95 or 0.99).
         method: VaR method -- "parametric" or "historical".
+        cov: Precomputed covariance for the parametric method.
 
     Returns:
         Dict mapping position index -> marginal VaR contribution.
     """
-    weights = np.asarray(weights, dtype=np.float64)
-    returns_matrix = np.asarray(returns_matrix, dtype=np.float64)
-    n_assets = len(weights)
-    epsilon = 0.001
-
     if method == "parametric":
-        # Analytical marginal VaR using Ledoit-Wolf covariance
-        lw = LedoitWolf().fit(returns_matrix)
-        cov = lw.covariance_
-        z_alpha = stats.norm.ppf(1.0 - confidence)  # negative
-
-        sigma_w = cov @ weights
-        port_vol = float(np.sqrt(weights @ cov @ weights))
-
-        if port_vol < 1e-12:
-            return {i: 0.0 for i in range(n_assets)}
-
-        marginal = {}
-        for i in range(n_assets):
-            marginal[i] = float(sigma_w[i] / port_vol * z_alpha)
-        return marginal
+        decomposition = compute_parametric_decomposition(
+            returns_matrix, weights, confidence, cov=cov
+        )
     else:
-        # Finite-difference approximation for any method
-        marginal = {}
-        for i in range(n_assets):
-            w_plus = weights.copy()
-            w_minus = weights.copy()
-            w_plus[i] += epsilon
-            w_minus[i] -= epsilon
-
-            port_ret_plus = returns_matrix @ w_plus
-            port_ret_minus = returns_matrix @ w_minus
-
-            var_plus, _ = compute_historical_var(port_ret_plus, confidence)
-            var_minus, _ = compute_historical_var(port_ret_minus, confidence)
-
-            marginal[i] = float((var_plus - var_minus) / (2.0 * epsilon))
-
-        return marginal
+        decomposition = compute_historical_decomposition(
+            returns_matrix, weights, confidence
+        )
+    return dict(enumerate(decomposition.marginal_var.tolist()))
 
 
 def compute_component_var(
     returns_matrix: np.ndarray,
     weights: np.ndarray,
     confidence: float = 0.95,
+    cov: np.ndarray | None = None,
 ) -> dict[int, float]:
     """Compute component VaR for each position.
 
@@ -320,35 +355,22 @@ def compute_component_var(
 
     Sum of all component VaRs equals total parametric VaR.
 
-    Uses Ledoit-Wolf shrinkage covariance for robust estimation.
+    Uses Ledoit-Wolf shrinkage covariance for robust estimation (pass
+    ``cov`` to reuse an existing fit).
 
     Args:
         returns_matrix: Shape (n_obs, n_assets) array of asset returns.
         weights: Shape (n_assets,) portfolio weights.
         confidence: Confidence level (0.95 or 0.99).
+        cov: Precomputed covariance.
 
     Returns:
         Dict mapping position index -> component VaR.
     """
-    weights = np.asarray(weights, dtype=np.float64)
-    returns_matrix = np.asarray(returns_matrix, dtype=np.float64)
-    n_assets = len(weights)
-
-    lw = LedoitWolf().fit(returns_matrix)
-    cov = lw.covariance_
-    z_alpha = stats.norm.ppf(1.0 - confidence)  # negative
-
-    sigma_w = cov @ weights
-    port_vol = float(np.sqrt(weights @ cov @ weights))
-
-    if port_vol < 1e-12:
-        return {i: 0.0 for i in range(n_assets)}
-
-    component = {}
-    for i in range(n_assets):
-        component[i] = float(weights[i] * sigma_w[i] / port_vol * z_alpha)
-
-    return component
+    decomposition = compute_parametric_decomposition(
+        returns_matrix, weights, confidence, cov=cov
+    )
+    return dict(enumerate(decomposition.component_var.tolist()))
 
 
 # ---------------------------------------------------------------------------
@@ -366,6 +388,8 @@ class VaRCalculator:
         lookback_days: Number of days to use for Monte Carlo fitting.
             Defaults to 756 (3 years). If returns_matrix has more rows,
             only the last ``lookback_days`` rows are used.
+        mc_sampler: Monte Carlo draws -- "pseudo" or "sobol".
+        mc_chunk_size: Monte Carlo draws simulated per chunk.
     """
 
     def __init__(
@@ -373,10 +397,17 @@ class VaRCalculator:
         min_historical_obs: int = 756,
         mc_simulations: int = 10_000,
         lookback_days: int = 756,
+        mc_sampler: str = "pseudo",
+        mc_chunk_size: int = 100_000,
     ) -> None:
         self.min_historical_obs = min_historical_obs
         self.mc_simulations = mc_simulations
         self.lookback_days = lookback_days
+        self.mc_engine = MonteCarloEngine(
+            n_simulations=mc_simulations,
+            chunk_size=mc_chunk_size,
+            sampler=mc_sampler,
+        )
 
     def calculate(
         self,
@@ -455,20 +486,22 @@ class VaRCalculator:
             returns_matrix = returns_matrix[-self.lookback_days :]
         n_obs = returns_matrix.shape[0]
 
-        var_95, cvar_95 = compute_monte_carlo_var(
-            returns_matrix, weights, 0.95, self.mc_simulations, rng=rng
-        )
-        var_99, cvar_99 = compute_monte_carlo_var(
-            returns_matrix, weights, 0.99, self.mc_simulations, rng=rng
-        )
+        # One simulation serves both confidence levels
+        mc = self.mc_engine.run(returns_matrix, weights, (0.95, 0.99), rng=rng)
 
         return VaRResult(
-            var_95=var_95,
-            var_99=var_99,
-            cvar_95=cvar_95,
-            cvar_99=cvar_99,
+            var_95=mc.var[0.95],
+            var_99=mc.var[0.99],
+            cvar_95=mc.cvar[0.95],
+            cvar_99=mc.cvar[0.99],
             method="monte_carlo",
             n_observations=n_obs,
+            standard_errors={
+                "var_95": mc.var_se[0.95],
+                "cvar_95": mc.cvar_se[0.95],
+                "var_99": mc.var_se[0.99],
+                "cvar_99": mc.cvar_se[0.99],
+            },
         )
 
     def calculate_all_methods(
@@ -500,12 +533,15 @@ class VaRCalculator:
         weights: np.ndarray,
         instrument_names: list[str],
         confidence: float = 0.95,
+        method: str = "parametric",
     ) -> VaRDecomposition:
         """Decompose portfolio VaR into per-instrument marginal and component VaR.
 
-        Combines ``compute_marginal_var`` (parametric method) and
-        ``compute_component_var`` to produce a full decomposition that maps
-        position indices to human-readable instrument names.
+        ``parametric`` fits one Ledoit-Wolf covariance and derives marginal
+        and component VaR / CVaR from it; ``historical`` uses the Euler
+        allocation over the historical tail scenarios
+        (``compute_historical_decomposition``).  Both are single vectorized
+        passes, so books of several hundred instruments stay fast.
 
         Args:
             returns_matrix: Shape (n_obs, n_assets) array of asset returns.
@@ -513,6 +549,7 @@ class VaRCalculator:
             instrument_names: List of instrument names matching columns of
                 returns_matrix.
             confidence: Confidence level (0.95 or 0.99).
+            method: "parametric" or "historical".
 
         Returns:
             VaRDecomposition with marginal VaR, component VaR, and percentage
@@ -525,37 +562,36 @@ class VaRCalculator:
         if returns_matrix.shape[0] > self.lookback_days:
             returns_matrix = returns_matrix[-self.lookback_days :]
 
-        # Compute portfolio returns for total VaR/CVaR
-        portfolio_returns = returns_matrix @ weights
-        total_var, total_cvar = compute_parametric_var(portfolio_returns, confidence)
-
-        # Marginal and component VaR
-        marginal_idx = compute_marginal_var(
-            returns_matrix, weights, confidence, method="parametric"
-        )
-        component_idx = compute_component_var(returns_matrix, weights, confidence)
+        if method == "parametric":
+            # Totals keep the mean term; components are volatility-only
+            portfolio_returns = returns_matrix @ weights
+            total_var, total_cvar = compute_parametric_var(portfolio_returns, confidence)
+            euler = compute_parametric_decomposition(returns_matrix, weights, confidence)
+        elif method == "historical":
+            euler = compute_historical_decomposition(returns_matrix, weights, confidence)
+            total_var, total_cvar = euler.total_var, euler.total_cvar
+        else:
+            raise ValueError(
+                f"Unknown method '{method}'. Use 'parametric' or 'historical'."
+            )
 
-        # Map indices to instrument names
-        marginal_named = {
-            instrument_names[i]: marginal_idx[i] for i in range(len(instrument_names))
-        }
-        component_named = {
-            instrument_names[i]: component_idx[i] for i in range(len(instrument_names))
-        }
+        def named(values: np.ndarray) -> dict[str, float]:
+            return dict(zip(instrument_names, values.tolist()))
 
         # Percentage contribution: component_var_i / total_var
-        pct_contribution: dict[str, float] = {}
-        for name in instrument_names:
-            if abs(total_var) > 1e-12:
-                pct_contribution[name] = component_named[name] / total_var
-            else:
-                pct_contribution[name] = 0.0
+        if abs(total_var) > 1e-12:
+            pct = euler.component_var / total_var
+        else:
+            pct = np.zeros_like(euler.component_var)
 
         return VaRDecomposition(
             total_var=total_var,
             total_cvar=total_cvar,
             confidence=confidence,
-            marginal_var=marginal_named,
-            component_var=component_named,
-            pct_contribution=pct_contribution,
+            marginal_var=named(euler.marginal_var),
+            component_var=named(euler.component_var),
+            pct_contribution=named(pct),
+            method=method,
+            marginal_cvar=named(euler.marginal_cvar),
+            component_cvar=named(euler.component_cvar),
         )
@@ -7,6 +7,7 @@ Uses respx to mock BCB OData API responses and verify:
 - MAX_PAGES safety limit stops infinite loops
 - Empty response handling
 - Indicator name normalization (accents, hyphens removed)
+- fetch() fails when any indicator fails
 """
 
 from __future__ import annotations
@@ -19,6 +20,7 @@ import httpx
 import pytest
 import respx
 
+from src.connectors.base import FetchError
 from src.connectors.bcb_focus import BcbFocusConnector, _normalize_indicator_name
 
 # ---------------------------------------------------------------------------
@@ -417,3 +419,18 @@ async def test_release_time_has_sp_timezone(bcb_focus_sample):
     for rec in records:
         assert rec["release_time"].tzinfo is not None
         assert str(rec["release_time"].tzinfo) == "America/Sao_Paulo"
+
+
+@pytest.mark.asyncio
+async def test_fetch_fails_when_an_indicator_fails():
+    """Verify one failed indicator fails fetch() instead of going missing."""
+
+    async def paginated(entity_set, odata_filter):
+        if "'IGP-M'" in odata_filter:
+            raise FetchError("IGP-M unavailable")
+        return []
+
+    conn = BcbFocusConnector()
+    conn._fetch_odata_paginated = paginated
+    with pytest.raises(FetchError, match="IGP-M unavailable"):
+        await conn.fetch(date(2025, 1, 1), date(2025, 2, 28))
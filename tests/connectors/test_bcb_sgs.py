@@ -10,8 +10,10 @@ Uses respx to mock BCB SGS API HTTP responses and verify:
 
 from __future__ import annotations
 
+import asyncio
 from datetime import date
 
+import httpx
 import pytest
 import respx
 
@@ -189,3 +191,90 @@ async def test_fetch_series_handles_non_list_response():
             )
 
     assert len(records) == 0
+
+
+# ---------------------------------------------------------------------------
+# Concurrent fetch + token-bucket limiter
+# ---------------------------------------------------------------------------
+@pytest.mark.asyncio
+async def test_fetch_schedules_series_chunks_concurrently():
+    """All (series, chunk) requests are in flight together, tagged per series."""
+    state = {"in_flight": 0, "max_in_flight": 0}
+
+    async def handler(request):
+        state["in_flight"] += 1
+        state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+        await asyncio.sleep(0.01)
+        state["in_flight"] -= 1
+        start = request.url.params["dataInicial"]
+        return httpx.Response(200, json=[{"data": start, "valor": "1.0"}])
+
+    with respx.mock(base_url="https://api.bcb.gov.br") as mock:
+        route = mock.get(url__regex=r"/dados/serie/bcdata\.sgs\.\d+/dados").mock(
+            side_effect=handler
+        )
+        async with BcbSgsConnector() as conn:
+            records = await conn.fetch(
+                date(2000, 1, 1),
+                date(2024, 12, 31),
+                series_ids=["BR_SELIC_TARGET", "BR_IPCA_MOM"],
+            )
+
+    assert route.call_count == 6  # 2 series x 3 ten-year chunks
+    assert state["max_in_flight"] > 1
+    assert [r["_series_key"] for r in records] == ["BR_SELIC_TARGET"] * 3 + [
+        "BR_IPCA_MOM"
+    ] * 3
+    assert [r["observation_date"] for r in records[:3]] == [
+        date(2000, 1, 1),
+        date(2010, 1, 1),
+        date(2020, 1, 1),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_fetch_drops_series_with_failed_chunk():
+    """A failed chunk drops its whole series; other series are unaffected."""
+
+    def handler(request):
+        if "sgs.432" in request.url.path and request.url.params["dataInicial"].endswith(
+            "2010"
+        ):
+            return httpx.Response(500)
+        return httpx.Response(200, json=[{"data": "01/01/2000", "valor": "1.0"}])
+
+    with respx.mock(base_url="https://api.bcb.gov.br") as mock:
+        mock.get(url__regex=r"/dados/serie/bcdata\.sgs\.\d+/dados").mock(
+            side_effect=handler
+        )
+        async with BcbSgsConnector() as conn:
+            conn.MAX_RETRIES = 1
+            records = await conn.fetch(
+                date(2000, 1, 1),
+                date(2024, 12, 31),
+                series_ids=["BR_SELIC_TARGET", "BR_IPCA_MOM"],
+            )
+
+    assert {r["_series_key"] for r in records} == {"BR_IPCA_MOM"}
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_paces_after_burst(monkeypatch):
+    """rate=2/s with capacity 2: two immediate tokens, then 0.5s apart."""
+    from src.connectors import base
+
+    clock = {"now": 100.0}
+    sleeps: list[float] = []
+
+    async def fake_sleep(seconds):
+        sleeps.append(seconds)
+        clock["now"] += seconds
+
+    monkeypatch.setattr(base.time, "monotonic", lambda: clock["now"])
+    monkeypatch.setattr(base.asyncio, "sleep", fake_sleep)
+
+    bucket = base.TokenBucket(rate=2.0)
+    for _ in range(5):
+        await bucket.acquire()
+
+    assert sleeps == [pytest.approx(0.5)] * 3
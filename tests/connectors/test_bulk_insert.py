@@ -0,0 +1,163 @@
+"""Tests for BaseConnector._bulk_insert dispatch and the COPY + merge path.
+
+The async engine is replaced with a fake connection so no database is
+needed; the tests check the SQL issued and the rows handed to COPY.
+"""
+
+from contextlib import asynccontextmanager
+from datetime import date
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.connectors.base import ConnectorError, _copy_merge_sql
+from src.connectors.bcb_sgs import BcbSgsConnector
+from src.core.models.macro_series import MacroSeries
+
+
+def _records(n: int) -> list[dict]:
+    return [
+        {
+            "series_id": 1,
+            "observation_date": date(2024, 1, 1),
+            "value": float(i),
+            "revision_number": 0,
+        }
+        for i in range(n)
+    ]
+
+
+def _fake_engine(inserted: int):
+    apg = SimpleNamespace(copy_records_to_table=AsyncMock())
+    conn = SimpleNamespace(
+        dialect=SimpleNamespace(
+            identifier_preparer=SimpleNamespace(quote=lambda s: f'"{s}"')
+        ),
+        exec_driver_sql=AsyncMock(
+            side_effect=[MagicMock(), MagicMock(rowcount=inserted)]
+        ),
+        get_raw_connection=AsyncMock(
+            return_value=SimpleNamespace(driver_connection=apg)
+        ),
+    )
+
+    @asynccontextmanager
+    async def begin():
+        yield conn
+
+    return SimpleNamespace(begin=begin), conn, apg
+
+
+def test_copy_merge_sql() -> None:
+    create_sql, merge_sql = _copy_merge_sql(
+        "macro_series", ["series_id", "value"], "uq_macro", "_stg_macro_series"
+    )
+    assert create_sql == (
+        'CREATE TEMP TABLE "_stg_macro_series" ON COMMIT DROP AS '
+        'SELECT "series_id", "value" FROM "macro_series" WITH NO DATA'
+    )
+    assert merge_sql == (
+        'INSERT INTO "macro_series" ("series_id", "value") '
+        'SELECT "series_id", "value" FROM "_stg_macro_series" '
+        'ON CONFLICT ON CONSTRAINT "uq_macro" DO NOTHING'
+    )
+
+
+@pytest.mark.asyncio
+async def test_small_loads_use_batched_insert() -> None:
+    session = SimpleNamespace(execute=AsyncMock(return_value=MagicMock(rowcount=3)))
+
+    @asynccontextmanager
+    async def begin():
+        yield
+
+    @asynccontextmanager
+    async def factory():
+        yield session
+
+    session.begin = begin
+    conn = BcbSgsConnector()
+    with patch.object(conn, "_copy_insert", new=AsyncMock()) as copy_insert, patch(
+        "src.connectors.base.async_session_factory", factory
+    ):
+        inserted = await conn._bulk_insert(MacroSeries, _records(5), "uq", 2)
+
+    assert inserted == 9  # three batches of <= 2 rows
+    copy_insert.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_large_loads_use_copy() -> None:
+    conn = BcbSgsConnector()
+    conn.COPY_THRESHOLD = 4
+    with patch.object(conn, "_copy_insert", new=AsyncMock(return_value=3)) as ci:
+        assert await conn._bulk_insert(MacroSeries, _records(4), "uq") == 3
+    ci.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_copy_insert_stages_then_merges() -> None:
+    engine, conn, apg = _fake_engine(inserted=2)
+    records = _records(3)
+    records[2]["release_time"] = None  # key present on some records only
+    with patch("src.connectors.base.async_engine", engine):
+        inserted = await BcbSgsConnector()._copy_insert(
+            MacroSeries, records, "uq_macro_series_natural_key"
+        )
+
+    assert inserted == 2
+    create_sql, merge_sql = [c.args[0] for c in conn.exec_driver_sql.await_args_list]
+    assert create_sql.startswith('CREATE TEMP TABLE "_stg_macro_series"')
+    assert "ON CONFLICT ON CONSTRAINT" in merge_sql
+    kwargs = apg.copy_records_to_table.await_args.kwargs
+    assert kwargs["columns"] == [
+        "series_id",
+        "observation_date",
+        "value",
+        "revision_number",
+        "release_time",
+    ]
+    assert kwargs["records"][0] == (1, date(2024, 1, 1), 0.0, 0, None)
+
+
+@pytest.mark.asyncio
+async def test_copy_insert_fills_python_defaults() -> None:
+    from src.core.models.market_data import MarketData
+
+    engine, conn, apg = _fake_engine(inserted=2)
+    records = _records(2)
+    del records[1]["revision_number"]  # omitted on some records only
+    with patch("src.connectors.base.async_engine", engine):
+        await BcbSgsConnector()._copy_insert(MacroSeries, records, "uq")
+    assert [r[3] for r in apg.copy_records_to_table.await_args.kwargs["records"]] == [0, 0]
+
+    engine, conn, apg = _fake_engine(inserted=1)
+    bar = {"instrument_id": 1, "timestamp": date(2024, 1, 2), "close": 10.0}
+    with patch("src.connectors.base.async_engine", engine):
+        await BcbSgsConnector()._copy_insert(MarketData, [bar], "uq")
+    kwargs = apg.copy_records_to_table.await_args.kwargs
+    assert kwargs["columns"] == ["instrument_id", "timestamp", "close", "frequency"]
+    assert kwargs["records"] == [(1, date(2024, 1, 2), 10.0, "daily")]
+
+
+@pytest.mark.asyncio
+async def test_copy_insert_rejects_unknown_columns() -> None:
+    with pytest.raises(ConnectorError, match="unknown columns"):
+        await BcbSgsConnector()._copy_insert(
+            MacroSeries, [{"series_id": 1, "bogus": 2}], "uq"
+        )
+
+
+@pytest.mark.asyncio
+async def test_market_data_insert_invalidates_prices() -> None:
+    from src.core.models.market_data import MarketData
+
+    conn = BcbSgsConnector()
+    conn.COPY_THRESHOLD = 1
+    with patch.object(conn, "_copy_insert", new=AsyncMock(return_value=2)), patch.object(
+        conn, "_notify_prices_changed", new=AsyncMock()
+    ) as notify:
+        await conn._bulk_insert(MarketData, [{"close": 1.0}], "uq")
+        await conn._bulk_insert(MacroSeries, _records(1), "uq")
+    notify.assert_awaited_once()
@@ -7,6 +7,7 @@ Uses respx to mock IBGE SIDRA API HTTP responses and verify:
 - Series keys correctly incorporate group name
 - All 9 IPCA groups are in the registry
 - Both MoM change and weight variables are fetched
+- fetch() fails when either variable fails
 """
 
 from __future__ import annotations
@@ -19,6 +20,7 @@ import httpx
 import pytest
 import respx
 
+from src.connectors.base import FetchError
 from src.connectors.ibge_sidra import IbgeSidraConnector
 
 # ---------------------------------------------------------------------------
@@ -257,6 +259,21 @@ async def test_fetch_calls_both_variables():
     assert "BR_IPCA_FOOD_WEIGHT" in keys
 
 
+@pytest.mark.asyncio
+async def test_fetch_fails_when_weights_fail():
+    """Verify fetch() raises instead of returning MoM changes without weights."""
+
+    async def fetch_variable(variable, start, end):
+        if variable == IbgeSidraConnector._VAR_WEIGHT:
+            raise FetchError("weights unavailable")
+        return [{"_series_key": "BR_IPCA_FOOD_MOM", "value": 0.5}]
+
+    conn = IbgeSidraConnector()
+    conn._fetch_variable = fetch_variable
+    with pytest.raises(FetchError, match="weights unavailable"):
+        await conn.fetch(date(2024, 1, 1), date(2024, 1, 31))
+
+
 @pytest.mark.asyncio
 async def test_records_have_required_fields(ibge_sidra_sample):
     """Verify each record has all required fields for macro_series table."""
@@ -46,12 +46,61 @@ class TestLoaderInterface:
             "get_market_data",
             "get_flow_data",
             "get_focus_expectations",
+            "get_last_prices",
         ]
         for method_name in expected_methods:
             assert hasattr(loader, method_name), f"Missing method: {method_name}"
             assert callable(getattr(loader, method_name))
 
 
+    def test_get_last_prices_single_distinct_on_query(self) -> None:
+        from datetime import datetime, timezone
+        from unittest.mock import MagicMock, patch
+
+        from sqlalchemy.dialects import postgresql
+
+        session = MagicMock()
+        session.execute.return_value.all.return_value = [
+            ("USDBRL", 5.1, datetime(2024, 6, 14, tzinfo=timezone.utc)),
+            ("IBOVESPA", 120000.0, datetime(2024, 6, 13, tzinfo=timezone.utc)),
+        ]
+        with patch(
+            "src.agents.data_loader.sync_session_factory", return_value=session
+        ):
+            prices = PointInTimeDataLoader().get_last_prices(
+                ["USDBRL", "IBOVESPA", "MISSING"], date(2024, 6, 15)
+            )
+
+        assert session.execute.call_count == 1
+        sql = str(
+            session.execute.call_args[0][0].compile(dialect=postgresql.dialect())
+        )
+        assert "DISTINCT ON (instruments.ticker)" in sql
+        assert prices == {
+            "USDBRL": (5.1, date(2024, 6, 14)),
+            "IBOVESPA": (120000.0, date(2024, 6, 13)),
+        }
+
+    def test_macro_vintage_stmt_is_sargable(self) -> None:
+        from sqlalchemy.dialects import postgresql
+
+        stmt = PointInTimeDataLoader.macro_vintage_stmt(
+            "432", date(2024, 6, 15), date(2014, 6, 15)
+        )
+        sql = str(
+            stmt.compile(
+                dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+            )
+        )
+        assert "DISTINCT ON (macro_series.observation_date)" in sql
+        assert "CAST" not in sql.upper()
+        # Exclusive cutoff at the start of the next UTC day
+        assert "macro_series.release_time < '2024-06-16 00:00:00+00:00'" in sql
+
+    def test_get_last_prices_empty_tickers(self) -> None:
+        assert PointInTimeDataLoader().get_last_prices([], date(2024, 6, 15)) == {}
+
+
 # ---------------------------------------------------------------------------
 # Database-dependent tests (skipped without DB)
 # ---------------------------------------------------------------------------
@@ -0,0 +1,154 @@
+"""Tests for the shared LRU + TTL loader cache.
+
+The uncached PointInTimeDataLoader methods are patched so no database is
+needed; the tests count how often they are actually called.
+"""
+
+from datetime import date
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from src.agents.base import BaseAgent
+from src.agents.data_loader import PointInTimeDataLoader
+from src.agents.loader_cache import CachedDataLoader, LoaderCache
+from src.agents.registry import AgentRegistry
+
+AS_OF = date(2024, 6, 14)
+
+
+def _macro_frame(as_of_date, lookback_days) -> pd.DataFrame:
+    dates = pd.date_range(end=pd.Timestamp(as_of_date), periods=lookback_days, freq="D")
+    return pd.DataFrame(
+        {"value": range(len(dates)), "release_time": dates, "revision_number": 0},
+        index=pd.DatetimeIndex(dates, name="date"),
+    )
+
+
+@pytest.fixture
+def base_macro():
+    with patch.object(
+        PointInTimeDataLoader,
+        "get_macro_series",
+        autospec=True,
+        side_effect=lambda self, code, as_of, lb=3650: _macro_frame(as_of, lb),
+    ) as mock:
+        yield mock
+
+
+@pytest.fixture
+def loader() -> CachedDataLoader:
+    return CachedDataLoader(cache=LoaderCache())
+
+
+class TestCachedDataLoader:
+    def test_aliases_share_one_entry(self, loader, base_macro) -> None:
+        first = loader.get_macro_series("BR_SELIC_TARGET", AS_OF, 100)
+        second = loader.get_macro_series("BCB-432", AS_OF, 100)
+        pd.testing.assert_frame_equal(first, second)
+        assert base_macro.call_count == 1
+        assert loader.cache.stats["hits"] == 1
+        assert loader.cache.stats["misses"] == 1
+
+    def test_narrower_window_served_from_wider(self, loader, base_macro) -> None:
+        loader.get_macro_series("432", AS_OF, 100)
+        narrow = loader.get_macro_series("432", AS_OF, 10)
+        assert base_macro.call_count == 1
+        assert narrow.index.min() >= pd.Timestamp(date(2024, 6, 4))
+        assert len(narrow) == 11  # observation_date >= start is inclusive
+
+    def test_wider_window_is_a_miss(self, loader, base_macro) -> None:
+        loader.get_macro_series("432", AS_OF, 10)
+        loader.get_macro_series("432", AS_OF, 100)
+        assert base_macro.call_count == 2
+
+    def test_as_of_date_is_part_of_key(self, loader, base_macro) -> None:
+        loader.get_macro_series("432", AS_OF, 10)
+        loader.get_macro_series("432", date(2024, 6, 13), 10)
+        assert base_macro.call_count == 2
+
+    def test_returned_frames_are_copies(self, loader, base_macro) -> None:
+        df = loader.get_macro_series("432", AS_OF, 10)
+        df["value"] = -1
+        assert (loader.get_macro_series("432", AS_OF, 10)["value"] >= 0).all()
+
+    def test_curve_history_exact_window_only(self, loader) -> None:
+        with patch.object(
+            PointInTimeDataLoader,
+            "get_curve_history",
+            return_value=pd.DataFrame({"rate": [10.0]}),
+        ) as base:
+            loader.get_curve_history("DI", 252, AS_OF, 756)
+            loader.get_curve_history("DI_PRE", 252, AS_OF, 756)
+            loader.get_curve_history("DI", 252, AS_OF, 365)
+        assert base.call_count == 2
+
+
+class TestLoaderCache:
+    def test_lru_eviction_by_bytes(self) -> None:
+        frame = _macro_frame(AS_OF, 50)
+        size = int(frame.memory_usage(index=True, deep=True).sum())
+        cache = LoaderCache(max_bytes=int(size * 2.5))
+        for code in ("A", "B"):
+            cache.put("macro_series", code, AS_OF, 50, frame)
+        cache.get("macro_series", "A", AS_OF, 50)  # A becomes most recent
+        cache.put("macro_series", "C", AS_OF, 50, frame)
+
+        assert cache.get("macro_series", "B", AS_OF, 50) == (None, None)
+        assert cache.get("macro_series", "A", AS_OF, 50)[1] is not None
+        assert cache.stats["evictions"] == 1
+        assert cache.stats["bytes"] <= cache.max_bytes
+
+    def test_ttl_expiry(self) -> None:
+        cache = LoaderCache(ttl_seconds=10.0)
+        with patch("src.agents.loader_cache.time.monotonic", return_value=100.0):
+            cache.put("curve", "DI_PRE", AS_OF, None, {252: 10.0})
+        with patch("src.agents.loader_cache.time.monotonic", return_value=105.0):
+            assert cache.get("curve", "DI_PRE", AS_OF)[1] == {252: 10.0}
+        with patch("src.agents.loader_cache.time.monotonic", return_value=111.0):
+            assert cache.get("curve", "DI_PRE", AS_OF) == (None, None)
+        assert cache.stats["entries"] == 0
+
+
+class _ProbeAgent(BaseAgent):
+    """Records which loader it saw during load_data."""
+
+    def __init__(self) -> None:
+        super().__init__("probe_agent", "Probe")
+        self.loader = PointInTimeDataLoader()
+        self.seen: list = []
+
+    def load_data(self, as_of_date):
+        self.seen.append(self.loader)
+        return {}
+
+    def compute_features(self, data):
+        return {}
+
+    def run_models(self, features):
+        return []
+
+    def generate_narrative(self, signals, features):
+        return ""
+
+    def _persist_signals(self, signals):
+        return 0
+
+    def _persist_report(self, report):
+        pass
+
+
+class TestRegistrySharedLoader:
+    def test_plain_loaders_swapped_for_run_and_restored(self) -> None:
+        AgentRegistry.clear()
+        agent = _ProbeAgent()
+        original = agent.loader
+        AgentRegistry.register(agent)
+        try:
+            AgentRegistry.run_all(AS_OF)
+        finally:
+            AgentRegistry.clear()
+
+        assert isinstance(agent.seen[0], CachedDataLoader)
+        assert agent.loader is original
@@ -0,0 +1,156 @@
+"""Tests for PointInTimeDataCube in-memory PIT slicing.
+
+Bulk fetchers are patched with synthetic rows so no database is needed.
+"""
+
+from datetime import date, datetime, timezone
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+
+from src.agents.data_loader import PointInTimeDataLoader
+from src.agents.pit_data_cube import PointInTimeDataCube
+
+
+def _utc(y: int, m: int, d: int, hour: int = 12) -> datetime:
+    return datetime(y, m, d, hour, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def cube() -> PointInTimeDataCube:
+    c = PointInTimeDataCube(horizon=date(2024, 12, 31))
+    # (observation_date, value, release_time, revision_number)
+    c._fetch_macro_rows = MagicMock(
+        side_effect=lambda code: {
+            "432": [
+                (date(2024, 1, 31), 11.75, _utc(2024, 2, 1), 0),
+                (date(2024, 2, 29), 11.25, _utc(2024, 3, 1), 0),
+                (date(2024, 3, 31), 10.75, _utc(2024, 4, 1), 0),
+            ],
+            "REVISED": [
+                (date(2024, 1, 31), 1.0, _utc(2024, 2, 10), 0),
+                (date(2024, 1, 31), 1.5, _utc(2024, 3, 10), 1),
+                (date(2024, 2, 29), 2.0, _utc(2024, 3, 10), 0),
+            ],
+        }.get(code, [])
+    )
+    c._fetch_market_rows = MagicMock(
+        return_value=[
+            (_utc(2024, 1, d), 1.0, 1.0, 1.0, 100.0 + d, 10.0, None)
+            for d in range(2, 12)
+        ]
+    )
+    c._fetch_curve_rows = MagicMock(
+        return_value=[
+            (date(2024, 1, 2), 252, 10.0),
+            (date(2024, 1, 2), 504, 10.5),
+            (date(2024, 1, 3), 252, 10.1),
+            (date(2024, 1, 3), 504, 10.6),
+            (date(2024, 1, 5), 252, 10.2),
+            (date(2024, 1, 5), 504, 10.7),
+        ]
+    )
+    c._fetch_flow_rows = MagicMock(
+        return_value=[
+            (date(2024, 1, 10), 5.0, "commercial", None),
+            (date(2024, 1, 11), 6.0, "commercial", _utc(2024, 1, 20)),
+        ]
+    )
+    return c
+
+
+class TestCubeInterface:
+    def test_is_drop_in_loader(self, cube: PointInTimeDataCube) -> None:
+        assert isinstance(cube, PointInTimeDataLoader)
+
+    def test_series_loaded_once(self, cube: PointInTimeDataCube) -> None:
+        for day in range(1, 29):
+            cube.get_macro_series("BR_SELIC_TARGET", date(2024, 2, day))
+        cube.get_latest_macro_value("BCB-432", date(2024, 5, 1))
+        assert cube._fetch_macro_rows.call_count == 1
+        assert cube.stats["loads"] == 1
+        assert cube.stats["hits"] == 28
+
+
+class TestCubeMacro:
+    def test_pit_slice_excludes_unreleased(self, cube: PointInTimeDataCube) -> None:
+        df = cube.get_macro_series("BR_SELIC_TARGET", date(2024, 3, 1))
+        assert list(df["value"]) == [11.75, 11.25]
+        assert list(df.columns) == ["value", "release_time", "revision_number"]
+        assert df.index.dtype == "datetime64[ns]"
+
+    def test_lookback_window(self, cube: PointInTimeDataCube) -> None:
+        df = cube.get_macro_series("BR_SELIC_TARGET", date(2024, 4, 2), lookback_days=40)
+        assert list(df.index) == [pd.Timestamp("2024-02-29"), pd.Timestamp("2024-03-31")]
+
+    def test_empty_before_first_release(self, cube: PointInTimeDataCube) -> None:
+        df = cube.get_macro_series("BR_SELIC_TARGET", date(2024, 1, 31))
+        assert df.empty
+        assert cube.get_latest_macro_value("BR_SELIC_TARGET", date(2024, 1, 31)) is None
+
+    def test_vintage_selection(self, cube: PointInTimeDataCube) -> None:
+        before = cube.get_macro_series("REVISED", date(2024, 3, 1))
+        assert list(before["value"]) == [1.0]
+
+        after = cube.get_macro_series("REVISED", date(2024, 3, 10))
+        assert list(after["value"]) == [1.5, 2.0]
+        assert list(after["revision_number"]) == [1, 0]
+
+    def test_latest_value(self, cube: PointInTimeDataCube) -> None:
+        assert cube.get_latest_macro_value("REVISED", date(2024, 3, 1)) == 1.0
+        assert cube.get_latest_macro_value("BR_SELIC_TARGET", date(2024, 6, 1)) == 10.75
+
+
+class TestCubeMarketAndCurves:
+    def test_market_window(self, cube: PointInTimeDataCube) -> None:
+        df = cube.get_market_data("USDBRL", date(2024, 1, 6), lookback_days=2)
+        assert list(df["close"]) == [104.0, 105.0, 106.0]
+        assert str(df.index.tz) == "UTC"
+        assert df["adjusted_close"].isna().all()
+
+    def test_market_empty(self, cube: PointInTimeDataCube) -> None:
+        assert cube.get_market_data("USDBRL", date(2023, 1, 1)).empty
+
+    def test_last_prices(self, cube: PointInTimeDataCube) -> None:
+        prices = cube.get_last_prices(["USDBRL"], date(2024, 1, 6))
+        assert prices == {"USDBRL": (106.0, date(2024, 1, 6))}
+        assert cube.get_last_prices(["USDBRL"], date(2023, 12, 1)) == {}
+        stale = cube.get_last_prices(["USDBRL"], date(2024, 2, 1), lookback_days=5)
+        assert stale == {}
+
+    def test_engine_uses_batched_prices(self, cube: PointInTimeDataCube) -> None:
+        from src.backtesting.engine import BacktestConfig, BacktestEngine
+
+        config = BacktestConfig(
+            start_date=date(2024, 1, 1),
+            end_date=date(2024, 1, 31),
+            initial_capital=1_000_000.0,
+        )
+        engine = BacktestEngine(config, cube)
+        cube.get_market_data = MagicMock(side_effect=AssertionError("per-ticker"))
+        assert engine._get_prices(date(2024, 1, 9), ["USDBRL"]) == {"USDBRL": 109.0}
+        # Gap fill from the last known price when nothing is in the window
+        assert engine._get_prices(date(2024, 2, 28), ["USDBRL"]) == {"USDBRL": 109.0}
+
+    def test_curve_snapshot_uses_latest_date(self, cube: PointInTimeDataCube) -> None:
+        assert cube.get_curve("DI", date(2024, 1, 4)) == {252: 10.1, 504: 10.6}
+        assert cube.get_curve("DI", date(2024, 1, 1)) == {}
+
+    def test_curve_history_exact_and_fuzzy(self, cube: PointInTimeDataCube) -> None:
+        exact = cube.get_curve_history("DI", 252, date(2024, 1, 5))
+        assert list(exact["rate"]) == [10.0, 10.1, 10.2]
+
+        fuzzy = cube.get_curve_history("DI", 540, date(2024, 1, 3))
+        assert list(fuzzy["rate"]) == [10.5, 10.6]
+
+        assert cube.get_curve_history("DI", 2520, date(2024, 1, 5)).empty
+
+
+class TestCubeFlow:
+    def test_flow_coalesces_release_time(self, cube: PointInTimeDataCube) -> None:
+        early = cube.get_flow_data("BR_FX_FLOW_COMMERCIAL", date(2024, 1, 15))
+        assert list(early["value"]) == [5.0]
+
+        late = cube.get_flow_data("BR_FX_FLOW_COMMERCIAL", date(2024, 1, 20))
+        assert list(late["value"]) == [5.0, 6.0]
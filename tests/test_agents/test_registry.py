@@ -1,5 +1,7 @@
 """Tests for AgentRegistry ordered execution."""
 
+import os
+import threading
 from datetime import date, datetime
 from typing import Any
 
@@ -209,3 +211,87 @@ class TestRunAllReports:
         assert len(report.signals) == 1
         assert report.narrative == "Narrative from inflation_agent"
         assert isinstance(report.generated_at, datetime)
+
+
+# ---------------------------------------------------------------------------
+# Concurrent DAG execution (run_all)
+# ---------------------------------------------------------------------------
+class _BarrierAgent(_TestAgent):
+    """Blocks in load_data until ``parties`` agents are loading at once."""
+
+    barrier: threading.Barrier | None = None
+
+    def load_data(self, as_of_date: date) -> dict[str, Any]:
+        if self.barrier is not None:
+            self.barrier.wait(timeout=5)
+        _execution_log.append(f"load:{self.agent_id}")
+        return {}
+
+
+class _CpuAgent(_TestAgent):
+    """CPU-bound agent whose signal records the pid that ran run_models."""
+
+    CPU_BOUND = True
+
+    def run_models(self, features: dict) -> list[AgentSignal]:
+        signals = super().run_models(features)
+        signals[0].metadata["pid"] = os.getpid()
+        return signals
+
+
+class TestRunAllDag:
+    def test_waves_put_cross_asset_last(self) -> None:
+        for aid in ("cross_asset_agent", "fx_agent", "inflation_agent", "extra"):
+            AgentRegistry.register(_TestAgent(aid, aid))
+        assert AgentRegistry._execution_waves() == [
+            ["inflation_agent", "fx_agent", "extra"],
+            ["cross_asset_agent"],
+        ]
+
+    def test_cycle_raises(self, monkeypatch) -> None:
+        monkeypatch.setattr(
+            AgentRegistry, "DEPENDENCIES", {"a": ["b"], "b": ["a"]}
+        )
+        AgentRegistry.register(_TestAgent("a", "A"))
+        AgentRegistry.register(_TestAgent("b", "B"))
+        with pytest.raises(ValueError, match="cycle"):
+            AgentRegistry._execution_waves()
+
+    def test_independent_loads_overlap_and_dependents_wait(self) -> None:
+        barrier = threading.Barrier(2)
+        for aid in ("inflation_agent", "monetary_agent"):
+            agent = _BarrierAgent(aid, aid)
+            agent.barrier = barrier
+            AgentRegistry.register(agent)
+        AgentRegistry.register(_BarrierAgent("cross_asset_agent", "Cross"))
+
+        reports = AgentRegistry.run_all(date(2024, 6, 15), use_processes=False)
+
+        # Both loads passed the 2-party barrier, so they ran concurrently
+        assert list(reports) == ["inflation_agent", "monetary_agent", "cross_asset_agent"]
+        assert _execution_log.index("load:cross_asset_agent") > max(
+            _execution_log.index("inflation_agent"),
+            _execution_log.index("monetary_agent"),
+        )
+
+    def test_stage_timings_reported(self) -> None:
+        AgentRegistry.register(_TestAgent("fx_agent", "FX"))
+        report = AgentRegistry.run_all(date(2024, 6, 15))["fx_agent"]
+        timings = report.model_diagnostics["stage_timings"]
+        assert set(timings) == {
+            "load_data",
+            "compute_features",
+            "run_models",
+            "generate_narrative",
+            "persist_signals",
+        }
+        assert all(t >= 0 for t in timings.values())
+
+    def test_cpu_bound_models_run_in_worker_process(self) -> None:
+        AgentRegistry.register(_CpuAgent("monetary_agent", "Monetary"))
+        AgentRegistry.register(_TestAgent("fx_agent", "FX"))
+
+        reports = AgentRegistry.run_all(date(2024, 6, 15))
+
+        assert reports["monetary_agent"].signals[0].metadata["pid"] != os.getpid()
+        assert "fx_agent" in reports
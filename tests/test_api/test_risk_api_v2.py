@@ -347,3 +347,23 @@ class TestRiskReportBackwardCompat:
         body = resp.json()
         assert body["status"] == "ok"
         assert "data" in body
+
+
+# -----------------------------------------------------------------------
+# Materialized snapshot
+# -----------------------------------------------------------------------
+
+
+class TestRiskSnapshot:
+    """/var, /stress and /dashboard are served from one risk snapshot."""
+
+    def test_endpoints_share_snapshot(self, client: TestClient):
+        """All three endpoints report the same snapshot id and staleness."""
+        metas = [
+            client.get(f"/api/v1/risk/{path}").json()["meta"]
+            for path in ("var", "stress", "dashboard")
+        ]
+        assert len({m["snapshot_id"] for m in metas}) == 1
+        for meta in metas:
+            assert "as_of" in meta
+            assert meta["staleness_seconds"] >= 0.0
@@ -0,0 +1,126 @@
+"""Tests for streamed columnar bulk endpoints (src/api/streaming.py).
+
+Verifies:
+- Columnar JSON chunks concatenate back to the source rows
+- gzip content-encoding when accepted
+- Content negotiation (406 for Arrow without pyarrow, Arrow round-trip with it)
+- GET /market-data/bulk rejects unknown tickers before streaming
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api import streaming
+from src.api.deps import get_db
+from src.api.routes import market_data
+
+ROWS = [
+    ("USDBRL", datetime(2024, 1, 2, tzinfo=timezone.utc), 4.9, 4.95, 4.88, 4.91, None),
+    ("USDBRL", datetime(2024, 1, 3, tzinfo=timezone.utc), 4.91, 4.97, 4.9, 4.93, 10.0),
+    ("VIX", datetime(2024, 1, 2, tzinfo=timezone.utc), 13.0, 14.1, 12.8, 13.2, None),
+]
+
+
+class _FakeSession:
+    """Answers the bulk endpoint's ticker lookup."""
+
+    def __init__(self, tickers: list[str]) -> None:
+        self._tickers = tickers
+
+    async def execute(self, stmt):
+        return SimpleNamespace(
+            scalars=lambda: SimpleNamespace(all=lambda: self._tickers)
+        )
+
+
+@pytest.fixture
+def client(monkeypatch: pytest.MonkeyPatch):
+    """App with the market-data router; DB session and cursor are faked."""
+
+    async def fake_stream_rows(stmt, chunk_rows: int = 2):
+        for i in range(0, len(ROWS), chunk_rows):
+            yield ROWS[i : i + chunk_rows]
+
+    async def fake_db():
+        yield _FakeSession(["USDBRL", "VIX"])
+
+    monkeypatch.setattr(market_data, "stream_rows", fake_stream_rows)
+    app = FastAPI()
+    app.include_router(market_data.router)
+    app.dependency_overrides[get_db] = fake_db
+    with TestClient(app) as c:
+        yield c
+
+
+def _concat(payload: dict) -> dict[str, list]:
+    return {
+        name: [v for chunk in payload["chunks"] for v in chunk[name]]
+        for name in payload["columns"]
+    }
+
+
+class TestBulkMarketData:
+    def test_columnar_json_round_trip(self, client: TestClient) -> None:
+        resp = client.get(
+            "/market-data/bulk",
+            params={"tickers": "USDBRL,VIX"},
+            headers={"Accept-Encoding": "identity"},
+        )
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("application/json")
+
+        payload = resp.json()
+        assert payload["row_count"] == 3
+        assert len(payload["chunks"]) == 2
+        table = _concat(payload)
+        assert table["ticker"] == ["USDBRL", "USDBRL", "VIX"]
+        assert table["close"] == [4.91, 4.93, 13.2]
+        assert table["volume"] == [None, 10.0, None]
+        assert table["timestamp"][0] == ROWS[0][1].isoformat()
+
+    def test_gzip_when_accepted(self, client: TestClient) -> None:
+        with client.stream(
+            "GET",
+            "/market-data/bulk",
+            params={"tickers": "USDBRL,VIX"},
+            headers={"Accept-Encoding": "gzip"},
+        ) as resp:
+            assert resp.headers["content-encoding"] == "gzip"
+            raw = b"".join(resp.iter_raw())
+        assert json.loads(gzip.decompress(raw))["row_count"] == 3
+
+    def test_unknown_ticker_is_404(self, client: TestClient) -> None:
+        resp = client.get("/market-data/bulk", params={"tickers": "USDBRL,NOPE"})
+        assert resp.status_code == 404
+        assert "NOPE" in resp.json()["detail"]
+
+    def test_arrow_without_pyarrow_is_406(
+        self, client: TestClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(streaming, "_ARROW_AVAILABLE", False)
+        resp = client.get(
+            "/market-data/bulk",
+            params={"tickers": "USDBRL"},
+            headers={"Accept": streaming.ARROW_MEDIA_TYPE},
+        )
+        assert resp.status_code == 406
+
+    def test_arrow_round_trip(self, client: TestClient) -> None:
+        pa = pytest.importorskip("pyarrow")
+        resp = client.get(
+            "/market-data/bulk",
+            params={"tickers": "USDBRL,VIX", "format": "arrow"},
+            headers={"Accept-Encoding": "identity"},
+        )
+        assert resp.headers["content-type"] == streaming.ARROW_MEDIA_TYPE
+        table = pa.ipc.open_stream(resp.content).read_all()
+        assert table.num_rows == 3
+        assert table.column("close").to_pylist() == [4.91, 4.93, 13.2]
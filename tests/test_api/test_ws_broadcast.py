@@ -0,0 +1,244 @@
+"""Tests for per-client WebSocket fan-out (src/api/ws_broadcast.py).
+
+Verifies:
+- drop_oldest and coalesce_latest queue policies
+- A stalled client neither delays nor blocks the others
+- Payloads are serialized once per broadcast
+- Failed or stalled sockets are evicted and closed; metrics report depth,
+  drops and latency
+- The pub/sub bridge shares channels across managers, falls back locally
+  and resubscribes after the subscription drops
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from src.api import ws_broadcast
+from src.api.routes.websocket_api import ConnectionManager
+from src.api.ws_broadcast import (
+    COALESCE_LATEST,
+    DROP_OLDEST,
+    EVICT_CLOSE_CODE,
+    ClientQueue,
+    RedisPubSub,
+)
+
+
+class _FakeSocket:
+    """Records sent payloads; ``gate`` (if set) must open before each send."""
+
+    def __init__(self, gate: asyncio.Event | None = None, fail: bool = False) -> None:
+        self.sent: list[str] = []
+        self.gate = gate
+        self.fail = fail
+        self.close_code: int | None = None
+
+    async def accept(self) -> None:
+        pass
+
+    async def close(self, code: int = 1000) -> None:
+        self.close_code = code
+
+    async def send_text(self, payload: str) -> None:
+        if self.fail:
+            raise RuntimeError("socket closed")
+        if self.gate is not None:
+            await self.gate.wait()
+        self.sent.append(payload)
+
+
+class _FakeRedis:
+    """Pattern pub/sub over in-memory queues, shared by several bridges."""
+
+    def __init__(self) -> None:
+        self.subscribers: list[_FakePubSub] = []
+
+    def pubsub(self) -> _FakePubSub:
+        return _FakePubSub(self)
+
+    async def publish(self, channel: str, data: str) -> None:
+        for sub in self.subscribers:
+            sub.queue.put_nowait({"type": "pmessage", "channel": channel, "data": data})
+
+
+class _FakePubSub:
+    def __init__(self, redis: _FakeRedis) -> None:
+        self._redis = redis
+        self.queue: asyncio.Queue = asyncio.Queue()
+
+    async def psubscribe(self, pattern: str) -> None:
+        self._redis.subscribers.append(self)
+
+    async def listen(self):
+        while True:
+            message = await self.queue.get()
+            if message is None:
+                raise ConnectionError("connection lost")
+            yield message
+
+    async def aclose(self) -> None:
+        self._redis.subscribers.remove(self)
+
+
+async def _settle() -> None:
+    """Let writer tasks run until idle."""
+    for _ in range(20):
+        await asyncio.sleep(0)
+
+
+class TestClientQueue:
+    async def test_drop_oldest_keeps_newest(self) -> None:
+        queue = ClientQueue(maxsize=3, policy=DROP_OLDEST)
+        for i in range(5):
+            queue.put(str(i))
+        assert len(queue) == 3
+        assert queue.dropped == 2
+        assert [(await queue.get())[0] for _ in range(3)] == ["2", "3", "4"]
+
+    async def test_coalesce_latest_keeps_one(self) -> None:
+        queue = ClientQueue(maxsize=100, policy=COALESCE_LATEST)
+        for i in range(5):
+            queue.put(str(i))
+        assert len(queue) == 1
+        assert (await queue.get())[0] == "4"
+
+    def test_unknown_policy(self) -> None:
+        with pytest.raises(ValueError):
+            ClientQueue(policy="block")
+
+
+class TestConnectionManager:
+    async def test_slow_client_does_not_stall_others(self) -> None:
+        mgr = ConnectionManager(queue_size=4)
+        gate = asyncio.Event()
+        slow, fast = _FakeSocket(gate=gate), _FakeSocket()
+        await mgr.connect(slow, "signals")
+        await mgr.connect(fast, "signals")
+        await _settle()
+
+        for i in range(10):
+            await mgr.broadcast("signals", {"seq": i})
+            await _settle()  # producer yields between updates
+        await _settle()
+
+        assert len(fast.sent) == 10
+        metrics = mgr.metrics()["channels"]["signals"]
+        assert metrics["queue_depth_max"] == 4
+        assert metrics["dropped"] == 5  # 1 in flight + 4 queued of 10
+        assert metrics["send_latency_ms"]["p50"] is not None
+
+        gate.set()
+        await _settle()
+        assert slow.sent == [f'{{"seq": {i}}}' for i in (0, 6, 7, 8, 9)]
+        mgr.disconnect(slow, "signals")
+        mgr.disconnect(fast, "signals")
+
+    async def test_payload_serialized_once(self) -> None:
+        mgr = ConnectionManager()
+        a, b = _FakeSocket(), _FakeSocket()
+        await mgr.connect(a, "alerts")
+        await mgr.connect(b, "alerts")
+        await mgr.broadcast("alerts", {"type": "risk_breach"})
+        await _settle()
+        assert a.sent[0] is b.sent[0]
+
+    async def test_portfolio_coalesces(self) -> None:
+        mgr = ConnectionManager()
+        gate = asyncio.Event()
+        sock = _FakeSocket(gate=gate)
+        await mgr.connect(sock, "portfolio")
+        await _settle()
+        for i in range(5):
+            await mgr.broadcast("portfolio", {"nav": i})
+            await _settle()
+        await _settle()
+        gate.set()
+        await _settle()
+        assert sock.sent == ['{"nav": 0}', '{"nav": 4}']
+        assert mgr.metrics()["channels"]["portfolio"]["policy"] == COALESCE_LATEST
+
+    async def test_failed_socket_is_evicted(self) -> None:
+        mgr = ConnectionManager()
+        await mgr.connect(_FakeSocket(fail=True), "alerts")
+        await mgr.broadcast("alerts", {"x": 1})
+        await _settle()
+        assert mgr.channel_counts == {"alerts": 0}
+        assert mgr.metrics()["channels"]["alerts"]["evicted_clients"] == 1
+
+    async def test_stalled_socket_is_evicted_and_closed(self, monkeypatch) -> None:
+        monkeypatch.setattr(ws_broadcast, "SEND_TIMEOUT_SECONDS", 0.01)
+        mgr = ConnectionManager()
+        stalled = _FakeSocket(gate=asyncio.Event())  # never opens
+        await mgr.connect(stalled, "signals")
+        await mgr.broadcast("signals", {"x": 1})
+        await asyncio.sleep(0.05)
+        await _settle()
+        assert mgr.channel_counts == {"signals": 0}
+        assert stalled.close_code == EVICT_CLOSE_CODE
+        assert mgr.metrics()["channels"]["signals"]["evicted_clients"] == 1
+
+
+class TestBridge:
+    async def test_redis_bridge_shares_channels(self) -> None:
+        redis = _FakeRedis()
+        worker_a, worker_b = ConnectionManager(), ConnectionManager()
+        await worker_a.start_bridge(RedisPubSub(redis))
+        await worker_b.start_bridge(RedisPubSub(redis))
+        sock = _FakeSocket()
+        await worker_b.connect(sock, "signals")
+
+        await worker_a.broadcast("signals", {"signal": "long"})
+        await _settle()
+        assert sock.sent == ['{"signal": "long"}']
+        assert worker_a.metrics()["bridge"] == "RedisPubSub"
+
+        await worker_a.stop_bridge()
+        await worker_b.stop_bridge()
+        worker_b.disconnect(sock, "signals")
+
+    async def test_unreachable_redis_falls_back_to_local(self) -> None:
+        class _DownRedis(_FakeRedis):
+            def pubsub(self):
+                raise ConnectionError("refused")
+
+        mgr = ConnectionManager()
+        await mgr.start_bridge(RedisPubSub(_DownRedis()))
+        sock = _FakeSocket()
+        await mgr.connect(sock, "alerts")
+        await mgr.broadcast("alerts", {"x": 1})
+        await _settle()
+        assert mgr.metrics()["bridge"] == "LocalPubSub"
+        assert sock.sent == ['{"x": 1}']
+        mgr.disconnect(sock, "alerts")
+
+    async def test_dropped_subscription_resubscribes(self, monkeypatch) -> None:
+        monkeypatch.setattr(ws_broadcast, "BRIDGE_RETRY_SECONDS", 0.01)
+        redis = _FakeRedis()
+        mgr = ConnectionManager()
+        bridge = RedisPubSub(redis)
+        await mgr.start_bridge(bridge)
+        sock = _FakeSocket()
+        await mgr.connect(sock, "alerts")
+
+        # Drop the subscription: its listener sees an error message
+        (sub,) = redis.subscribers
+        sub.queue.put_nowait(None)
+        await _settle()
+        metrics = mgr.metrics()
+        assert metrics["bridge_healthy"] is False
+        await mgr.broadcast("alerts", {"during": "outage"})  # delivered locally
+
+        await asyncio.sleep(0.05)
+        await _settle()
+        metrics = mgr.metrics()
+        assert metrics["bridge_healthy"] is True
+        assert metrics["bridge_reconnects"] == 1
+        await mgr.broadcast("alerts", {"after": "reconnect"})
+        await _settle()
+        assert sock.sent == ['{"during": "outage"}', '{"after": "reconnect"}']
+
+        await mgr.stop_bridge()
+        mgr.disconnect(sock, "alerts")
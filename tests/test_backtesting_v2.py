@@ -358,3 +358,121 @@ class TestBacktestConfigV2:
         )
         with pytest.raises((AttributeError, TypeError)):
             c.initial_capital = 2e6  # type: ignore[misc]
+
+
+# ---------------------------------------------------------------------------
+# Parallel walk-forward tests
+# ---------------------------------------------------------------------------
+class ConstantPriceLoader:
+    """Picklable loader with a deterministic upward-drifting close series."""
+
+    def get_market_data(self, ticker, as_of_date, lookback_days=756):
+        dates = pd.bdate_range(end=pd.Timestamp(as_of_date), periods=5)
+        base = (pd.Timestamp(as_of_date) - pd.Timestamp("2020-01-01")).days
+        return pd.DataFrame({"close": 100.0 + base * 0.05 + np.arange(5)}, index=dates)
+
+
+class ParamStrategy:
+    """Strategy whose weight depends on a tunable attribute."""
+
+    def __init__(self):
+        self.strategy_id = "PARAM"
+        self.scale = 0.1
+
+    def generate_signals(self, as_of_date: date) -> dict[str, float]:
+        return {"IBOVESPA": self.scale}
+
+
+class PreloadingLoader(ConstantPriceLoader):
+    """ConstantPriceLoader that records the tickers it served."""
+
+    def __init__(self):
+        self.loaded: list[str] = []
+
+    def preload(self, **kwargs):
+        pass
+
+    def get_market_data(self, ticker, as_of_date, lookback_days=756):
+        self.loaded.append(ticker)
+        return super().get_market_data(ticker, as_of_date, lookback_days)
+
+
+class LoaderStrategy(ParamStrategy):
+    """ParamStrategy reading through its own ``data_loader``."""
+
+    seen_loaders: list = []  # class-level: survives the per-trial copies
+
+    def __init__(self, data_loader):
+        super().__init__()
+        self.data_loader = data_loader
+
+    def generate_signals(self, as_of_date: date) -> dict[str, float]:
+        LoaderStrategy.seen_loaders.append(self.data_loader)
+        self.data_loader.get_market_data("IBOVESPA", as_of_date)
+        return super().generate_signals(as_of_date)
+
+
+class TestWalkForwardParallel:
+    @pytest.fixture
+    def wf_config(self):
+        return BacktestConfig(
+            start_date=date(2021, 1, 1),
+            end_date=date(2023, 1, 1),
+            initial_capital=1_000_000.0,
+            rebalance_frequency="monthly",
+            walk_forward_train_months=12,
+            walk_forward_test_months=6,
+        )
+
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_matches_serial(self, wf_config, max_workers):
+        grid = {"scale": [0.1, 0.5, 0.9]}
+        engine = BacktestEngine(wf_config, ConstantPriceLoader())
+        serial = engine.walk_forward_validation(ParamStrategy(), grid)
+        run = engine.walk_forward_parallel(ParamStrategy(), grid, max_workers)
+
+        assert len(run.windows) == len(serial) > 0
+        for fast, slow in zip(run.windows, serial):
+            assert set(fast) == set(slow)
+            assert fast["params_used"] == slow["params_used"]
+            assert fast["in_sample_sharpe"] == pytest.approx(slow["in_sample_sharpe"])
+            assert fast["out_of_sample_sharpe"] == pytest.approx(
+                slow["out_of_sample_sharpe"]
+            )
+
+    def test_timing_and_trials(self, wf_config):
+        engine = BacktestEngine(wf_config, ConstantPriceLoader())
+        run = engine.walk_forward_parallel(
+            ParamStrategy(), {"scale": [0.1, 0.2]}, max_workers=1
+        )
+        n_windows = len(run.windows)
+        assert len([t for t in run.trials if t["phase"] == "train"]) == 2 * n_windows
+        assert len([t for t in run.trials if t["phase"] == "test"]) == n_windows
+        assert all(t["elapsed_seconds"] >= 0 for t in run.trials)
+        assert run.wall_clock_seconds > 0
+
+    def test_strategy_not_mutated(self, wf_config):
+        strategy = ParamStrategy()
+        engine = BacktestEngine(wf_config, ConstantPriceLoader())
+        engine.walk_forward_parallel(strategy, {"scale": [0.7]}, max_workers=1)
+        assert strategy.scale == 0.1
+
+    def test_trials_share_loader(self, wf_config):
+        loader = PreloadingLoader()
+        LoaderStrategy.seen_loaders = []
+        engine = BacktestEngine(wf_config, loader)
+        engine.walk_forward_parallel(LoaderStrategy(loader), {"scale": [0.1]}, max_workers=1)
+        assert LoaderStrategy.seen_loaders
+        assert all(seen is loader for seen in LoaderStrategy.seen_loaders)
+
+    def test_warm_up_fills_shared_loader(self):
+        from src.backtesting.parallel import _warm_loader
+
+        loader = PreloadingLoader()
+        _warm_loader(LoaderStrategy(loader), loader, date(2023, 1, 1))
+        assert loader.loaded == ["IBOVESPA"]
+
+    def test_no_windows(self, base_config):
+        engine = BacktestEngine(base_config, ConstantPriceLoader())
+        run = engine.walk_forward_parallel(ParamStrategy(), max_workers=1)
+        assert run.windows == []
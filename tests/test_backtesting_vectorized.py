@@ -0,0 +1,198 @@
+"""Tests for the vectorized fast-path backtester.
+
+Covers:
+- Equivalence with the event-driven BacktestEngine.run (equity + trades)
+- Per-instrument costs from TransactionCostModel
+- Turnover/costs series and blotter structure
+- No-signal rows and exits of instruments dropped from the targets
+- Dates whose signal generation fails are skipped on both paths
+"""
+
+from __future__ import annotations
+
+from datetime import date
+from unittest.mock import MagicMock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.backtesting.costs import TransactionCostModel
+from src.backtesting.engine import BacktestConfig, BacktestEngine
+from src.backtesting.vectorized import (
+    BLOTTER_COLUMNS,
+    EQUIVALENCE_RTOL,
+    run_vectorized,
+)
+
+TICKERS = ["IBOVESPA", "USDBRL", "DI_PRE_365"]
+
+
+def _price_panel() -> pd.DataFrame:
+    dates = pd.bdate_range("2023-01-02", "2023-12-29")
+    rng = np.random.RandomState(7)
+    data = {t: 100.0 * np.exp(np.cumsum(rng.randn(len(dates)) * 0.01)) for t in TICKERS}
+    return pd.DataFrame(data, index=dates)
+
+
+@pytest.fixture
+def panel() -> pd.DataFrame:
+    return _price_panel()
+
+
+@pytest.fixture
+def loader(panel: pd.DataFrame) -> MagicMock:
+    """Loader whose get_market_data slices the panel PIT-style."""
+
+    def get_market_data(ticker, as_of_date, lookback_days=756):
+        col = panel[ticker]
+        window = col[
+            (col.index >= pd.Timestamp(as_of_date) - pd.Timedelta(days=lookback_days))
+            & (col.index <= pd.Timestamp(as_of_date))
+        ]
+        return pd.DataFrame({"close": window})
+
+    mock = MagicMock()
+    mock.get_market_data.side_effect = get_market_data
+    return mock
+
+
+class RotatingStrategy:
+    """Changes weights every date and drops USDBRL on odd months."""
+
+    strategy_id = "ROTATING"
+
+    def generate_signals(self, as_of_date: date) -> dict[str, float]:
+        if as_of_date.month == 6:
+            return {}
+        weights = {
+            "IBOVESPA": 0.2 + 0.05 * (as_of_date.month % 3),
+            "DI_PRE_365": -0.3 if as_of_date.day % 2 else 0.4,
+        }
+        if as_of_date.month % 2 == 0:
+            weights["USDBRL"] = 0.5
+        return weights
+
+
+class FlakyStrategy(RotatingStrategy):
+    """RotatingStrategy whose signal generation fails on some dates."""
+
+    strategy_id = "FLAKY"
+
+    def generate_signals(self, as_of_date: date) -> dict[str, float]:
+        if as_of_date.month in (3, 9) and as_of_date.day > 14:
+            raise RuntimeError("data unavailable")
+        return super().generate_signals(as_of_date)
+
+
+def _config(**kwargs) -> BacktestConfig:
+    params = dict(
+        start_date=date(2023, 1, 1),
+        end_date=date(2023, 12, 31),
+        initial_capital=1_000_000.0,
+        rebalance_frequency="weekly",
+        max_leverage=1.0,
+    )
+    params.update(kwargs)
+    return BacktestConfig(**params)
+
+
+class TestEquivalence:
+    @pytest.mark.parametrize(
+        "cost_model", [None, TransactionCostModel()], ids=["flat", "per_instrument"]
+    )
+    @pytest.mark.parametrize("strategy_cls", [RotatingStrategy, FlakyStrategy])
+    def test_matches_event_driven_run(self, loader, cost_model, strategy_cls) -> None:
+        config = _config(cost_model=cost_model)
+        strategy = strategy_cls()
+
+        event = BacktestEngine(config, loader).run(strategy)
+
+        engine = BacktestEngine(config, loader)
+        weights = engine.build_weight_matrix(strategy)
+        fast = engine.run_vectorized(weights, strategy_id=strategy.strategy_id)
+
+        event_eq = np.array([e for _, e in event.equity_curve])
+        fast_eq = np.array([e for _, e in fast.equity_curve])
+        assert [d for d, _ in event.equity_curve] == [d for d, _ in fast.equity_curve]
+        np.testing.assert_allclose(fast_eq, event_eq, rtol=EQUIVALENCE_RTOL)
+        assert fast.total_trades == event.total_trades
+        assert fast.sharpe_ratio == pytest.approx(event.sharpe_ratio)
+        assert fast.win_rate == pytest.approx(event.win_rate)
+
+    def test_blotter_matches_trade_log(self, loader) -> None:
+        from src.backtesting.portfolio import Portfolio
+
+        config = _config()
+        engine = BacktestEngine(config, loader)
+        strategy = RotatingStrategy()
+        weights = engine.build_weight_matrix(strategy)
+        prices = engine.build_price_matrix(list(weights.columns), weights.index)
+        run = run_vectorized(weights, prices, config)
+
+        # Replay the event path to obtain its trade log
+        portfolio = Portfolio(config.initial_capital)
+        replay = BacktestEngine(config, loader)
+        for as_of in replay._get_rebalance_dates():
+            target = strategy.generate_signals(as_of)
+            if not target:
+                continue
+            px = replay._get_prices(as_of, list(target))
+            portfolio.mark_to_market(px)
+            portfolio._rebalance_date = as_of
+            portfolio.rebalance(target, px, config)
+
+        expected = sorted(
+            (t["date"], t["ticker"], t["direction"], t["trade_notional"])
+            for t in portfolio.trade_log
+        )
+        actual = sorted(
+            zip(
+                run.blotter["date"],
+                run.blotter["ticker"],
+                run.blotter["direction"],
+                run.blotter["trade_notional"],
+            )
+        )
+        assert len(actual) == len(expected)
+        for (d1, t1, dir1, n1), (d2, t2, dir2, n2) in zip(actual, expected):
+            assert (d1, t1, dir1) == (d2, t2, dir2)
+            assert n1 == pytest.approx(n2, abs=0.02)
+
+
+class TestVectorizedRun:
+    def test_turnover_and_costs(self, panel) -> None:
+        config = _config(transaction_cost_bps=5.0, slippage_bps=2.0)
+        dates = panel.index[:3]
+        weights = pd.DataFrame(
+            {"IBOVESPA": [0.5, 0.5, np.nan], "USDBRL": [np.nan, np.nan, 0.1]},
+            index=dates,
+        )
+        run = run_vectorized(weights, panel, config)
+
+        assert run.turnover.iloc[0] == pytest.approx(0.5)
+        assert run.costs.iloc[0] == pytest.approx(500_000.0 * 7 / 10_000)
+        assert list(run.blotter.columns) == BLOTTER_COLUMNS
+        exits = run.blotter[run.blotter["direction"] == "EXIT"]
+        assert list(exits["ticker"]) == ["IBOVESPA"]
+        assert run.positions.iloc[-1]["IBOVESPA"] == 0.0
+
+    def test_no_signal_row_keeps_equity(self, panel) -> None:
+        config = _config()
+        dates = panel.index[:3]
+        weights = pd.DataFrame(
+            {"IBOVESPA": [np.nan, np.nan, np.nan], "USDBRL": [np.nan] * 3},
+            index=dates,
+        )
+        run = run_vectorized(weights, panel, config)
+        assert (run.equity == config.initial_capital).all()
+        assert run.blotter.empty
+
+    def test_leverage_cap(self, panel) -> None:
+        config = _config(max_leverage=1.0, transaction_cost_bps=0.0, slippage_bps=0.0)
+        weights = pd.DataFrame(
+            {"IBOVESPA": [1.5], "USDBRL": [-0.5]}, index=panel.index[:1]
+        )
+        run = run_vectorized(weights, panel, config)
+        assert run.positions.iloc[0]["IBOVESPA"] == pytest.approx(750_000.0)
+        assert run.positions.iloc[0]["USDBRL"] == pytest.approx(-250_000.0)
@@ -0,0 +1,153 @@
+"""Tests for the materialized, version-keyed RiskSnapshotService.
+
+Covers coalescing of concurrent requests, recompute on version change or
+age, and sharing snapshots across services through the PMS cache.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+
+from src.cache.risk_snapshot import RiskSnapshot, RiskSnapshotService
+
+
+class FakeCache:
+    """In-memory stand-in for the PMSCache methods the service uses."""
+
+    def __init__(self) -> None:
+        self.versions = {"book": 0, "price": 0}
+        self.snapshot: dict | None = None
+
+    async def get_versions(self) -> dict:
+        return dict(self.versions)
+
+    async def get_risk_snapshot(self) -> dict | None:
+        return self.snapshot
+
+    async def set_risk_snapshot(self, data: dict) -> None:
+        self.snapshot = data
+
+
+def _counting_compute(gate: threading.Event | None = None):
+    calls = {"n": 0}
+
+    def compute() -> dict:
+        if gate is not None:
+            gate.wait(timeout=5)
+        calls["n"] += 1
+        return {"var": {"results": {"n": calls["n"]}}}
+
+    return compute, calls
+
+
+class TestRiskSnapshotService:
+    def test_concurrent_requests_coalesce(self) -> None:
+        gate = threading.Event()
+        compute, calls = _counting_compute(gate)
+        service = RiskSnapshotService(compute)
+
+        async def scenario() -> list[RiskSnapshot]:
+            tasks = [asyncio.create_task(service.get()) for _ in range(8)]
+            await asyncio.sleep(0.05)
+            gate.set()
+            return await asyncio.gather(*tasks)
+
+        snapshots = asyncio.run(scenario())
+        assert calls["n"] == 1
+        assert len({s.snapshot_id for s in snapshots}) == 1
+
+    def test_reads_until_version_changes(self) -> None:
+        compute, calls = _counting_compute()
+        cache = FakeCache()
+
+        async def factory() -> FakeCache:
+            return cache
+
+        service = RiskSnapshotService(compute, cache_factory=factory)
+
+        async def scenario() -> tuple:
+            first = await service.get()
+            again = await service.get()
+            cache.versions["book"] += 1
+            changed = await service.get()
+            return first, again, changed
+
+        first, again, changed = asyncio.run(scenario())
+        assert again is first
+        assert changed.version == "1.0" and changed is not first
+        assert calls["n"] == 2
+        assert service.computations == 2
+
+    def test_local_epoch_versions_without_redis(self) -> None:
+        compute, calls = _counting_compute()
+        service = RiskSnapshotService(compute)
+
+        async def scenario() -> tuple:
+            first = await service.get()
+            service.notify_book_changed()
+            return first, await service.get()
+
+        first, changed = asyncio.run(scenario())
+        assert first.version == "local:0"
+        assert changed.version == "local:1"
+        assert calls["n"] == 2
+
+    def test_notify_does_not_split_shared_version(self) -> None:
+        cache = FakeCache()
+        cache.versions = {"book": 5, "price": 0}
+
+        async def factory() -> FakeCache:
+            return cache
+
+        compute_a, calls_a = _counting_compute()
+        compute_b, calls_b = _counting_compute()
+        writer = RiskSnapshotService(compute_a, cache_factory=factory)
+        reader = RiskSnapshotService(compute_b, cache_factory=factory)
+
+        async def scenario() -> tuple:
+            writer.notify_book_changed()
+            return await writer.get(), await reader.get()
+
+        produced, read = asyncio.run(scenario())
+        assert calls_a["n"] + calls_b["n"] == 1
+        assert read.snapshot_id == produced.snapshot_id
+
+    def test_stale_snapshot_recomputed(self) -> None:
+        compute, calls = _counting_compute()
+        service = RiskSnapshotService(compute, max_age_seconds=0.0)
+
+        async def scenario() -> None:
+            await service.get()
+            await service.get()
+
+        asyncio.run(scenario())
+        assert calls["n"] == 2
+
+    def test_shared_snapshot_reused_by_other_process(self) -> None:
+        cache = FakeCache()
+
+        async def factory() -> FakeCache:
+            return cache
+
+        compute_a, calls_a = _counting_compute()
+        compute_b, calls_b = _counting_compute()
+        producer = RiskSnapshotService(compute_a, cache_factory=factory)
+        reader = RiskSnapshotService(compute_b, cache_factory=factory)
+
+        async def scenario() -> tuple:
+            return await producer.get(), await reader.get()
+
+        produced, read = asyncio.run(scenario())
+        assert calls_a["n"] == 1 and calls_b["n"] == 0
+        assert read.snapshot_id == produced.snapshot_id
+        assert read.payload == produced.payload
+
+    def test_meta_reports_staleness(self) -> None:
+        compute, _ = _counting_compute()
+        snapshot = asyncio.run(RiskSnapshotService(compute).get())
+        meta = snapshot.meta()
+        assert meta["snapshot_id"] == snapshot.snapshot_id
+        assert meta["book_version"] == "local:0"
+        assert meta["staleness_seconds"] >= 0.0
+        assert RiskSnapshot.from_dict(snapshot.to_dict()) == snapshot
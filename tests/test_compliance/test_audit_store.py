@@ -0,0 +1,297 @@
+"""Tests for the segmented, indexed audit store behind AuditLogger.
+
+Covers daily segment rotation, sidecar index catch-up across store
+instances, filtered newest-first queries, legacy single-file trails,
+checksum chain verification and concurrent writers.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.compliance.audit import AuditLogger, _compute_checksum
+from src.compliance.audit_store import SegmentedAuditStore, shared_store
+
+DAY1 = datetime(2026, 2, 20, 9, 0, tzinfo=timezone.utc)
+
+
+def _record(
+    when: datetime,
+    event_type: str = "MTM_UPDATE",
+    entity_id: str = "portfolio",
+    severity: str = "INFO",
+) -> dict:
+    return {
+        "event_timestamp": when.isoformat(),
+        "event_type": event_type,
+        "entity_type": "position",
+        "entity_id": entity_id,
+        "user": "system",
+        "action": f"{event_type} {entity_id}",
+        "before_state": None,
+        "after_state": {"at": when.isoformat()},
+        "metadata": {},
+        "severity": severity,
+    }
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = SegmentedAuditStore(tmp_path)
+    yield store
+    store.close()
+
+
+def _fill(store: SegmentedAuditStore) -> list[dict]:
+    """Three days of events: 3 on day 1, 2 on day 2, 3 on day 3."""
+    records = []
+    for day, kinds in enumerate(
+        [
+            [("POSITION_OPEN", "1", "INFO"), ("MTM_UPDATE", "1", "INFO"), ("RISK_BREACH", "p", "CRITICAL")],
+            [("MTM_UPDATE", "1", "INFO"), ("POSITION_OPEN", "2", "INFO")],
+            [("MTM_UPDATE", "2", "INFO"), ("RISK_BREACH", "p", "CRITICAL"), ("MTM_UPDATE", "1", "WARNING")],
+        ]
+    ):
+        for k, (event_type, entity_id, severity) in enumerate(kinds):
+            record = _record(DAY1 + timedelta(days=day, hours=k), event_type, entity_id, severity)
+            store.append(record, _compute_checksum)
+            records.append(record)
+    return records
+
+
+class TestSegments:
+    def test_rotates_daily(self, store, tmp_path) -> None:
+        _fill(store)
+        assert [p.name for p in store.segments()] == [
+            "audit-20260220.jsonl",
+            "audit-20260221.jsonl",
+            "audit-20260222.jsonl",
+        ]
+        lines = (tmp_path / "audit-20260221.jsonl").read_text().splitlines()
+        assert [json.loads(line)["event_type"] for line in lines] == [
+            "MTM_UPDATE",
+            "POSITION_OPEN",
+        ]
+
+    def test_append_straddling_midnight(self, tmp_path) -> None:
+        midnight = datetime(2026, 2, 21, tzinfo=timezone.utc)
+        early, late = SegmentedAuditStore(tmp_path), SegmentedAuditStore(tmp_path)
+        early.append(_record(midnight - timedelta(hours=1)), _compute_checksum)
+        # Stamped either side of midnight; the later stamp is written first
+        after = _record(midnight + timedelta(milliseconds=1), entity_id="after")
+        before = _record(midnight - timedelta(milliseconds=1), entity_id="before")
+        late.append(after, _compute_checksum)
+        early.append(before, _compute_checksum)
+        early.close()
+        late.close()
+
+        assert before["prev_checksum"] == after["checksum"]
+        lines = (tmp_path / "audit-20260221.jsonl").read_text().splitlines()
+        assert [json.loads(line)["entity_id"] for line in lines] == ["after", "before"]
+        reader = SegmentedAuditStore(tmp_path)
+        assert reader.verify(_compute_checksum)["valid"] is True
+        assert reader.query({"entity_id": "before"})[0]["checksum"] == before["checksum"]
+
+    def test_chain_crosses_segments(self, store) -> None:
+        records = _fill(store)
+        assert records[0]["prev_checksum"] is None
+        for prev, record in zip(records, records[1:]):
+            assert record["prev_checksum"] == prev["checksum"]
+
+
+class TestSidecarIndex:
+    def test_second_instance_catches_up(self, store, tmp_path) -> None:
+        records = _fill(store)
+        assert len(store.query({}, limit=100)) == len(records)
+        sidecar = tmp_path / "audit-20260222.jsonl.idx"
+        before = sidecar.read_bytes()
+
+        # Another process appends to today's segment after the index was built
+        other = SegmentedAuditStore(tmp_path)
+        late = _record(DAY1 + timedelta(days=2, hours=5), "TRADE_APPROVED", "9")
+        other.append(late, _compute_checksum)
+        other.close()
+        assert late["prev_checksum"] == records[-1]["checksum"]
+
+        reader = SegmentedAuditStore(tmp_path)
+        hits = reader.query({"event_type": "TRADE_APPROVED"})
+        assert [r["checksum"] for r in hits] == [late["checksum"]]
+        assert len(reader.query({}, limit=100)) == len(records) + 1
+
+        # The catch-up appended one chunk; the existing sidecar is untouched
+        after = sidecar.read_bytes()
+        assert after.startswith(before)
+        assert len(after.splitlines()) == len(before.splitlines()) + 1
+        chunk = json.loads(after.splitlines()[-1])
+        assert len(chunk["entries"]) == 1
+
+    def test_sidecar_reused_without_rescanning(self, store, tmp_path, monkeypatch) -> None:
+        _fill(store)
+        store.query({}, limit=100)
+
+        reader = SegmentedAuditStore(tmp_path)
+        monkeypatch.setattr(
+            SegmentedAuditStore,
+            "_catch_up",
+            staticmethod(lambda path, index: pytest.fail(f"rescanned {path.name}")),
+        )
+        assert len(reader.query({"event_type": "MTM_UPDATE"}, limit=100)) == 4
+
+    def test_corrupt_sidecar_is_rebuilt(self, store, tmp_path) -> None:
+        _fill(store)
+        store.query({}, limit=100)
+        (tmp_path / "audit-20260220.jsonl.idx").write_text("{not json")
+
+        reader = SegmentedAuditStore(tmp_path)
+        assert len(reader.query({}, limit=100)) == 8
+        header = (tmp_path / "audit-20260220.jsonl.idx").read_text().splitlines()[0]
+        assert json.loads(header) == {"version": 2}
+
+
+class TestQuery:
+    def test_filters(self, store) -> None:
+        _fill(store)
+        assert len(store.query({"event_type": "MTM_UPDATE"})) == 4
+        assert len(store.query({"entity_id": "1"})) == 4
+        assert len(store.query({"severity": "CRITICAL"})) == 2
+        hits = store.query({"event_type": "MTM_UPDATE", "entity_id": "1"})
+        assert [r["severity"] for r in hits] == ["WARNING", "INFO", "INFO"]
+        assert store.query({"event_type": "EMERGENCY_STOP"}) == []
+
+    def test_newest_first_with_limit(self, store) -> None:
+        records = _fill(store)
+        hits = store.query({"event_type": "MTM_UPDATE"}, limit=2)
+        assert [r["checksum"] for r in hits] == [records[7]["checksum"], records[5]["checksum"]]
+
+    def test_time_range(self, store) -> None:
+        records = _fill(store)
+        start = (DAY1 + timedelta(days=1)).timestamp()
+        end = (DAY1 + timedelta(days=2, hours=1)).timestamp()
+        hits = store.query({}, start=start, end=end, limit=100)
+        assert [r["checksum"] for r in hits] == [r["checksum"] for r in reversed(records[3:7])]
+
+    def test_limit_stops_before_older_segments(self, store, monkeypatch) -> None:
+        _fill(store)
+        visited = []
+        original = SegmentedAuditStore._index
+
+        def spy(self, path):
+            visited.append(path.name)
+            return original(self, path)
+
+        monkeypatch.setattr(SegmentedAuditStore, "_index", spy)
+        assert len(store.query({}, limit=3)) == 3
+        assert visited == ["audit-20260222.jsonl"]
+
+        visited.clear()
+        start = (DAY1 + timedelta(days=2)).timestamp()
+        assert len(store.query({"event_type": "POSITION_OPEN"}, start=start)) == 0
+        assert visited == ["audit-20260222.jsonl", "audit-20260221.jsonl"]
+
+
+class TestAuditLogger:
+    def test_reads_legacy_single_file(self, tmp_path) -> None:
+        legacy = []
+        for k in range(3):
+            record = _record(DAY1 - timedelta(days=30 - k), entity_id=f"old-{k}")
+            record["checksum"] = _compute_checksum(record)  # pre-chaining
+            legacy.append(record)
+        (tmp_path / "audit.jsonl").write_text(
+            "".join(json.dumps(r) + "\n" for r in legacy)
+        )
+
+        audit = AuditLogger(audit_dir=str(tmp_path))
+        try:
+            new = audit.log_event("POSITION_OPEN", "position", "new", "system", "opened")
+            trail = audit.get_audit_trail(limit=10)
+            assert [r["entity_id"] for r in trail] == ["new", "old-2", "old-1", "old-0"]
+            assert new["prev_checksum"] == legacy[-1]["checksum"]
+            assert audit.get_audit_trail(entity_id="old-1")[0]["checksum"] == legacy[1]["checksum"]
+            assert audit.verify_chain() == {"valid": True, "records": 4, "errors": []}
+        finally:
+            audit.close()
+
+    def test_verify_chain_detects_tampering(self, tmp_path) -> None:
+        audit = AuditLogger(audit_dir=str(tmp_path))
+        try:
+            for k in range(4):
+                audit.log_event("MTM_UPDATE", "position", str(k), "system", "marked")
+            assert audit.verify_chain()["valid"] is True
+        finally:
+            audit.close()
+
+        (segment,) = tmp_path.glob("audit-*.jsonl")
+        lines = segment.read_text().splitlines()
+        record = json.loads(lines[1])
+        record["user"] = "intruder"
+        lines[1] = json.dumps(record)
+        segment.write_text("\n".join(lines) + "\n")
+
+        result = AuditLogger(audit_dir=str(tmp_path)).verify_chain()
+        assert result["valid"] is False
+        assert result["records"] == 4
+        assert result["errors"] == [
+            {"segment": segment.name, "line": 2, "error": "checksum mismatch"}
+        ]
+
+    def test_verify_chain_detects_removed_record(self, tmp_path) -> None:
+        audit = AuditLogger(audit_dir=str(tmp_path))
+        try:
+            for k in range(3):
+                audit.log_event("MTM_UPDATE", "position", str(k), "system", "marked")
+        finally:
+            audit.close()
+
+        (segment,) = tmp_path.glob("audit-*.jsonl")
+        lines = segment.read_text().splitlines()
+        segment.write_text(lines[0] + "\n" + lines[2] + "\n")
+
+        result = AuditLogger(audit_dir=str(tmp_path)).verify_chain()
+        assert result["valid"] is False
+        assert result["errors"] == [
+            {"segment": segment.name, "line": 2, "error": "broken chain link"}
+        ]
+
+
+def _run_writers(targets: list) -> None:
+    threads = [threading.Thread(target=t) for t in targets]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+
+class TestConcurrentWriters:
+    def test_independent_stores_keep_one_chain(self, tmp_path) -> None:
+        stores = [SegmentedAuditStore(tmp_path) for _ in range(4)]
+
+        def write(store: SegmentedAuditStore, n: int) -> None:
+            for k in range(200):
+                store.append(_record(DAY1 + timedelta(seconds=k), entity_id=f"{n}-{k}"), _compute_checksum)
+
+        _run_writers([lambda s=s, n=n: write(s, n) for n, s in enumerate(stores)])
+        for store in stores:
+            store.close()
+        assert SegmentedAuditStore(tmp_path).verify(_compute_checksum) == {
+            "valid": True,
+            "records": 800,
+            "errors": [],
+        }
+
+    def test_per_call_loggers_share_store_and_chain(self, tmp_path) -> None:
+        assert AuditLogger(audit_dir=str(tmp_path))._store is shared_store(tmp_path)
+
+        def write(n: int) -> None:
+            for k in range(200):
+                AuditLogger(audit_dir=str(tmp_path)).log_event(
+                    "MTM_UPDATE", "position", f"{n}-{k}", "system", "marked"
+                )
+
+        _run_writers([lambda n=n: write(n) for n in range(4)])
+        result = AuditLogger(audit_dir=str(tmp_path)).verify_chain()
+        shared_store(tmp_path).close()
+        assert result == {"valid": True, "records": 800, "errors": []}
@@ -4,6 +4,8 @@ All external dependencies (DB, agents, strategies, risk) are mocked so that
 tests run without a database or live services.
 """
 
+import threading
+import time
 import uuid
 from datetime import date
 from unittest.mock import patch
@@ -325,3 +327,101 @@ class TestFullPipelineRun:
         for step_name in expected_steps:
             assert step_name in result.step_timings
             assert result.step_timings[step_name] >= 0.0
+
+
+# ---------------------------------------------------------------------------
+# Test parallel strategy fan-out
+# ---------------------------------------------------------------------------
+_release_slow = threading.Event()
+_release_hung = threading.Event()
+_pair_barrier = threading.Barrier(2)
+
+
+def _fake_strategy(behaviour: str):
+    class _Strategy:
+        def __init__(self, data_loader):
+            self.data_loader = data_loader
+
+        def generate_signals(self, as_of_date):
+            if behaviour == "fail":
+                raise RuntimeError("boom")
+            if behaviour == "slow":
+                _release_slow.wait(timeout=10)
+            if behaviour == "hung":
+                _release_hung.wait(timeout=30)
+            if behaviour == "pair":
+                _pair_barrier.wait(timeout=5)
+            return [f"{behaviour}_position"]
+
+    return _Strategy
+
+
+class TestStrategyFanOut:
+    """Bounded-concurrency strategy step with timeouts and isolation."""
+
+    def test_isolation_timeout_and_latency_table(self):
+        strategies = {
+            "PAIR_A": _fake_strategy("pair"),
+            "FAILS": _fake_strategy("fail"),
+            "SLOW": _fake_strategy("slow"),
+            "PAIR_B": _fake_strategy("pair"),
+        }
+        pipeline = DailyPipeline(
+            as_of_date=date(2024, 1, 15),
+            dry_run=True,
+            strategy_workers=4,
+            strategy_timeout=0.2,
+        )
+        try:
+            with patch("src.pipeline.daily_pipeline.ALL_STRATEGIES", strategies):
+                pipeline._step_strategies()
+        finally:
+            _release_slow.set()
+
+        # PAIR_A / PAIR_B met at a 2-party barrier -> they ran concurrently
+        assert pipeline._strategy_positions == ["pair_position", "pair_position"]
+        rows = {r["strategy_id"]: r for r in pipeline._result.strategy_latency}
+        assert rows["FAILS"]["status"] == "failed"
+        assert rows["SLOW"]["status"] == "timeout"
+        assert rows["PAIR_A"] == {**rows["PAIR_A"], "status": "ok", "positions": 1}
+        seconds = [r["seconds"] for r in pipeline._result.strategy_latency]
+        assert seconds == sorted(seconds, reverse=True)
+        assert "2 failed/timed out" in pipeline._step_details["strategies"]
+
+    def test_step_deadline_covers_strategies_queued_behind_hung_workers(self):
+        strategies = {
+            "HUNG_1": _fake_strategy("hung"),
+            "HUNG_2": _fake_strategy("hung"),
+            "HUNG_3": _fake_strategy("hung"),
+            "QUEUED": _fake_strategy("ok"),
+        }
+        pipeline = DailyPipeline(
+            as_of_date=date(2024, 1, 15),
+            dry_run=True,
+            strategy_workers=2,
+            strategy_timeout=0.2,
+        )
+        t0 = time.monotonic()
+        try:
+            with patch("src.pipeline.daily_pipeline.ALL_STRATEGIES", strategies):
+                pipeline._step_strategies()
+            elapsed = time.monotonic() - t0
+            workers = [t for t in threading.enumerate() if t.name.startswith("strategy_")]
+            assert workers and all(t.daemon for t in workers)
+        finally:
+            _release_hung.set()
+
+        # Two waves of 0.2s at most, not until the hung calls return
+        assert elapsed < 2.0
+        assert pipeline._strategy_positions == []
+        rows = {r["strategy_id"]: r for r in pipeline._result.strategy_latency}
+        assert {sid: r["status"] for sid, r in rows.items()} == {
+            "HUNG_1": "timeout",
+            "HUNG_2": "timeout",
+            "HUNG_3": "timeout",
+            "QUEUED": "timeout",
+        }
+        # The strategies stuck behind the hung workers never started
+        assert rows["HUNG_3"]["seconds"] == 0.0
+        assert rows["QUEUED"]["seconds"] == 0.0
+        assert "4 failed/timed out" in pipeline._step_details["strategies"]
@@ -277,3 +277,109 @@ class TestAttribution:
             assert (
                 point["drawdown_pct"] <= 0.0001
             ), f"Drawdown should be <= 0, got {point['drawdown_pct']} on {point['date']}"
+
+    def test_period_attribution_slices_ledger(
+        self, populated_pm: PositionManager
+    ) -> None:
+        """Daily attribution only carries that day's P&L; inception carries lifetime P&L."""
+        engine = PerformanceAttributionEngine(position_manager=populated_pm)
+
+        days = [date(2026, 2, 20), date(2026, 2, 21), date(2026, 2, 22)]
+        daily_totals = [
+            engine.compute_for_period("daily", as_of=d)["total_pnl_brl"] for d in days
+        ]
+        inception = engine.compute_for_period("inception", as_of=date(2026, 2, 22))
+        assert sum(daily_totals) == pytest.approx(inception["total_pnl_brl"])
+
+        # Lifetime P&L: unrealized for open positions, realized for closed ones
+        lifetime = sum(
+            p["unrealized_pnl_brl"] if p["is_open"] else p["realized_pnl_brl"]
+            for p in populated_pm._positions
+        )
+        assert inception["total_pnl_brl"] == pytest.approx(lifetime)
+
+        # The 2/21 mark's P&L per position is that day's move only
+        day = engine.compute_for_period("daily", as_of=date(2026, 2, 21))
+        snaps = {
+            s["position_id"]: s["daily_pnl_brl"]
+            for s in populated_pm._pnl_history
+            if s["snapshot_date"] == date(2026, 2, 21)
+        }
+        for row in day["by_instrument"]:
+            assert row["pnl_brl"] == pytest.approx(snaps[row["position_id"]])
+
+        # Position 3 closed on 2/22 is not active in a later period
+        later = engine.compute_attribution(date(2026, 2, 23), date(2026, 2, 28))
+        assert 3 not in {row["position_id"] for row in later["by_instrument"]}
+        assert later["total_pnl_brl"] == pytest.approx(0.0)
+
+    def test_hydrated_positions_seed_ledger(
+        self, populated_pm: PositionManager
+    ) -> None:
+        """Hydrating positions posts their current P&L as an opening balance."""
+        pm = PositionManager()
+        pm._positions = [dict(p) for p in populated_pm._positions]
+        engine = PerformanceAttributionEngine(position_manager=pm)
+
+        result = engine.compute_for_period("inception", as_of=date.today())
+        lifetime = sum(
+            p["unrealized_pnl_brl"] if p["is_open"] else p["realized_pnl_brl"]
+            for p in pm._positions
+        )
+        assert result["total_pnl_brl"] == pytest.approx(lifetime)
+        assert sum(
+            r["pnl_brl"] for r in result["by_strategy"]
+        ) == pytest.approx(lifetime)
+
+    def test_hydration_replays_pnl_history(
+        self, populated_pm: PositionManager
+    ) -> None:
+        """Hydrated period totals match the book that posted them live."""
+        pm = PositionManager()
+        pm.hydrate(
+            [dict(p) for p in populated_pm._positions],
+            [dict(s) for s in populated_pm._pnl_history],
+        )
+        live = PerformanceAttributionEngine(position_manager=populated_pm)
+        hydrated = PerformanceAttributionEngine(position_manager=pm)
+
+        for as_of in (date(2026, 2, 20), date(2026, 2, 21), date(2026, 2, 22)):
+            for period in ("daily", "MTD", "inception"):
+                expected = live.compute_for_period(period, as_of=as_of)
+                result = hydrated.compute_for_period(period, as_of=as_of)
+                assert result["total_pnl_brl"] == pytest.approx(
+                    expected["total_pnl_brl"]
+                ), (period, as_of)
+
+        daily = hydrated.compute_for_period("daily", as_of=date(2026, 2, 21))
+        assert daily["total_pnl_brl"] != pytest.approx(
+            hydrated.compute_for_period("inception", as_of=date(2026, 2, 21))[
+                "total_pnl_brl"
+            ]
+        )
+
+    def test_hydration_without_history_dates_pnl_at_entry(self) -> None:
+        """A position with no snapshots does not land in today's P&L."""
+        pm = PositionManager()
+        pm.hydrate(
+            [
+                {
+                    "id": 1,
+                    "instrument": "DI1_F27",
+                    "asset_class": "RATES",
+                    "strategy_ids": ["RATES_BR_01"],
+                    "is_open": True,
+                    "entry_date": date(2024, 3, 4),
+                    "unrealized_pnl_brl": 750_000.0,
+                    "updated_at": datetime(2026, 2, 24, 18),
+                }
+            ],
+            [],
+        )
+        engine = PerformanceAttributionEngine(position_manager=pm)
+        as_of = date(2026, 2, 24)
+        assert engine.compute_for_period("daily", as_of=as_of)["total_pnl_brl"] == 0.0
+        assert engine.compute_for_period("MTD", as_of=as_of)["total_pnl_brl"] == 0.0
+        assert engine.compute_for_period("inception", as_of=as_of)[
+            "total_pnl_brl"
+        ] == pytest.approx(750_000.0)
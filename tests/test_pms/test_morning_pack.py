@@ -6,15 +6,17 @@ Verifies:
 - Graceful degradation when all components are None
 - Auto-persistence across multiple briefings
 - Action item prioritization (CRITICAL before LOW)
+- Per-section caching on forced regeneration and timeout degradation
 """
 
 from __future__ import annotations
 
+import time
 from datetime import date
 
 import pytest
 
-from src.pms.morning_pack import MorningPackService
+from src.pms.morning_pack import SECTION_TIMEOUT_SECONDS, MorningPackService
 from src.pms.position_manager import PositionManager
 from src.pms.trade_workflow import TradeWorkflowService
 
@@ -298,3 +300,64 @@ class TestMorningPackGeneration:
                 f"Action items not sorted by priority at index {i}: "
                 f"{priorities[i]} > {priorities[i+1]}"
             )
+
+
+class TestMorningPackSections:
+    """Concurrent collection, per-section timeouts and per-section caching."""
+
+    def test_force_regenerate_reuses_unchanged_sections(
+        self,
+        position_manager: PositionManager,
+        trade_workflow: TradeWorkflowService,
+    ) -> None:
+        """Only sections whose fingerprint changed are recollected."""
+        service = MorningPackService(
+            position_manager=position_manager,
+            trade_workflow=trade_workflow,
+        )
+        first = service.generate(briefing_date=date(2026, 2, 24))
+        timings = first["section_timings"]
+        assert set(timings) >= {
+            "trade_proposals",
+            "portfolio_state",
+            "market_snapshot",
+            "action_items",
+            "macro_narrative",
+        }
+        assert not timings["portfolio_state"]["cached"]
+
+        second = service.generate(briefing_date=date(2026, 2, 24), force=True)
+        assert second["section_timings"]["trade_proposals"]["cached"]
+        assert second["section_timings"]["portfolio_state"]["cached"]
+        assert second["portfolio_state"] is first["portfolio_state"]
+
+        # A book change invalidates the portfolio section (and the narrative)
+        position_manager.mark_to_market(
+            price_overrides={"DI1_F27": 11.60}, as_of_date=date(2026, 2, 24)
+        )
+        third = service.generate(briefing_date=date(2026, 2, 24), force=True)
+        assert not third["section_timings"]["portfolio_state"]["cached"]
+        assert not third["section_timings"]["macro_narrative"]["cached"]
+        assert third["section_timings"]["trade_proposals"]["cached"]
+
+    def test_slow_section_degrades_on_timeout(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A collector over its timeout is marked unavailable, not awaited."""
+        monkeypatch.setitem(SECTION_TIMEOUT_SECONDS, "market_snapshot", 0.05)
+        service = MorningPackService()
+
+        def slow_snapshot() -> dict:
+            time.sleep(0.5)
+            return {"fx": {}}
+
+        monkeypatch.setattr(service, "_collect_market_snapshot", slow_snapshot)
+
+        started = time.perf_counter()
+        briefing = service.generate(briefing_date=date(2026, 2, 24))
+        assert time.perf_counter() - started < 0.5
+
+        assert briefing["market_snapshot"]["status"] == "unavailable"
+        assert "timed out" in briefing["market_snapshot"]["reason"]
+        assert briefing["section_timings"]["market_snapshot"]["status"] == "timeout"
+        assert "market_snapshot" not in service._section_cache
@@ -534,3 +534,46 @@ def test_attribution_equity_curve(client: TestClient):
     assert resp.status_code == 200
     data = resp.json()
     assert isinstance(data, list)
+
+
+# =========================================================================
+# 21. Portfolio writes invalidate the /risk snapshot (no Redis)
+# =========================================================================
+def test_book_change_recomputes_risk_snapshot(client: TestClient, monkeypatch):
+    """Opening a position moves the local book version, so /risk recomputes."""
+    import asyncio
+
+    import src.api.routes.risk_api as risk_api_mod
+    from src.cache.risk_snapshot import RiskSnapshotService
+
+    calls = {"n": 0}
+
+    def compute() -> dict:
+        calls["n"] += 1
+        return {}
+
+    service = RiskSnapshotService(compute)  # no cache factory: no Redis
+    monkeypatch.setattr(risk_api_mod, "_snapshot_service", service)
+    try:
+        first = asyncio.run(service.get())
+        assert asyncio.run(service.get()) is first
+        assert calls["n"] == 1
+
+        resp = client.post(
+            "/api/v1/pms/book/positions/open",
+            json={
+                "instrument": "USDBRL",
+                "asset_class": "FX",
+                "direction": "LONG",
+                "notional_brl": 5_000_000,
+                "execution_price": 5.10,
+                "manager_thesis": "FX exposure thesis",
+            },
+        )
+        assert resp.status_code == 201
+
+        second = asyncio.run(service.get())
+        assert calls["n"] == 2
+        assert second.version != first.version
+    finally:
+        service.close()
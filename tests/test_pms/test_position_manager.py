@@ -6,18 +6,22 @@ All tests use pure in-memory PositionManager (no DB dependency).
 
 from datetime import date, datetime
 
+import numpy as np
 import pytest
 
-from src.pms.mtm_service import MarkToMarketService
+from src.pms.mtm_service import LatestPriceCache, MarkToMarketService
 from src.pms.position_manager import PositionManager
 from src.pms.pricing import (
+    compute_dv01_array,
     compute_dv01_from_pu,
     compute_fx_delta,
     compute_pnl_brl,
+    compute_pnl_brl_array,
     compute_pnl_usd,
     ntnb_yield_to_price,
     pu_to_rate,
     rate_to_pu,
+    rate_to_pu_array,
 )
 
 # =============================================================================
@@ -157,6 +161,37 @@ class TestPricing:
         price = ntnb_yield_to_price(6.0, 6.0, 5.0)
         assert price > 0
 
+    def test_array_variants_match_scalar(self):
+        """Vectorized PU / DV01 / P&L equal the scalar formulas elementwise."""
+        rates = np.array([10.0, 12.5, 9.0])
+        days = np.array([252, 0, 60])
+        np.testing.assert_allclose(
+            rate_to_pu_array(rates, days),
+            [rate_to_pu(r, int(d)) for r, d in zip(rates, days)],
+        )
+        np.testing.assert_allclose(
+            compute_dv01_array(rates, days, 1e7),
+            [
+                compute_dv01_from_pu(rate_to_pu(r, int(d)), r, int(d), 1e7)
+                for r, d in zip(rates, days)
+            ],
+        )
+        pnl = compute_pnl_brl_array(
+            np.array([90000.0, 5.0, 0.0]),
+            np.array([91000.0, 5.2, 1.0]),
+            np.array([1e7, 2e7, 1e6]),
+            np.array([-1.0, 1.0, 1.0]),
+            np.array([True, False, False]),
+        )
+        np.testing.assert_allclose(
+            pnl,
+            [
+                compute_pnl_brl(90000.0, 91000.0, 1e7, "SHORT", "DI1_F26", "RATES"),
+                compute_pnl_brl(5.0, 5.2, 2e7, "LONG", "USDBRL", "FX"),
+                0.0,
+            ],
+        )
+
 
 # =============================================================================
 # open_position tests
@@ -356,6 +391,12 @@ class TestClosePosition:
         with pytest.raises(ValueError, match="already closed"):
             pm.close_position(1, close_price=115.0)
 
+    def test_closed_position_leaves_open_positions(self, pm_with_positions: PositionManager):
+        """open_positions() returns only the positions still open."""
+        pm_with_positions.close_position(1, close_price=110.0)
+        open_ids = [p["id"] for p in pm_with_positions.open_positions()]
+        assert open_ids == [2, 3]
+
     def test_close_position_pnl_usd(self, pm: PositionManager):
         """Verify USD P&L computed when fx_rate provided."""
         pm.open_position(
@@ -544,6 +585,83 @@ class TestPnLTimeseries:
         assert ts[0]["daily_pnl_brl"] != 0.0
 
 
+# =============================================================================
+# Position store / P&L ledger tests
+# =============================================================================
+
+
+class TestPositionStore:
+    """Indexed book and pre-aggregated ledger agree with the raw records."""
+
+    def test_book_totals_match_records(self, pm_with_positions: PositionManager):
+        """Column reductions equal plain sums after MTM and a close."""
+        pm_with_positions.mark_to_market(
+            price_overrides={"DI1_F26": 91000.0, "USDBRL": 5.2, "CDS_BR_5Y": 140.0},
+            current_fx_rate=5.2,
+            as_of_date=date(2026, 2, 24),
+        )
+        pm_with_positions.close_position(2, close_price=5.3)
+        summary = pm_with_positions.get_book()["summary"]
+
+        positions = pm_with_positions._positions
+        open_pos = [p for p in positions if p["is_open"]]
+        assert summary["open_positions"] == 2
+        assert summary["total_notional_brl"] == pytest.approx(
+            sum(abs(p["notional_brl"]) for p in open_pos)
+        )
+        assert summary["total_unrealized_pnl_brl"] == pytest.approx(
+            sum(p["unrealized_pnl_brl"] for p in open_pos)
+        )
+        assert summary["total_realized_pnl_brl"] == pytest.approx(
+            positions[1]["realized_pnl_brl"]
+        )
+
+    def test_ledger_today_mtd_ytd(self, pm_with_positions: PositionManager):
+        """Today / MTD / YTD P&L equal sums over the snapshot history."""
+        overrides = {"DI1_F26": 91000.0, "USDBRL": 5.2, "CDS_BR_5Y": 140.0}
+        for as_of in (date(2025, 12, 31), date(2026, 1, 30), date(2026, 2, 24)):
+            pm_with_positions.mark_to_market(
+                price_overrides=overrides, current_fx_rate=5.2, as_of_date=as_of
+            )
+        ref = date(2026, 2, 24)
+        summary = pm_with_positions.get_book(as_of_date=ref)["summary"]
+        history = pm_with_positions._pnl_history
+
+        def total(pred) -> float:
+            return sum(s["daily_pnl_brl"] for s in history if pred(s["snapshot_date"]))
+
+        assert summary["pnl_today_brl"] == pytest.approx(total(lambda d: d == ref))
+        assert summary["pnl_mtd_brl"] == pytest.approx(
+            total(lambda d: (d.year, d.month) == (2026, 2))
+        )
+        assert summary["pnl_ytd_brl"] == pytest.approx(total(lambda d: d.year == 2026))
+        ts = pm_with_positions.get_pnl_timeseries(start_date=date(2026, 1, 1))
+        assert [s["snapshot_date"] for s in ts] == [date(2026, 1, 30), ref]
+
+    def test_hydration_rebuilds_index(self, pm: PositionManager):
+        """Assigning _positions (DB hydration) re-indexes lookups and masks."""
+        pm._positions = [
+            {"id": 7, "asset_class": "FX", "notional_brl": -3e6, "is_open": True},
+            {
+                "id": 9,
+                "asset_class": "RATES",
+                "notional_brl": 5e6,
+                "is_open": False,
+                "realized_pnl_brl": 1200.0,
+                "closed_at": datetime(2026, 2, 24, 18),
+            },
+        ]
+        assert pm._find_position(9)["asset_class"] == "RATES"
+        assert pm._find_position(1) is None
+        book = pm.get_book(as_of_date=date(2026, 2, 24))
+        assert book["summary"]["total_notional_brl"] == 3e6
+        assert book["summary"]["total_realized_pnl_brl"] == 1200.0
+        assert book["by_asset_class"] == {
+            "FX": {"count": 1, "notional_brl": 3e6, "unrealized_pnl_brl": 0.0}
+        }
+        assert [p["id"] for p in book["closed_today"]] == [9]
+
+
 # =============================================================================
 # MarkToMarketService tests
 # =============================================================================
@@ -582,6 +700,39 @@ class TestMarkToMarketService:
         assert prices["DI1_F26"]["price"] == 90000.0
         assert prices["DI1_F26"]["source"] == "entry_price_fallback"
 
+    def test_book_mtm_matches_position_mtm(self, pm_with_positions: PositionManager):
+        """Batch kernel reproduces compute_position_mtm for every asset class."""
+        svc = MarkToMarketService()
+        positions = pm_with_positions._positions + [
+            {
+                "id": 4,
+                "instrument": "IBOV",
+                "asset_class": "EQUITY",
+                "direction": "LONG",
+                "notional_brl": 3e6,
+                "entry_price": 120.0,
+                "unrealized_pnl_brl": 1500.0,
+            },
+            {
+                "id": 5,
+                "instrument": "DI1_N27",
+                "asset_class": "RATES",
+                "direction": "SHORT",
+                "notional_brl": 8e6,
+                "entry_price": 88000.0,
+                "rate_pct": None,
+                "business_days": 300,
+            },
+        ]
+        marks = [91000.0, 5.2, 140.0, 118.0, 87500.0]
+        batch = svc.compute_book_mtm(positions, marks, current_fx_rate=5.1)
+        assert batch.position_ids == [1, 2, 3, 4, 5]
+        for k, pos in enumerate(positions):
+            expected = svc.compute_position_mtm(pos, marks[k], 5.1)
+            assert batch.row(k) == pytest.approx(expected)
+        assert batch.current_dv01[0] > 0 and batch.current_dv01[4] == 0.0
+        assert batch.current_delta[1] > 0
+
     def test_var_contributions_proportional(self):
         """VaR contributions proportional to notional."""
         svc = MarkToMarketService()
@@ -603,3 +754,57 @@ class TestMarkToMarketService:
         svc = MarkToMarketService()
         dv01 = svc.compute_dv01("DI1_F26", 10.0, 252, 10_000_000)
         assert dv01 > 0
+
+
+# =============================================================================
+# LatestPriceCache tests
+# =============================================================================
+
+
+class TestLatestPriceCache:
+    """Tests for the in-process latest-price cache fronting the DB lookup."""
+
+    @staticmethod
+    def _cache(ttl_seconds: float = 60.0):
+        calls: list[list[str]] = []
+
+        def fetch(tickers, as_of_date):
+            calls.append(sorted(tickers))
+            return {t: (5.0, as_of_date) for t in tickers if t != "MISSING"}
+
+        return LatestPriceCache(fetch, ttl_seconds=ttl_seconds), calls
+
+    def test_only_misses_are_fetched(self):
+        """Second call fetches just the new ticker; misses are cached too."""
+        cache, calls = self._cache()
+        d = date(2026, 2, 24)
+        assert cache.get_many(["USDBRL", "MISSING"], d) == {"USDBRL": (5.0, d)}
+        assert cache.get_many(["USDBRL", "MISSING", "IBOV"], d) == {
+            "USDBRL": (5.0, d),
+            "IBOV": (5.0, d),
+        }
+        assert calls == [["MISSING", "USDBRL"], ["IBOV"]]
+
+    def test_invalidate_and_version_change(self):
+        """invalidate() and a new price version both force a refetch."""
+        cache, calls = self._cache()
+        d = date(2026, 2, 24)
+        cache.observe_version(1)
+        cache.get_many(["USDBRL"], d)
+        cache.invalidate(["IBOV"])
+        cache.observe_version(1)
+        cache.get_many(["USDBRL"], d)
+        assert len(calls) == 1
+
+        cache.observe_version(2)
+        cache.get_many(["USDBRL"], d)
+        cache.invalidate()
+        cache.get_many(["USDBRL"], d)
+        assert len(calls) == 3
+
+    def test_ttl_expiry(self):
+        """Entries older than the TTL are refetched."""
+        cache, calls = self._cache(ttl_seconds=0.0)
+        cache.get_many(["USDBRL"], date(2026, 2, 24))
+        cache.get_many(["USDBRL"], date(2026, 2, 24))
+        assert len(calls) == 2
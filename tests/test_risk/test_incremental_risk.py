@@ -0,0 +1,151 @@
+"""Unit tests for pre-trade incremental risk scoring.
+
+Checks the incremental delta VaR / ES against a full recompute of the
+post-trade book, stress delta P&L against StressTester, and batch scoring
+of trade proposals in TradeWorkflowService.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.pms.position_manager import PositionManager
+from src.pms.trade_workflow import TradeWorkflowService
+from src.risk.incremental_risk import IncrementalRiskModel
+from src.risk.risk_state import EWMARiskState
+from src.risk.stress_tester import StressScenario, StressTester
+from src.risk.var_calculator import compute_parametric_var
+
+INSTRUMENTS = ["USDBRL", "DI_PRE_365", "IBOVESPA", "NTN_B_REAL"]
+AUM = 100_000_000.0
+
+
+@pytest.fixture
+def returns() -> np.ndarray:
+    rng = np.random.default_rng(5)
+    cov = np.array(
+        [
+            [1.0, 0.3, -0.2, 0.1],
+            [0.3, 2.0, 0.4, 0.5],
+            [-0.2, 0.4, 3.0, 0.2],
+            [0.1, 0.5, 0.2, 1.5],
+        ]
+    ) * 1e-4
+    return rng.multivariate_normal(np.zeros(4), cov, size=2000)
+
+
+BOOK = {"USDBRL": 20_000_000.0, "DI_PRE_365": -10_000_000.0, "IBOVESPA": 5_000_000.0}
+
+
+def _full_var(model: IncrementalRiskModel, positions: dict[str, float]) -> tuple:
+    """VaR / CVaR of a book recomputed from the model's moments."""
+    w = np.array([positions.get(i, 0.0) / AUM for i in model.instruments])
+    mu = float(w @ model.mean)
+    sigma = float(np.sqrt(w @ model.cov @ w))
+    # compute_parametric_var on a 2-point series with that mean and sigma
+    series = np.array([mu - sigma / np.sqrt(2), mu + sigma / np.sqrt(2)])
+    return compute_parametric_var(series, model.confidence)
+
+
+class TestIncrementalRiskModel:
+    def test_matches_full_recompute(self, returns: np.ndarray) -> None:
+        model = IncrementalRiskModel.from_returns(returns, INSTRUMENTS, BOOK, AUM)
+        trades = [
+            ("USDBRL", -30_000_000.0),
+            ("NTN_B_REAL", 8_000_000.0),
+            ("DI_PRE_365", 10_000_000.0),
+        ]
+        for impact, (name, delta) in zip(model.evaluate(trades), trades):
+            after = dict(BOOK)
+            after[name] = after.get(name, 0.0) + delta
+            var, cvar = _full_var(model, after)
+            assert impact.var_after == pytest.approx(var, rel=1e-9)
+            assert impact.cvar_after == pytest.approx(cvar, rel=1e-9)
+            assert impact.covered
+
+        var0, cvar0 = _full_var(model, BOOK)
+        assert model.var_before == pytest.approx(var0, rel=1e-9)
+        assert model.cvar_before == pytest.approx(cvar0, rel=1e-9)
+
+    def test_small_trade_matches_marginal_var(self, returns: np.ndarray) -> None:
+        model = IncrementalRiskModel.from_returns(returns, INSTRUMENTS, BOOK, AUM)
+        (impact,) = model.evaluate([("IBOVESPA", 1_000.0)])
+        assert impact.delta_var == pytest.approx(
+            impact.marginal_var * 1_000.0 / AUM, rel=1e-3
+        )
+
+    def test_stress_delta_matches_stress_tester(self, returns: np.ndarray) -> None:
+        scenarios = [
+            StressScenario("fx", "", {"USDBRL": -0.2, "DI_PRE": 0.01}, ""),
+            StressScenario("eq", "", {"IBOVESPA": -0.3}, ""),
+        ]
+        model = IncrementalRiskModel.from_returns(
+            returns, INSTRUMENTS, BOOK, AUM, scenarios=scenarios
+        )
+        tester = StressTester(scenarios=scenarios)
+        trade = ("IBOVESPA", 40_000_000.0)
+        (impact,) = model.evaluate([trade])
+
+        after = dict(BOOK)
+        after["IBOVESPA"] += trade[1]
+        before_pnl = min(r.portfolio_pnl for r in tester.run_all(BOOK, AUM))
+        after_results = tester.run_all(after, AUM)
+        worst = min(after_results, key=lambda r: r.portfolio_pnl)
+        assert impact.stress_pnl_before == pytest.approx(before_pnl)
+        assert impact.stress_pnl_after == pytest.approx(worst.portfolio_pnl)
+        assert impact.worst_scenario_after == worst.scenario_name == "eq"
+
+    def test_uncovered_instrument(self, returns: np.ndarray) -> None:
+        model = IncrementalRiskModel.from_returns(returns, INSTRUMENTS, BOOK, AUM)
+        (impact,) = model.evaluate([("CDS_BR_5Y", 1e6)])
+        assert not impact.covered
+        assert impact.var_after is None and impact.delta_var is None
+        assert impact.to_dict()["delta_var_pct"] is None
+
+    def test_empty_batch(self, returns: np.ndarray) -> None:
+        model = IncrementalRiskModel.from_returns(returns, INSTRUMENTS, {}, AUM)
+        assert model.evaluate([]) == []
+
+
+class TestTradeWorkflowIntegration:
+    def test_pending_proposals_scored_in_one_batch(self, returns: np.ndarray) -> None:
+        frame = pd.DataFrame(
+            returns,
+            index=pd.bdate_range("2020-01-01", periods=len(returns)),
+            columns=INSTRUMENTS,
+        )
+        state = EWMARiskState.from_history(frame)
+        tws = TradeWorkflowService(
+            position_manager=PositionManager(aum=AUM), risk_state=state
+        )
+        signals = [
+            {
+                "instrument": "USDBRL",
+                "asset_class": "FX",
+                "direction": "SHORT",
+                "conviction": 0.8,
+                "suggested_notional_brl": 15_000_000.0,
+            },
+            {
+                "instrument": "IBOVESPA",
+                "asset_class": "EQUITY",
+                "direction": "LONG",
+                "conviction": 0.7,
+            },
+        ]
+        proposals = tws.generate_proposals_from_signals(signals)
+        risk = proposals[0]["risk_impact"]
+        assert "estimated_leverage_delta" in risk
+        assert risk["var_before"] == 0.0
+        assert risk["var_after"] > 0.0 and risk["delta_var_pct"] > 0.0
+        assert risk["risk_model_covered"] is True
+
+        refreshed = tws.evaluate_pending_risk()
+        assert set(refreshed) == {p["id"] for p in proposals}
+        model = IncrementalRiskModel.from_state(state, {}, AUM)
+        (expected,) = model.evaluate([("IBOVESPA", 10_000_000.0)])
+        assert refreshed[proposals[1]["id"]]["var_after"] == pytest.approx(
+            abs(expected.var_after) * 100.0, abs=1e-4
+        )
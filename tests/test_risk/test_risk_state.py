@@ -0,0 +1,255 @@
+"""Unit tests for the incremental EWMA risk state.
+
+Covers equivalence of the warm start and bar-by-bar updates, the ring
+buffer, VaR reads against the batch functions, serialization round trips,
+and the RiskMonitorService hook.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.core.config import settings
+from src.pms.position_manager import PositionManager
+from src.pms.risk_monitor import RiskMonitorService
+from src.risk import risk_state
+from src.risk.risk_state import EWMARiskState
+from src.risk.var_calculator import compute_historical_var
+
+
+class FakeRedis:
+    def __init__(self) -> None:
+        self.store: dict[str, str] = {}
+
+    async def set(self, key: str, value: str) -> None:
+        self.store[key] = value
+
+    async def get(self, key: str) -> str | None:
+        return self.store.get(key)
+
+    async def incr(self, key: str) -> int:
+        value = int(self.store.get(key, 0)) + 1
+        self.store[key] = str(value)
+        return value
+
+
+@pytest.fixture
+def returns() -> pd.DataFrame:
+    rng = np.random.default_rng(11)
+    values = rng.multivariate_normal(
+        [0.0005, 0.0, -0.0002],
+        [[1e-4, 2e-5, 0.0], [2e-5, 4e-4, -5e-5], [0.0, -5e-5, 2.5e-4]],
+        size=300,
+    )
+    index = pd.bdate_range("2025-01-01", periods=300)
+    return pd.DataFrame(values, index=index, columns=["USDBRL", "DI1_F26", "IBOV"])
+
+
+class TestUpdates:
+    def test_warm_start_matches_replay(self, returns: pd.DataFrame) -> None:
+        warm = EWMARiskState.from_history(returns, history_days=100)
+        replay = EWMARiskState(returns.columns, history_days=100)
+        for ts, row in returns.iterrows():
+            assert replay.update(ts.date(), row.to_dict())
+
+        np.testing.assert_allclose(replay.mean, warm.mean, atol=1e-15)
+        np.testing.assert_allclose(replay.cov, warm.cov, rtol=1e-9, atol=1e-18)
+        np.testing.assert_array_equal(replay.history(), warm.history())
+        assert replay.last_date == warm.last_date
+        assert replay.n_updates == warm.n_updates == 300
+
+    def test_matches_exponential_weights(self, returns: pd.DataFrame) -> None:
+        state = EWMARiskState.from_history(returns, decay=0.97)
+        w = 0.97 ** np.arange(len(returns))[::-1]
+        expected = np.cov(returns.to_numpy().T, aweights=w, bias=True)
+        np.testing.assert_allclose(state.cov, expected, rtol=1e-9)
+
+    def test_incremental_after_warm_start(self, returns: pd.DataFrame) -> None:
+        state = EWMARiskState.from_history(returns.iloc[:-1])
+        last = returns.iloc[-1]
+        assert state.update(returns.index[-1].date(), last.to_numpy())
+        full = EWMARiskState.from_history(returns)
+        np.testing.assert_allclose(state.cov, full.cov, rtol=1e-9)
+
+    def test_stale_bar_ignored(self, returns: pd.DataFrame) -> None:
+        state = EWMARiskState.from_history(returns)
+        cov = state.cov.copy()
+        assert not state.update(state.last_date, {"USDBRL": 0.5})
+        np.testing.assert_array_equal(state.cov, cov)
+
+    def test_missing_instrument_is_zero_return(self) -> None:
+        state = EWMARiskState(["A", "B"], history_days=3)
+        state.update(date(2025, 1, 1), {"A": 0.01, "B": float("nan")})
+        np.testing.assert_array_equal(state.history(), [[0.01, 0.0]])
+
+    def test_ring_buffer_keeps_latest(self) -> None:
+        state = EWMARiskState(["A"], history_days=3)
+        start = date(2025, 1, 1)
+        for k in range(5):
+            state.update(start + timedelta(days=k), np.array([float(k)]))
+        np.testing.assert_array_equal(state.history().ravel(), [2.0, 3.0, 4.0])
+
+    def test_invalid_decay(self) -> None:
+        with pytest.raises(ValueError, match="decay"):
+            EWMARiskState(["A"], decay=1.0)
+
+
+class TestReads:
+    def test_parametric_var(self, returns: pd.DataFrame) -> None:
+        state = EWMARiskState.from_history(returns)
+        weights = {"USDBRL": 0.5, "IBOV": -0.2, "UNKNOWN": 1.0}
+        w = np.array([0.5, 0.0, -0.2])
+        mu = float(w @ state.mean)
+        sigma = float(np.sqrt(w @ state.cov @ w))
+        var, cvar = state.parametric_var(weights, 0.99)
+        assert var == pytest.approx(mu - 2.3263478740 * sigma, rel=1e-8)
+        assert cvar < var < 0
+
+    def test_historical_var_uses_buffer(self, returns: pd.DataFrame) -> None:
+        state = EWMARiskState.from_history(returns, history_days=250)
+        w = np.array([0.3, 0.3, 0.4])
+        expected = compute_historical_var(returns.to_numpy()[-250:] @ w, 0.95)
+        assert state.historical_var(w, 0.95) == pytest.approx(expected)
+
+    def test_calculate(self, returns: pd.DataFrame) -> None:
+        state = EWMARiskState.from_history(returns)
+        result = state.calculate({"DI1_F26": 1.0})
+        assert result.method == "ewma"
+        assert result.cvar_99 < result.var_99 < result.var_95 < 0
+        with pytest.raises(ValueError, match="Unknown method"):
+            state.calculate({"DI1_F26": 1.0}, method="monte_carlo")
+
+
+class TestSerialization:
+    def test_disk_round_trip(self, returns: pd.DataFrame, tmp_path) -> None:
+        state = EWMARiskState.from_history(returns, history_days=50)
+        path = tmp_path / "state" / "risk_state.json"
+        state.save(path)
+        loaded = EWMARiskState.load(path)
+        np.testing.assert_array_equal(loaded.cov, state.cov)
+        np.testing.assert_array_equal(loaded.history(), state.history())
+        assert loaded.last_date == state.last_date
+
+        # Both continue identically after the round trip
+        next_day = state.last_date + timedelta(days=1)
+        bar = {"USDBRL": 0.01, "DI1_F26": -0.02, "IBOV": 0.005}
+        state.update(next_day, bar)
+        loaded.update(next_day, bar)
+        np.testing.assert_allclose(loaded.cov, state.cov)
+        np.testing.assert_array_equal(loaded.history(), state.history())
+
+    def test_redis_round_trip(self, returns: pd.DataFrame) -> None:
+        redis = FakeRedis()
+        state = EWMARiskState.from_history(returns)
+        asyncio.run(state.save_redis(redis))
+        loaded = asyncio.run(EWMARiskState.load_redis(redis))
+        np.testing.assert_array_equal(loaded.mean, state.mean)
+        assert redis.store[risk_state.REDIS_VERSION_KEY] == "1"
+        assert asyncio.run(EWMARiskState.load_redis(redis, key="missing")) is None
+
+
+class TestSharedState:
+    """The process-wide state follows every publish without a restart."""
+
+    @pytest.fixture
+    def state_path(self, tmp_path, monkeypatch):
+        path = tmp_path / "risk_state.json"
+        monkeypatch.setattr(settings, "risk_state_path", str(path))
+        monkeypatch.setattr(risk_state, "_shared_state", None)
+        monkeypatch.setattr(risk_state, "_shared_mtime_ns", None)
+        monkeypatch.setattr(risk_state, "_shared_redis_version", None)
+        return path
+
+    def test_api_sees_state_published_to_disk(
+        self, returns: pd.DataFrame, state_path
+    ) -> None:
+        from src.api.routes.risk_api import _ewma_var_from_state
+
+        book = {"USDBRL": -20_000_000.0}
+        assert _ewma_var_from_state(book, 100_000_000.0) is None
+
+        EWMARiskState.from_history(returns.iloc[:200]).save(state_path)
+        first = _ewma_var_from_state(book, 100_000_000.0)
+        assert first["as_of_date"] == str(returns.index[199].date())
+
+        EWMARiskState.from_history(returns).save(state_path)
+        stat = state_path.stat()
+        os.utime(state_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        latest = _ewma_var_from_state(book, 100_000_000.0)
+        assert latest["as_of_date"] == str(returns.index[-1].date())
+
+    def test_services_read_latest_state(
+        self, returns: pd.DataFrame, state_path
+    ) -> None:
+        pm = PositionManager(aum=100_000_000.0)
+        pm.open_position(
+            instrument="USDBRL",
+            asset_class="FX",
+            direction="SHORT",
+            notional_brl=20_000_000.0,
+            entry_price=5.0,
+            entry_date=date(2026, 2, 20),
+            entry_fx_rate=5.0,
+        )
+        svc = RiskMonitorService(
+            position_manager=pm, risk_state=risk_state.get_shared_risk_state
+        )
+        assert svc._var_from_risk_state(100_000_000.0) is None
+
+        state = EWMARiskState.from_history(returns)
+        state.save(state_path)
+        var_95, _ = state.parametric_var({"USDBRL": -0.2}, 0.95)
+        assert svc._var_from_risk_state(100_000_000.0)[0] == pytest.approx(
+            abs(var_95) * 100.0
+        )
+
+    def test_redis_version_change_reloads(
+        self, returns: pd.DataFrame, state_path
+    ) -> None:
+        redis = FakeRedis()
+        assert asyncio.run(risk_state.refresh_shared_risk_state(redis)) is None
+
+        asyncio.run(EWMARiskState.from_history(returns.iloc[:200]).save_redis(redis))
+        loaded = asyncio.run(risk_state.refresh_shared_risk_state(redis))
+        assert loaded.last_date == returns.index[199].date()
+
+        asyncio.run(EWMARiskState.from_history(returns).save_redis(redis))
+        loaded = asyncio.run(risk_state.refresh_shared_risk_state(redis))
+        assert loaded.last_date == returns.index[-1].date()
+        assert risk_state.get_shared_risk_state() is loaded
+
+    def test_older_publish_does_not_regress(
+        self, returns: pd.DataFrame, state_path
+    ) -> None:
+        redis = FakeRedis()
+        asyncio.run(EWMARiskState.from_history(returns).save_redis(redis))
+        asyncio.run(risk_state.refresh_shared_risk_state(redis))
+
+        EWMARiskState.from_history(returns.iloc[:200]).save(state_path)
+        assert risk_state.get_shared_risk_state().last_date == returns.index[-1].date()
+
+
+class TestRiskMonitorHook:
+    def test_var_section_reads_state(self, returns: pd.DataFrame) -> None:
+        pm = PositionManager(aum=100_000_000.0)
+        pm.open_position(
+            instrument="USDBRL",
+            asset_class="FX",
+            direction="SHORT",
+            notional_brl=20_000_000.0,
+            entry_price=5.0,
+            entry_date=date(2026, 2, 20),
+            entry_fx_rate=5.0,
+        )
+        state = EWMARiskState.from_history(returns)
+        svc = RiskMonitorService(position_manager=pm, risk_state=state)
+        section = svc._compute_var_section(100_000_000.0, svc.pms_limits)
+
+        var_95, _ = state.parametric_var({"USDBRL": -0.2}, 0.95)
+        assert section["parametric_95"] == pytest.approx(abs(var_95) * 100.0)
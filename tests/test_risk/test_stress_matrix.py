@@ -0,0 +1,128 @@
+"""Unit tests for the compiled scenario x position shock matrix.
+
+Checks that trie-based resolution picks exactly the shock ``_find_shock``
+picks, and that the vectorized StressTester paths match the per-scenario
+``run_scenario`` results.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from src.risk.stress_matrix import CompiledScenarios, ShockKeyTrie
+from src.risk.stress_tester import (
+    DEFAULT_SCENARIOS,
+    StressScenario,
+    StressTester,
+    _find_shock,
+)
+
+
+def _scenario(name: str, shocks: dict[str, float]) -> StressScenario:
+    return StressScenario(name=name, description="", shocks=shocks, historical_period="")
+
+
+class TestShockKeyTrie:
+    def test_exact_and_prefixes(self) -> None:
+        trie = ShockKeyTrie()
+        di, di_pre, usd = trie.add("DI"), trie.add("DI_PRE"), trie.add("USDBRL")
+        assert trie.add("DI") == di
+        assert trie.prefixes_of("DI_PRE_365") == (None, [di, di_pre])
+        assert trie.prefixes_of("DI_PRE") == (di_pre, [di])
+        assert trie.prefixes_of("USDBRL") == (usd, [])
+        assert trie.prefixes_of("EURUSD") == (None, [])
+
+
+class TestResolution:
+    def test_matches_find_shock(self) -> None:
+        scenarios = [
+            # Shorter prefix inserted first wins over a longer one
+            _scenario("a", {"DI": 0.01, "DI_PRE": 0.02, "USDBRL": 0.1}),
+            # Longer prefix inserted first wins
+            _scenario("b", {"DI_PRE": 0.03, "DI": 0.04}),
+            # Exact beats an earlier prefix; explicit zero still counts
+            _scenario("c", {"DI": 0.05, "DI_PRE_365": 0.0}),
+            _scenario("d", {}),
+        ]
+        instruments = ["DI_PRE_365", "DI_PRE", "DI", "USDBRL", "UST_NOM", "D"]
+        compiled = CompiledScenarios(scenarios)
+        matrix = compiled.resolve({i: 1.0 for i in instruments})
+
+        for s, scenario in enumerate(scenarios):
+            for j, instrument in enumerate(instruments):
+                expected = _find_shock(instrument, scenario.shocks)
+                assert matrix.impacted[s, j] == (expected is not None)
+                assert matrix.shocks[s, j] == (expected or 0.0)
+
+    def test_random_books_match_run_scenario(self) -> None:
+        rng = np.random.default_rng(3)
+        keys = ["USDBRL", "DI_PRE", "DI", "NTN_B_REAL", "IBOVESPA", "CDS_BR", "SP"]
+        scenarios = [
+            _scenario(
+                f"gen_{k}",
+                {
+                    key: float(rng.normal(0, 0.1))
+                    for key in rng.permutation(keys)[: rng.integers(1, len(keys))]
+                },
+            )
+            for k in range(200)
+        ]
+        positions = {
+            name: float(rng.normal(0, 1e6))
+            for name in ["USDBRL", "DI_PRE_365", "DI_PRE_720", "DI_X", "SP500", "OIL"]
+        }
+        tester = StressTester(scenarios=scenarios)
+
+        fast = tester.run_all(positions, 5e6)
+        for result, scenario in zip(fast, scenarios):
+            slow = tester.run_scenario(positions, scenario, 5e6)
+            assert result.portfolio_pnl == pytest.approx(slow.portfolio_pnl)
+            assert result.position_pnl == pytest.approx(slow.position_pnl)
+            assert result.worst_position == slow.worst_position
+            assert result.positions_impacted == slow.positions_impacted
+
+
+class TestStressTesterMatrix:
+    def test_run_matrix_pnl_vector(self) -> None:
+        tester = StressTester()
+        positions = {"USDBRL": 100_000.0, "DI_PRE_365": -50_000.0}
+        pnl = tester.run_matrix(positions).portfolio_pnl()
+        expected = [r.portfolio_pnl for r in tester.run_all(positions)]
+        np.testing.assert_allclose(pnl, expected)
+
+    def test_recompiles_when_scenarios_change(self) -> None:
+        tester = StressTester()
+        positions = {"USDBRL": 100_000.0}
+        assert len(tester.run_all(positions)) == len(DEFAULT_SCENARIOS)
+        tester.scenarios = [_scenario("only", {"USDBRL": -0.5})]
+        (result,) = tester.run_all(positions)
+        assert result.portfolio_pnl == pytest.approx(-50_000.0)
+
+    def test_reverse_closed_form(self) -> None:
+        tester = StressTester(scenarios=[_scenario("fx", {"USDBRL": -0.10})])
+        out = tester.reverse_stress_test({"USDBRL": 200_000.0}, 1_000_000.0, -0.05)
+        # base P&L -20k; -50k target needs 2.5x
+        assert out["fx"]["multiplier"] == pytest.approx(2.5)
+        assert out["fx"]["required_shocks"] == {"USDBRL": pytest.approx(-0.25)}
+        assert out["fx"]["resulting_loss_pct"] == pytest.approx(-0.05)
+        assert out["fx"]["feasible"] is True
+
+    def test_reverse_infeasible_results_are_independent(self) -> None:
+        tester = StressTester(
+            scenarios=[
+                _scenario("rally", {"USDBRL": 0.10}),
+                _scenario("unrelated", {"IBOVESPA": -0.10}),
+            ]
+        )
+        out = tester.reverse_stress_test({"USDBRL": 100_000.0}, 1_000_000.0, -0.10)
+        assert out["rally"]["feasible"] is out["unrelated"]["feasible"] is False
+        out["rally"]["required_shocks"]["USDBRL"] = 1.0
+        assert out["unrelated"]["required_shocks"] == {}
+
+    def test_reverse_caps_at_five_x(self) -> None:
+        tester = StressTester(scenarios=[_scenario("fx", {"USDBRL": -0.01})])
+        out = tester.reverse_stress_test({"USDBRL": 100_000.0}, 1_000_000.0, -0.10)
+        assert out["fx"]["feasible"] is False
+        assert out["fx"]["multiplier"] == 5.0
+        assert out["fx"]["resulting_loss_pct"] == pytest.approx(-0.005)
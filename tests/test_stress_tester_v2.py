@@ -7,6 +7,7 @@ reverse stress testing, historical replay, and run_all_v2.
 from __future__ import annotations
 
 import numpy as np
+import pandas as pd
 import pytest
 
 from src.risk.stress_tester import (
@@ -344,3 +345,61 @@ class TestRunAllV2:
         # Worst case should be the scenario with most negative P&L
         all_pnls = [r.portfolio_pnl for r in result["scenarios"]]
         assert result["worst_case"].portfolio_pnl == min(all_pnls)
+
+
+# ---------------------------------------------------------------------------
+# Historical sweep
+# ---------------------------------------------------------------------------
+
+
+class TestHistoricalSweep:
+    """Tests for the rolling-window historical_sweep method."""
+
+    @pytest.fixture
+    def panel(self) -> pd.DataFrame:
+        rng = np.random.default_rng(11)
+        dates = pd.bdate_range("2004-01-01", periods=5200)
+        data = rng.normal(0.0, 0.005, size=(len(dates), 2))
+        data[1000:1010, 0] = -0.03  # crash in USDBRL-long terms
+        data[3000:3005, 1] = -0.04  # equity crash
+        return pd.DataFrame(data, index=dates, columns=["USDBRL", "IBOVESPA"])
+
+    def test_finds_injected_crashes(self, tester: StressTester, panel) -> None:
+        positions = {"USDBRL": 1_000_000.0, "IBOVESPA": 500_000.0, "OIL": 1.0}
+        windows = tester.historical_sweep(positions, panel, 2_000_000.0, 20, top_k=3)
+
+        assert len(windows) == 3
+        pnls = [w.result.portfolio_pnl for w in windows]
+        assert pnls == sorted(pnls)
+        # Both injected crashes fall inside a returned window
+        for crash_end in (1009, 3004):
+            crash = panel.index[crash_end].date()
+            assert any(w.start_date <= crash <= w.trough_date for w in windows), crash
+        assert windows[0].result.positions_unaffected == 1
+        # Non-overlapping episodes
+        starts = sorted(w.start_date for w in windows)
+        for a, b in zip(starts, starts[1:]):
+            assert len(panel.loc[a:b]) - 1 >= 20
+
+    def test_matches_historical_replay(self, tester: StressTester, panel) -> None:
+        positions = {"USDBRL": 1_000_000.0, "IBOVESPA": -250_000.0}
+        (worst,) = tester.historical_sweep(positions, panel, 1_000_000.0, 20, top_k=1)
+
+        window = panel.loc[worst.start_date : worst.end_date]
+        replay = tester.historical_replay(
+            positions,
+            {c: window[c].to_numpy() for c in window.columns},
+            1_000_000.0,
+        )
+        assert worst.result.portfolio_pnl == pytest.approx(replay.portfolio_pnl)
+        assert worst.result.position_pnl == pytest.approx(replay.position_pnl)
+
+    def test_as_scenario_reproduces_pnl(self, tester: StressTester, panel) -> None:
+        positions = {"USDBRL": 1_000_000.0, "IBOVESPA": 500_000.0}
+        (worst,) = tester.historical_sweep(positions, panel, 2_000_000.0, 10, top_k=1)
+        scenario = worst.as_scenario()
+        rerun = tester.run_scenario(positions, scenario, 2_000_000.0)
+        assert rerun.portfolio_pnl == pytest.approx(worst.result.portfolio_pnl)
+
+    def test_short_panel_returns_empty(self, tester: StressTester, panel) -> None:
+        assert tester.historical_sweep({"USDBRL": 1.0}, panel.iloc[:5], 1.0, 20) == []
@@ -13,8 +13,11 @@ from src.risk.var_calculator import (
     VaRCalculator,
     VaRDecomposition,
     compute_component_var,
+    compute_historical_decomposition,
+    compute_historical_var,
     compute_marginal_var,
     compute_parametric_var,
+    ledoit_wolf_covariance,
 )
 
 # ---------------------------------------------------------------------------
@@ -387,3 +390,62 @@ class TestParametricVaRLedoitWolf:
             assert (
                 val < 0.0
             ), f"Marginal VaR for asset {i} should be negative, got {val:.6f}"
+
+
+# ---------------------------------------------------------------------------
+# Euler decomposition (historical + shared covariance)
+# ---------------------------------------------------------------------------
+
+
+class TestEulerDecomposition:
+    """Tests for the vectorized historical / parametric Euler allocation."""
+
+    @pytest.fixture
+    def book(self) -> tuple[np.ndarray, np.ndarray]:
+        rng = np.random.default_rng(5)
+        returns_matrix = rng.standard_t(4, size=(756, 40)) * 0.01
+        weights = rng.normal(0.0, 1.0, size=40) / 40
+        return returns_matrix, weights
+
+    def test_historical_components_sum_to_totals(self, book) -> None:
+        returns_matrix, weights = book
+        euler = compute_historical_decomposition(returns_matrix, weights, 0.99)
+        var, cvar = compute_historical_var(returns_matrix @ weights, 0.99)
+
+        assert euler.total_var == pytest.approx(var, rel=1e-12)
+        assert euler.total_cvar == pytest.approx(cvar, rel=1e-12)
+        assert euler.component_var.sum() == pytest.approx(var, rel=1e-9)
+        assert euler.component_cvar.sum() == pytest.approx(cvar, rel=1e-9)
+
+    def test_historical_marginal_is_exact_gradient(self, book) -> None:
+        returns_matrix, weights = book
+        marginal = compute_marginal_var(returns_matrix, weights, 0.95, "historical")
+        eps = 1e-9
+        for i in (0, 17, 39):
+            bumped = weights.copy()
+            bumped[i] += eps
+            up, _ = compute_historical_var(returns_matrix @ bumped, 0.95)
+            base, _ = compute_historical_var(returns_matrix @ weights, 0.95)
+            assert marginal[i] == pytest.approx((up - base) / eps, rel=1e-4)
+
+    def test_component_var_accepts_shared_covariance(self, book) -> None:
+        returns_matrix, weights = book
+        cov = ledoit_wolf_covariance(returns_matrix)
+        assert compute_component_var(
+            returns_matrix, weights, 0.95, cov=cov
+        ) == pytest.approx(compute_component_var(returns_matrix, weights, 0.95))
+
+    def test_decompose_var_historical(self, book) -> None:
+        returns_matrix, weights = book
+        names = [f"I{i}" for i in range(40)]
+        decomp = VaRCalculator().decompose_var(
+            returns_matrix, weights, names, 0.95, method="historical"
+        )
+        assert decomp.method == "historical"
+        assert sum(decomp.pct_contribution.values()) == pytest.approx(1.0)
+        assert sum(decomp.component_cvar.values()) == pytest.approx(decomp.total_cvar)
+
+    def test_decompose_var_rejects_unknown_method(self, book) -> None:
+        returns_matrix, weights = book
+        with pytest.raises(ValueError, match="Unknown method"):
+            VaRCalculator().decompose_var(returns_matrix, weights, ["a"] * 40, 0.95, "mc")